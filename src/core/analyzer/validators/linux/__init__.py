@@ -10,28 +10,108 @@ validator 함수들을 제공합니다.
     >>> from src.core.analyzer.validators.linux import check_u01
     >>> result = check_u01(["..."])
     >>> print(result.status)
+
+validator 함수는 처음 접근할 때 정의 모듈만 import합니다 (__getattr__).
 """
 
-from .account_management import check_u01, check_u02, check_u03, check_u04
-from .account_management import check_u05, check_u06, check_u07, check_u08
-from .account_management import check_u09, check_u10, check_u11, check_u12
-from .account_management import check_u13, check_u14, check_u15
-from .file_management import check_u16, check_u17, check_u18, check_u19
-from .file_management import check_u20, check_u21, check_u22, check_u23
-from .file_management import check_u24, check_u25, check_u26, check_u27
-from .file_management import check_u28, check_u29, check_u30, check_u31
-from .file_management import check_u32, check_u33, check_u34, check_u35
-from .log_management import check_u72, check_u73
-from .patch_management import check_u71
-from .service_management import check_u36, check_u37, check_u38, check_u39
-from .service_management import check_u40, check_u41, check_u42, check_u43
-from .service_management import check_u44, check_u45, check_u46, check_u47
-from .service_management import check_u48, check_u49, check_u50, check_u51
-from .service_management import check_u52, check_u53, check_u54, check_u55
-from .service_management import check_u56, check_u57, check_u58, check_u59
-from .service_management import check_u60, check_u61, check_u62, check_u63
-from .service_management import check_u64, check_u65, check_u66, check_u67
-from .service_management import check_u68, check_u69, check_u70
+import importlib
+
+# validator 함수 -> 정의 모듈 (처음 접근할 때 해당 모듈만 import)
+_VALIDATOR_MODULES = {
+    "check_u01": "account_management",
+    "check_u02": "account_management",
+    "check_u03": "account_management",
+    "check_u04": "account_management",
+    "check_u05": "account_management",
+    "check_u06": "account_management",
+    "check_u07": "account_management",
+    "check_u08": "account_management",
+    "check_u09": "account_management",
+    "check_u10": "account_management",
+    "check_u11": "account_management",
+    "check_u12": "account_management",
+    "check_u13": "account_management",
+    "check_u14": "account_management",
+    "check_u15": "account_management",
+    "check_u16": "file_management",
+    "check_u17": "file_management",
+    "check_u18": "file_management",
+    "check_u19": "file_management",
+    "check_u20": "file_management",
+    "check_u21": "file_management",
+    "check_u22": "file_management",
+    "check_u23": "file_management",
+    "check_u24": "file_management",
+    "check_u25": "file_management",
+    "check_u26": "file_management",
+    "check_u27": "file_management",
+    "check_u28": "file_management",
+    "check_u29": "file_management",
+    "check_u30": "file_management",
+    "check_u31": "file_management",
+    "check_u32": "file_management",
+    "check_u33": "file_management",
+    "check_u34": "file_management",
+    "check_u35": "file_management",
+    "check_u36": "service_management",
+    "check_u37": "service_management",
+    "check_u38": "service_management",
+    "check_u39": "service_management",
+    "check_u40": "service_management",
+    "check_u41": "service_management",
+    "check_u42": "service_management",
+    "check_u43": "service_management",
+    "check_u44": "service_management",
+    "check_u45": "service_management",
+    "check_u46": "service_management",
+    "check_u47": "service_management",
+    "check_u48": "service_management",
+    "check_u49": "service_management",
+    "check_u50": "service_management",
+    "check_u51": "service_management",
+    "check_u52": "service_management",
+    "check_u53": "service_management",
+    "check_u54": "service_management",
+    "check_u55": "service_management",
+    "check_u56": "service_management",
+    "check_u57": "service_management",
+    "check_u58": "service_management",
+    "check_u59": "service_management",
+    "check_u60": "service_management",
+    "check_u61": "service_management",
+    "check_u62": "service_management",
+    "check_u63": "service_management",
+    "check_u64": "service_management",
+    "check_u65": "service_management",
+    "check_u66": "service_management",
+    "check_u67": "service_management",
+    "check_u68": "service_management",
+    "check_u69": "service_management",
+    "check_u70": "service_management",
+    "check_u71": "patch_management",
+    "check_u72": "log_management",
+    "check_u73": "log_management",
+}
+
+
+def __getattr__(name: str):
+    """validator 함수 지연 import (PEP 562)
+
+    처음 접근할 때 정의 모듈만 import하고 패키지 속성으로 저장하므로,
+    이후 접근은 일반 속성 조회입니다.
+    """
+    module_name = _VALIDATOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VALIDATOR_MODULES))
+
 
 __all__ = [
     "check_u01",
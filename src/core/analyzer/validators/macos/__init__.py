@@ -4,14 +4,45 @@ macOS 보안 점검 validator 함수들을 제공합니다.
 
 각 함수는 명령어 출력을 받아 CheckResult를 반환합니다.
 - check_m01 ~ check_m10: macOS 전용 점검 항목
+
+validator 함수는 처음 접근할 때 정의 모듈만 import합니다 (__getattr__).
 """
 
-from .system_protection import check_m01, check_m10
-from .data_protection import check_m02, check_m09
-from .application_security import check_m03
-from .network_security import check_m04, check_m08
-from .patch_management import check_m05
-from .access_control import check_m06, check_m07
+import importlib
+
+# validator 함수 -> 정의 모듈 (처음 접근할 때 해당 모듈만 import)
+_VALIDATOR_MODULES = {
+    "check_m01": "system_protection",
+    "check_m02": "data_protection",
+    "check_m03": "application_security",
+    "check_m04": "network_security",
+    "check_m05": "patch_management",
+    "check_m06": "access_control",
+    "check_m07": "access_control",
+    "check_m08": "network_security",
+    "check_m09": "data_protection",
+    "check_m10": "system_protection",
+}
+
+
+def __getattr__(name: str):
+    """validator 함수 지연 import (PEP 562)
+
+    처음 접근할 때 정의 모듈만 import하고 패키지 속성으로 저장하므로,
+    이후 접근은 일반 속성 조회입니다.
+    """
+    module_name = _VALIDATOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VALIDATOR_MODULES))
+
 
 __all__ = [
     # System Protection
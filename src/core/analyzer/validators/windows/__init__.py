@@ -2,68 +2,85 @@
 Windows validators 패키지
 
 Windows 보안 점검 규칙의 validator 함수들을 포함합니다.
+
+validator 함수는 처음 접근할 때 정의 모듈만 import합니다 (__getattr__).
 """
 
-from .account_management import (
-    check_w01,
-    check_w02,
-    check_w03,
-    check_w04,
-    check_w05,
-    check_w06,
-    check_w07,
-)
-from .service_management import (
-    check_w08,
-    check_w09,
-    check_w10,
-    check_w31,
-    check_w32,
-    check_w33,
-    check_w34,
-    check_w35,
-    check_w36,
-    check_w37,
-    check_w38,
-    check_w39,
-    check_w40,
-)
-from .registry import (
-    check_w11,
-    check_w12,
-    check_w13,
-    check_w14,
-    check_w15,
-    check_w16,
-    check_w17,
-    check_w18,
-    check_w19,
-    check_w20,
-    check_w21,
-    check_w22,
-    check_w23,
-    check_w24,
-    check_w25,
-    check_w26,
-    check_w27,
-    check_w28,
-    check_w29,
-    check_w30,
-)
-from .patch_management import (
-    check_w41,
-    check_w42,
-    check_w43,
-    check_w44,
-    check_w45,
-)
-from .logging_auditing import (
-    check_w46,
-    check_w47,
-    check_w48,
-    check_w49,
-    check_w50,
-)
+import importlib
+
+# validator 함수 -> 정의 모듈 (처음 접근할 때 해당 모듈만 import)
+_VALIDATOR_MODULES = {
+    "check_w01": "account_management",
+    "check_w02": "account_management",
+    "check_w03": "account_management",
+    "check_w04": "account_management",
+    "check_w05": "account_management",
+    "check_w06": "account_management",
+    "check_w07": "account_management",
+    "check_w08": "service_management",
+    "check_w09": "service_management",
+    "check_w10": "service_management",
+    "check_w11": "registry",
+    "check_w12": "registry",
+    "check_w13": "registry",
+    "check_w14": "registry",
+    "check_w15": "registry",
+    "check_w16": "registry",
+    "check_w17": "registry",
+    "check_w18": "registry",
+    "check_w19": "registry",
+    "check_w20": "registry",
+    "check_w21": "registry",
+    "check_w22": "registry",
+    "check_w23": "registry",
+    "check_w24": "registry",
+    "check_w25": "registry",
+    "check_w26": "registry",
+    "check_w27": "registry",
+    "check_w28": "registry",
+    "check_w29": "registry",
+    "check_w30": "registry",
+    "check_w31": "service_management",
+    "check_w32": "service_management",
+    "check_w33": "service_management",
+    "check_w34": "service_management",
+    "check_w35": "service_management",
+    "check_w36": "service_management",
+    "check_w37": "service_management",
+    "check_w38": "service_management",
+    "check_w39": "service_management",
+    "check_w40": "service_management",
+    "check_w41": "patch_management",
+    "check_w42": "patch_management",
+    "check_w43": "patch_management",
+    "check_w44": "patch_management",
+    "check_w45": "patch_management",
+    "check_w46": "logging_auditing",
+    "check_w47": "logging_auditing",
+    "check_w48": "logging_auditing",
+    "check_w49": "logging_auditing",
+    "check_w50": "logging_auditing",
+}
+
+
+def __getattr__(name: str):
+    """validator 함수 지연 import (PEP 562)
+
+    처음 접근할 때 정의 모듈만 import하고 패키지 속성으로 저장하므로,
+    이후 접근은 일반 속성 조회입니다.
+    """
+    module_name = _VALIDATOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = func
+    return func
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VALIDATOR_MODULES))
+
 
 __all__ = [
     # Account Management
@@ -4,10 +4,21 @@ Windows 계정 관리 validator 함수
 Windows 계정 정책 및 보안 설정 점검 함수들을 포함합니다.
 """
 
-from typing import List
+import re
+from typing import List, Optional
 from ....domain.models import CheckResult, Status
 
 
+def _extract_number(output: str) -> Optional[int]:
+    """net accounts 정책 줄에서 첫 번째 숫자 추출
+
+    "Minimum password length                      8" → 8
+    숫자가 없으면 (예: "Never") None을 반환합니다.
+    """
+    match = re.search(r"(\d+)", output)
+    return int(match.group(1)) if match else None
+
+
 def check_w01(command_outputs: List[str]) -> CheckResult:
     """
     W-01: Administrator 계정 이름 변경
@@ -91,26 +102,18 @@ def check_w04(command_outputs: List[str]) -> CheckResult:
     output = command_outputs[0].strip()
 
     # "Minimum password length                      8" 형식에서 숫자 추출
-    try:
-        # 숫자만 추출
-        import re
-
-        match = re.search(r"(\d+)", output)
-        if match:
-            min_length = int(match.group(1))
-
-            if min_length >= 8:
-                return CheckResult(
-                    status=Status.PASS,
-                    message=f"패스워드 최소 길이가 설정되어 있습니다: {min_length}자",
-                )
-            else:
-                return CheckResult(
-                    status=Status.FAIL,
-                    message=f"패스워드 최소 길이가 부족합니다: {min_length}자 (권장: 8자 이상)",
-                )
-    except (ValueError, AttributeError):
-        pass
+    min_length = _extract_number(output)
+    if min_length is not None:
+        if min_length >= 8:
+            return CheckResult(
+                status=Status.PASS,
+                message=f"패스워드 최소 길이가 설정되어 있습니다: {min_length}자",
+            )
+        else:
+            return CheckResult(
+                status=Status.FAIL,
+                message=f"패스워드 최소 길이가 부족합니다: {min_length}자 (권장: 8자 이상)",
+            )
 
     return CheckResult(
         status=Status.MANUAL,
@@ -133,25 +136,18 @@ def check_w05(command_outputs: List[str]) -> CheckResult:
     output = command_outputs[0].strip()
 
     # "Maximum password age (days):              90" 형식에서 숫자 추출
-    try:
-        import re
-
-        match = re.search(r"(\d+)", output)
-        if match:
-            max_age = int(match.group(1))
-
-            if 1 <= max_age <= 90:
-                return CheckResult(
-                    status=Status.PASS,
-                    message=f"패스워드 최대 사용 기간이 적절합니다: {max_age}일",
-                )
-            elif max_age == 0 or max_age > 90:
-                return CheckResult(
-                    status=Status.FAIL,
-                    message=f"패스워드 최대 사용 기간이 부적절합니다: {max_age}일 (권장: 1~90일)",
-                )
-    except (ValueError, AttributeError):
-        pass
+    max_age = _extract_number(output)
+    if max_age is not None:
+        if 1 <= max_age <= 90:
+            return CheckResult(
+                status=Status.PASS,
+                message=f"패스워드 최대 사용 기간이 적절합니다: {max_age}일",
+            )
+        elif max_age == 0 or max_age > 90:
+            return CheckResult(
+                status=Status.FAIL,
+                message=f"패스워드 최대 사용 기간이 부적절합니다: {max_age}일 (권장: 1~90일)",
+            )
 
     return CheckResult(
         status=Status.MANUAL,
@@ -175,29 +171,22 @@ def check_w06(command_outputs: List[str]) -> CheckResult:
     output = command_outputs[0].strip()
 
     # "Lockout threshold:                    5" 형식에서 숫자 추출
-    try:
-        import re
-
-        match = re.search(r"(\d+)", output)
-        if match:
-            threshold = int(match.group(1))
-
-            if threshold == 0:
-                return CheckResult(
-                    status=Status.FAIL, message="계정 잠금 기능이 비활성화되어 있습니다."
-                )
-            elif 1 <= threshold <= 5:
-                return CheckResult(
-                    status=Status.PASS,
-                    message=f"계정 잠금 임계값이 적절합니다: {threshold}회",
-                )
-            else:
-                return CheckResult(
-                    status=Status.FAIL,
-                    message=f"계정 잠금 임계값이 너무 높습니다: {threshold}회 (권장: 1~5회)",
-                )
-    except (ValueError, AttributeError):
-        pass
+    threshold = _extract_number(output)
+    if threshold is not None:
+        if threshold == 0:
+            return CheckResult(
+                status=Status.FAIL, message="계정 잠금 기능이 비활성화되어 있습니다."
+            )
+        elif 1 <= threshold <= 5:
+            return CheckResult(
+                status=Status.PASS,
+                message=f"계정 잠금 임계값이 적절합니다: {threshold}회",
+            )
+        else:
+            return CheckResult(
+                status=Status.FAIL,
+                message=f"계정 잠금 임계값이 너무 높습니다: {threshold}회 (권장: 1~5회)",
+            )
 
     return CheckResult(
         status=Status.MANUAL, message=f"계정 잠금 임계값을 파싱할 수 없습니다: {output}"
@@ -219,24 +208,17 @@ def check_w07(command_outputs: List[str]) -> CheckResult:
     output = command_outputs[0].strip()
 
     # "Lockout duration (minutes):          30" 형식에서 숫자 추출
-    try:
-        import re
-
-        match = re.search(r"(\d+)", output)
-        if match:
-            duration = int(match.group(1))
-
-            if duration >= 30:
-                return CheckResult(
-                    status=Status.PASS, message=f"계정 잠금 기간이 적절합니다: {duration}분"
-                )
-            else:
-                return CheckResult(
-                    status=Status.FAIL,
-                    message=f"계정 잠금 기간이 부족합니다: {duration}분 (권장: 30분 이상)",
-                )
-    except (ValueError, AttributeError):
-        pass
+    duration = _extract_number(output)
+    if duration is not None:
+        if duration >= 30:
+            return CheckResult(
+                status=Status.PASS, message=f"계정 잠금 기간이 적절합니다: {duration}분"
+            )
+        else:
+            return CheckResult(
+                status=Status.FAIL,
+                message=f"계정 잠금 기간이 부족합니다: {duration}분 (권장: 30분 이상)",
+            )
 
     return CheckResult(
         status=Status.MANUAL, message=f"계정 잠금 기간을 파싱할 수 없습니다: {output}"
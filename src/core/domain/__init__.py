@@ -7,6 +7,7 @@ Clean Architecture Domain Layer.
 from src.core.domain.models import (
     CheckResult,
     RemediationInfo,
+    RuleDependencies,
     RuleMetadata,
     Severity,
     Status,
@@ -17,5 +18,6 @@ __all__ = [
     "Severity",
     "CheckResult",
     "RemediationInfo",
+    "RuleDependencies",
     "RuleMetadata",
 ]
@@ -137,6 +137,39 @@ class RemediationInfo(BaseModel):
     manual_steps: Optional[List[str]] = None
 
 
+class RuleDependencies(BaseModel):
+    """점검 규칙 입력 의존성
+
+    규칙 결과에 영향을 주는 원격 입력(파일, 패키지, 서비스)을 선언합니다.
+    증분 스캔은 입력의 지문(mtime, 크기, inode, 패키지 버전 등)이
+    이전 스캔과 같으면 규칙을 다시 실행하지 않고 이전 결과를 재사용합니다.
+
+    Attributes:
+        files: 파일 경로 목록
+        packages: 패키지 이름 목록
+        services: 서비스 이름 목록
+
+    Examples:
+        >>> deps = RuleDependencies(files=["/etc/pam.d/login", "/etc/securetty"])
+        >>> deps.keys()
+        ['file:/etc/pam.d/login', 'file:/etc/securetty']
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    files: List[str] = Field(default_factory=list)
+    packages: List[str] = Field(default_factory=list)
+    services: List[str] = Field(default_factory=list)
+
+    def keys(self) -> List[str]:
+        """지문 키 목록 ("file:<경로>", "package:<이름>", "service:<이름>")"""
+        return (
+            [f"file:{path}" for path in self.files]
+            + [f"package:{name}" for name in self.packages]
+            + [f"service:{name}" for name in self.services]
+        )
+
+
 class RuleMetadata(BaseModel):
     """점검 규칙 메타데이터
 
@@ -154,6 +187,9 @@ class RuleMetadata(BaseModel):
         validator: validator 함수 경로
         expected_result: 기대 결과 설명
         remediation: 자동 수정 정보 (Optional)
+        depends_on: 입력 의존성 (Optional, 증분 스캔에 사용)
+        platforms: 규칙을 적용할 플랫폼 목록 (예: ["linux", "macos"],
+            비어 있으면 규칙 파일 디렉토리의 플랫폼)
 
     Validation:
         - id: U-01 ~ U-73, W-01 ~ W-50, M-01 ~ M-50 형식
@@ -196,6 +232,8 @@ class RuleMetadata(BaseModel):
     )
     expected_result: Optional[str] = None
     remediation: Optional[RemediationInfo] = None
+    depends_on: Optional[RuleDependencies] = None
+    platforms: List[str] = Field(default_factory=list)
 
 
 @dataclass
@@ -230,6 +268,7 @@ __all__ = [
     "Severity",
     "CheckResult",
     "RemediationInfo",
+    "RuleDependencies",
     "RuleMetadata",
     "RemediationResult",
 ]
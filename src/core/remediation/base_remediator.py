@@ -3,6 +3,7 @@
 모든 플랫폼 Remediator의 기본 인터페이스를 정의합니다.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 import logging
@@ -126,6 +127,14 @@ class BaseRemediator(ABC):
                 executed_commands=executed_commands,
             )
 
+        except asyncio.CancelledError:
+            # 취소: 실행 중인 원격 명령어는 클라이언트가 중단, 백업한 파일은 되돌린 후 전파
+            logger.warning(f"{rule.id} 자동 수정 취소")
+            if session_id and backup_files:
+                for bf in backup_files:
+                    self.backup_manager.rollback_file(bf)
+            raise
+
         except Exception as e:
             logger.error(f"{rule.id} 자동 수정 실패: {e}")
 
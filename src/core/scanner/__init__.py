@@ -5,10 +5,22 @@
 주요 모듈:
 - base_scanner: BaseScanner 추상 클래스, ScanResult
 - rule_loader: YAML 규칙 파일 로더
+- rule_catalog: 프로세스 공유 규칙 카탈로그 (id, 카테고리, 심각도, 플랫폼 인덱스, 증분 갱신)
+- validator_table: validator 디스패치 테이블 (규칙 로드 시 1회 import)
+- command_batch: 명령어 배치 수집기 (SSH 세션 1회 실행)
+- collector_agent: 원격 수집 에이전트 (서버에서 병렬 실행, 압축 JSON 번들 반환)
+- powershell_batch: PowerShell 명령어 배치 수집기 (WinRM 왕복 1회 실행)
+- command_cache: 스캔 단위 명령어 결과 캐시
+- fingerprint: 증분 스캔 입력 지문 수집 및 저장소 (FingerprintStore)
+- rule_timing: 규칙 실행 시간 기록 및 LPT 스케줄링 (RuleTimingStore)
+- checkpoint: 스캔 체크포인트 (연결이 끊어진 스캔 이어서 실행)
+- collectors: 스냅샷 수집기 (프로세스 테이블 등)
 - unix_scanner: UnixScanner (Linux, macOS 공통)
 - linux_scanner: Linux 서버 스캐너
 - macos_scanner: macOS 서버 스캐너
 - windows_scanner: Windows 서버 스캐너
+- fleet_scanner: 여러 서버 동시 스캔 (FleetScanner)
+- replay: 캡처 파일 재생 스캐너 (네트워크 없이 재검증)
 """
 
 from .base_scanner import BaseScanner, ScanResult
@@ -16,7 +28,19 @@ from .unix_scanner import UnixScanner
 from .linux_scanner import LinuxScanner
 from .macos_scanner import MacOSScanner
 from .windows_scanner import WindowsScanner
+from .fleet_scanner import FleetScanner, FleetScanOutcome, create_scanner
+from .replay import create_replay_scanner
 from .rule_loader import RuleLoaderError, load_rules
+from .rule_catalog import RuleCatalog, RuleChanges, get_rule_catalog
+from .validator_table import ValidatorNotFoundError, ValidatorTable, get_validator_table
+from .command_batch import BatchOutput, CommandBatch, CommandBatchError
+from .collector_agent import AgentNotInstalledError, CollectorAgent, CollectorAgentError
+from .powershell_batch import PowerShellBatch
+from .command_cache import CommandCache, normalize_command
+from .fingerprint import FingerprintStore
+from .rule_timing import RuleTimingStore, order_longest_first, predict_makespan
+from .checkpoint import DEFAULT_CHECKPOINT_DIR, ScanCheckpoint, discard_checkpoints
+from .collectors import ProcessSnapshotCollector, SnapshotCollector
 
 __all__ = [
     "BaseScanner",
@@ -25,6 +49,34 @@ __all__ = [
     "LinuxScanner",
     "MacOSScanner",
     "WindowsScanner",
+    "FleetScanner",
+    "FleetScanOutcome",
+    "create_scanner",
+    "create_replay_scanner",
     "RuleLoaderError",
     "load_rules",
+    "RuleCatalog",
+    "RuleChanges",
+    "get_rule_catalog",
+    "ValidatorNotFoundError",
+    "ValidatorTable",
+    "get_validator_table",
+    "BatchOutput",
+    "CommandBatch",
+    "CommandBatchError",
+    "CollectorAgent",
+    "CollectorAgentError",
+    "AgentNotInstalledError",
+    "PowerShellBatch",
+    "CommandCache",
+    "normalize_command",
+    "FingerprintStore",
+    "RuleTimingStore",
+    "order_longest_first",
+    "predict_makespan",
+    "DEFAULT_CHECKPOINT_DIR",
+    "ScanCheckpoint",
+    "discard_checkpoints",
+    "SnapshotCollector",
+    "ProcessSnapshotCollector",
 ]
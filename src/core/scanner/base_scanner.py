@@ -6,17 +6,27 @@ Clean Architecture의 Domain Layer에 해당하며,
 
 설계 원칙:
 - ABC (Abstract Base Class) 사용
-- AsyncIO 기반 비동기 처리
+- AsyncIO 기반 비동기 처리 (규칙 동시 실행 지원)
 - 플랫폼 독립적 인터페이스
 - 의존성 역전 원칙 (DIP)
 """
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ..domain.models import CheckResult, RuleMetadata
+from .checkpoint import ScanCheckpoint
+from .command_cache import CommandCache
+from .fingerprint import FingerprintStore, collect_dependency_keys, parse_fingerprint_output
+from .rule_timing import RuleTimingStore, order_longest_first, predict_makespan
+from .validator_table import get_validator_table
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -94,20 +104,60 @@ class BaseScanner(ABC):
         >>> result = await scanner.scan_all()
         >>> print(f"점수: {result.score}/100")
         >>> await scanner.disconnect()
+
+    결과 스트리밍:
+        >>> async for rule, check_result in scanner.scan_iter():
+        ...     print(rule.id, check_result.status)
+
+    증분 스캔 (depends_on 입력이 바뀌지 않은 규칙은 이전 결과 재사용):
+        >>> scanner.set_fingerprint_store(FingerprintStore("data/scan_state/fingerprints.json"))
+        >>> result = await scanner.scan_all()
+        >>> scanner.get_incremental_stats()
+        {'reused': 20, 'executed': 53}
+
+    실행 시간 기반 스케줄링 (동시 실행 시 느린 규칙부터 시작, 남은 시간 예측):
+        >>> scanner.set_timing_store(RuleTimingStore("data/scan_state/rule_timings.json"))
+        >>> async for rule, check_result in scanner.scan_iter():
+        ...     print(scanner.estimate_remaining())
+
+    체크포인트 (연결이 끊어지면 재연결 후 남은 규칙만 실행):
+        >>> scanner.set_checkpoint(ScanCheckpoint("scan-001", "data/scan_state/checkpoints"))
+        >>> result = await scanner.scan_all_resumable(max_retries=5)
     """
 
-    def __init__(self, server_id: str, platform: str):
+    def __init__(self, server_id: str, platform: str, max_concurrency: int = 1):
         """초기화
 
         Args:
             server_id: 서버 식별자
             platform: 플랫폼 (linux, macos, windows)
+            max_concurrency: 동시에 실행할 최대 규칙 수 (기본: 1, 순차 실행)
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}")
+
         self.server_id = server_id
         self.platform = platform
+        self.max_concurrency = max_concurrency
         self._connected = False
         self._rules: List[RuleMetadata] = []
 
+        # 스캔 단위 명령어 결과 캐시 (scan_all() 시작 시 초기화)
+        self._command_cache = CommandCache()
+
+        # 증분 스캔 저장소 (None이면 항상 전체 실행)
+        self._fingerprint_store: Optional[FingerprintStore] = None
+        self._fingerprints: Dict[str, str] = {}
+        self._incremental_stats = {"reused": 0, "executed": 0}
+
+        # 규칙 실행 시간 저장소 (None이면 규칙 순서대로 실행, 시간 예측 없음)
+        self._timing_store: Optional[RuleTimingStore] = None
+        self._estimates: Dict[str, float] = {}
+        self._unfinished: Dict[str, float] = {}
+
+        # 스캔 체크포인트 (None이면 완료된 결과를 따로 기록하지 않음)
+        self._checkpoint: Optional[ScanCheckpoint] = None
+
     @abstractmethod
     async def connect(self) -> None:
         """서버에 연결
@@ -153,7 +203,9 @@ class BaseScanner(ABC):
     async def scan_all(self) -> ScanResult:
         """전체 점검 실행
 
-        모든 규칙을 순차적으로 실행합니다.
+        max_concurrency가 1이면 모든 규칙을 순차적으로 실행하고,
+        2 이상이면 최대 max_concurrency개의 규칙을 동시에 실행합니다.
+        동시 실행 시에도 결과는 규칙 id 순서로 저장됩니다.
 
         Returns:
             전체 스캔 결과
@@ -161,19 +213,420 @@ class BaseScanner(ABC):
         Raises:
             RuntimeError: 연결되지 않은 상태에서 호출 시
         """
+        result = ScanResult(server_id=self.server_id, platform=self.platform)
+
+        completed = {rule.id: check_result async for rule, check_result in self.scan_iter()}
+        for rule in self._rules:
+            result.results[rule.id] = completed[rule.id]
+
+        return result
+
+    async def scan_all_resumable(
+        self, max_retries: int = 5, backoff: float = 1.0, max_backoff: float = 30.0
+    ) -> ScanResult:
+        """전체 점검 실행 (연결이 끊어지면 재연결 후 이어서 실행)
+
+        인자는 scan_iter_resumable()과 같습니다.
+
+        Returns:
+            전체 스캔 결과
+
+        Raises:
+            ConnectionError: max_retries번 재시도해도 연결이 복구되지 않은 경우
+        """
+        result = ScanResult(server_id=self.server_id, platform=self.platform)
+
+        completed = {
+            rule.id: check_result
+            async for rule, check_result in self.scan_iter_resumable(
+                max_retries=max_retries, backoff=backoff, max_backoff=max_backoff
+            )
+        }
+        for rule in self._rules:
+            result.results[rule.id] = completed[rule.id]
+
+        return result
+
+    async def scan_iter_resumable(
+        self, max_retries: int = 5, backoff: float = 1.0, max_backoff: float = 30.0
+    ) -> AsyncIterator[Tuple[RuleMetadata, CheckResult]]:
+        """전체 점검 실행 (연결이 끊어지면 재연결 후 남은 규칙만 실행)
+
+        완료된 결과는 체크포인트에 기록되므로, 스캔 중 ConnectionError가 발생하면
+        지수 백오프로 기다린 뒤 다시 연결하고 체크포인트에 없는 규칙만 실행합니다.
+        체크포인트가 설정되지 않았으면 이번 호출 동안 메모리 체크포인트를 사용합니다.
+        각 규칙의 결과는 한 번만 반환합니다.
+
+        Args:
+            max_retries: 연속 재연결 시도 최대 횟수 (결과를 받으면 다시 0부터 계산)
+            backoff: 첫 재연결 대기 시간 (초, 시도마다 2배)
+            max_backoff: 재연결 대기 시간 상한 (초)
+
+        Yields:
+            (규칙, 점검 결과)
+
+        Raises:
+            ConnectionError: max_retries번 재시도해도 연결이 복구되지 않은 경우
+            RuntimeError: 연결되지 않았거나 규칙이 로드되지 않은 경우
+        """
+        previous_checkpoint = self._checkpoint
+        if self._checkpoint is None:
+            self._checkpoint = ScanCheckpoint(f"{self.platform}-{self.server_id}")
+
+        yielded = set()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    if attempt:
+                        await self._reconnect()
+
+                    results = self.scan_iter()
+                    try:
+                        async for rule, check_result in results:
+                            if rule.id in yielded:
+                                continue
+                            # 새 결과를 받았으면 연결이 복구된 것으로 보고 재시도 횟수 초기화
+                            attempt = 0
+                            yielded.add(rule.id)
+                            yield rule, check_result
+                    finally:
+                        await results.aclose()
+                    return
+
+                except ConnectionError as e:
+                    attempt += 1
+                    if attempt > max_retries:
+                        logger.error(f"재연결 {max_retries}회 실패, 스캔 중단: {self.server_id}")
+                        raise
+                    delay = min(max_backoff, backoff * 2 ** (attempt - 1))
+                    logger.warning(
+                        f"연결 끊김, {delay:.1f}초 후 재연결 ({attempt}/{max_retries}, "
+                        f"완료 {len(yielded)}개): {self.server_id}, {e}"
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            self._checkpoint = previous_checkpoint
+
+    async def _reconnect(self) -> None:
+        """연결 해제 후 다시 연결
+
+        Raises:
+            ConnectionError: 연결 실패 시
+        """
+        try:
+            await self.disconnect()
+        except Exception as e:
+            logger.debug(f"끊어진 연결 해제 중 오류 (무시): {e}")
+        self._connected = False
+        await self.connect()
+        logger.info(f"재연결 성공: {self.server_id}")
+
+    async def scan_iter(self) -> AsyncIterator[Tuple[RuleMetadata, CheckResult]]:
+        """전체 점검 실행 (규칙이 끝날 때마다 결과 반환)
+
+        순차 실행이면 규칙 순서대로, 동시 실행이면 완료된 순서대로 반환합니다.
+        반복을 중단하면(break, aclose) 실행 중인 규칙은 취소됩니다.
+
+        Yields:
+            (규칙, 점검 결과)
+
+        Raises:
+            RuntimeError: 연결되지 않았거나 규칙이 로드되지 않은 경우
+        """
         if not self._connected:
             raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
 
         if not self._rules:
             raise RuntimeError("규칙이 로드되지 않았습니다. load_rules()를 먼저 호출하세요.")
 
-        result = ScanResult(server_id=self.server_id, platform=self.platform)
+        rules = list(self._rules)
+
+        self._command_cache.clear()
+        restored: Dict[str, CheckResult] = {}
+        if self._checkpoint is not None:
+            restored = self._checkpoint.load(self.server_id, self.platform, rules)
+
+        reused = await self._reuse_results([rule for rule in rules if rule.id not in restored])
+        for rule in rules:
+            if rule.id in reused:
+                self._checkpoint_result(rule, reused[rule.id])
+        reused.update(restored)
+        pending = [rule for rule in rules if rule.id not in reused]
+        self._incremental_stats = {"reused": len(reused), "executed": len(pending)}
+        if self._fingerprint_store is not None:
+            logger.info(
+                f"증분 스캔: 재사용 {len(reused)}개, 실행 {len(pending)}개 ({self.server_id})"
+            )
+
+        pending = self._schedule(pending)
+
+        try:
+            for rule in rules:
+                if rule.id in reused:
+                    yield rule, reused[rule.id]
+
+            if pending:
+                await self._prepare_scan(pending)
+
+            if self.max_concurrency > 1:
+                results = self._scan_concurrently(pending)
+                try:
+                    async for rule, check_result in results:
+                        self._record_result(rule, check_result)
+                        self._unfinished.pop(rule.id, None)
+                        yield rule, check_result
+                finally:
+                    # 중첩 async generator는 명시적으로 닫아야 남은 규칙이 즉시 취소됨
+                    await results.aclose()
+            else:
+                for rule in pending:
+                    check_result = await self._scan_one_timed(rule)
+                    self._record_result(rule, check_result)
+                    self._unfinished.pop(rule.id, None)
+                    yield rule, check_result
+        finally:
+            self._save_fingerprints()
+            self._save_timings()
+
+        stats = self._command_cache.get_stats()
+        logger.info(
+            f"명령어 캐시: 원격 실행 {stats['executions']}회, 절약 {stats['saved']}회 "
+            f"({self.server_id})"
+        )
+
+    async def _prepare_scan(self, rules: Optional[List[RuleMetadata]] = None) -> None:
+        """스캔 시작 전 준비 (hook)
+
+        scan_iter()가 규칙 실행 전에 호출합니다.
+        하위 클래스는 명령어 일괄 수집 등 스캔 단위 준비 작업을 구현할 수 있습니다.
 
-        for rule in self._rules:
-            check_result = await self.scan_one(rule)
-            result.results[rule.id] = check_result
+        Args:
+            rules: 이번 스캔에서 실행할 규칙 (기본: 로드된 전체 규칙)
+        """
+        pass
 
-        return result
+    def set_fingerprint_store(self, store: Optional[FingerprintStore]) -> None:
+        """증분 스캔 저장소 설정
+
+        설정하면 depends_on을 선언한 규칙 중 입력 지문과 규칙 정의가
+        이전 스캔과 같은 규칙은 명령어와 validator를 실행하지 않고 이전 결과를 재사용합니다.
+
+        Args:
+            store: FingerprintStore (None이면 증분 스캔 해제)
+        """
+        self._fingerprint_store = store
+
+    def set_checkpoint(self, checkpoint: Optional[ScanCheckpoint]) -> None:
+        """스캔 체크포인트 설정
+
+        설정하면 완료된 규칙의 결과를 체크포인트에 기록하고, 같은 체크포인트로 다시 스캔하면
+        기록된 결과를 재사용하여 남은 규칙만 실행합니다.
+        스캔이 끝나도 체크포인트는 삭제하지 않습니다 (필요하면 discard() 호출).
+
+        Args:
+            checkpoint: ScanCheckpoint (None이면 해제)
+        """
+        self._checkpoint = checkpoint
+
+    def get_incremental_stats(self) -> Dict[str, int]:
+        """마지막 스캔의 증분 스캔 통계 반환 (reused, executed)"""
+        return dict(self._incremental_stats)
+
+    def set_timing_store(self, store: Optional[RuleTimingStore]) -> None:
+        """규칙 실행 시간 저장소 설정
+
+        설정하면 규칙 실행 시간을 기록하고, 동시 실행 시 기록된 시간이 긴 규칙부터
+        시작합니다(LPT). 기록된 시간으로 스캔 소요 시간과 남은 시간을 예측합니다.
+
+        Args:
+            store: RuleTimingStore (None이면 규칙 순서대로 실행)
+        """
+        self._timing_store = store
+
+    def get_predicted_duration(self) -> Optional[float]:
+        """마지막(또는 진행 중인) 스캔의 예측 소요 시간 (초, 저장소가 없으면 None)"""
+        if self._timing_store is None or not self._estimates:
+            return None
+        return predict_makespan(self._estimates.values(), self.max_concurrency)
+
+    def estimate_remaining(self) -> Optional[float]:
+        """진행 중인 스캔의 남은 시간 예측 (초, 저장소가 없으면 None)
+
+        끝나지 않은 규칙을 실행 순서대로 max_concurrency개 슬롯에 배정한 소요 시간입니다.
+        """
+        if self._timing_store is None:
+            return None
+        return predict_makespan(self._unfinished.values(), self.max_concurrency)
+
+    def _schedule(self, rules: List[RuleMetadata]) -> List[RuleMetadata]:
+        """실행 순서 결정 및 규칙별 시간 추정
+
+        동시 실행이면 추정 시간이 긴 규칙부터 실행합니다.
+        순차 실행은 순서가 소요 시간에 영향을 주지 않으므로 규칙 순서를 유지합니다.
+
+        Args:
+            rules: 이번 스캔에서 실행할 규칙
+
+        Returns:
+            실행 순서대로의 규칙 리스트
+        """
+        self._estimates = {}
+        self._unfinished = {}
+        if self._timing_store is None:
+            return rules
+
+        self._estimates = self._timing_store.estimates(self.server_id, self.platform, rules)
+        if self.max_concurrency > 1:
+            rules = order_longest_first(rules, self._estimates)
+        self._unfinished = {rule.id: self._estimates[rule.id] for rule in rules}
+
+        logger.info(
+            f"예상 스캔 시간: {self.get_predicted_duration():.1f}초 "
+            f"(규칙 {len(rules)}개, 동시 {self.max_concurrency}개, {self.server_id})"
+        )
+        return rules
+
+    async def _scan_one_timed(self, rule: RuleMetadata) -> CheckResult:
+        """단일 규칙 점검 후 실행 시간 기록"""
+        started = time.monotonic()
+        check_result = await self.scan_one(rule)
+        if self._timing_store is not None:
+            self._timing_store.record(
+                self.server_id, self.platform, rule.id, time.monotonic() - started
+            )
+        return check_result
+
+    def _save_timings(self) -> None:
+        """실행 시간 저장소를 파일에 저장 (실패해도 스캔 결과에는 영향 없음)"""
+        if self._timing_store is None:
+            return
+
+        try:
+            self._timing_store.save()
+        except OSError as e:
+            logger.warning(f"실행 시간 저장소 저장 실패: {e}")
+
+    def _fingerprint_command(self, keys: List[str]) -> Optional[str]:
+        """입력 지문 수집 명령어 (hook)
+
+        하위 클래스는 플랫폼에 맞는 지문 수집 스크립트를 반환합니다.
+
+        Args:
+            keys: 지문 키 목록 ("file:<경로>", "package:<이름>", "service:<이름>")
+
+        Returns:
+            실행할 명령어 (지문 수집을 지원하지 않으면 None)
+        """
+        return None
+
+    async def _reuse_results(self, rules: List[RuleMetadata]) -> Dict[str, CheckResult]:
+        """입력 지문을 1회 수집하여 재사용할 수 있는 이전 결과 조회
+
+        지문 수집에 실패하면 모든 규칙을 실행합니다.
+
+        Args:
+            rules: 점검 규칙 리스트
+
+        Returns:
+            rule_id -> 이전 CheckResult
+        """
+        self._fingerprints = {}
+        if self._fingerprint_store is None:
+            return {}
+
+        keys = collect_dependency_keys(rules)
+        command = self._fingerprint_command(keys) if keys else None
+        if command is None:
+            return {}
+
+        try:
+            self._fingerprints = parse_fingerprint_output(await self._execute_cached(command))
+        except Exception as e:
+            logger.warning(f"입력 지문 수집 실패, 전체 규칙 실행으로 대체: {e}")
+            return {}
+
+        reused: Dict[str, CheckResult] = {}
+        for rule in rules:
+            previous = self._fingerprint_store.get(self.server_id, rule, self._fingerprints)
+            if previous is not None:
+                reused[rule.id] = previous
+        return reused
+
+    def _record_result(self, rule: RuleMetadata, result: CheckResult) -> None:
+        """실행한 규칙의 입력 지문과 결과를 저장소와 체크포인트에 기록"""
+        if self._fingerprint_store is not None and self._fingerprints:
+            self._fingerprint_store.put(self.server_id, rule, self._fingerprints, result)
+        self._checkpoint_result(rule, result)
+
+    def _checkpoint_result(self, rule: RuleMetadata, result: CheckResult) -> None:
+        """완료된 결과를 체크포인트에 기록 (실패해도 스캔 결과에는 영향 없음)"""
+        if self._checkpoint is None:
+            return
+
+        try:
+            self._checkpoint.record(rule, result)
+        except OSError as e:
+            logger.warning(f"체크포인트 기록 실패: {rule.id}, {e}")
+
+    def _save_fingerprints(self) -> None:
+        """저장소를 파일에 저장 (실패해도 스캔 결과에는 영향 없음)"""
+        if self._fingerprint_store is None or not self._fingerprints:
+            return
+
+        try:
+            self._fingerprint_store.save()
+        except OSError as e:
+            logger.warning(f"증분 스캔 저장소 저장 실패: {e}")
+
+    async def _execute_cached(self, command: str) -> str:
+        """캐시를 거쳐 명령어 실행
+
+        같은 스캔에서 이미 실행했거나 실행 중인 명령어는 원격 실행 없이 결과를 공유합니다.
+
+        Args:
+            command: 실행할 명령어
+
+        Returns:
+            명령어 출력 (stdout)
+        """
+        return await self._command_cache.get_or_execute(command, self.execute_command)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """명령어 캐시 통계 반환 (entries, executions, saved)"""
+        return self._command_cache.get_stats()
+
+    async def _scan_concurrently(
+        self, rules: List[RuleMetadata]
+    ) -> AsyncIterator[Tuple[RuleMetadata, CheckResult]]:
+        """규칙 동시 실행
+
+        Semaphore로 동시 실행 수를 max_concurrency개로 제한하며, 규칙은 주어진 순서대로
+        슬롯을 얻습니다(asyncio.Semaphore는 대기 순서대로 깨움).
+
+        Args:
+            rules: 점검 규칙 리스트
+
+        Yields:
+            (규칙, 점검 결과) (완료된 순서)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(rule: RuleMetadata) -> Tuple[RuleMetadata, CheckResult]:
+            async with semaphore:
+                return rule, await self._scan_one_timed(rule)
+
+        tasks = [asyncio.ensure_future(run(rule)) for rule in rules]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 반복 중단 또는 규칙 예외: 남은 규칙 취소
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     @abstractmethod
     async def scan_one(self, rule: RuleMetadata) -> CheckResult:
@@ -198,6 +651,52 @@ class BaseScanner(ABC):
         """로드된 규칙 수 반환"""
         return len(self._rules)
 
+    def get_rules(self) -> List[RuleMetadata]:
+        """로드된 규칙 목록 반환 (복사본)"""
+        return list(self._rules)
+
+    def set_rules(self, rules: List[RuleMetadata]) -> None:
+        """이미 로드된 규칙 설정 (여러 스캐너가 같은 규칙 목록을 공유할 때)
+
+        규칙의 validator를 공유 디스패치 테이블에 미리 등록하고,
+        찾을 수 없는 validator는 스캔 전에 보고합니다 (해당 규칙은 MANUAL 처리).
+
+        Args:
+            rules: 점검 규칙 리스트
+        """
+        self._rules = list(rules)
+        missing = get_validator_table().compile(self._rules)
+        if missing:
+            logger.warning(
+                f"validator를 찾을 수 없는 규칙 {len(missing)}개: {', '.join(sorted(missing))}"
+            )
+
+    def _call_validator(self, rule: RuleMetadata, outputs: List[str]) -> CheckResult:
+        """Validator 함수 호출 (디스패치 테이블 조회, import 없음)
+
+        Args:
+            rule: 점검 규칙
+            outputs: 명령어 출력 리스트
+
+        Returns:
+            CheckResult
+
+        Raises:
+            RuntimeError: validator를 찾을 수 없거나 호출 실패
+        """
+        try:
+            result = get_validator_table().get(rule.validator)(outputs)
+
+            # CheckResult 타입 확인
+            if not isinstance(result, CheckResult):
+                raise RuntimeError(f"Validator가 CheckResult를 반환하지 않았습니다: {type(result)}")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Validator 호출 실패 ({rule.id}): {e}")
+            raise RuntimeError(f"Validator 호출 실패: {e}")
+
 
 __all__ = [
     "ScanResult",
@@ -0,0 +1,247 @@
+"""스캔 체크포인트 (중단된 스캔 이어서 실행)
+
+스캔 중 완료된 규칙의 점검 결과를 스캔 id별 파일에 즉시 추가 기록합니다.
+연결이 끊어져 스캔이 중단되어도 완료된 결과는 남아 있으므로,
+재연결 후 같은 스캔 id로 다시 스캔하면 남은 규칙만 실행합니다.
+
+파일 형식 (JSON Lines, <directory>/<scan_id>.jsonl):
+    {"version": 1, "scan_id": ..., "server_id": ..., "platform": ..., "created_at": ...}
+    {"rule_id": "U-01", "digest": "...", "result": {...}}
+    ...
+
+결과는 한 줄씩 추가하므로 기록 도중 프로세스가 종료되어도 앞선 결과는 유지되며,
+완성되지 않은 마지막 줄은 로드할 때 무시합니다.
+규칙 정의가 바뀐 규칙(digest 불일치)은 이어서 실행할 때 다시 점검합니다.
+
+체크포인트는 한 번의 스캔 안에서 재연결 후 이어서 실행하기 위한 것입니다.
+서버 상태가 바뀐 뒤(자동 수정 등)에는 discard_checkpoints()로 남은 체크포인트를 삭제합니다.
+"""
+
+import json
+import logging
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ..domain.models import CheckResult, RuleMetadata
+from .fingerprint import _result_from_dict, _result_to_dict, rule_digest
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 파일 형식 버전
+CHECKPOINT_VERSION = 1
+
+# 기본 체크포인트 디렉토리
+DEFAULT_CHECKPOINT_DIR = "data/scan_state/checkpoints"
+
+
+class ScanCheckpoint:
+    """스캔 체크포인트
+
+    path 없이(directory=None) 생성하면 메모리에만 기록합니다
+    (같은 프로세스 안의 재연결 후 이어서 실행용).
+
+    사용 예시:
+        >>> checkpoint = ScanCheckpoint("linux-server-001", "data/scan_state/checkpoints")
+        >>> scanner.set_checkpoint(checkpoint)
+        >>> async for rule, check_result in scanner.scan_iter_resumable():
+        ...     print(rule.id, check_result.status)
+        >>> checkpoint.discard()  # 스캔 완료 후 삭제
+    """
+
+    def __init__(
+        self,
+        scan_id: str,
+        directory: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ):
+        """초기화
+
+        Args:
+            scan_id: 스캔 식별자 (파일 이름에 사용)
+            directory: 체크포인트 파일 디렉토리 (None이면 메모리에만 기록)
+            max_age: 이 시간보다 오래된 체크포인트는 무시 (초, 기본: 제한 없음)
+        """
+        self.scan_id = scan_id
+        self.max_age = max_age
+        self.path: Optional[Path] = None
+        if directory is not None:
+            filename = re.sub(r"[^A-Za-z0-9._-]", "_", scan_id)
+            self.path = Path(directory) / f"{filename}.jsonl"
+
+        self._header: Optional[Dict[str, Any]] = None
+        self._entries: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._loaded = False
+
+        # 파일이 줄바꿈 없이 끝남 (기록 도중 중단, 다음 기록은 새 줄에서 시작)
+        self._partial_line = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(
+        self, server_id: str, platform: str, rules: Iterable[RuleMetadata]
+    ) -> Dict[str, CheckResult]:
+        """기록된 결과 중 이어서 사용할 수 있는 결과 조회
+
+        다른 서버의 체크포인트이거나 max_age보다 오래된 체크포인트는 버리고 새로 시작합니다.
+
+        Args:
+            server_id: 서버 식별자
+            platform: 플랫폼
+            rules: 이번 스캔의 규칙
+
+        Returns:
+            rule_id -> CheckResult (규칙 정의가 기록 당시와 같은 규칙만)
+        """
+        if not self._loaded:
+            self._read_file()
+            self._loaded = True
+
+        if self._header is not None and not self._matches(server_id, platform):
+            logger.info(f"이전 체크포인트를 사용하지 않습니다: {self.scan_id}")
+            self.discard()
+
+        if self._header is None:
+            self._header = {
+                "version": CHECKPOINT_VERSION,
+                "scan_id": self.scan_id,
+                "server_id": server_id,
+                "platform": platform,
+                "created_at": datetime.now().isoformat(),
+            }
+
+        results: Dict[str, CheckResult] = {}
+        for rule in rules:
+            entry = self._entries.get(rule.id)
+            if entry is None or entry[0] != rule_digest(rule):
+                continue
+            try:
+                results[rule.id] = _result_from_dict(entry[1])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        if results:
+            logger.info(f"체크포인트에서 {len(results)}개 결과 복원: {self.scan_id}")
+        return results
+
+    def record(self, rule: RuleMetadata, result: CheckResult) -> None:
+        """완료된 규칙 결과 기록 (파일이면 즉시 한 줄 추가)
+
+        Args:
+            rule: 점검 규칙
+            result: 점검 결과
+
+        Raises:
+            OSError: 파일 기록 실패
+        """
+        entry = {"rule_id": rule.id, "digest": rule_digest(rule), "result": _result_to_dict(result)}
+        self._entries[rule.id] = (entry["digest"], entry["result"])
+
+        if self.path is None:
+            return
+
+        lines = [""] if self._partial_line else []
+        self._partial_line = False
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            lines.append(json.dumps(self._header or {}, ensure_ascii=False))
+        lines.append(json.dumps(entry, ensure_ascii=False))
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+
+    def discard(self) -> None:
+        """기록된 결과와 파일 삭제 (스캔 완료 후 또는 새로 시작할 때)"""
+        self._header = None
+        self._entries = {}
+        self._partial_line = False
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _matches(self, server_id: str, platform: str) -> bool:
+        """기록된 체크포인트가 이번 스캔에 사용할 수 있는지 확인"""
+        header = self._header or {}
+        if header.get("server_id") != server_id or header.get("platform") != platform:
+            return False
+        if self.max_age is None:
+            return True
+
+        try:
+            created_at = datetime.fromisoformat(header["created_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return datetime.now() - created_at <= timedelta(seconds=self.max_age)
+
+    def _read_file(self) -> None:
+        """체크포인트 파일 읽기 (손상된 줄은 무시)"""
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"체크포인트 로드 실패, 처음부터 실행: {self.path}, {e}")
+            return
+
+        self._partial_line = bool(text) and not text.endswith("\n")
+        lines = text.splitlines()
+        for index, line in enumerate(lines):
+            try:
+                data = json.loads(line)
+                if index == 0:
+                    if data.get("version") != CHECKPOINT_VERSION:
+                        logger.warning(f"지원하지 않는 체크포인트 버전: {self.path}")
+                        self.discard()
+                        return
+                    self._header = data
+                else:
+                    self._entries[data["rule_id"]] = (data["digest"], dict(data["result"]))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                if index == 0:
+                    logger.warning(f"체크포인트 헤더 손상, 처음부터 실행: {self.path}")
+                    self.discard()
+                    return
+                # 기록 도중 중단된 줄
+                logger.debug(f"체크포인트 손상된 줄 무시: {self.path}:{index + 1}")
+
+
+def discard_checkpoints(directory: str, server_id: str) -> int:
+    """서버의 체크포인트 파일 삭제 (자동 수정 후, 비정상 종료된 스캔의 파일 정리)
+
+    Args:
+        directory: 체크포인트 파일 디렉토리
+        server_id: 서버 식별자 (파일 헤더의 server_id)
+
+    Returns:
+        삭제한 파일 수
+    """
+    path = Path(directory)
+    if not path.is_dir():
+        return 0
+
+    removed = 0
+    for checkpoint_file in path.glob("*.jsonl"):
+        try:
+            with open(checkpoint_file, encoding="utf-8") as f:
+                header = json.loads(f.readline())
+        except (OSError, UnicodeDecodeError, ValueError):
+            continue
+        if not isinstance(header, dict) or header.get("server_id") != server_id:
+            continue
+        checkpoint_file.unlink(missing_ok=True)
+        removed += 1
+
+    if removed:
+        logger.info(f"체크포인트 {removed}개 삭제: {server_id}")
+    return removed
+
+
+__all__ = [
+    "CHECKPOINT_VERSION",
+    "DEFAULT_CHECKPOINT_DIR",
+    "ScanCheckpoint",
+    "discard_checkpoints",
+]
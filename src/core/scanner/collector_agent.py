@@ -0,0 +1,240 @@
+"""원격 수집 에이전트
+
+규칙 명령어를 내장한 Python 표준 라이브러리 스크립트를 대상 서버에 한 번 업로드하고,
+스캔할 때마다 에이전트가 서버에서 명령어를 병렬 실행한 뒤
+zlib 압축 JSON 번들 하나로 출력과 종료 코드를 돌려줍니다.
+
+업로드한 에이전트는 스크립트 내용의 해시로 이름을 붙여
+($HOME/.cache/bluepy/agent-<해시>.py) 규칙 세트가 바뀔 때만 다시 업로드합니다.
+
+실행 순서:
+    1. run_command() 실행 (stdin: 실행할 명령어 요청)
+    2. 에이전트가 없으면 AGENT_MISSING 출력 → upload_command()로 업로드 후 1 재시도
+    3. parse_output()으로 번들 해제
+
+요청 형식 (stdin JSON):
+    {"workers": 8, "commands": [내장 명령어 인덱스 또는 명령어 문자열, ...]}
+
+출력 형식 (stdout 한 줄):
+    <AGENT_MARKER> <base64(zlib(JSON {"results": [[종료 코드, stdout], ...]}))>
+
+주요 기능:
+- 규칙 세트별 결정적 스크립트 생성 (같은 규칙이면 같은 해시)
+- 내장되지 않은 명령어(스냅샷 수집 명령어 등)는 요청에 직접 포함
+- 명령어는 bash가 있으면 bash로 실행 (배치 수집, 명령어별 실행과 같은 셸 문법)
+- 명령어별 타임아웃 (시간을 넘기면 파이프라인의 프로세스 그룹 전체를 종료)
+- python3가 없거나 에이전트 실행에 실패하면 CollectorAgentError
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import shlex
+import zlib
+from typing import Dict, Iterable, List, Union
+
+from .command_batch import BatchOutput
+
+logger = logging.getLogger(__name__)
+
+# 에이전트 결과 번들 줄 접두어
+AGENT_MARKER = "BLUEPY-AGENT"
+
+# 대상 서버에 에이전트가 없을 때 run_command()의 출력
+AGENT_MISSING = "BLUEPY-AGENT-MISSING"
+
+# 대상 서버에 python3가 없을 때 run_command()의 출력
+AGENT_NO_PYTHON = "BLUEPY-AGENT-NOPYTHON"
+
+# 에이전트를 저장할 원격 디렉토리 (sh에서 확장)
+AGENT_DIR = '"${HOME:-/tmp}/.cache/bluepy"'
+
+# 에이전트 스크립트 (Python 3 표준 라이브러리만 사용)
+AGENT_TEMPLATE = """\
+import base64
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+MARKER = "__MARKER__"
+COMMANDS = json.loads(__COMMANDS__)
+TIMEOUT = __TIMEOUT__
+SHELL = shutil.which("bash")
+
+
+def run(command):
+    try:
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            executable=SHELL,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return [127, ""]
+    try:
+        stdout, _ = process.communicate(timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        # 파이프라인의 자식 프로세스가 stdout을 잡고 있으므로 프로세스 그룹 전체 종료
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        stdout, _ = process.communicate()
+    return [process.returncode, stdout.decode("utf-8", "replace")]
+
+
+def main():
+    request = json.loads(sys.stdin.read())
+    commands = [COMMANDS[entry] if isinstance(entry, int) else entry for entry in request["commands"]]
+    with ThreadPoolExecutor(max_workers=max(1, int(request.get("workers", 8)))) as pool:
+        results = list(pool.map(run, commands))
+    bundle = zlib.compress(json.dumps({"results": results}).encode("utf-8"), 6)
+    sys.stdout.write(MARKER + " " + base64.b64encode(bundle).decode("ascii") + "\\n")
+
+
+main()
+"""
+
+
+class CollectorAgentError(Exception):
+    """수집 에이전트 예외"""
+
+    pass
+
+
+class AgentNotInstalledError(CollectorAgentError):
+    """대상 서버에 이 규칙 세트의 에이전트가 없음 (업로드 필요)"""
+
+    pass
+
+
+class CollectorAgent:
+    """규칙 세트별 수집 에이전트
+
+    사용 예시:
+        >>> agent = CollectorAgent(["cat /etc/passwd", "ls -l /etc/shadow"])
+        >>> commands = ["ls -l /etc/shadow"]
+        >>> request = agent.build_request(commands)
+        >>> output = await ssh_client.execute(agent.run_command(), input=request)
+        >>> try:
+        ...     outputs = agent.parse_output(output, commands)
+        ... except AgentNotInstalledError:
+        ...     await ssh_client.execute(agent.upload_command(), input=agent.script)
+        ...     output = await ssh_client.execute(agent.run_command(), input=request)
+        ...     outputs = agent.parse_output(output, commands)
+        >>> outputs["ls -l /etc/shadow"].stdout
+    """
+
+    def __init__(self, commands: Iterable[str], command_timeout: int = 120):
+        """초기화
+
+        Args:
+            commands: 에이전트에 내장할 명령어 (규칙 세트 전체, 중복은 한 번만)
+            command_timeout: 에이전트가 명령어 1개에 허용하는 시간 (초, 기본: 120)
+        """
+        self.commands: List[str] = list(dict.fromkeys(commands))
+        self._index = {command: index for index, command in enumerate(self.commands)}
+
+        self.script = (
+            AGENT_TEMPLATE.replace("__MARKER__", AGENT_MARKER)
+            .replace("__COMMANDS__", repr(json.dumps(self.commands, ensure_ascii=False)))
+            .replace("__TIMEOUT__", str(command_timeout))
+        )
+        self.digest = hashlib.sha256(self.script.encode("utf-8")).hexdigest()[:16]
+        self.filename = f"agent-{self.digest}.py"
+
+    def run_command(self) -> str:
+        """에이전트 실행 명령어 (에이전트나 python3가 없으면 안내 문자열 출력)"""
+        script = (
+            f"f={AGENT_DIR}/{self.filename}; "
+            f'[ -f "$f" ] || {{ echo {AGENT_MISSING}; exit 0; }}; '
+            f"command -v python3 >/dev/null 2>&1 || {{ echo {AGENT_NO_PYTHON}; exit 0; }}; "
+            'exec python3 "$f"'
+        )
+        return f"sh -c {shlex.quote(script)}"
+
+    def upload_command(self) -> str:
+        """에이전트 업로드 명령어 (stdin: self.script, 이전 규칙 세트의 에이전트는 삭제)"""
+        script = (
+            f'd={AGENT_DIR}; f="$d/{self.filename}"; '
+            'mkdir -p "$d" && cat > "$f.$$" && mv "$f.$$" "$f" && '
+            'for o in "$d"/agent-*.py; do [ "$o" = "$f" ] || rm -f "$o"; done'
+        )
+        return f"sh -c {shlex.quote(script)}"
+
+    def build_request(self, commands: Iterable[str], workers: int = 8) -> str:
+        """에이전트 요청 생성
+
+        Args:
+            commands: 실행할 명령어 (내장된 명령어는 인덱스로 전달)
+            workers: 에이전트의 동시 실행 수
+
+        Returns:
+            요청 JSON (run_command()의 stdin)
+        """
+        entries: List[Union[int, str]] = [
+            self._index.get(command, command) for command in dict.fromkeys(commands)
+        ]
+        return json.dumps({"workers": workers, "commands": entries}, ensure_ascii=False)
+
+    def parse_output(self, output: str, commands: Iterable[str]) -> Dict[str, BatchOutput]:
+        """에이전트 번들을 명령어별로 분리
+
+        Args:
+            output: run_command() 출력
+            commands: build_request()에 전달한 명령어 (같은 순서)
+
+        Returns:
+            명령어 -> BatchOutput 딕셔너리
+
+        Raises:
+            AgentNotInstalledError: 대상 서버에 에이전트가 없는 경우
+            CollectorAgentError: python3가 없거나 번들을 해제할 수 없는 경우
+        """
+        requested = list(dict.fromkeys(commands))
+
+        for line in output.splitlines():
+            if line == AGENT_MISSING:
+                raise AgentNotInstalledError(f"에이전트가 설치되지 않았습니다: {self.filename}")
+            if line == AGENT_NO_PYTHON:
+                raise CollectorAgentError("대상 서버에 python3가 없습니다")
+            if not line.startswith(AGENT_MARKER + " "):
+                continue
+
+            try:
+                bundle = zlib.decompress(base64.b64decode(line[len(AGENT_MARKER) + 1 :]))
+                results = json.loads(bundle.decode("utf-8"))["results"]
+            except (ValueError, KeyError, TypeError, zlib.error) as e:
+                raise CollectorAgentError(f"에이전트 번들 해제 실패: {e}")
+
+            if len(results) != len(requested):
+                raise CollectorAgentError(
+                    f"에이전트 결과 수 불일치: 요청 {len(requested)}개, 결과 {len(results)}개"
+                )
+
+            return {
+                command: BatchOutput(stdout=stdout, exit_code=exit_code)
+                for command, (exit_code, stdout) in zip(requested, results)
+            }
+
+        raise CollectorAgentError(
+            f"에이전트 출력에서 결과 번들을 찾을 수 없습니다: {output[:100]!r}"
+        )
+
+
+__all__ = [
+    "AGENT_MARKER",
+    "CollectorAgentError",
+    "AgentNotInstalledError",
+    "CollectorAgent",
+]
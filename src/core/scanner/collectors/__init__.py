@@ -0,0 +1,24 @@
+"""Snapshot collector 모듈
+
+원격 시스템 상태를 스캔당 한 번 수집하여
+여러 규칙의 점검 명령어 출력을 로컬에서 재현합니다.
+
+주요 모듈:
+- base: SnapshotCollector 추상 클래스
+- process: 프로세스 테이블 스냅샷 (ps | grep 규칙)
+- registry: 레지스트리 스냅샷 (Windows Get-ItemProperty 규칙)
+- account_policy: 계정 정책 스냅샷 (Windows net accounts 규칙)
+"""
+
+from .base import SnapshotCollector
+from .process import ProcessEntry, ProcessSnapshotCollector
+from .registry import RegistryCollector
+from .account_policy import AccountPolicyCollector
+
+__all__ = [
+    "SnapshotCollector",
+    "ProcessEntry",
+    "ProcessSnapshotCollector",
+    "RegistryCollector",
+    "AccountPolicyCollector",
+]
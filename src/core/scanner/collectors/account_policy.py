@@ -0,0 +1,145 @@
+"""계정 정책 스냅샷 수집기
+
+`net accounts | findstr "<문자열>"` 형태의 Windows 계정 정책 점검 명령어를
+`net accounts` 1회 출력으로 로컬에서 재현합니다.
+
+장점:
+- 규칙마다 net accounts를 실행하지 않음 (W-04..W-07 → 1회)
+- 정책 항목을 딕셔너리(항목 이름 → 값)로 파싱하여 get_int()로 제공
+
+findstr 동작:
+    따옴표 안의 공백으로 구분된 단어 중 하나라도 포함된 줄을 출력합니다
+    (대소문자 구분, /I 등의 옵션을 사용한 명령어는 원격 실행).
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+from .base import SnapshotCollector
+
+logger = logging.getLogger(__name__)
+
+# 계정 정책 스냅샷 명령어
+NET_ACCOUNTS_COMMAND = "net accounts"
+
+# net accounts | findstr "<문자열>" (옵션 없는 형태만)
+_FINDSTR_RE = re.compile(
+    r"""^net\s+accounts\s*\|\s*findstr\s+(?:"(?P<quoted>[^"]+)"|(?P<bare>[^\s"/][^\s"]*))\s*$""",
+    re.IGNORECASE,
+)
+
+# 정책 항목 줄 ("Minimum password length:            8")
+_POLICY_LINE_RE = re.compile(r"^(?P<label>[^:]+?)\s*:\s+(?P<value>.*?)\s*$")
+
+# findstr 정규식 메타 문자 (포함되면 로컬 재현하지 않음)
+_FINDSTR_META_CHARS = set(".*^$[]\\")
+
+
+def parse_findstr_command(command: str) -> Optional[List[str]]:
+    """net accounts | findstr 명령어에서 검색 단어 추출
+
+    Args:
+        command: 규칙 점검 명령어
+
+    Returns:
+        검색 단어 목록 (재현할 수 없는 명령어면 None)
+    """
+    match = _FINDSTR_RE.match(command.strip())
+    if match is None:
+        return None
+
+    pattern = match.group("quoted") or match.group("bare")
+    if _FINDSTR_META_CHARS & set(pattern):
+        return None
+
+    words = pattern.split()
+    return words or None
+
+
+def parse_net_accounts(output: str) -> Dict[str, str]:
+    """net accounts 출력을 항목 이름 → 값 딕셔너리로 파싱
+
+    Args:
+        output: net accounts 출력
+
+    Returns:
+        {"Minimum password length": "8", "Maximum password age (days)": "90", ...}
+    """
+    policies: Dict[str, str] = {}
+    for line in output.splitlines():
+        match = _POLICY_LINE_RE.match(line)
+        if match:
+            policies[match.group("label")] = match.group("value")
+    return policies
+
+
+class AccountPolicyCollector(SnapshotCollector):
+    """계정 정책 스냅샷 수집기
+
+    사용 예시:
+        >>> collector = AccountPolicyCollector()
+        >>> collector.claims('net accounts | findstr "Lockout threshold"')
+        True
+        >>> collector.load(await execute(collector.build_command([...])))
+        >>> collector.get_int("Lockout threshold")
+        5
+    """
+
+    name = "account_policy"
+
+    def __init__(self):
+        """초기화"""
+        self.policies: Dict[str, str] = {}
+        self._lines: List[str] = []
+        self._loaded = False
+
+    def claims(self, command: str) -> bool:
+        return parse_findstr_command(command) is not None
+
+    def build_command(self, commands: List[str]) -> str:
+        return NET_ACCOUNTS_COMMAND
+
+    def load(self, output: str) -> None:
+        policies = parse_net_accounts(output)
+        if not policies:
+            raise ValueError("net accounts 출력을 해석할 수 없습니다")
+
+        self.policies = policies
+        self._lines = output.splitlines()
+        self._loaded = True
+        logger.debug(f"계정 정책 스냅샷: {len(self.policies)}개 항목")
+
+    def get(self, label: str) -> Optional[str]:
+        """정책 값 조회 (항목 이름은 대소문자 구분 없음, 없으면 None)"""
+        for key, value in self.policies.items():
+            if key.lower() == label.lower():
+                return value
+        return None
+
+    def get_int(self, label: str) -> Optional[int]:
+        """정책 값을 정수로 조회 ("Never", "None" 등 숫자가 아니면 None)"""
+        value = self.get(label)
+        if value is None:
+            return None
+        match = re.search(r"\d+", value)
+        return int(match.group()) if match else None
+
+    def render(self, command: str) -> Optional[str]:
+        if not self._loaded:
+            return None
+
+        words = parse_findstr_command(command)
+        if words is None:
+            return None
+
+        matched = [line for line in self._lines if any(word in line for word in words)]
+        return "".join(f"{line}\r\n" for line in matched)
+
+
+__all__ = [
+    "NET_ACCOUNTS_COMMAND",
+    "parse_findstr_command",
+    "parse_net_accounts",
+    "AccountPolicyCollector",
+]
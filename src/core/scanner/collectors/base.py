@@ -0,0 +1,72 @@
+"""SnapshotCollector 추상 클래스
+
+원격 시스템 상태를 스캔당 한 번 수집(스냅샷)하고,
+여러 규칙의 점검 명령어 출력을 로컬에서 재현하는 수집기의 인터페이스입니다.
+
+동작 순서 (스캐너가 호출):
+1. claims(): 로드된 규칙 명령어 중 수집기가 대신 처리할 명령어 선택
+2. build_command(): 스냅샷을 수집할 원격 명령어 1개 생성
+3. load(): 원격 명령어 출력을 구조화된 스냅샷으로 파싱
+4. render(): 스냅샷으로 원래 명령어의 출력을 재현 (None이면 원격 실행)
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class SnapshotCollector(ABC):
+    """스냅샷 수집기 기본 클래스
+
+    Attributes:
+        name: 수집기 이름 (로그용)
+    """
+
+    name: str = "snapshot"
+
+    @abstractmethod
+    def claims(self, command: str) -> bool:
+        """수집기가 처리할 수 있는 명령어인지 확인
+
+        Args:
+            command: 규칙 점검 명령어
+
+        Returns:
+            스냅샷으로 출력을 재현할 수 있으면 True
+        """
+        pass
+
+    @abstractmethod
+    def build_command(self, commands: List[str]) -> str:
+        """스냅샷 수집용 원격 명령어 생성
+
+        Args:
+            commands: claims()가 True인 명령어 목록
+
+        Returns:
+            원격에서 실행할 명령어
+        """
+        pass
+
+    @abstractmethod
+    def load(self, output: str) -> None:
+        """스냅샷 명령어 출력 파싱
+
+        Args:
+            output: build_command() 명령어의 출력 (stdout)
+        """
+        pass
+
+    @abstractmethod
+    def render(self, command: str) -> Optional[str]:
+        """스냅샷으로 명령어 출력 재현
+
+        Args:
+            command: 규칙 점검 명령어
+
+        Returns:
+            재현한 출력 (재현할 수 없으면 None → 원격 실행)
+        """
+        pass
+
+
+__all__ = ["SnapshotCollector"]
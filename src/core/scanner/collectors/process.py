@@ -0,0 +1,269 @@
+"""프로세스 테이블 스냅샷 수집기
+
+`ps -ef | grep X | grep -v grep` 형태의 점검 명령어를
+스캔당 한 번 수집한 `ps -ef` 출력으로 로컬에서 평가합니다.
+
+장점:
+- 규칙마다 원격 ps/grep 프로세스를 띄우지 않음
+- 모든 프로세스 점검 규칙이 같은 시점의 프로세스 테이블을 사용
+- 프로세스 정보를 타입이 있는 ProcessEntry 레코드로도 제공 (find())
+
+validator는 원격 실행과 같은 텍스트 출력(render())을 그대로 사용하므로
+스냅샷 사용 여부와 관계없이 같은 판정을 합니다.
+
+원격 실행과 같은 출력을 보장하기 위해 다음 조건의 파이프라인만 처리합니다:
+- ps 단계가 스냅샷과 같은 `ps -ef` (출력 열 형식이 동일)
+- `grep -v grep` 단계가 있어 원격 실행 시에도 grep 프로세스 자신이 출력되지 않음
+
+`ps -ef | grep X`처럼 grep 자신의 줄이 출력에 포함되는 명령어는 원격 실행합니다.
+"""
+
+import logging
+import re
+import shlex
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .base import SnapshotCollector
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 수집 명령어 (규칙의 ps 단계와 같은 명령어, 출력을 그대로 grep 평가에 사용)
+PS_SNAPSHOT_COMMAND = "ps -ef"
+
+# ps -ef 출력 열 수 (UID PID PPID C STIME TTY TIME CMD)
+PS_EF_FIELDS = 8
+
+# 지원하는 grep 옵션
+SUPPORTED_GREP_FLAGS = {"-v", "-E", "-i", "-w"}
+
+
+@dataclass(frozen=True)
+class ProcessEntry:
+    """프로세스 테이블 항목
+
+    Attributes:
+        pid: 프로세스 ID
+        ppid: 부모 프로세스 ID
+        user: 실행 사용자
+        args: 전체 명령줄
+    """
+
+    pid: int
+    ppid: int
+    user: str
+    args: str
+
+    @property
+    def argv(self) -> List[str]:
+        """명령줄 인자 리스트 (공백 기준 분리)"""
+        return self.args.split()
+
+    @property
+    def command(self) -> str:
+        """실행 파일 이름 (경로 제외)"""
+        argv = self.argv
+        return argv[0].rsplit("/", 1)[-1] if argv else ""
+
+
+@dataclass(frozen=True)
+class GrepFilter:
+    """파이프라인의 grep 단계 1개
+
+    Attributes:
+        pattern: 컴파일된 정규식
+        invert: -v 여부
+    """
+
+    pattern: "re.Pattern[str]"
+    invert: bool
+
+    def matches(self, line: str) -> bool:
+        return bool(self.pattern.search(line)) != self.invert
+
+
+def bre_to_python(pattern: str) -> str:
+    r"""POSIX 기본 정규식(BRE)을 Python 정규식으로 변환
+
+    BRE에서는 `| ( ) { } + ?`가 리터럴이고 `\|`, `\(` 등이 메타 문자입니다.
+
+    Args:
+        pattern: grep BRE 패턴
+
+    Returns:
+        Python re 패턴
+    """
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            result.append(nxt if nxt in "|(){}+?" else "\\" + nxt)
+            i += 2
+            continue
+        result.append("\\" + char if char in "|(){}+?" else char)
+        i += 1
+    return "".join(result)
+
+
+def parse_ps_pipeline(command: str) -> Optional[List[GrepFilter]]:
+    """`ps -ef | grep ... | grep -v grep` 파이프라인 파싱
+
+    Args:
+        command: 점검 명령어
+
+    Returns:
+        grep 단계 리스트 (지원하지 않는 형태이거나, 원격 실행 시 grep 프로세스
+        자신이 출력에 남아 스냅샷과 결과가 달라지는 경우 None)
+    """
+    if "ps" not in command or "|" not in command:
+        return None
+
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+
+    stages: List[List[str]] = [[]]
+    for token in tokens:
+        if token == "|":
+            stages.append([])
+        else:
+            stages[-1].append(token)
+
+    ps_stage, grep_stages = stages[0], stages[1:]
+    if not ps_stage or ps_stage[0] != "ps" or not grep_stages:
+        return None
+    if ps_stage != PS_SNAPSHOT_COMMAND.split():
+        return None
+
+    filters: List[GrepFilter] = []
+    for stage in grep_stages:
+        parsed = _parse_grep_stage(stage)
+        if parsed is None:
+            return None
+        filters.append(parsed)
+
+    # 원격 실행 결과와 같으려면 파이프라인이 grep 자신의 줄을 제외해야 함
+    if not any(f.invert and f.pattern.search("grep") for f in filters):
+        return None
+
+    return filters
+
+
+def _parse_grep_stage(stage: List[str]) -> Optional[GrepFilter]:
+    """grep/egrep 단계 1개 파싱 (지원하지 않으면 None)"""
+    if not stage or stage[0] not in ("grep", "egrep"):
+        return None
+
+    flags = [token for token in stage[1:] if token.startswith("-")]
+    operands = [token for token in stage[1:] if not token.startswith("-")]
+    if len(operands) != 1 or not set(flags) <= SUPPORTED_GREP_FLAGS:
+        return None
+
+    extended = stage[0] == "egrep" or "-E" in flags
+    pattern = operands[0] if extended else bre_to_python(operands[0])
+    if "-w" in flags:
+        pattern = rf"\b(?:{pattern})\b"
+
+    try:
+        compiled = re.compile(pattern, re.IGNORECASE if "-i" in flags else 0)
+    except re.error:
+        return None
+
+    return GrepFilter(pattern=compiled, invert="-v" in flags)
+
+
+def parse_ps_output(output: str) -> List[ProcessEntry]:
+    """`ps -ef` 출력 파싱 (헤더 및 형식이 다른 줄은 무시)
+
+    Args:
+        output: ps -ef 출력
+
+    Returns:
+        ProcessEntry 리스트
+    """
+    entries: List[ProcessEntry] = []
+    for line in output.splitlines():
+        parts = line.split(None, PS_EF_FIELDS - 1)
+        if len(parts) < PS_EF_FIELDS:
+            continue
+        try:
+            pid, ppid = int(parts[1]), int(parts[2])
+        except ValueError:
+            continue
+        entries.append(ProcessEntry(pid=pid, ppid=ppid, user=parts[0], args=parts[-1]))
+    return entries
+
+
+class ProcessSnapshotCollector(SnapshotCollector):
+    """프로세스 테이블 스냅샷 수집기
+
+    사용 예시:
+        >>> collector = ProcessSnapshotCollector()
+        >>> collector.claims('ps -ef | grep sendmail | grep -v "grep"')
+        True
+        >>> collector.load(await execute(collector.build_command([...])))
+        >>> [entry.pid for entry in collector.find("^sendmail")]
+        [812]
+    """
+
+    name = "process"
+
+    def __init__(self):
+        """초기화"""
+        self.processes: List[ProcessEntry] = []
+
+        # ps -ef 원본 출력 줄 (grep 평가 대상, 원격 실행과 같은 출력 재현)
+        self._lines: List[str] = []
+        self._loaded = False
+
+    def claims(self, command: str) -> bool:
+        return parse_ps_pipeline(command) is not None
+
+    def build_command(self, commands: List[str]) -> str:
+        return PS_SNAPSHOT_COMMAND
+
+    def load(self, output: str) -> None:
+        self.processes = parse_ps_output(output)
+        self._lines = [line for line in output.splitlines() if line]
+        self._loaded = True
+        logger.debug(f"프로세스 스냅샷: {len(self.processes)}개 프로세스")
+
+    def find(self, pattern: str, extended: bool = True) -> List[ProcessEntry]:
+        """명령줄(args)이 패턴과 일치하는 프로세스 조회
+
+        Args:
+            pattern: 정규식 패턴
+            extended: True면 ERE(Python re), False면 grep BRE로 해석
+
+        Returns:
+            일치하는 ProcessEntry 리스트
+        """
+        compiled = re.compile(pattern if extended else bre_to_python(pattern))
+        return [entry for entry in self.processes if compiled.search(entry.args)]
+
+    def render(self, command: str) -> Optional[str]:
+        if not self._loaded:
+            return None
+
+        filters = parse_ps_pipeline(command)
+        if filters is None:
+            return None
+
+        lines = self._lines
+        for grep_filter in filters:
+            lines = [line for line in lines if grep_filter.matches(line)]
+
+        return "".join(f"{line}\n" for line in lines)
+
+
+__all__ = [
+    "PS_SNAPSHOT_COMMAND",
+    "ProcessEntry",
+    "bre_to_python",
+    "parse_ps_pipeline",
+    "parse_ps_output",
+    "ProcessSnapshotCollector",
+]
@@ -0,0 +1,131 @@
+"""레지스트리 스냅샷 수집기
+
+`Get-ItemProperty -Path "<키>" -Name "<값>" | Select-Object -ExpandProperty <값>` 형태의
+Windows 레지스트리 점검 명령어를 키 단위 일괄 조회 1회로 수집한 값으로 로컬에서 재현합니다.
+
+장점:
+- 같은 키의 여러 값(예: HKLM:\\System\\CurrentControlSet\\Control\\Lsa)을 키마다 한 번만 조회
+- 규칙마다 PowerShell을 실행하지 않음 (값 수십 개 → 스크립트 1회)
+- 값 형식(DWord, String 등)이 있는 RegistryValue 레코드로 제공
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from ....infrastructure.network.winrm_client import (
+    RegistryPair,
+    RegistryValue,
+    build_registry_script,
+    normalize_registry_pair,
+    parse_registry_output,
+)
+from .base import SnapshotCollector
+
+logger = logging.getLogger(__name__)
+
+# Get-ItemProperty 단일 값 조회 명령어
+_GET_ITEM_PROPERTY_RE = re.compile(
+    r"""^Get-ItemProperty\s+-Path\s+(?P<q1>["'])(?P<path>[^"'`$]+)(?P=q1)"""
+    r"""\s+-Name\s+(?P<q2>["'])(?P<name>[^"'`$]+)(?P=q2)"""
+    r"""(?:\s+-ErrorAction\s+SilentlyContinue)?"""
+    r"""\s*\|\s*Select-Object\s+-ExpandProperty\s+(?P<prop>[\w.-]+)\s*$""",
+    re.IGNORECASE,
+)
+
+# -Path는 와일드카드를 확장하므로 포함되면 원격 실행
+_WILDCARD_CHARS = set("*?[]")
+
+
+def parse_registry_command(command: str) -> Optional[RegistryPair]:
+    """Get-ItemProperty 명령어에서 (키 경로, 값 이름) 추출
+
+    Args:
+        command: 규칙 점검 명령어
+
+    Returns:
+        (키 경로, 값 이름) (재현할 수 없는 명령어면 None)
+    """
+    match = _GET_ITEM_PROPERTY_RE.match(command.strip())
+    if match is None:
+        return None
+
+    path, name = match.group("path"), match.group("name")
+    if match.group("prop").lower() != name.lower() or _WILDCARD_CHARS & set(path):
+        return None
+    return (path, name)
+
+
+class RegistryCollector(SnapshotCollector):
+    """레지스트리 스냅샷 수집기 (스캔 단위 레지스트리 캐시)
+
+    사용 예시:
+        >>> collector = RegistryCollector()
+        >>> command = collector.build_command([
+        ...     'Get-ItemProperty -Path "HKLM:\\...\\Lsa" -Name "NoLMHash" | '
+        ...     'Select-Object -ExpandProperty NoLMHash'
+        ... ])
+        >>> collector.load(await execute(command))
+        >>> collector.get("HKLM:\\...\\Lsa", "NoLMHash").value
+        1
+    """
+
+    name = "registry"
+
+    def __init__(self):
+        """초기화"""
+        self.values: Dict[RegistryPair, RegistryValue] = {}
+        # 조회를 마친 (키 경로, 값 이름) (값이 없는 경우 포함)
+        self._fetched: Set[RegistryPair] = set()
+        self._requested: List[RegistryPair] = []
+
+    def claims(self, command: str) -> bool:
+        return parse_registry_command(command) is not None
+
+    def build_command(self, commands: List[str]) -> str:
+        pairs = [parse_registry_command(command) for command in commands]
+        self._requested = list(dict.fromkeys(pair for pair in pairs if pair is not None))
+        return build_registry_script(self._requested)
+
+    def load(self, output: str) -> None:
+        self.add(parse_registry_output(output), self._requested)
+        logger.debug(f"레지스트리 스냅샷: {len(self.values)}/{len(self._requested)}개 값")
+
+    def add(
+        self,
+        values: Dict[RegistryPair, Optional[RegistryValue]],
+        pairs: Iterable[RegistryPair],
+    ) -> None:
+        """조회 결과 등록
+
+        Args:
+            values: 조회 결과 (None이거나 없으면 존재하지 않는 값)
+            pairs: 조회한 (키 경로, 값 이름) 목록
+        """
+        for value in values.values():
+            if value is not None:
+                self.values[normalize_registry_pair(value.path, value.name)] = value
+        self._fetched.update(normalize_registry_pair(*pair) for pair in pairs)
+
+    def is_fetched(self, path: str, name: str) -> bool:
+        """이번 스캔에서 이미 조회한 값인지 확인"""
+        return normalize_registry_pair(path, name) in self._fetched
+
+    def get(self, path: str, name: str) -> Optional[RegistryValue]:
+        """레지스트리 값 조회 (키 경로와 값 이름은 대소문자 구분 없음, 없으면 None)"""
+        return self.values.get(normalize_registry_pair(path, name))
+
+    def render(self, command: str) -> Optional[str]:
+        pair = parse_registry_command(command)
+        if pair is None or not self.is_fetched(*pair):
+            return None
+
+        value = self.get(*pair)
+        # 키나 값이 없으면 Get-ItemProperty는 stderr에만 출력
+        return value.to_output() if value else ""
+
+
+__all__ = [
+    "parse_registry_command",
+    "RegistryCollector",
+]
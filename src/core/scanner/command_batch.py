@@ -0,0 +1,174 @@
+"""명령어 배치 수집기
+
+여러 점검 명령어를 하나의 원격 셸 스크립트로 묶어
+SSH 세션 1개로 실행하고, 출력을 명령어별로 다시 분리합니다.
+
+명령어마다 세션 채널과 원격 셸을 새로 여는 대신
+왕복(round trip) 1회로 전체 규칙의 출력을 수집합니다.
+
+출력 형식 (명령어마다 섹션 1개, 길이 접두 프레임):
+    <marker> <index> <exit_code> <byte_length>\\n
+    <byte_length 바이트의 stdout>
+
+주요 기능:
+- 중복 명령어 제거 (입력 순서 유지)
+- POSIX sh 스크립트 생성 (stdin으로 전달, bash가 있으면 `bash -s`로 실행)
+- 프레임 파싱 및 종료 코드 수집
+
+실행 셸:
+    규칙 명령어는 명령어별 실행 시 원격 로그인 셸(대부분 bash)에서 실행되므로,
+    배치도 bash가 있으면 bash로 실행합니다. `/bin/sh`가 dash인 서버에서도
+    `[[ ]]`, `$'..'`, 프로세스 치환 같은 bash 문법이 명령어별 실행과 같게 동작합니다.
+    bash가 없는 서버(일부 BSD, 임베디드 시스템)에서만 `sh -s`로 실행합니다.
+"""
+
+import hashlib
+import logging
+import shlex
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# 배치 스크립트를 실행할 원격 명령어 (스크립트는 stdin으로 전달)
+# 로그인 셸 종류(bash, zsh, csh 등)와 무관하도록 sh -c로 감싸고, bash가 있으면 bash로 실행
+BATCH_SHELL = "sh -c 'command -v bash >/dev/null 2>&1 && exec bash -s; exec sh -s'"
+
+
+class CommandBatchError(Exception):
+    """명령어 배치 예외"""
+
+    pass
+
+
+@dataclass
+class BatchOutput:
+    """배치 내 단일 명령어 실행 결과
+
+    Attributes:
+        stdout: 명령어 출력 (stdout)
+        exit_code: 종료 코드
+    """
+
+    stdout: str
+    exit_code: int
+
+
+class CommandBatch:
+    """명령어 배치
+
+    사용 예시:
+        >>> batch = CommandBatch(["cat /etc/passwd", "ls -l /etc/shadow"])
+        >>> script = batch.build_script()
+        >>> output = await ssh_client.execute(BATCH_SHELL, input=script)
+        >>> outputs = batch.parse_output(output)
+        >>> outputs["cat /etc/passwd"].stdout
+    """
+
+    def __init__(self, commands: Iterable[str]):
+        """초기화
+
+        Args:
+            commands: 실행할 명령어 목록 (중복은 한 번만 실행)
+        """
+        self.commands: List[str] = list(dict.fromkeys(commands))
+
+        # 같은 명령어 집합이면 같은 marker (스크립트가 결정적이도록)
+        digest = hashlib.sha1("\n".join(self.commands).encode("utf-8")).hexdigest()
+        self.marker = f"BLUEPY-BATCH-{digest[:16]}"
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def build_script(self) -> str:
+        """원격 셸 스크립트 생성
+
+        각 명령어는 서브셸에서 실행되며, stdout은 임시 파일에 저장된 뒤
+        헤더(marker, index, 종료 코드, 바이트 길이)와 함께 출력됩니다.
+        stderr는 버립니다 (기존 명령어별 실행과 동일하게 stdout만 사용).
+
+        Returns:
+            셸 스크립트 (POSIX sh 문법, BATCH_SHELL에서 bash 또는 sh로 실행)
+        """
+        lines = [
+            't=$(mktemp 2>/dev/null || echo "/tmp/.bluepy_batch.$$")',
+            "trap 'rm -f \"$t\"' EXIT",
+            "bluepy_run() {",
+            '    ( eval "$2" ) >"$t" 2>/dev/null </dev/null',
+            "    rc=$?",
+            f"    printf '%s %s %s %s\\n' '{self.marker}' \"$1\" \"$rc\" "
+            '"$(wc -c <"$t" | tr -d \' \')"',
+            '    cat "$t"',
+            "}",
+        ]
+
+        for index, command in enumerate(self.commands):
+            lines.append(f"bluepy_run {index} {shlex.quote(command)}")
+
+        return "\n".join(lines) + "\n"
+
+    def parse_output(self, output: str) -> Dict[str, BatchOutput]:
+        """배치 출력을 명령어별로 분리
+
+        프레임이 깨진 경우 다음 marker를 찾아 재동기화하며,
+        결과가 없는 명령어는 반환 딕셔너리에 포함되지 않습니다.
+
+        Args:
+            output: 배치 스크립트 출력 (stdout)
+
+        Returns:
+            명령어 -> BatchOutput 딕셔너리
+
+        Raises:
+            CommandBatchError: marker를 하나도 찾지 못한 경우
+        """
+        data = output.encode("utf-8")
+        marker = self.marker.encode("ascii") + b" "
+        results: Dict[str, BatchOutput] = {}
+
+        pos = data.find(marker)
+        if pos < 0 and self.commands:
+            raise CommandBatchError("배치 출력에서 결과 섹션을 찾을 수 없습니다")
+
+        while 0 <= pos < len(data):
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                break
+
+            header = data[pos:newline].split(b" ")
+            try:
+                if len(header) != 4 or header[0] + b" " != marker:
+                    raise ValueError(header)
+                index, exit_code, size = int(header[1]), int(header[2]), int(header[3])
+                command = self.commands[index]
+            except (ValueError, IndexError):
+                logger.warning(f"배치 출력 헤더 파싱 실패: {data[pos:newline][:100]!r}")
+                pos = data.find(marker, pos + 1)
+                continue
+
+            start = newline + 1
+            end = start + size
+            if end > len(data):
+                logger.warning(f"배치 출력이 잘렸습니다: {command[:50]}...")
+                break
+
+            results[command] = BatchOutput(
+                stdout=data[start:end].decode("utf-8", errors="replace"),
+                exit_code=exit_code,
+            )
+
+            pos = end if data.startswith(marker, end) else data.find(marker, end)
+
+        missing = len(self.commands) - len(results)
+        if missing:
+            logger.warning(f"배치 결과 누락: {missing}개 명령어")
+
+        return results
+
+
+__all__ = [
+    "BATCH_SHELL",
+    "CommandBatchError",
+    "BatchOutput",
+    "CommandBatch",
+]
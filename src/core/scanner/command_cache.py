@@ -0,0 +1,169 @@
+"""스캔 단위 명령어 결과 캐시
+
+여러 규칙이 바이트 단위로 같은 명령어를 실행하는 경우
+(예: `cat /etc/inetd.conf`, `ps -ef | grep sendmail | grep -v "grep"`)
+원격 실행을 한 번만 수행하고 결과를 공유합니다.
+
+주요 기능:
+- 정규화된 명령어 문자열 기준 캐싱
+- 동시 요청 병합 (같은 명령어는 실행 중인 작업 1개를 함께 대기)
+- 절약한 원격 실행 횟수 통계
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_command(command: str) -> str:
+    """명령어 문자열 정규화
+
+    앞뒤 공백을 제거하고, 따옴표 밖의 연속 공백을 하나로 합칩니다.
+    따옴표 안의 공백은 명령어 의미에 영향을 주므로 그대로 둡니다.
+
+    Args:
+        command: 명령어 문자열
+
+    Returns:
+        정규화된 명령어
+
+    Examples:
+        >>> normalize_command("  cat   /etc/passwd ")
+        'cat /etc/passwd'
+        >>> normalize_command('grep "a  b"   file')
+        'grep "a  b" file'
+    """
+    result = []
+    quote = None
+    pending_space = False
+
+    for char in command.strip():
+        if quote:
+            result.append(char)
+            if char == quote:
+                quote = None
+        elif char.isspace():
+            pending_space = True
+        else:
+            if pending_space:
+                result.append(" ")
+                pending_space = False
+            if char in ("'", '"'):
+                quote = char
+            result.append(char)
+
+    return "".join(result)
+
+
+class CommandCache:
+    """스캔 단위 명령어 결과 캐시
+
+    실패한 실행은 캐시하지 않으므로, 이후 같은 명령어 요청은 다시 실행됩니다.
+
+    사용 예시:
+        >>> cache = CommandCache()
+        >>> output = await cache.get_or_execute("cat /etc/passwd", scanner.execute_command)
+        >>> cache.saved_executions
+        0
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._results: Dict[str, str] = {}
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self.executions = 0
+        self.saved_executions = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, command: str) -> bool:
+        return normalize_command(command) in self._results
+
+    def prime(self, command: str, output: str) -> None:
+        """이미 수집된 결과 등록 (배치 수집 등)
+
+        Args:
+            command: 명령어
+            output: 명령어 출력 (stdout)
+        """
+        self._results[normalize_command(command)] = output
+
+    def get(self, command: str) -> Optional[str]:
+        """캐시된 결과 조회 (없으면 None)"""
+        return self._results.get(normalize_command(command))
+
+    async def get_or_execute(self, command: str, execute: Callable[[str], Awaitable[str]]) -> str:
+        """캐시된 결과 반환, 없으면 실행 후 저장
+
+        같은 명령어가 이미 실행 중이면 새로 실행하지 않고 그 결과를 기다립니다.
+
+        Args:
+            command: 실행할 명령어
+            execute: 명령어 실행 함수 (예: scanner.execute_command)
+
+        Returns:
+            명령어 출력 (stdout)
+
+        Raises:
+            Exception: execute가 발생시킨 예외 (대기 중인 요청에도 전달)
+        """
+        key = normalize_command(command)
+
+        if key in self._results:
+            self.saved_executions += 1
+            return self._results[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.saved_executions += 1
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self.executions += 1
+
+        try:
+            output = await execute(command)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._results[key] = output
+            future.set_result(output)
+            return output
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화 (새 스캔 시작 시)"""
+        self._results.clear()
+        self._inflight.clear()
+        self.executions = 0
+        self.saved_executions = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계
+
+        Returns:
+            {"entries": 캐시 항목 수, "executions": 실제 원격 실행 수,
+             "saved": 절약한 원격 실행 수}
+        """
+        return {
+            "entries": len(self._results),
+            "executions": self.executions,
+            "saved": self.saved_executions,
+        }
+
+
+__all__ = [
+    "normalize_command",
+    "CommandCache",
+]
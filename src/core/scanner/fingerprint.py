@@ -0,0 +1,335 @@
+"""증분 스캔 지문 수집 및 저장소
+
+규칙이 depends_on으로 선언한 입력(파일, 패키지, 서비스)의 지문을
+원격 명령어 1회로 수집하고, 이전 스캔의 지문과 비교하여
+입력이 바뀌지 않은 규칙은 이전 CheckResult를 재사용합니다.
+
+지문 키:
+    file:<경로>        Unix: 모드|UID|GID|크기|mtime|ctime|inode
+                       Windows: LastWriteTimeUtc|크기
+    package:<이름>     설치 버전 (rpm, dpkg, pkgutil / Windows 설치 프로그램 목록)
+    service:<이름>     상태와 시작 유형 (systemd, launchd / Windows 서비스)
+    없는 입력은 "missing"
+
+출력 형식 (marker 이후 한 줄에 입력 1개):
+    BLUEPY-FINGERPRINT
+    <키>\\t<지문>
+
+주요 기능:
+- 지문 수집 스크립트 생성 (POSIX sh, PowerShell)
+- 지문 출력 파싱
+- 규칙 정의 지문 (명령어, validator, depends_on이 바뀌면 재실행)
+- FingerprintStore: 서버별 규칙 지문과 결과를 JSON 파일로 저장
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shlex
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..domain.models import CheckResult, RuleMetadata, Status
+
+logger = logging.getLogger(__name__)
+
+# 지문 출력 시작 표시
+FINGERPRINT_MARKER = "BLUEPY-FINGERPRINT"
+
+# 없는 입력의 지문
+MISSING = "missing"
+
+# 저장소 파일 형식 버전
+STORE_VERSION = 1
+
+_UNIX_FUNCTIONS = [
+    "fp_file() {",
+    "  v=$(stat -c '%f|%u|%g|%s|%Y|%Z|%i' -- \"$1\" 2>/dev/null"
+    " || stat -f '%Xp|%u|%g|%z|%m|%c|%i' -- \"$1\" 2>/dev/null) || v=missing",
+    '  printf \'file:%s\\t%s\\n\' "$1" "$v"',
+    "}",
+    "fp_package() {",
+    "  v=$(rpm -q --qf '%{VERSION}-%{RELEASE}' \"$1\" 2>/dev/null)"
+    " || v=$(dpkg-query -W -f='${Version}' \"$1\" 2>/dev/null)"
+    " || v=$(pkgutil --pkg-info \"$1\" 2>/dev/null | sed -n 's/^version: //p')",
+    '  [ -n "$v" ] || v=missing',
+    '  printf \'package:%s\\t%s\\n\' "$1" "$v"',
+    "}",
+    "fp_service() {",
+    "  v=$(systemctl show -p LoadState -p ActiveState -p UnitFileState"
+    " -p ExecMainStartTimestamp \"$1\" 2>/dev/null | tr '\\n' '|')",
+    '  [ -n "$v" ] || v=$(launchctl list "$1" 2>/dev/null'
+    " | grep -E '\"PID\"|LastExitStatus' | tr -d ' \\t\\n;')",
+    '  [ -n "$v" ] || v=missing',
+    '  printf \'service:%s\\t%s\\n\' "$1" "$v"',
+    "}",
+]
+
+_WINDOWS_FUNCTIONS = [
+    "$ProgressPreference = 'SilentlyContinue'",
+    "function fp_file([string]$Path) {",
+    "    $item = Get-Item -LiteralPath $Path -Force -ErrorAction SilentlyContinue",
+    '    if ($item) { $v = "$($item.LastWriteTimeUtc.Ticks)|$($item.Length)" }'
+    " else { $v = 'missing' }",
+    '    Write-Output "file:$Path`t$v"',
+    "}",
+    "function fp_package([string]$Name) {",
+    "    $keys = 'HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',"
+    " 'HKLM:\\Software\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*'",
+    "    $app = Get-ItemProperty -Path $keys -ErrorAction SilentlyContinue"
+    " | Where-Object { $_.DisplayName -eq $Name } | Select-Object -First 1",
+    "    if ($app) { $v = [string]$app.DisplayVersion } else { $v = 'missing' }",
+    '    Write-Output "package:$Name`t$v"',
+    "}",
+    "function fp_service([string]$Name) {",
+    "    $svc = Get-Service -Name $Name -ErrorAction SilentlyContinue",
+    "    if ($svc) { $v = \"$($svc.Status)|$($svc.StartType)\" } else { $v = 'missing' }",
+    '    Write-Output "service:$Name`t$v"',
+    "}",
+]
+
+
+def _split_key(key: str):
+    kind, _, name = key.partition(":")
+    if kind not in ("file", "package", "service") or not name:
+        raise ValueError(f"올바르지 않은 지문 키: {key}")
+    return kind, name
+
+
+def build_unix_fingerprint_script(keys: Iterable[str]) -> str:
+    """Unix 지문 수집 스크립트 생성 (POSIX sh)
+
+    Args:
+        keys: 지문 키 목록 ("file:/etc/passwd", "package:openssh-server", ...)
+
+    Returns:
+        셸 스크립트
+    """
+    lines = list(_UNIX_FUNCTIONS)
+    lines.append(f"echo '{FINGERPRINT_MARKER}'")
+    for key in dict.fromkeys(keys):
+        kind, name = _split_key(key)
+        lines.append(f"fp_{kind} {shlex.quote(name)}")
+    return "\n".join(lines) + "\n"
+
+
+def build_windows_fingerprint_script(keys: Iterable[str]) -> str:
+    """Windows 지문 수집 스크립트 생성 (PowerShell)
+
+    Args:
+        keys: 지문 키 목록 ("file:C:\\Windows\\win.ini", "service:Spooler", ...)
+
+    Returns:
+        PowerShell 스크립트
+    """
+    lines = list(_WINDOWS_FUNCTIONS)
+    lines.append(f"Write-Output '{FINGERPRINT_MARKER}'")
+    for key in dict.fromkeys(keys):
+        kind, name = _split_key(key)
+        quoted = "'" + name.replace("'", "''") + "'"
+        lines.append(f"fp_{kind} {quoted}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_fingerprint_output(output: str) -> Dict[str, str]:
+    """지문 출력 파싱
+
+    Args:
+        output: 지문 수집 스크립트 출력
+
+    Returns:
+        키 -> 지문 딕셔너리
+
+    Raises:
+        ValueError: marker가 없는 경우
+    """
+    lines = output.splitlines()
+    try:
+        start = next(i for i, line in enumerate(lines) if line.strip() == FINGERPRINT_MARKER)
+    except StopIteration:
+        raise ValueError("지문 출력에서 결과 섹션을 찾을 수 없습니다")
+
+    fingerprints: Dict[str, str] = {}
+    for line in lines[start + 1 :]:
+        key, sep, value = line.rstrip("\r").partition("\t")
+        if sep:
+            fingerprints[key] = value.strip()
+    return fingerprints
+
+
+def rule_digest(rule: RuleMetadata) -> str:
+    """규칙 정의 지문 (명령어, validator, depends_on이 바뀌면 달라짐)"""
+    payload = json.dumps(
+        {
+            "commands": rule.commands,
+            "validator": rule.validator,
+            "depends_on": rule.depends_on.model_dump() if rule.depends_on else None,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _result_to_dict(result: CheckResult) -> Dict[str, Any]:
+    return {
+        "status": result.status.value,
+        "message": result.message,
+        "details": result.details,
+        "timestamp": result.timestamp.isoformat(),
+    }
+
+
+def _result_from_dict(data: Dict[str, Any]) -> CheckResult:
+    return CheckResult(
+        status=Status(data["status"]),
+        message=data["message"],
+        details=data.get("details"),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+class FingerprintStore:
+    """증분 스캔 저장소 (서버별 규칙 지문과 점검 결과)
+
+    JSON 파일 형식:
+        {"version": 1, "servers": {"<server_id>": {"<rule_id>": {
+            "digest": "...", "fingerprints": {"file:/etc/passwd": "..."}, "result": {...}
+        }}}}
+
+    사용 예시:
+        >>> store = FingerprintStore("data/scan_state/fingerprints.json")
+        >>> scanner.set_fingerprint_store(store)
+        >>> result = await scanner.scan_all()  # 입력이 바뀐 규칙만 실행, 종료 시 저장
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """초기화
+
+        Args:
+            path: JSON 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.path = Path(path) if path else None
+        self._servers: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._loaded = False
+
+    def load(self) -> None:
+        """파일에서 불러오기 (없거나 손상된 파일은 빈 저장소로 시작)"""
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != STORE_VERSION:
+                logger.info(f"지문 저장소 형식이 달라 초기화합니다: {self.path}")
+                return
+            self._servers = data.get("servers", {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"지문 저장소 로드 실패, 전체 스캔으로 대체: {self.path}, {e}")
+            self._servers = {}
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def get(
+        self, server_id: str, rule: RuleMetadata, fingerprints: Dict[str, str]
+    ) -> Optional[CheckResult]:
+        """입력이 바뀌지 않은 규칙의 이전 결과 조회
+
+        Args:
+            server_id: 서버 식별자
+            rule: 점검 규칙 (depends_on 필요)
+            fingerprints: 이번 스캔에서 수집한 지문
+
+        Returns:
+            이전 CheckResult (규칙 정의나 입력 지문이 다르면 None)
+        """
+        self._ensure_loaded()
+        if rule.depends_on is None:
+            return None
+
+        entry = self._servers.get(server_id, {}).get(rule.id)
+        if not entry or entry.get("digest") != rule_digest(rule):
+            return None
+
+        keys = rule.depends_on.keys()
+        if any(key not in fingerprints for key in keys):
+            return None
+        if any(entry.get("fingerprints", {}).get(key) != fingerprints[key] for key in keys):
+            return None
+
+        try:
+            return _result_from_dict(entry["result"])
+        except (KeyError, ValueError, TypeError):
+            return None
+
+    def put(
+        self,
+        server_id: str,
+        rule: RuleMetadata,
+        fingerprints: Dict[str, str],
+        result: CheckResult,
+    ) -> None:
+        """규칙 실행 결과와 입력 지문 저장 (save() 전까지 메모리에만 반영)"""
+        self._ensure_loaded()
+        if rule.depends_on is None:
+            return
+
+        keys = rule.depends_on.keys()
+        if any(key not in fingerprints for key in keys):
+            return
+
+        self._servers.setdefault(server_id, {})[rule.id] = {
+            "digest": rule_digest(rule),
+            "fingerprints": {key: fingerprints[key] for key in keys},
+            "result": _result_to_dict(result),
+        }
+
+    def forget(self, server_id: str) -> None:
+        """서버의 저장된 결과 삭제 (다음 스캔은 전체 실행)"""
+        self._ensure_loaded()
+        self._servers.pop(server_id, None)
+
+    def save(self) -> None:
+        """파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if self.path is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            {"version": STORE_VERSION, "servers": self._servers},
+            ensure_ascii=False,
+            default=str,
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".fingerprints-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def collect_dependency_keys(rules: Iterable[RuleMetadata]) -> List[str]:
+    """규칙들의 지문 키 목록 (중복 제거, 순서 유지)"""
+    return list(
+        dict.fromkeys(key for rule in rules if rule.depends_on for key in rule.depends_on.keys())
+    )
+
+
+__all__ = [
+    "FINGERPRINT_MARKER",
+    "MISSING",
+    "build_unix_fingerprint_script",
+    "build_windows_fingerprint_script",
+    "parse_fingerprint_output",
+    "rule_digest",
+    "collect_dependency_keys",
+    "FingerprintStore",
+]
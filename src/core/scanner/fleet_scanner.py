@@ -0,0 +1,286 @@
+"""Fleet 스캐너
+
+여러 서버를 하나의 asyncio 이벤트 루프에서 동시에 스캔합니다.
+
+주요 기능:
+- 전체 동시 연결 수 제한 (global connection cap)
+- 호스트당 동시 채널 수 제한 (BaseScanner.max_concurrency)
+- 호스트별 타임아웃 (느린 서버가 전체 스캔을 막지 않음)
+- 완료 순서대로 결과 스트림 제공 (scan_iter)
+- 플랫폼별 규칙은 공유 RuleCatalog에서 조회 (서버마다 같은 규칙 객체 사용)
+- 증분 스캔 저장소 공유 (입력이 바뀌지 않은 규칙은 이전 결과 재사용)
+- 규칙 실행 시간 저장소 공유 (호스트별 느린 규칙부터 실행)
+- Linux/macOS 수집 에이전트 모드 (서버에서 병렬 실행 후 압축 번들 1개 반환)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional
+
+from ..domain.models import RuleMetadata
+from .base_scanner import BaseScanner, ScanResult
+from .fingerprint import FingerprintStore
+from .rule_timing import RuleTimingStore
+from .linux_scanner import LinuxScanner
+from .macos_scanner import MacOSScanner
+from .rule_catalog import get_rule_catalog
+from .unix_scanner import UnixScanner
+from .windows_scanner import WindowsScanner
+
+logger = logging.getLogger(__name__)
+
+# Server 행의 포트가 SSH 기본값인 Windows 서버에 사용할 WinRM 포트
+DEFAULT_WINRM_PORT = 5986
+
+# 패스워드 조회 함수 (Server -> 패스워드, 키 인증이면 None)
+PasswordProvider = Callable[[Any], Optional[str]]
+
+# 스캐너 생성 함수 (Server, 패스워드, 호스트당 채널 수 -> BaseScanner)
+ScannerFactory = Callable[[Any, Optional[str], int], BaseScanner]
+
+
+@dataclass
+class FleetScanOutcome:
+    """서버 1대의 스캔 결과
+
+    Attributes:
+        server: 스캔 대상 Server (ServerRepository 조회 결과)
+        server_id: 서버 식별자
+        result: 스캔 결과 (실패 시 None)
+        error: 오류 메시지 (성공 시 None)
+        duration: 소요 시간 (초, 연결 대기 제외)
+    """
+
+    server: Any
+    server_id: str
+    result: Optional[ScanResult] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """스캔 성공 여부"""
+        return self.result is not None
+
+
+def create_scanner(server: Any, password: Optional[str], max_concurrency: int) -> BaseScanner:
+    """Server 행으로 플랫폼별 스캐너 생성 (기본 ScannerFactory)
+
+    Args:
+        server: Server 모델 (host, port, username, auth_method, key_path, platform)
+        password: 패스워드 (키 인증이면 None)
+        max_concurrency: 호스트당 동시 채널 수
+
+    Returns:
+        BaseScanner 하위 클래스 인스턴스
+
+    Raises:
+        ValueError: 지원하지 않는 플랫폼
+    """
+    server_id = str(server.id)
+    key_filename = server.key_path if server.auth_method == "key" else None
+
+    if server.platform == "linux":
+        return LinuxScanner(
+            server_id=server_id,
+            host=server.host,
+            username=server.username,
+            password=password,
+            key_filename=key_filename,
+            port=server.port,
+            max_concurrency=max_concurrency,
+        )
+    if server.platform == "macos":
+        return MacOSScanner(
+            server_id=server_id,
+            host=server.host,
+            username=server.username,
+            password=password,
+            key_filename=key_filename,
+            port=server.port,
+            max_concurrency=max_concurrency,
+        )
+    if server.platform == "windows":
+        return WindowsScanner(
+            server_id=server_id,
+            host=server.host,
+            username=server.username,
+            password=password or "",
+            port=DEFAULT_WINRM_PORT if server.port == 22 else server.port,
+            max_concurrency=max_concurrency,
+        )
+
+    raise ValueError(f"지원하지 않는 플랫폼입니다: {server.platform}")
+
+
+class FleetScanner:
+    """여러 서버 동시 스캔
+
+    사용 예시:
+        >>> servers = ServerRepository(session).get_all()
+        >>> fleet = FleetScanner(
+        ...     servers,
+        ...     password_provider=lambda server: keyring.get_password("bluepy", server.name),
+        ...     max_connections=50,
+        ... )
+        >>> async for outcome in fleet.scan_iter():
+        ...     print(outcome.server_id, outcome.result.score if outcome.succeeded else outcome.error)
+
+    동시성:
+        - max_connections: 동시에 열려 있는 서버 연결 수 상한 (전체)
+        - max_channels_per_host: 서버 1대에서 동시에 실행할 규칙 수
+        - host_timeout: 연결부터 스캔 완료까지 서버 1대에 허용하는 시간
+    """
+
+    def __init__(
+        self,
+        servers: Iterable[Any],
+        rules_dir: str = "config/rules",
+        max_connections: int = 32,
+        max_channels_per_host: int = 4,
+        host_timeout: Optional[float] = 600.0,
+        password_provider: Optional[PasswordProvider] = None,
+        scanner_factory: Optional[ScannerFactory] = None,
+        fingerprint_store: Optional[FingerprintStore] = None,
+        timing_store: Optional[RuleTimingStore] = None,
+        agent_mode: bool = False,
+    ):
+        """초기화
+
+        Args:
+            servers: 스캔 대상 Server 목록 (ServerRepository 조회 결과)
+            rules_dir: 규칙 디렉토리
+            max_connections: 전체 동시 연결 수 (기본: 32)
+            max_channels_per_host: 호스트당 동시 채널 수 (기본: 4)
+            host_timeout: 호스트별 타임아웃 (초, None이면 무제한)
+            password_provider: Server -> 패스워드 조회 함수 (기본: 패스워드 없음)
+            scanner_factory: 스캐너 생성 함수 (기본: create_scanner)
+            fingerprint_store: 증분 스캔 저장소 (기본: None, 항상 전체 실행)
+            timing_store: 규칙 실행 시간 저장소 (기본: None, 규칙 순서대로 실행)
+            agent_mode: Linux/macOS 서버에 수집 에이전트 사용 (기본: False)
+
+        Raises:
+            ValueError: 동시성 설정이 1 미만인 경우
+        """
+        if max_connections < 1:
+            raise ValueError(f"max_connections는 1 이상이어야 합니다: {max_connections}")
+        if max_channels_per_host < 1:
+            raise ValueError(
+                f"max_channels_per_host는 1 이상이어야 합니다: {max_channels_per_host}"
+            )
+
+        self.servers = list(servers)
+        self.rules_dir = rules_dir
+        self.max_connections = max_connections
+        self.max_channels_per_host = max_channels_per_host
+        self.host_timeout = host_timeout
+        self._password_provider = password_provider or (lambda server: None)
+        self._scanner_factory = scanner_factory or create_scanner
+        self.fingerprint_store = fingerprint_store
+        self.timing_store = timing_store
+        self.agent_mode = agent_mode
+
+    async def scan_iter(self) -> AsyncIterator[FleetScanOutcome]:
+        """전체 서버 스캔 (완료 순서대로 결과 반환)
+
+        서버 1대의 실패(연결 실패, 타임아웃 등)는 해당 FleetScanOutcome.error로
+        전달되며 다른 서버의 스캔에 영향을 주지 않습니다.
+
+        Yields:
+            FleetScanOutcome
+        """
+        tasks = self._start_tasks()
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 중단하면 남은 스캔 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def scan_all(self) -> List[FleetScanOutcome]:
+        """전체 서버 스캔
+
+        Returns:
+            FleetScanOutcome 리스트 (servers와 같은 순서)
+        """
+        return list(await asyncio.gather(*self._start_tasks()))
+
+    def _start_tasks(self) -> List["asyncio.Task[FleetScanOutcome]"]:
+        """서버별 스캔 작업 시작 (모든 작업이 전체 연결 수 Semaphore 공유)"""
+        connection_slots = asyncio.Semaphore(self.max_connections)
+
+        return [
+            asyncio.create_task(self._scan_server(server, connection_slots))
+            for server in self.servers
+        ]
+
+    async def _scan_server(
+        self, server: Any, connection_slots: asyncio.Semaphore
+    ) -> FleetScanOutcome:
+        """서버 1대 스캔 (연결 슬롯 획득 후 호스트 타임아웃 적용)"""
+        outcome = FleetScanOutcome(server=server, server_id=str(server.id))
+
+        async with connection_slots:
+            started = time.monotonic()
+            try:
+                outcome.result = await asyncio.wait_for(
+                    self._run_scanner(server), timeout=self.host_timeout
+                )
+            except asyncio.TimeoutError:
+                outcome.error = f"타임아웃 ({self.host_timeout}초 초과)"
+            except Exception as e:
+                outcome.error = str(e) or type(e).__name__
+            finally:
+                outcome.duration = time.monotonic() - started
+
+        if outcome.error:
+            logger.warning(f"서버 스캔 실패: {server.host} ({outcome.server_id}), {outcome.error}")
+        else:
+            logger.info(
+                f"서버 스캔 완료: {server.host} ({outcome.server_id}), "
+                f"{outcome.result.score:.1f}점, {outcome.duration:.1f}초"
+            )
+
+        return outcome
+
+    async def _run_scanner(self, server: Any) -> ScanResult:
+        """스캐너 생성, 연결, 스캔, 연결 해제"""
+        scanner = self._scanner_factory(
+            server, self._password_provider(server), self.max_channels_per_host
+        )
+        scanner.set_rules(self._get_rules(scanner.platform))
+        if self.fingerprint_store is not None:
+            scanner.set_fingerprint_store(self.fingerprint_store)
+        if self.timing_store is not None:
+            scanner.set_timing_store(self.timing_store)
+        if self.agent_mode and isinstance(scanner, UnixScanner):
+            scanner.agent_mode = True
+
+        await scanner.connect()
+        try:
+            return await scanner.scan_all()
+        finally:
+            await scanner.disconnect()
+
+    def _get_rules(self, platform: str) -> List[RuleMetadata]:
+        """플랫폼 규칙 조회 (프로세스 공유 RuleCatalog, 서버마다 같은 규칙 객체 사용)
+
+        Raises:
+            ValueError: 규칙 로드 실패
+        """
+        try:
+            return get_rule_catalog(self.rules_dir).rules(platform)
+        except Exception as e:
+            raise ValueError(f"규칙 로드 실패: {e}")
+
+
+__all__ = [
+    "FleetScanOutcome",
+    "FleetScanner",
+    "create_scanner",
+]
@@ -6,6 +6,7 @@ UnixScanner를 상속하여 Linux 전용 설정을 제공합니다.
 
 from typing import Optional
 
+from ...infrastructure.network.ssh_pool import SSHConnectionPool
 from .unix_scanner import UnixScanner
 
 
@@ -27,6 +28,11 @@ class LinuxScanner(UnixScanner):
         >>> result = await scanner.scan_all()
         >>> print(f"점수: {result.score}/100")
         >>> await scanner.disconnect()
+
+    로컬 머신 점검 (SSH 없이 실행):
+        >>> scanner = LinuxScanner(
+        ...     server_id="localhost", host="localhost", username="", local=True
+        ... )
     """
 
     def __init__(
@@ -37,6 +43,12 @@ class LinuxScanner(UnixScanner):
         password: Optional[str] = None,
         key_filename: Optional[str] = None,
         port: int = 22,
+        max_concurrency: int = 1,
+        batch_mode: bool = False,
+        snapshot_collectors: bool = False,
+        pool: Optional[SSHConnectionPool] = None,
+        local: bool = False,
+        agent_mode: bool = False,
     ):
         """초기화
 
@@ -47,6 +59,12 @@ class LinuxScanner(UnixScanner):
             password: SSH 패스워드 (선택)
             key_filename: SSH 키 파일 경로 (선택)
             port: SSH 포트 (기본: 22)
+            max_concurrency: 호스트당 동시 SSH 채널 수 (기본: 1, 순차 실행)
+            batch_mode: 명령어 배치 수집 사용 여부 (기본: False)
+            snapshot_collectors: 스냅샷 수집기 사용 여부 (기본: False)
+            pool: SSH 연결 풀 (선택)
+            local: 로컬 머신 점검 여부 (기본: False, True이면 SSH 없이 직접 실행)
+            agent_mode: 수집 에이전트 사용 여부 (기본: False)
         """
         # UnixScanner 초기화 (platform="linux" 고정)
         super().__init__(
@@ -57,6 +75,12 @@ class LinuxScanner(UnixScanner):
             password=password,
             key_filename=key_filename,
             port=port,
+            max_concurrency=max_concurrency,
+            batch_mode=batch_mode,
+            snapshot_collectors=snapshot_collectors,
+            pool=pool,
+            local=local,
+            agent_mode=agent_mode,
         )
 
 
@@ -0,0 +1,194 @@
+"""PowerShell 명령어 배치 수집기
+
+여러 Windows 점검 명령어를 하나의 PowerShell 스크립트로 묶어
+WinRM 왕복 1회로 실행하고, 결과를 명령어별로 다시 분리합니다.
+
+각 명령어는 try/catch 안에서 실행되므로 한 명령어의 오류(파싱 오류 포함)가
+다른 명령어의 실행을 막지 않습니다. 스크립트는 마지막에 JSON 문서 1개를 출력합니다.
+
+출력 형식:
+    <marker>\\n
+    {"<rule_id>:<index>": {"stdout": "...", "exit_code": 0, "error": "..."}, ...}
+
+주요 기능:
+- 중복 명령어 제거 (처음 등장한 규칙/인덱스를 키로 사용)
+- 명령줄 길이 제한에 맞춘 스크립트 분할 (split)
+- JSON 결과 파싱 및 종료 코드 수집
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from .command_batch import BatchOutput, CommandBatchError
+
+logger = logging.getLogger(__name__)
+
+# 스크립트 1개의 최대 길이 (문자)
+# -EncodedCommand 인자는 UTF-16LE + Base64로 약 2.7배 커지며,
+# Windows 명령줄은 32767자로 제한되므로 여유를 두고 분할합니다.
+MAX_SCRIPT_CHARS = 8000
+
+# 명령어 출력 문자열 변환 폭 (개별 실행보다 좁으면 긴 값이 잘리므로 넓게 설정)
+OUTPUT_WIDTH = 4096
+
+_SCRIPT_HEADER = [
+    "$ProgressPreference = 'SilentlyContinue'",
+    "$bluepy = @{}",
+    "function Invoke-BluepyCommand([string]$Key, [string]$Encoded) {",
+    "    try {",
+    "        $text = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($Encoded))",
+    "        $global:LASTEXITCODE = 0",
+    "        $out = & ([ScriptBlock]::Create($text)) 2>$null | "
+    f"Out-String -Width {OUTPUT_WIDTH}",
+    "        $bluepy[$Key] = @{ stdout = [string]$out; exit_code = [int]$LASTEXITCODE }",
+    "    } catch {",
+    "        $bluepy[$Key] = @{ stdout = ''; exit_code = 1; error = $_.Exception.Message }",
+    "    }",
+    "}",
+]
+
+
+class PowerShellBatch:
+    """PowerShell 명령어 배치
+
+    사용 예시:
+        >>> batch = PowerShellBatch([("W-01:0", "Get-LocalUser"), ("W-02:0", "net accounts")])
+        >>> for chunk in batch.split():
+        ...     output = await winrm_client.execute_powershell(chunk.build_script())
+        ...     outputs = chunk.parse_output(output)
+        >>> outputs["net accounts"].stdout
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """초기화
+
+        Args:
+            entries: (키, 명령어) 목록. 키는 "<rule_id>:<명령어 인덱스>" 형식
+                (같은 명령어는 처음 등장한 키로 한 번만 실행)
+        """
+        self.entries: Dict[str, str] = {}
+        seen = set()
+        for key, command in entries:
+            if command in seen:
+                continue
+            seen.add(command)
+            self.entries[key] = command
+
+        # 같은 명령어 집합이면 같은 marker (스크립트가 결정적이도록)
+        digest = hashlib.sha1(
+            "\n".join(f"{key}={command}" for key, command in self.entries.items()).encode("utf-8")
+        ).hexdigest()
+        self.marker = f"BLUEPY-PS-BATCH-{digest[:16]}"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def commands(self) -> List[str]:
+        """실행할 명령어 목록 (중복 제거, 순서 유지)"""
+        return list(self.entries.values())
+
+    def split(self, max_chars: int = MAX_SCRIPT_CHARS) -> List["PowerShellBatch"]:
+        """스크립트 길이 제한에 맞게 배치 분할
+
+        한 명령어만으로 제한을 넘으면 해당 명령어만 담은 배치를 만듭니다.
+
+        Args:
+            max_chars: 스크립트 1개의 최대 길이 (문자)
+
+        Returns:
+            PowerShellBatch 리스트 (비어 있으면 빈 리스트)
+        """
+        base = len(self._build_script([]))
+        chunks: List[List[Tuple[str, str]]] = []
+        size = base
+
+        for key, command in self.entries.items():
+            line = len(self._command_line(key, command)) + 1
+            if not chunks or (size + line > max_chars and len(chunks[-1]) > 0):
+                chunks.append([])
+                size = base
+            chunks[-1].append((key, command))
+            size += line
+
+        return [PowerShellBatch(chunk) for chunk in chunks]
+
+    def build_script(self) -> str:
+        """PowerShell 스크립트 생성
+
+        명령어는 UTF-8 Base64 문자열로 포함되어 따옴표 이스케이프 문제가 없으며,
+        [ScriptBlock]::Create()로 try 안에서 실행됩니다.
+        stderr는 버립니다 (개별 실행과 동일하게 stdout만 사용).
+
+        Returns:
+            PowerShell 스크립트
+        """
+        return self._build_script(list(self.entries.items()))
+
+    def _build_script(self, entries: List[Tuple[str, str]]) -> str:
+        """지정한 (키, 명령어) 목록으로 스크립트 생성 (이 배치의 marker 사용)"""
+        lines = list(_SCRIPT_HEADER)
+        lines.extend(self._command_line(key, command) for key, command in entries)
+        lines.append(f"Write-Output '{self.marker}'")
+        lines.append("ConvertTo-Json -InputObject $bluepy -Compress -Depth 3")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _command_line(key: str, command: str) -> str:
+        """명령어 1개 실행 줄"""
+        encoded = base64.b64encode(command.encode("utf-8")).decode("ascii")
+        return f"Invoke-BluepyCommand '{key}' '{encoded}'"
+
+    def parse_output(self, output: str) -> Dict[str, BatchOutput]:
+        """배치 출력을 명령어별로 분리
+
+        결과가 없는 명령어는 반환 딕셔너리에 포함되지 않습니다.
+
+        Args:
+            output: 배치 스크립트 출력 (stdout)
+
+        Returns:
+            명령어 -> BatchOutput 딕셔너리
+
+        Raises:
+            CommandBatchError: marker가 없거나 JSON 파싱에 실패한 경우
+        """
+        pos = output.rfind(self.marker)
+        if pos < 0:
+            raise CommandBatchError("배치 출력에서 결과 섹션을 찾을 수 없습니다")
+
+        try:
+            document = json.loads(output[pos + len(self.marker) :].strip() or "{}")
+        except json.JSONDecodeError as e:
+            raise CommandBatchError(f"배치 결과 JSON 파싱 실패: {e}")
+        if not isinstance(document, dict):
+            raise CommandBatchError(f"배치 결과 형식 오류: {type(document).__name__}")
+
+        results: Dict[str, BatchOutput] = {}
+        for key, command in self.entries.items():
+            value = document.get(key)
+            if not isinstance(value, dict):
+                continue
+
+            if value.get("error"):
+                logger.debug(f"배치 명령어 오류 ({key}): {str(value['error'])[:200]}")
+
+            results[command] = BatchOutput(
+                stdout=value.get("stdout") or "",
+                exit_code=int(value.get("exit_code") or 0),
+            )
+
+        missing = len(self.entries) - len(results)
+        if missing:
+            logger.warning(f"배치 결과 누락: {missing}개 명령어")
+
+        return results
+
+
+__all__ = [
+    "MAX_SCRIPT_CHARS",
+    "PowerShellBatch",
+]
@@ -0,0 +1,71 @@
+"""캡처 재생 스캐너
+
+캡처 파일(ScanCapture)로 네트워크 없이 스캔을 다시 실행하는 스캐너를 생성합니다.
+validator나 점수 계산이 바뀐 뒤 과거 스캔 출력으로 결과를 다시 계산하거나,
+원격 지연 없이 스캔 파이프라인 전체의 성능을 측정할 때 사용합니다.
+"""
+
+from ...infrastructure.network.capture import ReplayExecutor, ScanCapture
+from .base_scanner import BaseScanner
+from .linux_scanner import LinuxScanner
+from .macos_scanner import MacOSScanner
+from .windows_scanner import WindowsScanner
+
+
+def create_replay_scanner(
+    capture: ScanCapture, latency_scale: float = 0.0, max_concurrency: int = 1
+) -> BaseScanner:
+    """캡처를 재생하는 플랫폼별 스캐너 생성
+
+    기록 당시의 수집 옵션(capture.options)을 그대로 사용하므로 같은 명령어가 실행됩니다.
+
+    사용 예시:
+        >>> scanner = create_replay_scanner(ScanCapture.load("data/captures/server-001.bpcap"))
+        >>> await scanner.connect()
+        >>> await scanner.load_rules("config/rules")
+        >>> result = await scanner.scan_all()
+
+    Args:
+        capture: 재생할 캡처
+        latency_scale: 기록된 소요 시간에 곱해 대기할 비율 (기본: 0, 대기 없음)
+        max_concurrency: 동시에 실행할 최대 규칙 수 (기본: 1)
+
+    Returns:
+        ReplayExecutor를 사용하는 BaseScanner 하위 클래스 인스턴스
+
+    Raises:
+        ValueError: 지원하지 않는 플랫폼
+    """
+    options = dict(capture.options)
+
+    if capture.platform in ("linux", "macos"):
+        scanner_class = LinuxScanner if capture.platform == "linux" else MacOSScanner
+        scanner = scanner_class(
+            server_id=capture.server_id,
+            host="replay",
+            username="",
+            max_concurrency=max_concurrency,
+            batch_mode=options.get("batch_mode", False),
+            agent_mode=options.get("agent_mode", False),
+            snapshot_collectors=options.get("snapshot_collectors", False),
+        )
+    elif capture.platform == "windows":
+        scanner = WindowsScanner(
+            server_id=capture.server_id,
+            host="replay",
+            username="",
+            password="",
+            max_concurrency=max_concurrency,
+            batch_mode=options.get("batch_mode", False),
+            snapshot_collectors=options.get("snapshot_collectors", True),
+        )
+    else:
+        raise ValueError(f"지원하지 않는 플랫폼입니다: {capture.platform}")
+
+    scanner.set_executor(ReplayExecutor(capture, latency_scale=latency_scale))
+    return scanner
+
+
+__all__ = [
+    "create_replay_scanner",
+]
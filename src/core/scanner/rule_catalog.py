@@ -0,0 +1,450 @@
+"""규칙 카탈로그 (프로세스 전역 규칙 저장소)
+
+플랫폼별 규칙을 프로세스에서 한 번만 로드하여 스캐너, 자동 수정 Worker,
+결과 뷰가 같은 RuleMetadata 객체를 공유합니다.
+
+주요 기능:
+- 플랫폼별 1회 로드 (스레드 안전)
+- 규칙 id 조회 O(1)
+- 보조 인덱스: 카테고리, 심각도, 플랫폼, 자동 수정 가능 여부
+- platforms 필드 반영: 다른 플랫폼 디렉토리의 공유 규칙(예: macOS와 공유하는
+  Linux 규칙)은 복사하지 않고 같은 객체를 두 플랫폼 목록에 포함
+- validator는 플랫폼 규칙을 처음 사용할 때 등록 (BaseScanner.set_rules()),
+  사용하지 않는 플랫폼의 validator 모듈은 import하지 않음
+- 증분 갱신 (refresh): 바뀐 규칙 파일만 다시 파싱하여 인덱스를 한 번에 교체
+
+카탈로그는 규칙 디렉토리마다 하나씩 존재합니다 (get_rule_catalog()).
+규칙 파일을 수정한 뒤에는 refresh()로 바뀐 파일만 반영하거나 reload()로 전체를 다시 로드합니다.
+인덱스는 교체만 하고 변경하지 않으므로, 스캔 시작 시 rules()로 받은 목록은
+스캔이 끝날 때까지 같은 규칙 집합을 유지합니다.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..domain.models import RuleMetadata, Severity
+from .rule_loader import RuleLoaderError, convert_yaml_to_metadata, load_rules, load_yaml_file
+from .validator_table import get_validator_table
+
+logger = logging.getLogger(__name__)
+
+# 규칙 디렉토리 하위의 플랫폼 디렉토리
+PLATFORMS = ("linux", "macos", "windows")
+
+# 규칙 파일 확장자
+RULE_FILE_SUFFIXES = (".yaml", ".yml")
+
+# 규칙 파일 지문 (mtime_ns, 크기)
+FileSignature = Tuple[int, int]
+
+
+@dataclass
+class RuleChanges:
+    """refresh() 결과 (바뀐 규칙 id)
+
+    Attributes:
+        added: 추가된 규칙 id
+        modified: 정의가 바뀐 규칙 id
+        removed: 삭제된 규칙 id
+        errors: 파일 이름 -> 오류 메시지 (파싱 실패 파일은 이전 규칙 유지)
+    """
+
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def changed_ids(self) -> List[str]:
+        """추가, 수정, 삭제된 규칙 id (정렬)"""
+        return sorted(set(self.added) | set(self.modified) | set(self.removed))
+
+
+class _CatalogIndex:
+    """카탈로그 인덱스 (생성 후 변경하지 않음, 갱신 시 새 인덱스로 교체)"""
+
+    def __init__(
+        self,
+        by_id: Dict[str, RuleMetadata],
+        platforms: Dict[str, Tuple[str, ...]],
+        errors: Dict[str, str],
+    ):
+        # 규칙 id -> 규칙 (모든 플랫폼, 규칙마다 객체 1개)
+        self.by_id = by_id
+
+        # 규칙 id -> 적용 플랫폼 (platforms가 비어 있으면 규칙 파일 디렉토리의 플랫폼)
+        self.platforms = platforms
+
+        # 플랫폼 -> 디렉토리 로드 오류
+        self.errors = errors
+
+        # 보조 인덱스 (값은 규칙 id 순서의 리스트)
+        by_platform: Dict[str, List[RuleMetadata]] = defaultdict(list)
+        by_category: Dict[str, List[RuleMetadata]] = defaultdict(list)
+        by_severity: Dict[Severity, List[RuleMetadata]] = defaultdict(list)
+        self.auto_remediable: List[RuleMetadata] = []
+
+        for rule_id in sorted(by_id):
+            rule = by_id[rule_id]
+            for platform in platforms[rule_id]:
+                by_platform[platform].append(rule)
+            by_category[rule.category].append(rule)
+            by_severity[rule.severity].append(rule)
+            if rule.remediation and rule.remediation.auto:
+                self.auto_remediable.append(rule)
+
+        self.by_platform = dict(by_platform)
+        self.by_category = dict(by_category)
+        self.by_severity = dict(by_severity)
+
+    def filter(self, rules: List[RuleMetadata], platform: Optional[str]) -> List[RuleMetadata]:
+        if platform is None:
+            return list(rules)
+        return [rule for rule in rules if platform in self.platforms[rule.id]]
+
+
+class RuleCatalog:
+    """규칙 카탈로그
+
+    사용 예시:
+        >>> catalog = get_rule_catalog("config/rules")
+        >>> rules = catalog.rules("macos")  # macOS 규칙 + macOS와 공유하는 Linux 규칙
+        >>> catalog.get("U-01").name
+        'root 계정 원격 접속 제한'
+        >>> [rule.id for rule in catalog.by_severity(Severity.HIGH, platform="linux")]
+        >>> catalog.is_auto_remediable("U-03")
+        True
+        >>> catalog.refresh().changed_ids  # 규칙 파일 수정 후
+        ['U-03']
+    """
+
+    def __init__(self, rules_dir: str = "config/rules"):
+        """초기화
+
+        Args:
+            rules_dir: 규칙 디렉토리 (플랫폼 디렉토리를 지정하면 상위 디렉토리 사용)
+        """
+        path = Path(rules_dir)
+        self.rules_dir = str(path.parent if path.name in PLATFORMS else path)
+
+        self._lock = threading.RLock()
+        self._index: Optional[_CatalogIndex] = None
+
+        # 규칙 파일 -> (파일 지문, 파일이 정의한 규칙 id), 규칙 id -> 규칙 파일 (refresh용)
+        self._sources: Dict[Path, Tuple[FileSignature, Optional[str]]] = {}
+        self._owners: Dict[str, Path] = {}
+
+        # rules()로 규칙을 받은 플랫폼 (refresh 시 이 플랫폼 규칙만 validator 점검)
+        self._requested: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._current().by_id)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self._current().by_id
+
+    @property
+    def is_loaded(self) -> bool:
+        """규칙 파일을 로드했는지 여부 (rules(), get() 등 처음 조회 시 로드)"""
+        return self._index is not None
+
+    def rules(self, platform: str) -> List[RuleMetadata]:
+        """플랫폼 규칙 목록 (id 순서, 복사본)
+
+        Args:
+            platform: 플랫폼 (linux, macos, windows)
+
+        Returns:
+            플랫폼 디렉토리의 규칙과 platforms에 이 플랫폼을 포함한 다른 디렉토리의 규칙
+
+        Raises:
+            RuleLoaderError: 이 플랫폼에 사용할 수 있는 규칙이 없는 경우
+        """
+        index = self._current()
+        self._requested.add(platform)
+        rules = index.by_platform.get(platform)
+        if not rules:
+            error = index.errors.get(platform, f"{platform} 규칙이 없습니다")
+            raise RuleLoaderError(error)
+        return list(rules)
+
+    def get(self, rule_id: str, platform: Optional[str] = None) -> Optional[RuleMetadata]:
+        """규칙 id로 조회
+
+        Args:
+            rule_id: 규칙 id (예: U-01)
+            platform: 지정하면 이 플랫폼에 적용되는 규칙만 반환
+
+        Returns:
+            RuleMetadata (없으면 None)
+        """
+        index = self._current()
+        rule = index.by_id.get(rule_id)
+        if rule is None or platform is None:
+            return rule
+        return rule if platform in index.platforms[rule_id] else None
+
+    def by_category(self, category: str, platform: Optional[str] = None) -> List[RuleMetadata]:
+        """카테고리별 규칙 (id 순서)"""
+        index = self._current()
+        return index.filter(index.by_category.get(category, []), platform)
+
+    def by_severity(self, severity: Severity, platform: Optional[str] = None) -> List[RuleMetadata]:
+        """심각도별 규칙 (id 순서)"""
+        index = self._current()
+        return index.filter(index.by_severity.get(severity, []), platform)
+
+    def auto_remediable(self, platform: Optional[str] = None) -> List[RuleMetadata]:
+        """자동 수정 가능한 규칙 (remediation.auto가 True, id 순서)"""
+        index = self._current()
+        return index.filter(index.auto_remediable, platform)
+
+    def is_auto_remediable(self, rule_id: str) -> bool:
+        """자동 수정 가능 여부 (규칙이 없으면 False)"""
+        rule = self.get(rule_id)
+        return bool(rule and rule.remediation and rule.remediation.auto)
+
+    def missing_validators(self, platform: Optional[str] = None) -> Dict[str, str]:
+        """validator를 찾을 수 없는 규칙 (rule_id -> 오류 메시지)
+
+        대상 규칙의 validator 모듈을 import하므로 플랫폼을 지정하는 것이 좋습니다.
+
+        Args:
+            platform: 지정하면 이 플랫폼에 적용되는 규칙만 점검
+        """
+        index = self._current()
+        rules = index.filter(list(index.by_id.values()), platform)
+        return get_validator_table().compile(rules)
+
+    def categories(self) -> List[str]:
+        """카테고리 목록 (정렬)"""
+        return sorted(self._current().by_category)
+
+    def watch_paths(self) -> List[str]:
+        """변경을 감시할 경로 (존재하는 플랫폼 디렉토리와 로드한 규칙 파일)
+
+        규칙을 로드하지 않으며, 로드 전에는 플랫폼 디렉토리만 반환합니다.
+        """
+        with self._lock:
+            directories = [
+                str(Path(self.rules_dir) / platform)
+                for platform in PLATFORMS
+                if (Path(self.rules_dir) / platform).is_dir()
+            ]
+            return directories + sorted(str(path) for path in self._sources)
+
+    def reload(self) -> None:
+        """규칙 파일 전체 다시 로드 (다음 조회 시)"""
+        with self._lock:
+            self._index = None
+
+    def refresh(self) -> RuleChanges:
+        """바뀐 규칙 파일만 다시 파싱하여 반영
+
+        파일 지문(mtime, 크기)이 바뀐 파일만 다시 파싱하여 새 인덱스로 한 번에 교체합니다.
+        이미 rules()로 사용 중인 플랫폼의 바뀐 규칙은 validator도 등록합니다. 파싱에 실패한 파일은 이전 규칙을 유지하고
+        오류로 보고합니다 (편집 중인 파일).
+
+        Returns:
+            RuleChanges (아직 로드하지 않았으면 로드 후 빈 결과)
+        """
+        changes = RuleChanges()
+        with self._lock:
+            if self._index is None:
+                self._current()
+                return changes
+
+            index = self._index
+            by_id = dict(index.by_id)
+            platforms = dict(index.platforms)
+            sources = dict(self._sources)
+            owners = dict(self._owners)
+
+            def drop(rule_id: str) -> None:
+                by_id.pop(rule_id, None)
+                platforms.pop(rule_id, None)
+                owners.pop(rule_id, None)
+                changes.removed.append(rule_id)
+
+            current = self._scan_files(PLATFORMS)
+
+            for path in sorted(sources.keys() - current.keys()):
+                _, rule_id = sources.pop(path)
+                if rule_id is not None and owners.get(rule_id) == path:
+                    drop(rule_id)
+
+            for path, signature in sorted(current.items()):
+                previous_signature, previous_id = sources.get(path, (None, None))
+                if previous_signature == signature:
+                    continue
+                # 파싱에 실패해도 같은 내용을 다시 파싱하지 않음
+                sources[path] = (signature, previous_id)
+
+                try:
+                    rule = convert_yaml_to_metadata(load_yaml_file(path), path)
+                except RuleLoaderError as e:
+                    changes.errors[path.name] = str(e)
+                    logger.error(f"규칙 파일 갱신 실패 (이전 규칙 유지): {path.name}, {e}")
+                    continue
+
+                owner = owners.get(rule.id)
+                if owner is not None and owner != path:
+                    changes.errors[path.name] = f"중복 규칙 id: {rule.id} ({owner.name})"
+                    logger.warning(f"중복 규칙 id 무시: {rule.id} ({path})")
+                    continue
+
+                if previous_id is not None and previous_id != rule.id:
+                    if owners.get(previous_id) == path:
+                        drop(previous_id)
+
+                if rule.id in changes.removed:
+                    changes.removed.remove(rule.id)
+                    changes.modified.append(rule.id)
+                elif rule.id not in by_id:
+                    changes.added.append(rule.id)
+                elif by_id[rule.id] != rule:
+                    changes.modified.append(rule.id)
+
+                by_id[rule.id] = rule
+                platforms[rule.id] = tuple(rule.platforms or [path.parent.name])
+                owners[rule.id] = path
+                sources[path] = (signature, rule.id)
+
+            self._sources = sources
+            self._owners = owners
+            if changes:
+                changed = [
+                    by_id[rule_id]
+                    for rule_id in changes.added + changes.modified
+                    if self._requested.intersection(platforms[rule_id])
+                ]
+                for rule_id, message in get_validator_table().compile(changed).items():
+                    changes.errors[owners[rule_id].name] = message
+                self._index = _CatalogIndex(by_id, platforms, index.errors)
+                logger.info(f"규칙 카탈로그 갱신: {', '.join(changes.changed_ids)}")
+
+        return changes
+
+    def _current(self) -> _CatalogIndex:
+        """현재 인덱스 (처음 조회 시 로드)"""
+        index = self._index
+        if index is not None:
+            return index
+
+        with self._lock:
+            if self._index is None:
+                self._index = self._load()
+            return self._index
+
+    def _scan_files(self, directories: Iterable[str]) -> Dict[Path, FileSignature]:
+        """플랫폼 디렉토리의 규칙 파일 지문 조회"""
+        files: Dict[Path, FileSignature] = {}
+        for directory in directories:
+            path = Path(self.rules_dir) / directory
+            if not path.is_dir():
+                continue
+            for rule_file in path.iterdir():
+                if rule_file.suffix not in RULE_FILE_SUFFIXES:
+                    continue
+                try:
+                    stat = rule_file.stat()
+                except OSError:
+                    continue
+                files[rule_file] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _load(self) -> _CatalogIndex:
+        """모든 플랫폼 디렉토리 로드 및 인덱스 생성"""
+        by_id: Dict[str, RuleMetadata] = {}
+        rule_platforms: Dict[str, Tuple[str, ...]] = {}
+        errors: Dict[str, str] = {}
+        sources: Dict[Path, Tuple[FileSignature, Optional[str]]] = {}
+        owners: Dict[str, Path] = {}
+
+        for directory in PLATFORMS:
+            # 로드 전에 지문을 기록 (로드 중 바뀐 파일은 다음 refresh에서 반영)
+            files = self._scan_files([directory])
+            try:
+                loaded = {rule.id: rule for rule in load_rules(self.rules_dir, platform=directory)}
+            except RuleLoaderError as e:
+                errors[directory] = str(e)
+                logger.debug(f"{directory} 규칙 디렉토리 로드 실패: {e}")
+                loaded = {}
+
+            for path, signature in sorted(files.items()):
+                rule_id = self._rule_id_of(path, loaded)
+                if rule_id is not None and rule_id in by_id:
+                    logger.warning(f"중복 규칙 id 무시: {rule_id} ({directory})")
+                    rule_id = None
+                sources[path] = (signature, rule_id)
+                if rule_id is None:
+                    continue
+
+                rule = loaded[rule_id]
+                by_id[rule_id] = rule
+                rule_platforms[rule_id] = tuple(rule.platforms or [directory])
+                owners[rule_id] = path
+
+        index = _CatalogIndex(by_id, rule_platforms, errors)
+        self._sources = sources
+        self._owners = owners
+
+        logger.info(
+            "규칙 카탈로그 로드: "
+            + ", ".join(
+                f"{platform} {len(rules)}개" for platform, rules in index.by_platform.items()
+            )
+            + f" (규칙 {len(by_id)}개, {self.rules_dir})"
+        )
+        return index
+
+    @staticmethod
+    def _rule_id_of(path: Path, loaded: Dict[str, RuleMetadata]) -> Optional[str]:
+        """로드된 규칙 중 규칙 파일이 정의한 규칙 id (로드 실패 파일은 None)
+
+        규칙 파일 이름은 보통 규칙 id와 같으므로 (U-01.yaml), 다른 경우에만 파일을 다시 읽습니다.
+        """
+        if path.stem in loaded:
+            return path.stem
+        try:
+            rule_id = load_yaml_file(path).get("id")
+        except (RuleLoaderError, AttributeError):
+            return None
+        return rule_id if rule_id in loaded else None
+
+
+_catalogs: Dict[str, RuleCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_rule_catalog(rules_dir: str = "config/rules") -> RuleCatalog:
+    """규칙 디렉토리의 공유 카탈로그
+
+    Args:
+        rules_dir: 규칙 디렉토리 (플랫폼 디렉토리도 가능)
+
+    Returns:
+        RuleCatalog (규칙 디렉토리마다 1개)
+    """
+    path = Path(rules_dir)
+    key = str((path.parent if path.name in PLATFORMS else path).resolve())
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = RuleCatalog(rules_dir)
+            _catalogs[key] = catalog
+        return catalog
+
+
+__all__ = [
+    "RuleCatalog",
+    "RuleChanges",
+    "get_rule_catalog",
+]
@@ -4,23 +4,49 @@
 RuleMetadata 객체 리스트로 변환합니다.
 
 주요 기능:
-- YAML 파일 파싱
+- YAML 파일 파싱 (libyaml C 로더 사용 가능하면 사용)
 - RuleMetadata 객체 생성
 - Pydantic validation
+- 컴파일된 규칙 캐시 (규칙 파일이 바뀌지 않으면 YAML 파싱과 validation 생략)
 - 오류 처리 및 로깅
+
+규칙 캐시:
+    검증된 규칙 데이터를 사용자 캐시 디렉토리(default_rule_cache_dir())에 JSON으로 저장합니다.
+    파일 이름은 규칙 디렉토리 경로의 해시이며, 규칙 디렉토리(소스 트리)에는 쓰지 않습니다.
+    캐시 키는 규칙 디렉토리 경로, 규칙 파일의 이름, mtime, 크기와 RuleMetadata 필드 목록이며,
+    하나라도 바뀌면 YAML에서 다시 만듭니다. 캐시가 맞으면 validation 없이
+    model_construct()로 객체를 만듭니다 (저장할 때 이미 검증된 데이터, 일반 dict/list만 사용).
+    캐시 디렉토리에 쓸 수 없으면 캐시 없이 로드합니다.
 """
 
+import hashlib
+import json
 import logging
+import os
+import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import ValidationError
 
-from ..domain.models import RemediationInfo, RuleMetadata, Severity
+from ..domain.models import RemediationInfo, RuleDependencies, RuleMetadata, Severity
 
 logger = logging.getLogger(__name__)
 
+# YAML 로더 (libyaml이 있으면 C 구현 사용)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 사용자 캐시 디렉토리 환경 변수 (지정하면 기본 위치 대신 사용)
+CACHE_DIR_ENV = "BLUEPY_CACHE_DIR"
+
+# 규칙 캐시 형식 버전
+RULE_CACHE_VERSION = 2
+
+# 규칙 파일 지문 (파일 이름, mtime(ns), 크기)
+FileSignature = Tuple[str, int, int]
+
 
 class RuleLoaderError(Exception):
     """규칙 로더 예외"""
@@ -42,7 +68,7 @@ def load_yaml_file(file_path: Path) -> Dict[str, Any]:
     """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         if not isinstance(data, dict):
             raise RuleLoaderError(f"YAML 파일이 딕셔너리가 아닙니다: {file_path}")
@@ -66,12 +92,16 @@ def convert_yaml_to_metadata(yaml_data: Dict[str, Any], file_path: Path) -> Rule
           commands: [...]
         validator
         remediation: {...}
+        depends_on: {files: [...], packages: [...], services: [...]} (선택)
+        platforms: [linux, macos] (선택)
 
     RuleMetadata 구조:
         id, name, category, severity, kisa_standard, description
         commands: [...]
         validator
         remediation
+        depends_on
+        platforms
 
     Args:
         yaml_data: 파싱된 YAML 딕셔너리
@@ -117,6 +147,15 @@ def convert_yaml_to_metadata(yaml_data: Dict[str, Any], file_path: Path) -> Rule
                 logger.warning(f"Remediation validation 실패: {yaml_data.get('id')}, {e}")
                 # Remediation은 선택사항이므로 None으로 설정
 
+        # depends_on 정보 변환 (증분 스캔용, 선택사항)
+        depends_on = None
+        depends_on_data = yaml_data.get("depends_on")
+        if depends_on_data:
+            try:
+                depends_on = RuleDependencies(**depends_on_data)
+            except (ValidationError, TypeError) as e:
+                logger.warning(f"depends_on validation 실패: {yaml_data.get('id')}, {e}")
+
         # Severity 변환
         severity_str = yaml_data.get("severity", "").lower()
         try:
@@ -138,6 +177,8 @@ def convert_yaml_to_metadata(yaml_data: Dict[str, Any], file_path: Path) -> Rule
             validator=yaml_data["validator"],
             expected_result=yaml_data.get("expected_result"),
             remediation=remediation,
+            depends_on=depends_on,
+            platforms=yaml_data.get("platforms") or [],
         )
 
         return metadata
@@ -148,12 +189,129 @@ def convert_yaml_to_metadata(yaml_data: Dict[str, Any], file_path: Path) -> Rule
         raise RuleLoaderError(f"필수 필드 누락: {e} ({file_path})")
 
 
-def load_rules(rules_dir: str, platform: str = "linux") -> List[RuleMetadata]:
+def default_rule_cache_dir() -> Path:
+    """규칙 캐시 디렉토리 (사용자 캐시 디렉토리 아래 rules)
+
+    BLUEPY_CACHE_DIR 환경 변수가 있으면 그 경로를 사용하고, 없으면 플랫폼 관례를 따릅니다.
+    - Linux: $XDG_CACHE_HOME/bluepy (기본: ~/.cache/bluepy)
+    - macOS: ~/Library/Caches/BluePy
+    - Windows: %LOCALAPPDATA%\\BluePy\\Cache
+
+    Returns:
+        규칙 캐시 디렉토리 경로
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        base = Path(override)
+    elif sys.platform == "win32":
+        local = os.environ.get("LOCALAPPDATA")
+        base = (Path(local) if local else Path.home() / "AppData" / "Local") / "BluePy" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "BluePy"
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / "bluepy"
+    return base / "rules"
+
+
+def rule_cache_path(rules_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """규칙 디렉토리의 캐시 파일 경로
+
+    Args:
+        rules_path: 플랫폼 규칙 디렉토리 (예: config/rules/linux)
+        cache_dir: 캐시 디렉토리 (기본: default_rule_cache_dir())
+
+    Returns:
+        캐시 파일 경로 (규칙 디렉토리 경로의 해시를 이름으로 사용)
+    """
+    digest = hashlib.sha256(str(rules_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    directory = cache_dir if cache_dir is not None else default_rule_cache_dir()
+    return directory / f"{rules_path.name}-{digest}.json"
+
+
+def _file_signatures(files: List[Path]) -> List[FileSignature]:
+    """규칙 파일 지문 목록 (캐시 키)"""
+    signatures = []
+    for file_path in files:
+        stat = file_path.stat()
+        signatures.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    return signatures
+
+
+def _cache_key(rules_path: Path, signatures: List[FileSignature]) -> Dict[str, Any]:
+    """캐시 키 (규칙 디렉토리, 규칙 파일 지문과 RuleMetadata 스키마, JSON 비교 가능한 형태)"""
+    return {
+        "version": RULE_CACHE_VERSION,
+        "rules_dir": str(rules_path.resolve()),
+        "fields": list(RuleMetadata.model_fields),
+        "files": [list(signature) for signature in signatures],
+    }
+
+
+def _construct_rule(data: Dict[str, Any]) -> RuleMetadata:
+    """검증된 규칙 데이터(JSON dict)로 RuleMetadata 생성 (validation 생략)"""
+    data = dict(data)
+    data["severity"] = Severity(data["severity"])
+    if data.get("remediation") is not None:
+        data["remediation"] = RemediationInfo.model_construct(**data["remediation"])
+    if data.get("depends_on") is not None:
+        data["depends_on"] = RuleDependencies.model_construct(**data["depends_on"])
+    return RuleMetadata.model_construct(**data)
+
+
+def _read_rule_cache(cache_path: Path, key: Dict[str, Any]) -> Optional[List[RuleMetadata]]:
+    """규칙 캐시 읽기
+
+    Returns:
+        캐시된 규칙 리스트 (캐시가 없거나 키가 다르거나 손상되었으면 None)
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("key") != key:
+            return None
+        return [_construct_rule(data) for data in cache["rules"]]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"규칙 캐시 읽기 실패, YAML에서 다시 로드: {cache_path}, {e}")
+        return None
+
+
+def _write_rule_cache(cache_path: Path, key: Dict[str, Any], rules: List[RuleMetadata]) -> None:
+    """규칙 캐시 저장 (임시 파일에 쓴 뒤 교체, 실패해도 무시)"""
+    data = {"key": key, "rules": [rule.model_dump(mode="json") for rule in rules]}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".rules_cache-")
+    except OSError as e:
+        logger.debug(f"규칙 캐시 저장 실패: {cache_path}, {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        Path(tmp_path).unlink(missing_ok=True)
+        logger.debug(f"규칙 캐시 저장 실패: {cache_path}, {e}")
+
+
+def load_rules(
+    rules_dir: str,
+    platform: str = "linux",
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None,
+) -> List[RuleMetadata]:
     """규칙 디렉토리에서 모든 YAML 파일 로드
 
+    규칙 파일이 이전 로드와 같으면 컴파일된 규칙 캐시에서 바로 반환합니다.
+
     Args:
         rules_dir: 규칙 파일 디렉토리 경로 (예: config/rules 또는 config/rules/linux)
         platform: 플랫폼 이름 (linux, macos, windows) - rules_dir이 플랫폼 포함하지 않을 때만 사용
+        use_cache: 규칙 캐시 사용 여부 (기본: True)
+        cache_dir: 규칙 캐시 디렉토리 (기본: default_rule_cache_dir())
 
     Returns:
         RuleMetadata 객체 리스트 (id 순서로 정렬)
@@ -180,6 +338,19 @@ def load_rules(rules_dir: str, platform: str = "linux") -> List[RuleMetadata]:
     if not yaml_files:
         raise RuleLoaderError(f"규칙 파일이 없습니다: {rules_path}")
 
+    cache_path = rule_cache_path(rules_path, Path(cache_dir) if cache_dir else None)
+    cache_key: Optional[Dict[str, Any]] = None
+    if use_cache:
+        try:
+            cache_key = _cache_key(rules_path, _file_signatures(yaml_files))
+        except OSError:
+            cache_key = None
+
+        cached = _read_rule_cache(cache_path, cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"{platform} 규칙 {len(cached)}개 로드 완료 (캐시)")
+            return cached
+
     rules: List[RuleMetadata] = []
     errors: List[str] = []
 
@@ -204,6 +375,10 @@ def load_rules(rules_dir: str, platform: str = "linux") -> List[RuleMetadata]:
     # id 순서로 정렬 (U-01, U-02, ...)
     rules.sort(key=lambda r: r.id)
 
+    # 오류가 있으면 캐시하지 않음 (수정할 때까지 매번 오류 보고)
+    if cache_key is not None and not errors:
+        _write_rule_cache(cache_path, cache_key, rules)
+
     logger.info(f"{platform} 규칙 {len(rules)}개 로드 완료 (오류: {len(errors)}개)")
     return rules
 
@@ -213,4 +388,6 @@ __all__ = [
     "load_yaml_file",
     "convert_yaml_to_metadata",
     "load_rules",
+    "default_rule_cache_dir",
+    "rule_cache_path",
 ]
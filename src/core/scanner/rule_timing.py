@@ -0,0 +1,196 @@
+"""규칙 실행 시간 기록 및 스케줄링
+
+호스트와 플랫폼별로 규칙 실행 시간을 기록하고, 동시 실행 시
+오래 걸리는 규칙부터 시작하여(LPT: Longest Processing Time first)
+짧은 규칙이 그 사이를 채우도록 실행 순서를 정합니다.
+
+장점:
+- find 기반 권한 점검, Get-HotFix 같은 느린 규칙이 스캔 마지막에 남지 않음
+- 기록된 시간으로 전체 스캔 시간과 남은 시간(ETA) 예측
+
+실행 시간 추정 순서:
+    1. 같은 호스트의 기록 (지수 이동 평균)
+    2. 같은 플랫폼의 다른 호스트 기록 평균
+    3. 이번 스캔 규칙들의 추정값 평균 (기록이 하나도 없으면 DEFAULT_RULE_SECONDS)
+"""
+
+import heapq
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..domain.models import RuleMetadata
+
+logger = logging.getLogger(__name__)
+
+# 기록이 없는 규칙의 기본 추정 시간 (초)
+DEFAULT_RULE_SECONDS = 1.0
+
+# 저장소 파일 형식 버전
+STORE_VERSION = 1
+
+
+def order_longest_first(
+    rules: Iterable[RuleMetadata], durations: Dict[str, float]
+) -> List[RuleMetadata]:
+    """LPT 순서로 정렬 (추정 시간이 긴 규칙 먼저, 같으면 기존 순서 유지)
+
+    Args:
+        rules: 점검 규칙 리스트
+        durations: rule_id -> 추정 시간 (초)
+
+    Returns:
+        정렬된 규칙 리스트
+    """
+    return sorted(rules, key=lambda rule: -durations.get(rule.id, 0.0))
+
+
+def predict_makespan(durations: Iterable[float], workers: int = 1) -> float:
+    """주어진 순서대로 workers개 슬롯에 배정했을 때의 전체 소요 시간 예측
+
+    Semaphore 동시 실행과 같이 비어 있는 슬롯이 다음 작업을 가져간다고 가정합니다.
+
+    Args:
+        durations: 실행 순서대로의 작업 시간 (초)
+        workers: 동시 실행 수
+
+    Returns:
+        예측 소요 시간 (초)
+    """
+    slots = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(slots, slots[0] + duration)
+    return max(slots)
+
+
+class RuleTimingStore:
+    """규칙 실행 시간 저장소 (호스트, 플랫폼별)
+
+    JSON 파일 형식:
+        {"version": 1, "hosts": {"<platform>/<server_id>": {"<rule_id>": 초, ...}}}
+
+    사용 예시:
+        >>> timings = RuleTimingStore("data/scan_state/rule_timings.json")
+        >>> scanner.set_timing_store(timings)
+        >>> result = await scanner.scan_all()  # 느린 규칙부터 실행, 종료 시 저장
+        >>> scanner.get_predicted_duration()
+        42.5
+    """
+
+    def __init__(self, path: Optional[str] = None, smoothing: float = 0.3):
+        """초기화
+
+        Args:
+            path: JSON 파일 경로 (None이면 메모리에만 보관)
+            smoothing: 지수 이동 평균 가중치 (0~1, 클수록 최근 실행 시간 반영)
+
+        Raises:
+            ValueError: smoothing이 범위를 벗어난 경우
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing은 0 초과 1 이하여야 합니다: {smoothing}")
+
+        self.path = Path(path) if path else None
+        self.smoothing = smoothing
+        self._hosts: Dict[str, Dict[str, float]] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _host_key(server_id: str, platform: str) -> str:
+        return f"{platform}/{server_id}"
+
+    def load(self) -> None:
+        """파일에서 불러오기 (없거나 손상된 파일은 빈 저장소로 시작)"""
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != STORE_VERSION:
+                return
+            self._hosts = {
+                host: {rule_id: float(seconds) for rule_id, seconds in timings.items()}
+                for host, timings in data.get("hosts", {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"실행 시간 저장소 로드 실패: {self.path}, {e}")
+            self._hosts = {}
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def record(self, server_id: str, platform: str, rule_id: str, seconds: float) -> None:
+        """실행 시간 기록 (이전 기록과 지수 이동 평균)"""
+        self._ensure_loaded()
+        timings = self._hosts.setdefault(self._host_key(server_id, platform), {})
+        previous = timings.get(rule_id)
+        if previous is None:
+            timings[rule_id] = seconds
+        else:
+            timings[rule_id] = previous + self.smoothing * (seconds - previous)
+
+    def estimate(self, server_id: str, platform: str, rule_id: str) -> Optional[float]:
+        """규칙 실행 시간 추정 (같은 호스트, 없으면 같은 플랫폼 다른 호스트 평균)
+
+        Returns:
+            추정 시간 (초, 기록이 없으면 None)
+        """
+        self._ensure_loaded()
+        host_key = self._host_key(server_id, platform)
+        own = self._hosts.get(host_key, {}).get(rule_id)
+        if own is not None:
+            return own
+
+        prefix = f"{platform}/"
+        others = [
+            timings[rule_id]
+            for key, timings in self._hosts.items()
+            if key.startswith(prefix) and key != host_key and rule_id in timings
+        ]
+        return sum(others) / len(others) if others else None
+
+    def estimates(
+        self, server_id: str, platform: str, rules: Iterable[RuleMetadata]
+    ) -> Dict[str, float]:
+        """규칙별 추정 시간 (기록이 없는 규칙은 기록된 규칙의 평균)
+
+        Returns:
+            rule_id -> 추정 시간 (초)
+        """
+        rules = list(rules)
+        known = {
+            rule.id: seconds
+            for rule in rules
+            if (seconds := self.estimate(server_id, platform, rule.id)) is not None
+        }
+        fallback = sum(known.values()) / len(known) if known else DEFAULT_RULE_SECONDS
+        return {rule.id: known.get(rule.id, fallback) for rule in rules}
+
+    def save(self) -> None:
+        """파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if self.path is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"version": STORE_VERSION, "hosts": self._hosts}, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".rule_timings-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+__all__ = [
+    "DEFAULT_RULE_SECONDS",
+    "order_longest_first",
+    "predict_makespan",
+    "RuleTimingStore",
+]
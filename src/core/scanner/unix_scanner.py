@@ -4,24 +4,53 @@ Linux와 macOS 서버에 SSH로 연결하여 보안 점검을 수행합니다.
 두 플랫폼의 공통 로직을 담은 추상 클래스입니다.
 
 주요 기능:
-- SSH 연결 및 명령어 실행
+- SSH 연결 및 명령어 실행 (로컬 머신은 SSH 없이 직접 실행)
+- 명령어 배치 수집 (SSH 세션 1회로 전체 명령어 실행)
+- 수집 에이전트 (서버에 업로드한 Python 스크립트가 병렬 실행 후 압축 번들 반환)
+- 명령어 실행 기록 및 재생 (캡처 파일)
+- 스냅샷 수집기 (프로세스 테이블, 파일 stat을 1회 수집하여 로컬 평가)
 - YAML 규칙 파일 로드
 - Validator 함수 동적 호출
 - 점검 결과 수집
 """
 
-import importlib
 import logging
-from typing import List, Optional
+import shlex
+from typing import Dict, List, Optional, Protocol
 
 from .base_scanner import BaseScanner
-from .rule_loader import load_rules
+from .collectors import ProcessSnapshotCollector, SnapshotCollector
+from .collector_agent import AgentNotInstalledError, CollectorAgent
+from .command_batch import BATCH_SHELL, CommandBatch
+from .fingerprint import build_unix_fingerprint_script
+from .rule_catalog import get_rule_catalog
 from ..domain.models import CheckResult, RuleMetadata, Status
-from ...infrastructure.network.ssh_client import SSHClient, SSHClientError
+from ...infrastructure.network.capture import CaptureError, CommandRecorder, ScanCapture
+from ...infrastructure.network.local_executor import LocalExecutor, LocalExecutorError
+from ...infrastructure.network.ssh_client import (
+    SSHClient,
+    SSHClientError,
+    SSHConnectionLostError,
+)
+from ...infrastructure.network.ssh_pool import SSHConnectionPool
 
 logger = logging.getLogger(__name__)
 
 
+class CommandExecutor(Protocol):
+    """UnixScanner 명령어 실행 백엔드 (SSHClient, LocalExecutor, ReplayExecutor)"""
+
+    recorder: Optional[CommandRecorder]
+
+    async def connect(self) -> object: ...
+
+    async def disconnect(self) -> None: ...
+
+    async def execute(
+        self, command: str, timeout: int = 60, input: Optional[str] = None
+    ) -> str: ...
+
+
 class UnixScanner(BaseScanner):
     """Unix 서버 스캐너 (Linux, macOS 공통)
 
@@ -45,8 +74,49 @@ class UnixScanner(BaseScanner):
         >>> result = await scanner.scan_all()
         >>> print(f"점수: {result.score}/100")
         >>> await scanner.disconnect()
+
+    동시 스캔:
+        max_concurrency=8로 생성하면 하나의 SSH 연결 위에서
+        최대 8개의 규칙을 병렬 채널로 실행합니다.
+
+    배치 모드:
+        batch_mode=True로 생성하면 scan_all() 시작 시 전체 규칙의 명령어를
+        하나의 셸 스크립트로 묶어 SSH 세션 1개로 실행하고,
+        scan_one()은 수집된 출력을 사용합니다.
+
+    연결 풀:
+        pool=get_default_pool()로 생성하면 SSH 연결을 풀에서 빌리고,
+        disconnect() 시 풀에 반환합니다. 스캔 직후 자동 수정처럼
+        같은 서버에 다시 연결하는 작업은 SSH 핸드셰이크를 생략합니다.
+
+    스냅샷 수집기:
+        snapshot_collectors=True로 생성하면 `ps -ef | grep X | grep -v grep` 같은 명령어를
+        스캔당 1회 수집한 프로세스 테이블로 로컬에서 평가합니다.
+        수집기는 원격 실행과 같은 출력을 재현할 수 있는 명령어만 처리하며,
+        나머지 명령어는 기존처럼 원격 실행합니다.
+
+    에이전트 모드:
+        agent_mode=True로 생성하면 규칙 명령어를 내장한 수집 에이전트(collector_agent)를
+        서버에 한 번 업로드하고, 스캔 시작 시 에이전트가 서버에서 명령어를 병렬 실행한 뒤
+        압축 번들 하나로 결과를 돌려줍니다. 에이전트는 규칙 세트가 바뀔 때만 다시
+        업로드하며, python3가 없는 등 실패하면 배치 수집으로 대체합니다.
+
+    로컬 실행:
+        local=True로 생성하면 SSH 대신 LocalExecutor로 BluePy가 실행 중인
+        머신을 점검합니다. host, username 등 SSH 인증 정보는 사용하지 않으며,
+        max_concurrency는 동시 실행 프로세스 수가 됩니다.
+
+    기록 및 재생:
+        set_capture(ScanCapture(...))로 실행한 명령어의 출력, 종료 코드, 소요 시간을 기록하고,
+        set_executor(ReplayExecutor(capture))로 기록한 출력을 네트워크 없이 재생합니다.
     """
 
+    # 배치 스크립트 전체 실행 타임아웃 (초)
+    BATCH_TIMEOUT = 300
+
+    # 수집 에이전트의 동시 실행 명령어 수
+    AGENT_WORKERS = 8
+
     def __init__(
         self,
         server_id: str,
@@ -56,6 +126,12 @@ class UnixScanner(BaseScanner):
         password: Optional[str] = None,
         key_filename: Optional[str] = None,
         port: int = 22,
+        max_concurrency: int = 1,
+        batch_mode: bool = False,
+        snapshot_collectors: bool = False,
+        pool: Optional[SSHConnectionPool] = None,
+        local: bool = False,
+        agent_mode: bool = False,
     ):
         """초기화
 
@@ -67,18 +143,48 @@ class UnixScanner(BaseScanner):
             password: SSH 패스워드 (선택)
             key_filename: SSH 키 파일 경로 (선택)
             port: SSH 포트 (기본: 22)
+            max_concurrency: 호스트당 동시 SSH 채널 수 (기본: 1, 순차 실행)
+            batch_mode: 명령어 배치 수집 사용 여부 (기본: False)
+            snapshot_collectors: 스냅샷 수집기 사용 여부 (기본: False)
+            pool: SSH 연결 풀 (선택, 지정하면 disconnect() 후에도 연결을 재사용)
+            local: 로컬 머신 점검 여부 (기본: False, True이면 SSH 없이 직접 실행)
+            agent_mode: 수집 에이전트 사용 여부 (기본: False)
         """
-        super().__init__(server_id=server_id, platform=platform)
+        super().__init__(server_id=server_id, platform=platform, max_concurrency=max_concurrency)
+
+        self.local = local
+
+        # 명령어 실행 백엔드
+        # - SSH: 하나의 연결 위에서 최대 max_concurrency개 채널 사용
+        # - 로컬: 최대 max_concurrency개 프로세스 동시 실행
+        self._ssh_client: CommandExecutor
+        if local:
+            self._ssh_client = LocalExecutor(max_processes=max_concurrency)
+        else:
+            self._ssh_client = SSHClient(
+                host=host,
+                username=username,
+                password=password,
+                key_filename=key_filename,
+                port=port,
+                max_channels=max_concurrency,
+                pool=pool,
+            )
 
-        # SSH 클라이언트 초기화
-        self._ssh_client = SSHClient(
-            host=host, username=username, password=password, key_filename=key_filename, port=port
-        )
+        self.batch_mode = batch_mode
+        self.agent_mode = agent_mode
+        self.snapshot_collectors = snapshot_collectors
+
+        # 규칙 세트의 수집 에이전트 (규칙 명령어가 바뀌면 다시 생성)
+        self._agent: Optional[CollectorAgent] = None
+
+        # 마지막 스캔의 스냅샷 (수집기 이름 -> 수집기)
+        self._snapshots: Dict[str, SnapshotCollector] = {}
 
     async def connect(self) -> None:
         """서버에 연결
 
-        SSH 연결을 수행합니다.
+        SSH 연결을 수행합니다 (로컬 실행이면 연결 과정 없음).
 
         Raises:
             ConnectionError: 연결 실패 시
@@ -87,7 +193,7 @@ class UnixScanner(BaseScanner):
             await self._ssh_client.connect()
             self._connected = True
             logger.info(f"{self.platform.upper()} 서버 연결 성공: {self.server_id}")
-        except SSHClientError as e:
+        except (SSHClientError, LocalExecutorError) as e:
             raise ConnectionError(f"서버 연결 실패: {e}")
 
     async def disconnect(self) -> None:
@@ -107,6 +213,7 @@ class UnixScanner(BaseScanner):
 
         Raises:
             RuntimeError: 명령어 실행 실패 시
+            ConnectionError: 실행 중 서버 연결이 끊어진 경우
         """
         if not self._connected:
             raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
@@ -114,11 +221,38 @@ class UnixScanner(BaseScanner):
         try:
             result = await self._ssh_client.execute(command)
             return result
-        except SSHClientError as e:
+        except SSHConnectionLostError as e:
+            raise ConnectionError(f"서버 연결이 끊어졌습니다: {self.server_id}, 오류: {e}")
+        except (SSHClientError, LocalExecutorError, CaptureError) as e:
             raise RuntimeError(f"명령어 실행 실패: {command[:50]}..., 오류: {e}")
 
+    def set_capture(self, capture: Optional[ScanCapture]) -> None:
+        """명령어 실행 기록 시작 (None이면 중지)
+
+        실행기 호출 단위(배치 스크립트, 스냅샷 수집 포함)로 기록하며,
+        재생에 필요한 수집 옵션을 capture.options에 남깁니다.
+
+        Args:
+            capture: 기록할 캡처
+        """
+        if capture is not None:
+            capture.options = {
+                "batch_mode": self.batch_mode,
+                "agent_mode": self.agent_mode,
+                "snapshot_collectors": self.snapshot_collectors,
+            }
+        self._ssh_client.recorder = capture.record if capture is not None else None
+
+    def set_executor(self, executor: CommandExecutor) -> None:
+        """명령어 실행 백엔드 교체 (예: ReplayExecutor로 캡처 재생)
+
+        Args:
+            executor: connect/disconnect/execute를 제공하는 실행기
+        """
+        self._ssh_client = executor
+
     async def load_rules(self, rules_dir: str) -> None:
-        """규칙 파일 로드
+        """규칙 파일 로드 (프로세스 공유 RuleCatalog 사용)
 
         Args:
             rules_dir: 규칙 파일 디렉토리 경로 (예: config/rules)
@@ -128,11 +262,226 @@ class UnixScanner(BaseScanner):
             ValueError: 규칙 파일 파싱 실패
         """
         try:
-            self._rules = load_rules(rules_dir, platform=self.platform)
+            self.set_rules(get_rule_catalog(rules_dir).rules(self.platform))
             logger.info(f"{self.platform.upper()} 규칙 {len(self._rules)}개 로드 완료")
         except Exception as e:
             raise ValueError(f"규칙 로드 실패: {e}")
 
+    async def _prepare_scan(self, rules: Optional[List[RuleMetadata]] = None) -> None:
+        """스캔 시작 전 준비
+
+        1. 스냅샷 수집기가 처리할 명령어를 선택
+        2. 에이전트/배치 모드이면 나머지 명령어와 스냅샷 명령어를 한 번에 수집
+           (에이전트 수집에 실패하면 배치 수집으로 대체)
+        3. 스냅샷으로 재현한 출력을 명령어 캐시에 등록
+
+        Args:
+            rules: 이번 스캔에서 실행할 규칙 (기본: 로드된 전체 규칙)
+        """
+        self._snapshots = {}
+        commands = self._pending_commands(rules)
+
+        claimed: Dict[str, List[str]] = {}
+        collectors: List[SnapshotCollector] = []
+        for collector in self._create_collectors():
+            owned = [command for command in commands if collector.claims(command)]
+            if owned:
+                collectors.append(collector)
+                claimed[collector.name] = owned
+
+        snapshot_commands = [
+            collector.build_command(claimed[collector.name]) for collector in collectors
+        ]
+
+        if self.agent_mode or self.batch_mode:
+            owned_commands = {command for owned in claimed.values() for command in owned}
+            remaining = [command for command in commands if command not in owned_commands]
+            remaining += snapshot_commands
+            if not (self.agent_mode and await self.collect_agent(remaining)):
+                await self.collect_batch(remaining)
+
+        for collector, snapshot_command in zip(collectors, snapshot_commands):
+            await self._load_snapshot(collector, snapshot_command, claimed[collector.name])
+
+    def _create_collectors(self) -> List[SnapshotCollector]:
+        """스캔에 사용할 스냅샷 수집기 생성 (스캔마다 새로 생성)
+
+        Returns:
+            SnapshotCollector 리스트 (사용하도록 설정한 수집기만)
+        """
+        collectors: List[SnapshotCollector] = []
+        if self.snapshot_collectors:
+            collectors.append(ProcessSnapshotCollector())
+        return collectors
+
+    async def _load_snapshot(
+        self, collector: SnapshotCollector, snapshot_command: str, commands: List[str]
+    ) -> None:
+        """스냅샷 수집 후 재현한 출력을 명령어 캐시에 등록
+
+        스냅샷 수집에 실패하면 해당 명령어는 기존처럼 원격 실행됩니다.
+
+        Args:
+            collector: 스냅샷 수집기
+            snapshot_command: 스냅샷 수집 명령어
+            commands: 수집기가 처리할 명령어 목록
+        """
+        try:
+            output = await self._execute_cached(snapshot_command)
+            collector.load(output)
+        except Exception as e:
+            logger.warning(f"{collector.name} 스냅샷 수집 실패, 명령어별 실행으로 대체: {e}")
+            return
+
+        self._snapshots[collector.name] = collector
+
+        rendered = 0
+        for command in commands:
+            output = collector.render(command)
+            if output is not None:
+                self._command_cache.prime(command, output)
+                rendered += 1
+
+        logger.info(f"{collector.name} 스냅샷으로 {rendered}/{len(commands)}개 명령어 로컬 평가")
+
+    def get_snapshot(self, name: str) -> Optional[SnapshotCollector]:
+        """마지막 스캔에서 수집한 스냅샷 조회
+
+        Args:
+            name: 수집기 이름 (예: "process")
+
+        Returns:
+            SnapshotCollector (수집하지 않았거나 실패했으면 None)
+        """
+        return self._snapshots.get(name)
+
+    def _fingerprint_command(self, keys: List[str]) -> Optional[str]:
+        """입력 지문 수집 명령어 (로그인 셸과 무관하게 sh로 실행)"""
+        return f"sh -c {shlex.quote(build_unix_fingerprint_script(keys))}"
+
+    def _pending_commands(self, rules: Optional[List[RuleMetadata]] = None) -> List[str]:
+        """규칙의 원격 실행 대상 명령어 (수동 점검 및 캐시된 명령어 제외, 순서 유지)
+
+        Args:
+            rules: 점검 규칙 리스트 (기본: 로드된 전체 규칙)
+        """
+        return list(
+            dict.fromkeys(
+                command
+                for rule in (self._rules if rules is None else rules)
+                for command in rule.commands
+                if not self._is_manual_command(command) and command not in self._command_cache
+            )
+        )
+
+    async def collect_batch(self, commands: Optional[List[str]] = None) -> int:
+        """명령어를 배치로 실행
+
+        명령어를 하나의 셸 스크립트로 묶어 SSH 세션 1개(로컬이면 프로세스 1개)로 실행하고,
+        결과를 명령어 캐시에 등록합니다. 실패 시 명령어별 실행으로 대체됩니다.
+
+        Args:
+            commands: 실행할 명령어 목록 (기본: 로드된 규칙의 전체 명령어)
+
+        Returns:
+            수집된 명령어 수 (실패 시 0)
+        """
+        if not self._connected:
+            raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+
+        batch = CommandBatch(self._pending_commands() if commands is None else commands)
+        if not len(batch):
+            return 0
+
+        try:
+            output = await self._ssh_client.execute(
+                BATCH_SHELL, timeout=self.BATCH_TIMEOUT, input=batch.build_script()
+            )
+            outputs = batch.parse_output(output)
+        except Exception as e:
+            logger.warning(f"배치 수집 실패, 명령어별 실행으로 대체: {e}")
+            return 0
+
+        for command, batch_output in outputs.items():
+            if batch_output.exit_code != 0:
+                logger.debug(f"배치 명령어 종료 코드 {batch_output.exit_code}: {command[:50]}...")
+            self._command_cache.prime(command, batch_output.stdout)
+
+        logger.info(f"배치 수집 완료: {len(outputs)}/{len(batch)}개 명령어 (SSH 세션 1회)")
+        return len(outputs)
+
+    def _get_agent(self) -> CollectorAgent:
+        """로드된 규칙 세트의 수집 에이전트 (명령어가 같으면 재사용)"""
+        commands = list(
+            dict.fromkeys(
+                command
+                for rule in self._rules
+                for command in rule.commands
+                if not self._is_manual_command(command)
+            )
+        )
+        if self._agent is None or self._agent.commands != commands:
+            self._agent = CollectorAgent(commands)
+        return self._agent
+
+    async def collect_agent(self, commands: Optional[List[str]] = None) -> int:
+        """수집 에이전트로 명령어 실행
+
+        서버에 이 규칙 세트의 에이전트가 없으면 업로드한 뒤 다시 실행하고,
+        결과를 명령어 캐시에 등록합니다.
+
+        Args:
+            commands: 실행할 명령어 목록 (기본: 로드된 규칙의 전체 명령어)
+
+        Returns:
+            수집된 명령어 수 (실패 시 0)
+        """
+        if not self._connected:
+            raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+
+        commands = list(dict.fromkeys(self._pending_commands() if commands is None else commands))
+        if not commands:
+            return 0
+
+        agent = self._get_agent()
+        request = agent.build_request(commands, workers=self.AGENT_WORKERS)
+        uploaded = False
+
+        try:
+            output = await self._ssh_client.execute(
+                agent.run_command(), timeout=self.BATCH_TIMEOUT, input=request
+            )
+            try:
+                outputs = agent.parse_output(output, commands)
+            except AgentNotInstalledError:
+                await self._ssh_client.execute(agent.upload_command(), input=agent.script)
+                uploaded = True
+                output = await self._ssh_client.execute(
+                    agent.run_command(), timeout=self.BATCH_TIMEOUT, input=request
+                )
+                outputs = agent.parse_output(output, commands)
+        except Exception as e:
+            logger.warning(f"에이전트 수집 실패, 배치 수집으로 대체: {e}")
+            return 0
+
+        for command, agent_output in outputs.items():
+            if agent_output.exit_code != 0:
+                logger.debug(
+                    f"에이전트 명령어 종료 코드 {agent_output.exit_code}: {command[:50]}..."
+                )
+            self._command_cache.prime(command, agent_output.stdout)
+
+        logger.info(
+            f"에이전트 수집 완료: {len(outputs)}개 명령어 "
+            f"({agent.filename}{', 업로드' if uploaded else ''})"
+        )
+        return len(outputs)
+
+    @staticmethod
+    def _is_manual_command(command: str) -> bool:
+        """수동 점검 명령어 여부 (빈 문자열 또는 "echo 'No commands" 자리표시자)"""
+        return not command.strip() or command.strip().startswith("echo 'No commands")
+
     async def scan_one(self, rule: RuleMetadata) -> CheckResult:
         """단일 규칙 점검
 
@@ -144,6 +493,7 @@ class UnixScanner(BaseScanner):
 
         Raises:
             RuntimeError: 명령어 실행 실패 또는 validator 호출 실패
+            ConnectionError: 실행 중 서버 연결이 끊어진 경우
         """
         if not self._connected:
             raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
@@ -154,20 +504,24 @@ class UnixScanner(BaseScanner):
 
             for command in rule.commands:
                 # 수동 점검 명령어는 skip (명령어가 빈 문자열이거나 "echo" 같은 경우)
-                if not command.strip() or command.strip().startswith("echo 'No commands"):
+                if self._is_manual_command(command):
                     logger.debug(f"수동 점검 규칙: {rule.id}, 명령어 실행 skip")
                     command_outputs.append("")
                     continue
 
                 try:
-                    output = await self.execute_command(command)
+                    # 같은 스캔의 중복 명령어 및 배치 수집 결과는 캐시에서 반환
+                    output = await self._execute_cached(command)
                     command_outputs.append(output)
                     logger.debug(f"{rule.id}: 명령어 실행 완료, {len(output)} 바이트")
+                except ConnectionError:
+                    # 연결 끊김은 빈 출력으로 채점하지 않음 (재연결 후 다시 점검)
+                    raise
                 except Exception as e:
                     logger.error(f"{rule.id}: 명령어 실행 실패: {command[:50]}..., {e}")
                     command_outputs.append("")  # 빈 출력
 
-            # 2. Validator 함수 동적 import 및 호출
+            # 2. Validator 함수 호출 (디스패치 테이블)
             validator_result = self._call_validator(rule, command_outputs)
 
             logger.info(
@@ -177,59 +531,14 @@ class UnixScanner(BaseScanner):
 
             return validator_result
 
+        except ConnectionError:
+            raise
         except Exception as e:
             logger.error(f"{rule.id} 점검 중 오류: {e}")
             return CheckResult(status=Status.MANUAL, message=f"점검 중 오류 발생: {str(e)[:200]}")
 
-    def _call_validator(self, rule: RuleMetadata, outputs: List[str]) -> CheckResult:
-        """Validator 함수 동적 호출
-
-        Args:
-            rule: 점검 규칙
-            outputs: 명령어 출력 리스트
-
-        Returns:
-            CheckResult
-
-        Raises:
-            RuntimeError: validator 함수 import 또는 호출 실패
-        """
-        try:
-            # validator 경로 파싱: validators.linux.check_u01 또는 validators.macos.check_m01
-            parts = rule.validator.split(".")
-            if len(parts) < 3:
-                raise ValueError(f"올바르지 않은 validator 경로: {rule.validator}")
-
-            # 모듈 경로: src.core.analyzer.validators.linux (또는 macos)
-            module_path = f"src.core.analyzer.{'.'.join(parts[:-1])}"
-            function_name = parts[-1]  # check_u01 (또는 check_m01)
-
-            # 동적 import
-            try:
-                module = importlib.import_module(module_path)
-            except ModuleNotFoundError:
-                raise RuntimeError(f"Validator 모듈을 찾을 수 없습니다: {module_path}")
-
-            # 함수 가져오기
-            if not hasattr(module, function_name):
-                raise RuntimeError(f"Validator 함수를 찾을 수 없습니다: {function_name}")
-
-            validator_func = getattr(module, function_name)
-
-            # 함수 호출
-            result = validator_func(outputs)
-
-            # CheckResult 타입 확인
-            if not isinstance(result, CheckResult):
-                raise RuntimeError(f"Validator가 CheckResult를 반환하지 않았습니다: {type(result)}")
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Validator 호출 실패 ({rule.id}): {e}")
-            raise RuntimeError(f"Validator 호출 실패: {e}")
-
 
 __all__ = [
+    "CommandExecutor",
     "UnixScanner",
 ]
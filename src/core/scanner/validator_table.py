@@ -0,0 +1,158 @@
+"""Validator 디스패치 테이블
+
+규칙의 validator 경로(예: validators.linux.check_u01)를 규칙 로드 시 한 번만
+import하여 함수 객체로 변환해 두고, 스캔 중에는 딕셔너리 조회만으로 호출합니다.
+
+테이블은 프로세스 전역으로 공유되며 (get_validator_table()),
+스캐너, FleetScanner, 캡처 재생 스캐너가 같은 테이블을 사용합니다.
+찾을 수 없는 validator는 규칙 로드 시 로그로 보고하고 실패 원인을 기억하므로,
+스캔 중에 같은 import를 다시 시도하지 않습니다.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List
+
+from ..domain.models import CheckResult, RuleMetadata
+
+logger = logging.getLogger(__name__)
+
+# validator 경로의 기준 패키지 (validators.linux.check_u01 -> src.core.analyzer.validators.linux)
+VALIDATOR_PACKAGE = "src.core.analyzer"
+
+# Validator 함수 (명령어 출력 리스트 -> CheckResult)
+ValidatorFunc = Callable[[List[str]], CheckResult]
+
+
+class ValidatorNotFoundError(Exception):
+    """Validator를 찾을 수 없음 (경로 형식 오류, 모듈 또는 함수 없음)"""
+
+    pass
+
+
+def resolve_validator(path: str) -> ValidatorFunc:
+    """validator 경로를 함수로 변환
+
+    Args:
+        path: validator 경로 (예: validators.linux.check_u01)
+
+    Returns:
+        Validator 함수
+
+    Raises:
+        ValidatorNotFoundError: 경로 형식이 올바르지 않거나 모듈/함수가 없는 경우
+    """
+    parts = path.split(".")
+    if len(parts) < 3:
+        raise ValidatorNotFoundError(f"올바르지 않은 validator 경로: {path}")
+
+    # 모듈 경로: src.core.analyzer.validators.linux (또는 macos, windows)
+    module_path = f"{VALIDATOR_PACKAGE}.{'.'.join(parts[:-1])}"
+    function_name = parts[-1]
+
+    try:
+        module = importlib.import_module(module_path)
+    except ModuleNotFoundError:
+        raise ValidatorNotFoundError(f"Validator 모듈을 찾을 수 없습니다: {module_path}")
+
+    func = getattr(module, function_name, None)
+    if not callable(func):
+        raise ValidatorNotFoundError(f"Validator 함수를 찾을 수 없습니다: {function_name}")
+    return func
+
+
+class ValidatorTable:
+    """Validator 디스패치 테이블 (validator 경로 -> 함수, 스레드 안전)
+
+    사용 예시:
+        >>> table = get_validator_table()
+        >>> missing = table.compile(rules)  # 규칙 로드 시 1회
+        >>> table.get(rule.validator)(outputs)  # 스캔 중 (import 없음)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._funcs: Dict[str, ValidatorFunc] = {}
+
+        # 찾을 수 없는 validator 경로 -> 오류 메시지
+        self._errors: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._funcs)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._funcs
+
+    def compile(self, rules: Iterable[RuleMetadata]) -> Dict[str, str]:
+        """규칙의 validator를 미리 변환 (처음 보는 경로만 import)
+
+        Args:
+            rules: 점검 규칙
+
+        Returns:
+            rule_id -> 오류 메시지 (validator를 찾을 수 없는 규칙)
+        """
+        missing: Dict[str, str] = {}
+        for rule in rules:
+            try:
+                self.get(rule.validator)
+            except ValidatorNotFoundError as e:
+                missing[rule.id] = str(e)
+        return missing
+
+    def get(self, path: str) -> ValidatorFunc:
+        """validator 함수 조회 (테이블에 없으면 변환 후 등록)
+
+        Args:
+            path: validator 경로
+
+        Returns:
+            Validator 함수
+
+        Raises:
+            ValidatorNotFoundError: validator를 찾을 수 없는 경우 (실패도 기억하여 재시도하지 않음)
+        """
+        func = self._funcs.get(path)
+        if func is not None:
+            return func
+
+        with self._lock:
+            func = self._funcs.get(path)
+            if func is not None:
+                return func
+            if path in self._errors:
+                raise ValidatorNotFoundError(self._errors[path])
+
+            try:
+                func = resolve_validator(path)
+            except ValidatorNotFoundError as e:
+                self._errors[path] = str(e)
+                logger.error(f"Validator 로드 실패: {path}, {e}")
+                raise
+
+            self._funcs[path] = func
+            return func
+
+    def clear(self) -> None:
+        """테이블 비우기 (validator 모듈을 다시 로드한 경우)"""
+        with self._lock:
+            self._funcs = {}
+            self._errors = {}
+
+
+_default_table = ValidatorTable()
+
+
+def get_validator_table() -> ValidatorTable:
+    """프로세스 공유 validator 디스패치 테이블"""
+    return _default_table
+
+
+__all__ = [
+    "ValidatorFunc",
+    "ValidatorNotFoundError",
+    "ValidatorTable",
+    "get_validator_table",
+    "resolve_validator",
+]
@@ -4,21 +4,43 @@ Windows 서버에 WinRM으로 연결하여 보안 점검을 수행합니다.
 BaseScanner를 상속하여 Windows 전용 스캔 로직을 구현합니다.
 """
 
-import importlib
+import asyncio
 import logging
-from typing import List
+from typing import Dict, Iterable, List, Optional, Protocol, Tuple
 
+from ...infrastructure.network.capture import CommandRecorder, ScanCapture
 from ...infrastructure.network.winrm_client import (
+    RegistryPair,
+    RegistryValue,
     WinRMClient,
     WinRMConnectionError,
 )
 from ..domain.models import CheckResult, RuleMetadata, Status
 from .base_scanner import BaseScanner
-from .rule_loader import load_rules
+from .collectors import AccountPolicyCollector, RegistryCollector, SnapshotCollector
+from .fingerprint import build_windows_fingerprint_script
+from .powershell_batch import PowerShellBatch
+from .rule_catalog import get_rule_catalog
 
 logger = logging.getLogger(__name__)
 
 
+class PowerShellExecutor(Protocol):
+    """WindowsScanner 명령어 실행 백엔드 (WinRMClient, ReplayExecutor)"""
+
+    recorder: Optional[CommandRecorder]
+
+    async def connect(self) -> object: ...
+
+    async def disconnect(self) -> None: ...
+
+    async def execute_powershell(self, script: str, timeout: int = 60) -> str: ...
+
+    async def get_registry_values(
+        self, pairs: Iterable[RegistryPair]
+    ) -> Dict[RegistryPair, Optional[RegistryValue]]: ...
+
+
 class WindowsScanner(BaseScanner):
     """Windows 서버 스캐너
 
@@ -37,8 +59,28 @@ class WindowsScanner(BaseScanner):
         >>> result = await scanner.scan_all()
         >>> print(f"점수: {result.score}/100")
         >>> await scanner.disconnect()
+
+    배치 모드:
+        batch_mode=True로 생성하면 scan_all() 시작 시 전체 규칙의 명령어를
+        하나의 PowerShell 스크립트로 묶어 WinRM 왕복 1회로 실행하고,
+        scan_one()은 수집된 출력을 기존 validator에 그대로 전달합니다.
+        스크립트가 명령줄 길이 제한을 넘으면 여러 개로 나누어 셸 풀에서 동시에 실행합니다.
+
+    스냅샷 수집기:
+        snapshot_collectors=True(기본)이면 다음 명령어를 스캔당 1회 수집한 스냅샷으로
+        로컬에서 평가합니다. 수집기가 재현하지 못한 명령어는 기존처럼 원격 실행합니다.
+        - `Get-ItemProperty ... | Select-Object -ExpandProperty X`: 키 단위 레지스트리 일괄 조회
+          (스캔 동안 캐시되며 get_registry_values()로도 조회 가능)
+        - `net accounts | findstr "..."`: net accounts 1회
+
+    기록 및 재생:
+        set_capture(ScanCapture(...))로 실행한 PowerShell 스크립트의 출력, 종료 코드,
+        소요 시간을 기록하고, set_executor(ReplayExecutor(capture))로 네트워크 없이 재생합니다.
     """
 
+    # 배치 스크립트 1개의 실행 타임아웃 (초)
+    BATCH_TIMEOUT = 300
+
     def __init__(
         self,
         server_id: str,
@@ -48,6 +90,9 @@ class WindowsScanner(BaseScanner):
         port: int = 5986,
         transport: str = "ntlm",
         use_ssl: bool = True,
+        max_concurrency: int = 1,
+        batch_mode: bool = False,
+        snapshot_collectors: bool = True,
     ):
         """초기화
 
@@ -59,20 +104,34 @@ class WindowsScanner(BaseScanner):
             port: WinRM 포트 (기본: 5986 HTTPS)
             transport: 인증 방식 (ntlm, kerberos, basic, credssp)
             use_ssl: SSL/TLS 사용 여부 (기본: True)
+            max_concurrency: 동시에 실행할 최대 규칙 수 (기본: 1, 순차 실행,
+                WinRM 셸 풀 크기로도 사용)
+            batch_mode: PowerShell 배치 수집 사용 여부 (기본: False)
+            snapshot_collectors: 스냅샷 수집기 사용 여부 (기본: True)
         """
         # BaseScanner 초기화 (platform="windows" 고정)
-        super().__init__(server_id=server_id, platform="windows")
+        super().__init__(server_id=server_id, platform="windows", max_concurrency=max_concurrency)
 
         # WinRM 클라이언트 생성
-        self._client = WinRMClient(
+        self._client: PowerShellExecutor = WinRMClient(
             host=host,
             username=username,
             password=password,
             port=port,
             transport=transport,
             use_ssl=use_ssl,
+            max_shells=max_concurrency,
         )
 
+        self.batch_mode = batch_mode
+        self.snapshot_collectors = snapshot_collectors
+
+        # 스캔 단위 레지스트리 캐시 (scan_all() 시작 시 초기화)
+        self._registry = RegistryCollector()
+
+        # 마지막 스캔의 스냅샷 (수집기 이름 -> 수집기)
+        self._snapshots: Dict[str, SnapshotCollector] = {}
+
         logger.debug(f"WindowsScanner 초기화: {server_id} ({host})")
 
     async def connect(self) -> None:
@@ -119,6 +178,7 @@ class WindowsScanner(BaseScanner):
 
         Raises:
             RuntimeError: 연결되지 않았거나 명령어 실행 실패
+            ConnectionError: 실행 중 서버 연결이 끊어진 경우
         """
         if not self._connected:
             raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
@@ -126,11 +186,37 @@ class WindowsScanner(BaseScanner):
         try:
             return await self._client.execute_powershell(command)
 
+        except WinRMConnectionError as e:
+            raise ConnectionError(f"서버 연결이 끊어졌습니다: {self.server_id}, 오류: {e}")
         except Exception as e:
             raise RuntimeError(f"명령어 실행 실패: {e}")
 
+    def set_capture(self, capture: Optional[ScanCapture]) -> None:
+        """명령어 실행 기록 시작 (None이면 중지)
+
+        WinRM 호출 단위(배치 스크립트, 레지스트리 일괄 조회 포함)로 기록하며,
+        재생에 필요한 수집 옵션을 capture.options에 남깁니다.
+
+        Args:
+            capture: 기록할 캡처
+        """
+        if capture is not None:
+            capture.options = {
+                "batch_mode": self.batch_mode,
+                "snapshot_collectors": self.snapshot_collectors,
+            }
+        self._client.recorder = capture.record if capture is not None else None
+
+    def set_executor(self, executor: PowerShellExecutor) -> None:
+        """명령어 실행 백엔드 교체 (예: ReplayExecutor로 캡처 재생)
+
+        Args:
+            executor: connect/disconnect/execute_powershell/get_registry_values를 제공하는 실행기
+        """
+        self._client = executor
+
     async def load_rules(self, rules_dir: str) -> None:
-        """Windows 규칙 파일 로드
+        """Windows 규칙 파일 로드 (프로세스 공유 RuleCatalog 사용)
 
         Args:
             rules_dir: 규칙 파일 디렉토리 경로 (예: config/rules)
@@ -140,11 +226,185 @@ class WindowsScanner(BaseScanner):
             ValueError: 규칙 파일 파싱 실패
         """
         try:
-            self._rules = load_rules(rules_dir, platform="windows")
+            self.set_rules(get_rule_catalog(rules_dir).rules("windows"))
             logger.info(f"Windows 규칙 {len(self._rules)}개 로드 완료")
         except Exception as e:
             raise ValueError(f"규칙 로드 실패: {e}")
 
+    async def _prepare_scan(self, rules: Optional[List[RuleMetadata]] = None) -> None:
+        """스캔 시작 전 준비
+
+        1. 스냅샷 수집기가 처리할 명령어를 선택하여 수집기별로 1회 조회
+        2. 배치 모드이면 나머지 명령어를 일괄 수집 (스냅샷 수집과 동시에 실행)
+        3. 스냅샷으로 재현한 출력을 명령어 캐시에 등록
+
+        Args:
+            rules: 이번 스캔에서 실행할 규칙 (기본: 로드된 전체 규칙)
+        """
+        self._snapshots = {}
+        self._registry = RegistryCollector()
+        entries = self._pending_entries(rules)
+        commands = list(dict.fromkeys(command for _, command in entries))
+
+        claimed: Dict[str, List[str]] = {}
+        collectors: List[SnapshotCollector] = []
+        if self.snapshot_collectors:
+            for collector in self._create_collectors():
+                owned = [command for command in commands if collector.claims(command)]
+                if owned:
+                    collectors.append(collector)
+                    claimed[collector.name] = owned
+
+        tasks = [
+            self._load_snapshot(collector, claimed[collector.name]) for collector in collectors
+        ]
+        if self.batch_mode:
+            owned_commands = {command for owned in claimed.values() for command in owned}
+            tasks.append(
+                self.collect_batch([entry for entry in entries if entry[1] not in owned_commands])
+            )
+
+        await asyncio.gather(*tasks)
+
+    def _create_collectors(self) -> List[SnapshotCollector]:
+        """스캔에 사용할 스냅샷 수집기 (레지스트리 수집기는 스캔 단위 레지스트리 캐시로도 사용)
+
+        Returns:
+            SnapshotCollector 리스트
+        """
+        return [self._registry, AccountPolicyCollector()]
+
+    async def _load_snapshot(self, collector: SnapshotCollector, commands: List[str]) -> None:
+        """스냅샷 수집 후 재현한 출력을 명령어 캐시에 등록
+
+        스냅샷 수집에 실패하면 해당 명령어는 기존처럼 원격 실행됩니다.
+
+        Args:
+            collector: 스냅샷 수집기
+            commands: 수집기가 처리할 명령어 목록
+        """
+        try:
+            output = await self._client.execute_powershell(
+                collector.build_command(commands), timeout=self.BATCH_TIMEOUT
+            )
+            collector.load(output)
+        except Exception as e:
+            logger.warning(f"{collector.name} 스냅샷 수집 실패, 명령어별 실행으로 대체: {e}")
+            return
+
+        self._snapshots[collector.name] = collector
+
+        rendered = 0
+        for command in commands:
+            output = collector.render(command)
+            if output is not None:
+                self._command_cache.prime(command, output)
+                rendered += 1
+
+        logger.info(f"{collector.name} 스냅샷으로 {rendered}/{len(commands)}개 명령어 로컬 평가")
+
+    def get_snapshot(self, name: str) -> Optional[SnapshotCollector]:
+        """마지막 스캔에서 수집한 스냅샷 조회
+
+        Args:
+            name: 수집기 이름 (예: "registry", "account_policy")
+
+        Returns:
+            SnapshotCollector (수집하지 않았거나 실패했으면 None)
+        """
+        return self._snapshots.get(name)
+
+    async def get_registry_values(
+        self, pairs: Iterable[RegistryPair]
+    ) -> Dict[RegistryPair, Optional[RegistryValue]]:
+        r"""레지스트리 값 일괄 조회 (스캔 단위 캐시)
+
+        이번 스캔에서 이미 조회한 값은 원격 실행 없이 반환하고,
+        나머지는 키 단위로 묶어 한 번에 조회합니다.
+
+        Args:
+            pairs: (키 경로, 값 이름) 목록 (예: [("HKLM:\...\Lsa", "NoLMHash")])
+
+        Returns:
+            (키 경로, 값 이름) -> RegistryValue (키나 값이 없으면 None)
+        """
+        pairs = list(dict.fromkeys(pairs))
+        missing = [pair for pair in pairs if not self._registry.is_fetched(*pair)]
+        if missing:
+            self._registry.add(await self._client.get_registry_values(missing), missing)
+
+        return {pair: self._registry.get(*pair) for pair in pairs}
+
+    def _fingerprint_command(self, keys: List[str]) -> Optional[str]:
+        """입력 지문 수집 명령어 (PowerShell)"""
+        return build_windows_fingerprint_script(keys)
+
+    def _pending_entries(self, rules: Optional[List[RuleMetadata]] = None) -> List[Tuple[str, str]]:
+        """규칙의 원격 실행 대상 (키, 명령어) 목록 (수동 점검 및 캐시된 명령어 제외)
+
+        키는 "<rule_id>:<명령어 인덱스>" 형식입니다.
+
+        Args:
+            rules: 점검 규칙 리스트 (기본: 로드된 전체 규칙)
+        """
+        return [
+            (f"{rule.id}:{index}", command)
+            for rule in (self._rules if rules is None else rules)
+            for index, command in enumerate(rule.commands)
+            if not self._is_manual_command(command) and command not in self._command_cache
+        ]
+
+    async def collect_batch(self, entries: Optional[List[Tuple[str, str]]] = None) -> int:
+        """명령어를 PowerShell 배치로 실행
+
+        명령어를 하나의 PowerShell 스크립트로 묶어 실행하고 결과를 명령어 캐시에 등록합니다.
+        실패한 스크립트의 명령어는 명령어별 실행으로 대체됩니다.
+
+        Args:
+            entries: (키, 명령어) 목록 (기본: 로드된 규칙의 전체 명령어)
+
+        Returns:
+            수집된 명령어 수
+        """
+        if not self._connected:
+            raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+
+        batch = PowerShellBatch(self._pending_entries() if entries is None else entries)
+        if not len(batch):
+            return 0
+
+        chunks = batch.split()
+        counts = await asyncio.gather(*(self._collect_chunk(chunk) for chunk in chunks))
+
+        collected = sum(counts)
+        logger.info(
+            f"배치 수집 완료: {collected}/{len(batch)}개 명령어 (WinRM 왕복 {len(chunks)}회)"
+        )
+        return collected
+
+    async def _collect_chunk(self, chunk: PowerShellBatch) -> int:
+        """배치 스크립트 1개 실행 후 결과를 명령어 캐시에 등록"""
+        try:
+            output = await self._client.execute_powershell(
+                chunk.build_script(), timeout=self.BATCH_TIMEOUT
+            )
+            outputs = chunk.parse_output(output)
+        except Exception as e:
+            logger.warning(f"배치 수집 실패, 명령어별 실행으로 대체: {e}")
+            return 0
+
+        for command, batch_output in outputs.items():
+            if batch_output.exit_code != 0:
+                logger.debug(f"배치 명령어 종료 코드 {batch_output.exit_code}: {command[:50]}...")
+            self._command_cache.prime(command, batch_output.stdout)
+
+        return len(outputs)
+
+    @staticmethod
+    def _is_manual_command(command: str) -> bool:
+        """수동 점검 명령어 여부 (빈 문자열 또는 "echo 'No commands" 자리표시자)"""
+        return not command.strip() or command.strip().startswith("echo 'No commands")
+
     async def scan_one(self, rule: RuleMetadata) -> CheckResult:
         """단일 규칙 점검
 
@@ -156,6 +416,7 @@ class WindowsScanner(BaseScanner):
 
         Raises:
             RuntimeError: 명령어 실행 실패 시
+            ConnectionError: 실행 중 서버 연결이 끊어진 경우
         """
         if not self._connected:
             raise RuntimeError("서버에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
@@ -166,20 +427,24 @@ class WindowsScanner(BaseScanner):
 
             for command in rule.commands:
                 # 수동 점검 명령어는 skip
-                if not command.strip() or command.strip().startswith("echo 'No commands"):
+                if self._is_manual_command(command):
                     logger.debug(f"수동 점검 규칙: {rule.id}, 명령어 실행 skip")
                     command_outputs.append("")
                     continue
 
                 try:
-                    output = await self.execute_command(command)
+                    # 같은 스캔의 중복 명령어는 캐시에서 반환
+                    output = await self._execute_cached(command)
                     command_outputs.append(output)
                     logger.debug(f"{rule.id}: 명령어 실행 완료, {len(output)} 바이트")
+                except ConnectionError:
+                    # 연결 끊김은 빈 출력으로 채점하지 않음 (재연결 후 다시 점검)
+                    raise
                 except Exception as e:
                     logger.error(f"{rule.id}: 명령어 실행 실패: {command[:50]}..., {e}")
                     command_outputs.append("")  # 빈 출력
 
-            # 2. Validator 함수 동적 import 및 호출
+            # 2. Validator 함수 호출 (디스패치 테이블)
             validator_result = self._call_validator(rule, command_outputs)
 
             logger.info(
@@ -189,59 +454,14 @@ class WindowsScanner(BaseScanner):
 
             return validator_result
 
+        except ConnectionError:
+            raise
         except Exception as e:
             logger.error(f"{rule.id} 점검 중 오류: {e}")
             return CheckResult(status=Status.MANUAL, message=f"점검 중 오류 발생: {str(e)[:200]}")
 
-    def _call_validator(self, rule: RuleMetadata, outputs: List[str]) -> CheckResult:
-        """Validator 함수 동적 호출
-
-        Args:
-            rule: 점검 규칙
-            outputs: 명령어 출력 리스트
-
-        Returns:
-            CheckResult
-
-        Raises:
-            RuntimeError: validator 함수 import 또는 호출 실패
-        """
-        try:
-            # validator 경로 파싱: validators.windows.check_w01
-            parts = rule.validator.split(".")
-            if len(parts) < 3:
-                raise ValueError(f"올바르지 않은 validator 경로: {rule.validator}")
-
-            # 모듈 경로: src.core.analyzer.validators.windows
-            module_path = f"src.core.analyzer.{'.'.join(parts[:-1])}"
-            function_name = parts[-1]  # check_w01
-
-            # 동적 import
-            try:
-                module = importlib.import_module(module_path)
-            except ModuleNotFoundError:
-                raise RuntimeError(f"Validator 모듈을 찾을 수 없습니다: {module_path}")
-
-            # 함수 가져오기
-            if not hasattr(module, function_name):
-                raise RuntimeError(f"Validator 함수를 찾을 수 없습니다: {function_name}")
-
-            validator_func = getattr(module, function_name)
-
-            # 함수 호출
-            result = validator_func(outputs)
-
-            # CheckResult 타입 확인
-            if not isinstance(result, CheckResult):
-                raise RuntimeError(f"Validator가 CheckResult를 반환하지 않았습니다: {type(result)}")
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Validator 호출 실패 ({rule.id}): {e}")
-            raise RuntimeError(f"Validator 호출 실패: {e}")
-
 
 __all__ = [
+    "PowerShellExecutor",
     "WindowsScanner",
 ]
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from ...core.domain.models import RemediationResult
+from ...core.scanner.checkpoint import DEFAULT_CHECKPOINT_DIR
 from ..workers.remediation_worker import RemediationWorker
 
 
@@ -213,6 +214,7 @@ class RemediationDialog(QDialog):
             key_filename=self.server.get("key_path"),
             port=self.server.get("port", 22),
             dry_run=False,  # 실제 실행 모드
+            checkpoint_dir=DEFAULT_CHECKPOINT_DIR,
         )
 
         # 시그널 연결
@@ -360,5 +362,11 @@ class RemediationDialog(QDialog):
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def reject(self):
+        """다이얼로그 닫기 (실행 중인 Worker는 취소)"""
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+        super().reject()
+
 
 __all__ = ["RemediationDialog"]
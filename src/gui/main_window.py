@@ -32,9 +32,12 @@ from .dialogs.server_dialog import ServerDialog
 from .dialogs.remediation_dialog import RemediationDialog
 from .dialogs.settings_dialog import SettingsDialog
 from .workers.scan_worker import ScanWorker
+from .workers.event_loop import shutdown_event_loop
+from .workers.rule_watcher import RuleWatcher
 from ..infrastructure.reporting.excel_reporter import ExcelReporter
 from ..infrastructure.database.models import create_db_engine, create_db_session
 from ..infrastructure.config.settings import load_settings, get_setting
+from ..core.scanner import DEFAULT_CHECKPOINT_DIR, RuleTimingStore, get_rule_catalog
 
 
 class MainWindow(QMainWindow):
@@ -73,6 +76,12 @@ class MainWindow(QMainWindow):
         # 설정 로드
         self.app_settings = load_settings()
 
+        # 규칙 실행 시간 기록 (스캔 남은 시간 예측)
+        self.rule_timings = RuleTimingStore("data/scan_state/rule_timings.json")
+
+        # 규칙 파일 변경 감시 (수정한 규칙은 다음 스캔부터 반영, 규칙은 첫 스캔 때 로드)
+        self.rule_watcher = RuleWatcher(get_rule_catalog("config/rules"), self)
+
         # UI 초기화
         self._setup_ui()
         self._create_menus()
@@ -168,10 +177,15 @@ class MainWindow(QMainWindow):
 
         # 스캔 버튼 시그널
         self.scan_view.scan_requested.connect(self._on_start_scan)
+        self.scan_view.scan_stopped.connect(self._on_stop_scan)
 
         # 자동 수정 시그널
         self.result_view.remediate_requested.connect(self._on_remediate_requested)
 
+        # 규칙 파일 변경 시그널
+        self.rule_watcher.rules_changed.connect(self._on_rules_changed)
+        self.rule_watcher.error.connect(self.scan_view.append_log)
+
     def _on_add_server(self):
         """서버 추가 핸들러"""
         dialog = ServerDialog(self)
@@ -238,10 +252,16 @@ class MainWindow(QMainWindow):
             password=self.current_server.get("password"),
             key_filename=self.current_server.get("key_path"),
             port=self.current_server.get("port", 22),
+            timing_store=self.rule_timings,
+            checkpoint_dir=DEFAULT_CHECKPOINT_DIR,
+            max_concurrency=get_setting(
+                self.app_settings, "scan.max_concurrency", ScanWorker.DEFAULT_MAX_CONCURRENCY
+            ),
         )
 
         # 시그널 연결
         self.scan_worker.progress.connect(self._on_scan_progress)
+        self.scan_worker.eta.connect(self.scan_view.update_eta)
         self.scan_worker.log.connect(self._on_scan_log)
         self.scan_worker.finished.connect(self._on_scan_finished)
         self.scan_worker.error.connect(self._on_scan_error)
@@ -254,6 +274,12 @@ class MainWindow(QMainWindow):
         self.tab_widget.setCurrentWidget(self.scan_view)
         self.statusBar().showMessage("스캔 시작...")
 
+    def _on_stop_scan(self):
+        """스캔 중지 핸들러 (실행 중인 원격 명령어까지 취소)"""
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.scan_worker.cancel()
+            self.statusBar().showMessage("스캔 취소 중...")
+
     def _on_scan_progress(self, current: int, total: int, message: str):
         """스캔 진행률 업데이트
 
@@ -273,6 +299,14 @@ class MainWindow(QMainWindow):
         """
         self.scan_view.append_log(message)
 
+    def _on_rules_changed(self, changed_ids: list):
+        """규칙 파일 변경 반영
+
+        Args:
+            changed_ids: 바뀐 규칙 id
+        """
+        self.statusBar().showMessage(f"규칙 {len(changed_ids)}개 갱신: {', '.join(changed_ids)}")
+
     def _on_scan_finished(self, result):
         """스캔 완료
 
@@ -281,6 +315,9 @@ class MainWindow(QMainWindow):
         """
         self.last_scan_result = result
 
+        # 스캔이 규칙을 로드했으므로 규칙 파일 감시 시작 (스캔 중 수정한 파일 반영)
+        self.rule_watcher.refresh()
+
         self.statusBar().showMessage(f"스캔 완료! 점수: {result.score:.1f}/100")
         self.scan_completed.emit()
 
@@ -461,7 +498,12 @@ def main():
     window.show()
 
     # 이벤트 루프 실행
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    # Worker 공용 이벤트 루프 및 SSH 연결 풀 정리
+    shutdown_event_loop()
+
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
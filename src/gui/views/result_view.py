@@ -25,6 +25,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ...core.scanner.rule_catalog import get_rule_catalog
+
 
 class ResultView(QWidget):
     """결과 표시 뷰 클래스
@@ -45,13 +47,15 @@ class ResultView(QWidget):
     COLOR_FAIL = QColor(244, 67, 54)  # 빨간색
     COLOR_MANUAL = QColor(255, 152, 0)  # 주황색
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, rules_dir: str = "config/rules"):
         """초기화
 
         Args:
             parent: 부모 위젯
+            rules_dir: 규칙 디렉토리 (자동 수정 가능 여부 확인)
         """
         super().__init__(parent)
+        self.rules_dir = rules_dir
 
         self._setup_ui()
         self._connect_signals()
@@ -317,11 +321,10 @@ class ResultView(QWidget):
         status = item.text(1)
         rule_id = item.data(0, Qt.UserRole)
 
-        # TODO: 실제 규칙 메타데이터에서 remediation.auto 확인
-        # 현재는 샘플로 FAIL 상태이면서 특정 규칙만 자동 수정 가능으로 설정
-        auto_fixable_rules = ["U-03", "U-40", "M-03", "M-04", "M-05", "M-06", "M-07", "M-08"]
-
-        can_remediate = status == "FAIL" and rule_id in auto_fixable_rules
+        # 규칙 메타데이터의 remediation.auto 확인 (공유 카탈로그)
+        can_remediate = status == "FAIL" and get_rule_catalog(self.rules_dir).is_auto_remediable(
+            rule_id
+        )
 
         self.remediate_btn.setEnabled(can_remediate)
 
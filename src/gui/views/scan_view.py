@@ -5,9 +5,12 @@
 주요 기능:
 - 스캔 시작/중지
 - 진행률 표시
+- 남은 시간 표시 (규칙 실행 시간 기록 기반 예측)
 - 상태 메시지 표시
 """
 
+from typing import Optional
+
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import (
     QGroupBox,
@@ -105,6 +108,9 @@ class ScanView(QWidget):
         self.progress_bar.setTextVisible(True)
         control_layout.addWidget(self.progress_bar)
 
+        self.eta_label = QLabel("남은 시간: -")
+        control_layout.addWidget(self.eta_label)
+
         control_group.setLayout(control_layout)
         layout.addWidget(control_group)
 
@@ -158,6 +164,7 @@ class ScanView(QWidget):
         )
 
         self.log_text.clear()
+        self.update_eta(None)
         self.append_log("스캔을 시작합니다...")
 
         # 시그널 발생
@@ -248,6 +255,27 @@ class ScanView(QWidget):
         else:
             self.progress_bar.setValue(0)
 
+    def update_eta(self, seconds: Optional[float]):
+        """남은 시간 업데이트
+
+        Args:
+            seconds: 예측 남은 시간 (초, None이면 예측 불가)
+        """
+        self.eta_label.setText(f"남은 시간: {self.format_duration(seconds)}")
+
+    @staticmethod
+    def format_duration(seconds: Optional[float]) -> str:
+        """남은 시간 표시 문자열 ("약 1분 20초", 예측 불가면 "-")"""
+        if seconds is None:
+            return "-"
+        if seconds < 1:
+            return "곧 완료"
+
+        minutes, secs = divmod(int(round(seconds)), 60)
+        if minutes:
+            return f"약 {minutes}분 {secs}초"
+        return f"약 {secs}초"
+
     def append_log(self, message: str):
         """로그 메시지 추가
 
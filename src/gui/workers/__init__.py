@@ -5,12 +5,19 @@
 주요 Worker:
 - scan_worker: 스캔 실행 Worker (QThread 기반)
 - remediation_worker: 자동 수정 Worker (QThread 기반)
+- event_loop: Worker 공용 asyncio 이벤트 루프 (SSH 연결 풀 공유)
+- rule_watcher: 규칙 파일 변경 감시 (RuleCatalog 증분 갱신)
 """
 
 from .scan_worker import ScanWorker
 from .remediation_worker import RemediationWorker
+from .event_loop import run_coroutine, shutdown_event_loop
+from .rule_watcher import RuleWatcher
 
 __all__ = [
     "ScanWorker",
     "RemediationWorker",
+    "RuleWatcher",
+    "run_coroutine",
+    "shutdown_event_loop",
 ]
@@ -0,0 +1,122 @@
+"""Worker 공용 asyncio 이벤트 루프
+
+모든 Worker가 하나의 백그라운드 이벤트 루프에서 코루틴을 실행합니다.
+
+asyncssh 연결은 생성한 이벤트 루프에서만 사용할 수 있으므로,
+Worker마다 이벤트 루프를 새로 만들면 스캔이 끝난 연결을
+자동 수정 Worker가 재사용할 수 없습니다.
+공용 루프를 사용하면 SSH 연결 풀(get_default_pool())이 Worker 사이에서 공유됩니다.
+
+주요 기능:
+- 백그라운드 스레드에서 이벤트 루프 1개 실행 (처음 사용 시 시작)
+- QThread에서 코루틴 실행 후 결과 대기 (run_coroutine)
+- 취소 가능한 코루틴 제출 (submit_coroutine, Future.cancel()이 asyncio 작업을 취소)
+- 애플리케이션 종료 시 연결 풀 정리 (shutdown_event_loop)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from ...infrastructure.network.ssh_pool import get_default_pool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """공용 이벤트 루프 반환 (없으면 백그라운드 스레드에서 시작)
+
+    Returns:
+        실행 중인 공용 이벤트 루프
+    """
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name="bluepy-event-loop", daemon=True
+            )
+            _thread.start()
+            logger.debug("Worker 공용 이벤트 루프 시작")
+
+        return _loop
+
+
+def submit_coroutine(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """공용 이벤트 루프에 코루틴 제출
+
+    반환된 Future.cancel()은 다른 스레드에서 호출해도 asyncio 작업을 취소합니다.
+    작업은 취소 지점(await)에서 CancelledError를 받아 원격 명령어와 연결을 정리합니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        concurrent.futures.Future
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """공용 이벤트 루프에서 코루틴 실행 후 결과 반환 (호출 스레드는 대기)
+
+    QThread.run()처럼 이벤트 루프 밖의 스레드에서 호출합니다.
+
+    Args:
+        coro: 실행할 코루틴
+        timeout: 최대 대기 시간 (초, None이면 무제한)
+
+    Returns:
+        코루틴 반환값
+
+    Raises:
+        Exception: 코루틴이 발생시킨 예외
+    """
+    return submit_coroutine(coro).result(timeout)
+
+
+def shutdown_event_loop(timeout: float = 10.0) -> None:
+    """연결 풀 정리 후 공용 이벤트 루프 종료 (애플리케이션 종료 시)
+
+    Args:
+        timeout: 정리 작업 최대 대기 시간 (초)
+    """
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread = None, None
+
+    if loop is None or loop.is_closed():
+        return
+
+    async def close_pool() -> None:
+        await get_default_pool().close_all()
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_pool(), loop).result(timeout)
+    except Exception as e:
+        logger.warning(f"SSH 연결 풀 정리 실패: {e}")
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout)
+    loop.close()
+    logger.debug("Worker 공용 이벤트 루프 종료")
+
+
+__all__ = [
+    "get_event_loop",
+    "run_coroutine",
+    "submit_coroutine",
+    "shutdown_event_loop",
+]
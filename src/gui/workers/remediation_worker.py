@@ -2,15 +2,22 @@
 
 QThread를 사용하여 백그라운드에서 자동 수정을 실행하는 Worker입니다.
 ScanWorker 패턴을 따라 asyncio + QThread를 통합합니다.
+스캔에서 사용한 SSH 연결을 연결 풀에서 빌려 재사용합니다.
+실제 수정 후에는 서버의 스캔 체크포인트를 삭제하여 수정 전 결과를 다시 사용하지 않습니다.
+취소하면 이벤트 루프의 작업을 취소하여 실행 중인 원격 명령어까지 중단합니다.
 """
 
-import asyncio
+import concurrent.futures
 import logging
 from typing import Optional, List
 
 from PySide6.QtCore import QThread, Signal
 
 from ...core.domain.models import RemediationResult, RuleMetadata
+from ...core.scanner.checkpoint import discard_checkpoints
+from ...core.scanner.rule_catalog import get_rule_catalog
+from ...infrastructure.network.ssh_pool import get_default_pool
+from .event_loop import submit_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +59,8 @@ class RemediationWorker(QThread):
         key_filename: Optional[str] = None,
         port: int = 22,
         dry_run: bool = True,
+        rules_dir: str = "config/rules",
+        checkpoint_dir: Optional[str] = None,
     ):
         """초기화
 
@@ -65,6 +74,8 @@ class RemediationWorker(QThread):
             key_filename: SSH 키 파일 경로 (선택)
             port: SSH 포트 (기본 22)
             dry_run: Dry-run 모드 (기본 True)
+            rules_dir: 규칙 디렉토리
+            checkpoint_dir: 스캔 체크포인트 디렉토리 (선택, 실제 수정 후 이 서버의 체크포인트 삭제)
         """
         super().__init__()
 
@@ -77,30 +88,33 @@ class RemediationWorker(QThread):
         self.key_filename = key_filename
         self.port = port
         self.dry_run = dry_run
+        self.rules_dir = rules_dir
+        self.checkpoint_dir = checkpoint_dir
 
         self._is_cancelled = False
+        self._future: Optional[concurrent.futures.Future] = None
 
     def run(self):
         """스레드 실행 (QThread 오버라이드)
 
-        asyncio 이벤트 루프를 생성하여 _run_remediation()을 실행합니다.
-        ScanWorker 패턴을 따라 loop.run_until_complete() 사용.
+        Worker 공용 이벤트 루프에서 _run_remediation()을 실행합니다.
+        스캔과 같은 이벤트 루프를 사용하므로 풀의 SSH 연결을 재사용할 수 있습니다.
         """
         try:
-            # 새 이벤트 루프 생성 (스레드마다 독립적)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # 비동기 메서드 실행 및 완료 대기
-            result = loop.run_until_complete(self._run_remediation())
-
-            # 루프 정리
-            loop.close()
+            self._future = submit_coroutine(self._run_remediation())
+            if self._is_cancelled:
+                # 제출 전에 cancel()이 호출된 경우
+                self._future.cancel()
+            result = self._future.result()
 
             # 결과 emit (취소되지 않은 경우)
             if not self._is_cancelled:
                 self.finished.emit(result)
 
+        except concurrent.futures.CancelledError:
+            logger.info(f"자동 수정 취소됨: {self.rule_id}")
+            self.log.emit("자동 수정이 취소되었습니다")
+
         except Exception as e:
             logger.error(f"자동 수정 중 오류: {e}", exc_info=True)
             self.error.emit(f"자동 수정 실패: {str(e)}")
@@ -124,15 +138,11 @@ class RemediationWorker(QThread):
             self.log.emit("서버 연결 성공")
 
             # 2. 규칙 로드
-            await scanner.load_rules()
+            await scanner.load_rules(self.rules_dir)
             self.log.emit(f"규칙 로드 완료 (총 {len(scanner._rules)}개)")
 
-            # 3. 대상 규칙 찾기
-            target_rule = None
-            for rule in scanner._rules:
-                if rule.id == self.rule_id:
-                    target_rule = rule
-                    break
+            # 3. 대상 규칙 찾기 (공유 카탈로그에서 id로 조회)
+            target_rule = get_rule_catalog(self.rules_dir).get(self.rule_id, self.platform)
 
             if not target_rule:
                 raise ValueError(f"규칙을 찾을 수 없습니다: {self.rule_id}")
@@ -150,7 +160,12 @@ class RemediationWorker(QThread):
             self.log.emit(f"[{mode}] {self.rule_id} 실행 중...")
             self.progress.emit(0, 1, f"{self.rule_id} 수정 중...")
 
-            result = await remediator.remediate(target_rule, dry_run=self.dry_run)
+            try:
+                result = await remediator.remediate(target_rule, dry_run=self.dry_run)
+            finally:
+                # 서버 상태가 바뀌었을 수 있으므로 수정 전 점검 결과를 재사용하지 않음
+                if not self.dry_run and self.checkpoint_dir:
+                    discard_checkpoints(self.checkpoint_dir, self.server_id)
 
             self.progress.emit(1, 1, "완료!")
 
@@ -193,6 +208,7 @@ class RemediationWorker(QThread):
                 password=self.password,
                 key_filename=self.key_filename,
                 port=self.port,
+                pool=get_default_pool(),
             )
         elif self.platform == "macos":
             from ...core.scanner import MacOSScanner
@@ -203,6 +219,7 @@ class RemediationWorker(QThread):
                 password=self.password,
                 key_filename=self.key_filename,
                 port=self.port,
+                pool=get_default_pool(),
             )
         elif self.platform == "windows":
             # TODO: Windows Scanner 구현
@@ -226,9 +243,8 @@ class RemediationWorker(QThread):
             from ...core.remediation import MacOSRemediator
             return MacOSRemediator(scanner)
         elif self.platform == "linux":
-            # TODO: Linux Remediator 구현
-            from ...core.remediation import MacOSRemediator
-            return MacOSRemediator(scanner)  # 임시로 MacOS 사용
+            from ...core.remediation import LinuxRemediator
+            return LinuxRemediator(scanner)
         elif self.platform == "windows":
             # TODO: Windows Remediator 구현
             raise ValueError(f"Windows Remediator는 아직 구현되지 않았습니다")
@@ -236,9 +252,15 @@ class RemediationWorker(QThread):
             raise ValueError(f"지원하지 않는 플랫폼: {self.platform}")
 
     def cancel(self):
-        """자동 수정 취소"""
+        """자동 수정 취소 (다른 스레드에서 호출 가능)
+
+        이벤트 루프의 작업을 취소합니다. 실행 중인 원격 명령어는 종료 신호를 받고
+        채널이 닫히며, 백업한 파일은 되돌려집니다.
+        """
         self._is_cancelled = True
         self.log.emit("자동 수정 취소 중...")
+        if self._future is not None:
+            self._future.cancel()
 
 
 __all__ = ["RemediationWorker"]
@@ -0,0 +1,101 @@
+"""Rule Watcher
+
+규칙 디렉토리(config/rules)의 YAML 파일 변경을 감시하여 RuleCatalog에 반영합니다.
+QFileSystemWatcher(Linux에서는 inotify)로 변경을 받고, 짧은 시간 안의 연속 변경
+(편집기 저장 시 임시 파일 생성, 교체 등)은 한 번으로 모아 RuleCatalog.refresh()를 호출합니다.
+
+바뀐 파일만 다시 파싱하며, 이미 규칙 목록을 받은 실행 중인 스캔은 영향을 받지 않습니다.
+
+감시를 시작해도 규칙을 로드하지 않습니다. 카탈로그를 로드하기 전에는 플랫폼 디렉토리만
+감시하고 (로드 시 현재 파일을 읽으므로 반영할 변경이 없음), 스캔 등으로 로드된 뒤
+refresh()를 호출하면 그때부터 규칙 파일도 감시합니다.
+"""
+
+import logging
+from typing import List
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from ...core.scanner.rule_catalog import RuleCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class RuleWatcher(QObject):
+    """규칙 파일 변경 감시 클래스
+
+    Signals:
+        rules_changed: 규칙이 바뀌었을 때 발생 (changed_ids: list)
+        error: 규칙 파일 갱신 실패 (message: str)
+    """
+
+    rules_changed = Signal(list)
+    error = Signal(str)
+
+    # 연속 변경을 모으는 대기 시간 (밀리초)
+    DEBOUNCE_MS = 300
+
+    def __init__(self, catalog: RuleCatalog, parent=None):
+        """초기화
+
+        Args:
+            catalog: 변경을 반영할 규칙 카탈로그
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.catalog = catalog
+
+        self._watcher = QFileSystemWatcher(self)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+
+        self._watcher.directoryChanged.connect(self._schedule_refresh)
+        self._watcher.fileChanged.connect(self._schedule_refresh)
+        self._timer.timeout.connect(self.refresh)
+
+        self._update_watch_paths()
+
+    def refresh(self) -> List[str]:
+        """카탈로그 갱신 (바뀐 파일만 다시 파싱, 로드 전이면 감시 경로만 갱신)
+
+        Returns:
+            바뀐 규칙 id
+        """
+        if not self.catalog.is_loaded:
+            self._update_watch_paths()
+            return []
+
+        changes = self.catalog.refresh()
+
+        # 편집기가 파일을 교체하면 감시가 해제되므로 다시 등록
+        self._update_watch_paths()
+
+        for name, message in changes.errors.items():
+            self.error.emit(f"{name}: {message}")
+
+        changed_ids = changes.changed_ids
+        if changed_ids:
+            logger.info(f"규칙 변경 반영: {', '.join(changed_ids)}")
+            self.rules_changed.emit(changed_ids)
+        return changed_ids
+
+    def _schedule_refresh(self, path: str) -> None:
+        """변경 알림 수신 (대기 시간 후 한 번만 갱신)"""
+        logger.debug(f"규칙 파일 변경 감지: {path}")
+        self._timer.start()
+
+    def _update_watch_paths(self) -> None:
+        """감시 경로를 카탈로그의 규칙 디렉토리, 파일과 일치시킴"""
+        paths = set(self.catalog.watch_paths())
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+
+        removed = watched - paths
+        if removed:
+            self._watcher.removePaths(sorted(removed))
+        added = paths - watched
+        if added:
+            self._watcher.addPaths(sorted(added))
+
+
+__all__ = ["RuleWatcher"]
@@ -3,18 +3,30 @@
 QThread를 사용하여 백그라운드에서 스캔을 실행하는 Worker입니다.
 
 주요 기능:
-- 비동기 Scanner 실행
+- 비동기 Scanner 실행 (취소 시 asyncio 작업 취소로 원격 명령어까지 중단)
+- 하나의 SSH 연결 위에서 여러 규칙 동시 실행 (max_concurrency)
 - 진행률 시그널 emit
+- 남은 시간 시그널 emit (규칙 실행 시간 기록 기반)
+- 연결이 끊어지면 재연결 후 남은 규칙만 실행 (스캔 체크포인트, 이번 스캔 안에서만 사용)
 - 결과 반환
 """
 
-import asyncio
+import concurrent.futures
 import logging
+import uuid
 from typing import Optional
 
 from PySide6.QtCore import QThread, Signal
 
-from ...core.scanner import LinuxScanner, ScanResult
+from ...core.scanner import (
+    LinuxScanner,
+    RuleTimingStore,
+    ScanCheckpoint,
+    ScanResult,
+    discard_checkpoints,
+)
+from ...infrastructure.network.ssh_pool import get_default_pool
+from .event_loop import submit_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +38,7 @@ class ScanWorker(QThread):
 
     Signals:
         progress: 진행률 업데이트 (current: int, total: int, message: str)
+        eta: 남은 시간 업데이트 (seconds: Optional[float], 예측 불가면 None)
         log: 로그 메시지 (message: str)
         finished: 스캔 완료 (result: ScanResult)
         error: 오류 발생 (error_message: str)
@@ -33,10 +46,17 @@ class ScanWorker(QThread):
 
     # 커스텀 시그널
     progress = Signal(int, int, str)  # current, total, message
+    eta = Signal(object)  # 남은 시간 (초) 또는 None
     log = Signal(str)
     finished = Signal(object)  # ScanResult
     error = Signal(str)
 
+    # 스캔 중 연결이 끊어졌을 때 연속 재연결 시도 횟수
+    MAX_RECONNECTS = 5
+
+    # 기본 동시 실행 규칙 수 (설정 scan.max_concurrency가 없을 때)
+    DEFAULT_MAX_CONCURRENCY = 4
+
     def __init__(
         self,
         server_id: str,
@@ -46,6 +66,9 @@ class ScanWorker(QThread):
         key_filename: Optional[str] = None,
         port: int = 22,
         rules_dir: str = "config/rules",
+        timing_store: Optional[RuleTimingStore] = None,
+        checkpoint_dir: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """초기화
 
@@ -57,6 +80,11 @@ class ScanWorker(QThread):
             key_filename: SSH 키 파일 경로 (선택)
             port: SSH 포트
             rules_dir: 규칙 디렉토리
+            timing_store: 규칙 실행 시간 저장소 (선택, 지정하면 남은 시간 예측)
+            checkpoint_dir: 스캔 체크포인트 디렉토리 (선택, 지정하면 완료된 결과를 파일에 기록,
+                없으면 메모리에만 기록). 체크포인트는 이번 스캔의 재연결 후 이어서 실행할
+                때만 사용하며, 취소/실패한 스캔의 결과를 다음 스캔에서 재사용하지 않음
+            max_concurrency: 동시에 실행할 규칙 수 (기본: 4, 1이면 순차 실행)
         """
         super().__init__()
 
@@ -67,24 +95,31 @@ class ScanWorker(QThread):
         self.key_filename = key_filename
         self.port = port
         self.rules_dir = rules_dir
+        self.timing_store = timing_store
+        self.checkpoint_dir = checkpoint_dir
+        self.max_concurrency = max_concurrency
 
         self._is_cancelled = False
+        self._future: Optional[concurrent.futures.Future] = None
 
     def run(self):
         """스레드 실행 (오버라이드)"""
         try:
-            # asyncio 이벤트 루프 생성 및 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            result = loop.run_until_complete(self._run_scan())
-
-            loop.close()
+            # Worker 공용 이벤트 루프에서 실행 (SSH 연결 풀 공유)
+            self._future = submit_coroutine(self._run_scan())
+            if self._is_cancelled:
+                # 제출 전에 cancel()이 호출된 경우
+                self._future.cancel()
+            result = self._future.result()
 
             # 결과 시그널 emit
             if not self._is_cancelled:
                 self.finished.emit(result)
 
+        except concurrent.futures.CancelledError:
+            logger.info(f"스캔 취소됨: {self.host}")
+            self.log.emit("스캔이 취소되었습니다")
+
         except Exception as e:
             logger.error(f"스캔 중 오류: {e}")
             self.error.emit(f"스캔 실패: {str(e)}")
@@ -105,11 +140,22 @@ class ScanWorker(QThread):
             password=self.password,
             key_filename=self.key_filename,
             port=self.port,
+            max_concurrency=self.max_concurrency,
+            pool=get_default_pool(),
         )
+        scanner.set_timing_store(self.timing_store)
+
+        # 스캔마다 새 체크포인트 (이번 스캔의 재연결 후 이어서 실행용)
+        if self.checkpoint_dir:
+            # 비정상 종료된 이전 스캔의 체크포인트 정리
+            discard_checkpoints(self.checkpoint_dir, self.server_id)
+        checkpoint = ScanCheckpoint(
+            f"{scanner.platform}-{self.server_id}-{uuid.uuid4().hex[:12]}", self.checkpoint_dir
+        )
+        scanner.set_checkpoint(checkpoint)
 
+        await scanner.connect()
         try:
-            # 연결
-            await scanner.connect()
             self.log.emit("서버 연결 성공")
 
             # 규칙 로드
@@ -121,26 +167,25 @@ class ScanWorker(QThread):
             self.log.emit("스캔 시작...")
             self.progress.emit(0, total_rules, "스캔 준비 중...")
 
-            result = await self._scan_with_progress(scanner, total_rules)
+            return await self._scan_with_progress(scanner, total_rules)
+
+        finally:
+            # 완료/취소/실패와 관계없이 체크포인트 삭제 (다음 스캔은 처음부터 실행)
+            checkpoint.discard()
 
-            # 연결 해제
+            # 오류/취소 시에도 연결 해제 (연결은 풀에 반환되어 자동 수정 등에서 재사용)
             await scanner.disconnect()
             self.log.emit("서버 연결 해제")
 
-            return result
-
-        except Exception as e:
-            # 오류 시에도 연결 해제 시도
-            try:
-                await scanner.disconnect()
-            except:
-                pass
-
-            raise e
-
     async def _scan_with_progress(self, scanner: LinuxScanner, total: int) -> ScanResult:
         """진행률 업데이트와 함께 스캔 실행
 
+        scan_iter_resumable()로 규칙이 끝날 때마다 결과를 받아 진행률을 갱신합니다.
+        연결이 끊어지면 재연결 후 남은 규칙만 실행하며, 체크포인트에서 복원한 결과도
+        진행률에 포함됩니다.
+        cancel()은 이 작업을 취소하며, 실행 중인 규칙과 원격 명령어는 scan_iter()와
+        SSH 클라이언트가 정리합니다.
+
         Args:
             scanner: LinuxScanner 인스턴스
             total: 전체 규칙 수
@@ -148,34 +193,33 @@ class ScanWorker(QThread):
         Returns:
             ScanResult
         """
-        # Scanner의 scan_all()을 호출하되, 각 규칙마다 진행률 업데이트
-        # 현재 BaseScanner.scan_all()은 순차 실행이므로, 여기서 직접 구현
-
         result = ScanResult(server_id=scanner.server_id, platform=scanner.platform)
 
-        current = 0
-        for rule in scanner._rules:
-            if self._is_cancelled:
-                break
-
-            current += 1
-            self.progress.emit(current, total, f"{rule.id} 점검 중...")
-            self.log.emit(f"[{current}/{total}] {rule.id}: {rule.name}")
-
-            try:
-                check_result = await scanner.scan_one(rule)
+        results = scanner.scan_iter_resumable(max_retries=self.MAX_RECONNECTS)
+        try:
+            async for rule, check_result in results:
                 result.results[rule.id] = check_result
-            except Exception as e:
-                logger.error(f"{rule.id} 점검 실패: {e}")
-                self.log.emit(f"[오류] {rule.id}: {str(e)}")
+
+                current = len(result.results)
+                self.progress.emit(current, total, f"{rule.id} 점검 완료")
+                self.eta.emit(scanner.estimate_remaining())
+                self.log.emit(f"[{current}/{total}] {rule.id}: {rule.name}")
+        finally:
+            await results.aclose()
 
         self.progress.emit(total, total, "스캔 완료!")
         return result
 
     def cancel(self):
-        """스캔 취소"""
+        """스캔 취소 (다른 스레드에서 호출 가능)
+
+        이벤트 루프의 스캔 작업을 취소합니다. 실행 중인 원격 명령어는
+        종료 신호를 받고 채널이 닫히며, 연결은 풀에 반환됩니다.
+        """
         self._is_cancelled = True
         self.log.emit("스캔 취소 중...")
+        if self._future is not None:
+            self._future.cancel()
 
 
 __all__ = [
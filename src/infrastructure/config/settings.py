@@ -30,6 +30,9 @@ DEFAULT_SETTINGS = {
     "backup": {
         "directory": "data/backups",  # 백업 디렉토리 경로
     },
+    "scan": {
+        "max_concurrency": 4,  # 서버 1대에서 동시에 실행할 규칙 수 (SSH 채널 수)
+    },
 }
 
 
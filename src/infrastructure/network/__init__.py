@@ -4,11 +4,19 @@
 
 주요 모듈:
 - ssh_client: SSH 클라이언트 (AsyncSSH 기반)
-- winrm_client: WinRM 클라이언트 (pywinrm 기반)
+- local_executor: 로컬 명령어 실행기 (SSH 없이 로컬 머신 점검)
+- ssh_pool: SSH 연결 풀 (프로세스 전역 연결 재사용)
+- winrm_client: WinRM 클라이언트 (asyncio WS-Man / pywinrm)
+- wsman: asyncio WS-Man 전송 (keep-alive 연결, NTLM 세션 재사용)
+- capture: 명령어 실행 기록 및 재생 (ScanCapture, ReplayExecutor)
 """
 
-from .ssh_client import SSHClient, SSHClientError
+from .capture import CaptureError, ReplayExecutor, ReplayMissError, ScanCapture
+from .local_executor import LocalExecutor, LocalExecutorError
+from .ssh_client import SSHClient, SSHClientError, SSHConnectionLostError
+from .ssh_pool import SSHConnectionPool, get_default_pool, make_pool_key
 from .winrm_client import (
+    RegistryValue,
     WinRMClient,
     WinRMConnectionError,
     WinRMCommandError,
@@ -16,8 +24,19 @@ from .winrm_client import (
 )
 
 __all__ = [
+    "CaptureError",
+    "ReplayExecutor",
+    "ReplayMissError",
+    "ScanCapture",
+    "LocalExecutor",
+    "LocalExecutorError",
     "SSHClient",
     "SSHClientError",
+    "SSHConnectionLostError",
+    "SSHConnectionPool",
+    "get_default_pool",
+    "make_pool_key",
+    "RegistryValue",
     "WinRMClient",
     "WinRMConnectionError",
     "WinRMCommandError",
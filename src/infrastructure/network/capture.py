@@ -0,0 +1,300 @@
+"""명령어 기록 및 재생 (capture/replay)
+
+스캔 중 실행한 원격 명령어의 출력, 종료 코드, 소요 시간을 캡처 파일에 기록하고,
+ReplayExecutor가 네트워크 없이 기록한 출력을 그대로 돌려줍니다.
+
+용도:
+- validator 변경 후 과거 스캔 출력으로 오프라인 재검증 (결정적)
+- 네트워크 지연 없이 스캔 파이프라인 전체의 성능 측정 (재현 가능)
+- 운영 서버에 접속하지 않고 과거 스캔 재채점
+
+기록 단위는 실행기(SSHClient, LocalExecutor, WinRMClient) 호출 1회이며,
+배치 스크립트, 스냅샷 수집, 에이전트 실행도 원본 그대로 기록됩니다.
+재생할 때는 기록 당시와 같은 수집 경로(배치/스냅샷/에이전트)를 사용해야 같은 명령어가
+실행되므로, 스캐너가 기록 시작 시 옵션을 캡처에 남깁니다 (ScanCapture.options).
+
+캡처 파일 형식 (gzip 압축 JSON):
+    {"version": 1, "server_id": ..., "platform": ..., "created_at": ..., "options": {...},
+     "entries": [{"command", "input_digest", "stdout", "exit_code", "latency"}, ...]}
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .winrm_client import (
+    RegistryPair,
+    RegistryValue,
+    build_registry_script,
+    normalize_registry_pair,
+    parse_registry_output,
+)
+
+logger = logging.getLogger(__name__)
+
+# 캡처 파일 형식 버전
+CAPTURE_VERSION = 1
+
+# 실행기가 명령어 완료 시 호출하는 함수 (명령어, stdin, stdout, 종료 코드, 소요 시간 초)
+CommandRecorder = Callable[[str, Optional[str], str, int, float], None]
+
+
+class CaptureError(Exception):
+    """캡처 파일 예외"""
+
+    pass
+
+
+class ReplayMissError(CaptureError):
+    """캡처에 기록되지 않은 명령어"""
+
+    pass
+
+
+def input_digest(input: Optional[str]) -> str:
+    """stdin 데이터 식별자 (없으면 빈 문자열)"""
+    if input is None:
+        return ""
+    return hashlib.sha256(input.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CaptureEntry:
+    """기록된 명령어 실행 1회
+
+    Attributes:
+        command: 실행한 명령어 (PowerShell 스크립트 포함)
+        input_digest: stdin 데이터 식별자 (배치 스크립트 등, 없으면 빈 문자열)
+        stdout: 명령어 출력
+        exit_code: 종료 코드
+        latency: 소요 시간 (초)
+    """
+
+    command: str
+    input_digest: str
+    stdout: str
+    exit_code: int
+    latency: float
+
+
+class ScanCapture:
+    """스캔 캡처 (명령어 실행 기록)
+
+    사용 예시:
+        >>> capture = ScanCapture(server_id="server-001", platform="linux")
+        >>> scanner.set_capture(capture)
+        >>> await scanner.scan_all()
+        >>> capture.save("data/captures/server-001.bpcap")
+        >>>
+        >>> # 재생 (네트워크 없음)
+        >>> scanner = create_replay_scanner(ScanCapture.load("data/captures/server-001.bpcap"))
+        >>> await scanner.load_rules("config/rules")
+        >>> result = await scanner.scan_all()
+    """
+
+    def __init__(self, server_id: str, platform: str, created_at: Optional[datetime] = None):
+        """초기화
+
+        Args:
+            server_id: 서버 식별자
+            platform: 플랫폼 (linux, macos, windows)
+            created_at: 기록 시각 (기본: 현재 시각)
+        """
+        self.server_id = server_id
+        self.platform = platform
+        self.created_at = created_at or datetime.now()
+        self.entries: List[CaptureEntry] = []
+
+        # 기록 당시 스캐너 수집 옵션 (batch_mode 등, 재생 스캐너 생성에 사용)
+        self.options: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(
+        self, command: str, input: Optional[str], stdout: str, exit_code: int, latency: float
+    ) -> None:
+        """명령어 실행 기록 (CommandRecorder)"""
+        self.entries.append(
+            CaptureEntry(
+                command=command,
+                input_digest=input_digest(input),
+                stdout=stdout,
+                exit_code=exit_code,
+                latency=latency,
+            )
+        )
+
+    def total_latency(self) -> float:
+        """기록된 명령어 소요 시간 합계 (초)"""
+        return sum(entry.latency for entry in self.entries)
+
+    def save(self, path: str) -> None:
+        """캡처 파일 저장 (gzip JSON, 임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path: 캡처 파일 경로
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            {
+                "version": CAPTURE_VERSION,
+                "server_id": self.server_id,
+                "platform": self.platform,
+                "created_at": self.created_at.isoformat(),
+                "options": self.options,
+                "entries": [asdict(entry) for entry in self.entries],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".capture-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data))
+            os.replace(tmp_path, target)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"캡처 저장: {path} ({len(self.entries)}개 명령어)")
+
+    @classmethod
+    def load(cls, path: str) -> "ScanCapture":
+        """캡처 파일 로드
+
+        Args:
+            path: 캡처 파일 경로
+
+        Returns:
+            ScanCapture
+
+        Raises:
+            CaptureError: 파일을 읽을 수 없거나 형식이 올바르지 않은 경우
+        """
+        try:
+            data = json.loads(gzip.decompress(Path(path).read_bytes()).decode("utf-8"))
+            if data.get("version") != CAPTURE_VERSION:
+                raise CaptureError(f"지원하지 않는 캡처 버전: {data.get('version')}")
+
+            capture = cls(
+                server_id=data["server_id"],
+                platform=data["platform"],
+                created_at=datetime.fromisoformat(data["created_at"]),
+            )
+            capture.options = dict(data.get("options", {}))
+            capture.entries = [CaptureEntry(**entry) for entry in data["entries"]]
+            return capture
+        except CaptureError:
+            raise
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            raise CaptureError(f"캡처 파일 로드 실패: {path}, {e}")
+
+
+class ReplayExecutor:
+    """캡처 재생 실행기
+
+    SSHClient/LocalExecutor(execute)와 WinRMClient(execute_powershell,
+    get_registry_values) 인터페이스를 제공하며, 기록된 출력을 네트워크 없이 반환합니다.
+
+    같은 명령어가 여러 번 기록되어 있으면 기록된 순서대로 반환하고,
+    마지막 기록은 이후 호출에서 계속 반환합니다.
+    기록되지 않은 명령어는 ReplayMissError를 발생시킵니다 (기록 당시 실패한 명령어 포함).
+    """
+
+    def __init__(self, capture: ScanCapture, latency_scale: float = 0.0):
+        """초기화
+
+        Args:
+            capture: 재생할 캡처
+            latency_scale: 기록된 소요 시간에 곱해 대기할 비율
+                (기본: 0, 대기 없음, 1이면 기록 당시 속도로 재생)
+        """
+        self.capture = capture
+        self.latency_scale = latency_scale
+
+        # 재생 중 다시 기록할 함수 (선택)
+        self.recorder: Optional[CommandRecorder] = None
+
+        self._entries: Dict[Tuple[str, str], List[CaptureEntry]] = {}
+        for entry in capture.entries:
+            self._entries.setdefault((entry.command, entry.input_digest), []).append(entry)
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._connected = False
+
+    async def connect(self) -> bool:
+        """재생 준비 (연결 과정 없음)"""
+        self._connected = True
+        return True
+
+    async def disconnect(self) -> None:
+        """재생 종료"""
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        """준비 상태 확인"""
+        return self._connected
+
+    async def execute(self, command: str, timeout: int = 60, input: Optional[str] = None) -> str:
+        """기록된 명령어 출력 반환
+
+        Args:
+            command: 명령어
+            timeout: 사용하지 않음 (SSHClient 호환)
+            input: 명령어 stdin 데이터 (기록과 같아야 함)
+
+        Returns:
+            기록된 stdout
+
+        Raises:
+            ReplayMissError: 기록되지 않은 명령어
+        """
+        key = (command, input_digest(input))
+        entries = self._entries.get(key)
+        if not entries:
+            raise ReplayMissError(f"캡처에 없는 명령어: {command[:100]}...")
+
+        position = self._positions.get(key, 0)
+        entry = entries[min(position, len(entries) - 1)]
+        self._positions[key] = position + 1
+
+        if self.latency_scale > 0:
+            await asyncio.sleep(entry.latency * self.latency_scale)
+
+        if self.recorder is not None:
+            self.recorder(command, input, entry.stdout, entry.exit_code, entry.latency)
+        return entry.stdout
+
+    async def execute_powershell(self, script: str, timeout: int = 60) -> str:
+        """기록된 PowerShell 출력 반환 (WinRMClient 호환)"""
+        return await self.execute(script, timeout=timeout)
+
+    async def get_registry_values(
+        self, pairs: Iterable[RegistryPair]
+    ) -> Dict[RegistryPair, Optional[RegistryValue]]:
+        """기록된 레지스트리 일괄 조회 결과 반환 (WinRMClient 호환)"""
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+
+        values = parse_registry_output(await self.execute_powershell(build_registry_script(pairs)))
+        return {pair: values.get(normalize_registry_pair(*pair)) for pair in pairs}
+
+
+__all__ = [
+    "CommandRecorder",
+    "CaptureError",
+    "ReplayMissError",
+    "CaptureEntry",
+    "ScanCapture",
+    "ReplayExecutor",
+]
@@ -0,0 +1,171 @@
+"""로컬 명령어 실행기
+
+BluePy가 실행 중인 머신을 점검할 때 SSH 없이 명령어를 실행합니다.
+SSHClient와 같은 인터페이스(connect/execute/disconnect)를 제공하므로
+UnixScanner(local=True)가 SSHClient 대신 사용합니다.
+
+주요 기능:
+- asyncio.create_subprocess_shell 기반 비동기 실행 (bash가 있으면 bash, 없으면 /bin/sh)
+  (배치 수집, 수집 에이전트와 같은 셸 문법)
+- 동시 실행 프로세스 수 제한
+- 취소/타임아웃 시 프로세스 그룹 종료 (파이프라인의 자식 프로세스 포함)
+- 명령어 실행 기록 (recorder, 캡처 파일 작성용)
+
+장점:
+- localhost SSH 대비 명령어마다 암호화/인증 비용 없음
+- sshd 설정 없이 CI에서 실제 OS를 대상으로 validator 검증
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import signal
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 명령어 실행 셸 (None이면 기본 셸 /bin/sh)
+LOCAL_SHELL: Optional[str] = shutil.which("bash") if os.name == "posix" else None
+
+
+class LocalExecutorError(Exception):
+    """로컬 명령어 실행 예외"""
+
+    pass
+
+
+class LocalExecutor:
+    """로컬 명령어 실행기
+
+    사용 예시:
+        >>> executor = LocalExecutor(max_processes=8)
+        >>> await executor.connect()
+        >>> result = await executor.execute("ls -la /etc")
+        >>> print(result)
+        >>> await executor.disconnect()
+
+    SSHClient와 마찬가지로 종료 코드가 0이 아니어도 예외를 발생시키지 않고
+    stdout을 반환합니다 (validator가 결과를 판단).
+    """
+
+    def __init__(self, max_processes: int = 10):
+        """초기화
+
+        Args:
+            max_processes: 동시에 실행할 최대 프로세스 수 (기본: 10)
+        """
+        self.max_processes = max_processes
+
+        # 동시에 실행되는 프로세스 수 제한
+        self._process_semaphore = asyncio.Semaphore(max_processes)
+        self._connected = False
+
+        # 명령어 완료 시 호출 (명령어, stdin, stdout, 종료 코드, 소요 시간 초)
+        self.recorder: Optional[Callable[[str, Optional[str], str, int, float], None]] = None
+
+    async def connect(self) -> None:
+        """실행 준비 (연결 과정 없음)"""
+        self._connected = True
+        logger.debug("로컬 실행기 준비 완료")
+
+    async def disconnect(self) -> None:
+        """실행 종료"""
+        self._connected = False
+
+    async def execute(self, command: str, timeout: int = 60, input: Optional[str] = None) -> str:
+        """명령어 실행
+
+        Args:
+            command: 실행할 셸 명령어
+            timeout: 명령어 실행 타임아웃 (초, 기본: 60)
+            input: 명령어 stdin으로 전달할 데이터 (선택)
+
+        Returns:
+            명령어 출력 (stdout)
+
+        Raises:
+            LocalExecutorError: 준비되지 않았거나 명령어 실행 실패
+            asyncio.CancelledError: 실행 중 취소된 경우 (프로세스 종료 후 전파)
+        """
+        if not self._connected:
+            raise LocalExecutorError(
+                "로컬 실행기가 준비되지 않았습니다. connect()를 먼저 호출하세요."
+            )
+
+        logger.debug(f"로컬 명령어 실행: {command[:100]}...")
+
+        async with self._process_semaphore:
+            started = time.monotonic()
+            try:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdin=(
+                        asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL
+                    ),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    executable=LOCAL_SHELL,
+                    # 새 세션: 취소 시 파이프라인 전체를 프로세스 그룹 단위로 종료
+                    start_new_session=os.name == "posix",
+                )
+            except OSError as e:
+                raise LocalExecutorError(f"명령어 실행 실패: {command[:100]}..., 오류: {e}")
+
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input.encode("utf-8") if input is not None else None),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                self._abort_process(process)
+                raise LocalExecutorError(f"명령어 실행 타임아웃: {command[:100]}...")
+            except BaseException:
+                # 취소: 프로세스가 계속 실행되지 않도록 정리
+                self._abort_process(process)
+                raise
+
+        if process.returncode != 0:
+            logger.warning(
+                f"명령어 실행 실패 (exit: {process.returncode}): {command[:50]}...\n"
+                f"stderr: {stderr.decode('utf-8', errors='replace')[:200]}"
+            )
+
+        output = stdout.decode("utf-8", errors="replace")
+        logger.debug(f"명령어 실행 완료 (exit: {process.returncode}): {len(output)} 바이트 출력")
+        if self.recorder is not None:
+            self.recorder(command, input, output, process.returncode, time.monotonic() - started)
+        return output
+
+    @staticmethod
+    def _abort_process(process: asyncio.subprocess.Process) -> None:
+        """실행 중인 프로세스 그룹에 SIGTERM 전송 (기다리지 않음)"""
+        if process.returncode is not None:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def is_connected(self) -> bool:
+        """준비 상태 확인"""
+        return self._connected
+
+    async def __aenter__(self):
+        """비동기 context manager 진입"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 context manager 종료"""
+        await self.disconnect()
+
+
+__all__ = [
+    "LocalExecutorError",
+    "LocalExecutor",
+]
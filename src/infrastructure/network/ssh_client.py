@@ -6,15 +6,23 @@ Linux 및 macOS 서버에 연결하여 명령어를 실행합니다.
 주요 기능:
 - 비동기 SSH 연결
 - 명령어 실행 및 결과 수집
+- 단일 연결 위 다중 채널 동시 실행 (채널 수 제한)
+- 취소/타임아웃 시 원격 프로세스 종료 신호 및 채널 닫기
+- 실행 중 연결 끊김 감지 (SSHConnectionLostError, 재연결 판단용)
 - 에러 처리
-- 연결 풀 관리 (향후 확장)
+- 연결 풀 공유 (SSHConnectionPool, 선택)
+- 명령어 실행 기록 (recorder, 캡처 파일 작성용)
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 import asyncssh
 
+from .ssh_pool import SSHConnectionPool, make_pool_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +32,12 @@ class SSHClientError(Exception):
     pass
 
 
+class SSHConnectionLostError(SSHClientError):
+    """명령어 실행 중 SSH 연결이 끊어짐 (connect()로 다시 연결 가능)"""
+
+    pass
+
+
 class SSHClient:
     """AsyncSSH 기반 SSH 클라이언트
 
@@ -37,6 +51,11 @@ class SSHClient:
         >>> result = await client.execute("ls -la /etc")
         >>> print(result)
         >>> await client.disconnect()
+
+    연결 풀:
+        pool을 지정하면 connect()는 풀에서 연결을 빌리고,
+        disconnect()는 연결을 닫지 않고 풀에 반환합니다.
+        같은 서버에 다시 연결할 때 SSH 핸드셰이크와 인증을 생략합니다.
     """
 
     def __init__(
@@ -47,6 +66,8 @@ class SSHClient:
         key_filename: Optional[str] = None,
         port: int = 22,
         timeout: int = 30,
+        max_channels: int = 10,
+        pool: Optional[SSHConnectionPool] = None,
     ):
         """초기화
 
@@ -57,6 +78,9 @@ class SSHClient:
             key_filename: SSH 키 파일 경로 (선택)
             port: SSH 포트 (기본: 22)
             timeout: 연결 타임아웃 (초, 기본: 30)
+            max_channels: 동시에 열 수 있는 최대 세션 채널 수
+                (기본: 10, OpenSSH MaxSessions 기본값)
+            pool: 연결 풀 (선택, 없으면 연결을 직접 열고 닫음)
         """
         self.host = host
         self.username = username
@@ -64,10 +88,18 @@ class SSHClient:
         self.key_filename = key_filename
         self.port = port
         self.timeout = timeout
+        self.max_channels = max_channels
+        self.pool = pool
+
+        # 하나의 연결에서 동시에 실행되는 채널 수 제한
+        self._channel_semaphore = asyncio.Semaphore(max_channels)
 
         self._conn: Optional[asyncssh.SSHClientConnection] = None
         self._connected = False
 
+        # 명령어 완료 시 호출 (명령어, stdin, stdout, 종료 코드, 소요 시간 초)
+        self.recorder: Optional[Callable[[str, Optional[str], str, int, float], None]] = None
+
     async def connect(self) -> None:
         """SSH 서버에 연결
 
@@ -79,32 +111,14 @@ class SSHClient:
             return
 
         try:
-            logger.info(f"SSH 연결 시도: {self.username}@{self.host}:{self.port}")
-
-            # AsyncSSH 연결 옵션
-            connect_kwargs = {
-                "host": self.host,
-                "port": self.port,
-                "username": self.username,
-                "connect_timeout": self.timeout,
-                "known_hosts": None,  # 보안: 프로덕션에서는 known_hosts 사용 권장
-            }
-
-            # 인증 방법 선택
-            if self.key_filename:
-                connect_kwargs["client_keys"] = [self.key_filename]
-                logger.debug(f"SSH 키 사용: {self.key_filename}")
-            elif self.password:
-                connect_kwargs["password"] = self.password
-                logger.debug("패스워드 인증 사용")
+            if self.pool is not None:
+                self._conn = await self.pool.acquire(self._pool_key(), self._open_connection)
             else:
-                raise SSHClientError("패스워드 또는 SSH 키가 필요합니다")
-
-            self._conn = await asyncssh.connect(**connect_kwargs)
+                self._conn = await self._open_connection()
             self._connected = True
 
-            logger.info(f"SSH 연결 성공: {self.username}@{self.host}")
-
+        except SSHClientError:
+            raise
         except asyncssh.Error as e:
             raise SSHClientError(f"SSH 연결 실패: {self.host}, 오류: {e}")
         except OSError as e:
@@ -112,6 +126,48 @@ class SSHClient:
         except Exception as e:
             raise SSHClientError(f"예상치 못한 오류: {e}")
 
+    async def _open_connection(self) -> asyncssh.SSHClientConnection:
+        """새 SSH 연결 생성 (핸드셰이크 및 인증)
+
+        Returns:
+            asyncssh 연결
+
+        Raises:
+            SSHClientError: 인증 정보가 없는 경우
+        """
+        logger.info(f"SSH 연결 시도: {self.username}@{self.host}:{self.port}")
+
+        # AsyncSSH 연결 옵션
+        connect_kwargs = {
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "connect_timeout": self.timeout,
+            "known_hosts": None,  # 보안: 프로덕션에서는 known_hosts 사용 권장
+        }
+
+        # 인증 방법 선택
+        if self.key_filename:
+            connect_kwargs["client_keys"] = [self.key_filename]
+            logger.debug(f"SSH 키 사용: {self.key_filename}")
+        elif self.password:
+            connect_kwargs["password"] = self.password
+            logger.debug("패스워드 인증 사용")
+        else:
+            raise SSHClientError("패스워드 또는 SSH 키가 필요합니다")
+
+        # 풀 연결은 유휴 상태로 오래 유지되므로 keepalive 사용
+        if self.pool is not None:
+            connect_kwargs.update(self.pool.connect_options())
+
+        conn = await asyncssh.connect(**connect_kwargs)
+        logger.info(f"SSH 연결 성공: {self.username}@{self.host}")
+        return conn
+
+    def _pool_key(self):
+        """연결 풀 키 (host, port, username, 인증 정보 지문)"""
+        return make_pool_key(self.host, self.port, self.username, self.password, self.key_filename)
+
     async def disconnect(self) -> None:
         """SSH 연결 해제"""
         if not self._connected or not self._conn:
@@ -119,6 +175,14 @@ class SSHClient:
             return
 
         try:
+            if self.pool is not None:
+                # 연결은 풀에 남겨 다음 작업이 재사용
+                self.pool.release(self._pool_key(), self._conn)
+                self._conn = None
+                self._connected = False
+                logger.debug(f"SSH 연결 풀에 반환: {self.username}@{self.host}")
+                return
+
             self._conn.close()
             await self._conn.wait_closed()
             self._connected = False
@@ -126,27 +190,44 @@ class SSHClient:
         except Exception as e:
             logger.error(f"연결 해제 중 오류: {e}")
 
-    async def execute(self, command: str, timeout: int = 60) -> str:
+    async def execute(self, command: str, timeout: int = 60, input: Optional[str] = None) -> str:
         """명령어 실행
 
         Args:
             command: 실행할 bash 명령어
             timeout: 명령어 실행 타임아웃 (초, 기본: 60)
+            input: 명령어 stdin으로 전달할 데이터 (선택)
 
         Returns:
             명령어 출력 (stdout)
 
         Raises:
             SSHClientError: 연결되지 않았거나 명령어 실행 실패
+            SSHConnectionLostError: 실행 중 연결이 끊어진 경우
+            asyncio.CancelledError: 실행 중 취소된 경우 (원격 프로세스 종료 후 전파)
         """
         if not self._connected or not self._conn:
             raise SSHClientError("SSH에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
 
+        # 실행 중 disconnect()되어도 끊김 여부는 이 명령어를 실행한 연결로 판단
+        conn = self._conn
         try:
             logger.debug(f"명령어 실행: {command[:100]}...")
 
-            # AsyncSSH run() 메서드 사용
-            result = await self._conn.run(command, timeout=timeout, check=False)
+            # 명령어마다 세션 채널 1개
+            async with self._channel_semaphore:
+                started = time.monotonic()
+                process = await conn.create_process(command, input=input)
+                try:
+                    result = await process.wait(check=False, timeout=timeout)
+                except BaseException:
+                    # 취소 또는 타임아웃: 원격 프로세스가 계속 실행되지 않도록 정리
+                    self._abort_process(process)
+                    raise
+
+            # 서버가 연결을 끊으면 wait()는 예외 없이 종료 상태 없이 반환됨
+            if result.exit_status is None and result.exit_signal is None and conn.is_closed():
+                raise self._connection_lost(conn, "종료 상태 없이 연결이 닫혔습니다")
 
             # stdout 반환
             stdout = result.stdout if result.stdout else ""
@@ -163,15 +244,52 @@ class SSHClient:
                 # (validator가 결과를 판단)
 
             logger.debug(f"명령어 실행 완료 (exit: {exit_status}): {len(stdout)} 바이트 출력")
+            if self.recorder is not None:
+                self.recorder(command, input, stdout, exit_status, time.monotonic() - started)
             return stdout
 
+        except SSHClientError:
+            raise
         except asyncssh.TimeoutError:
             raise SSHClientError(f"명령어 실행 타임아웃: {command[:100]}...")
+        except (asyncssh.ConnectionLost, asyncssh.DisconnectError) as e:
+            raise self._connection_lost(conn, e)
+        except asyncssh.ChannelOpenError as e:
+            # 이미 닫힌 연결에서 채널 열기 실패
+            if conn.is_closed():
+                raise self._connection_lost(conn, e)
+            raise SSHClientError(f"명령어 실행 실패: {command[:100]}..., 오류: {e}")
         except asyncssh.Error as e:
             raise SSHClientError(f"명령어 실행 실패: {command[:100]}..., 오류: {e}")
         except Exception as e:
             raise SSHClientError(f"예상치 못한 오류: {e}")
 
+    def _connection_lost(
+        self, conn: asyncssh.SSHClientConnection, reason: object
+    ) -> SSHConnectionLostError:
+        """끊어진 연결을 풀에서 제거하고 예외 생성
+
+        연결 상태는 유지하므로 동시에 실행 중인 명령어도 같은 예외로 실패하며,
+        disconnect() 후 connect()하면 새로 연결합니다.
+        """
+        if self.pool is not None:
+            self.pool.invalidate(self._pool_key(), conn)
+        logger.warning(f"SSH 연결이 끊어졌습니다: {self.host}, {reason}")
+        return SSHConnectionLostError(f"SSH 연결이 끊어졌습니다: {self.host}, 오류: {reason}")
+
+    @staticmethod
+    def _abort_process(process: asyncssh.SSHClientProcess) -> None:
+        """실행 중인 원격 프로세스에 SIGTERM을 보내고 채널 닫기 (기다리지 않음)
+
+        서버가 signal 요청을 지원하지 않아도 채널을 닫으면 sshd가 프로세스의
+        입출력을 닫으므로 프로세스는 SIGPIPE/SIGHUP으로 종료됩니다.
+        """
+        try:
+            process.send_signal("TERM")
+        except (asyncssh.Error, OSError):
+            pass
+        process.close()
+
     def is_connected(self) -> bool:
         """연결 상태 확인"""
         return self._connected
@@ -188,5 +306,6 @@ class SSHClient:
 
 __all__ = [
     "SSHClientError",
+    "SSHConnectionLostError",
     "SSHClient",
 ]
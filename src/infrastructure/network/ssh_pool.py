@@ -0,0 +1,398 @@
+"""SSH 연결 풀
+
+프로세스 전역에서 SSH 연결을 재사용하기 위한 비동기 연결 풀입니다.
+스캔 직후 자동 수정처럼 같은 서버에 다시 접속하는 작업은
+SSH 핸드셰이크와 인증 없이 풀의 연결을 빌려 사용합니다.
+
+주요 기능:
+- (host, port, username, 인증 정보) 단위 연결 공유
+  (SSH 연결 1개 위에서 여러 채널을 열 수 있으므로 여러 사용자가 동시에 빌릴 수 있음)
+- 유휴 연결 자동 종료 (idle_timeout)
+- keepalive (asyncssh keepalive_interval)
+- 재사용 전 상태 확인 (닫힌 연결 및 오래 쉰 연결 점검)
+- 최대 연결 수 제한 (초과 시 유휴 연결 정리 후 대기)
+
+asyncssh 연결은 생성한 이벤트 루프에서만 사용할 수 있으므로
+풀은 이벤트 루프마다 하나씩 존재합니다 (get_default_pool()).
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import asyncssh
+
+logger = logging.getLogger(__name__)
+
+# 풀 키: (host, port, username, 인증 정보 지문)
+SSHPoolKey = Tuple[str, int, str, str]
+
+
+def make_pool_key(
+    host: str,
+    port: int,
+    username: str,
+    password: Optional[str] = None,
+    key_filename: Optional[str] = None,
+) -> SSHPoolKey:
+    """풀 키 생성
+
+    인증 정보는 평문 대신 SHA-256 지문으로 저장합니다.
+    인증 정보가 다르면 같은 서버라도 다른 연결을 사용합니다.
+
+    Args:
+        host: 서버 호스트
+        port: SSH 포트
+        username: SSH 사용자명
+        password: 패스워드 (선택)
+        key_filename: SSH 키 파일 경로 (선택)
+
+    Returns:
+        SSHPoolKey
+    """
+    if key_filename:
+        auth = f"key:{key_filename}"
+    else:
+        auth = f"password:{password or ''}"
+    fingerprint = hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16]
+    return (host, port, username, fingerprint)
+
+
+@dataclass
+class _PoolEntry:
+    """풀에 보관된 연결 1개"""
+
+    conn: asyncssh.SSHClientConnection
+    borrowers: int = 0
+    checking: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+
+
+class SSHConnectionPool:
+    """SSH 연결 풀
+
+    사용 예시:
+        >>> pool = get_default_pool()
+        >>> key = make_pool_key("192.168.1.100", 22, "admin", password="pw")
+        >>> conn = await pool.acquire(key, lambda: asyncssh.connect(...))
+        >>> result = await conn.run("uname -a")
+        >>> pool.release(key, conn)
+
+    대부분의 경우 SSHClient(pool=...)로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        idle_timeout: float = 300.0,
+        keepalive_interval: float = 30.0,
+        health_check_interval: float = 60.0,
+    ):
+        """초기화
+
+        Args:
+            max_connections: 최대 연결 수 (기본: 64)
+            idle_timeout: 빌린 사용자가 없는 연결을 닫기까지의 시간 (초, 기본: 300)
+            keepalive_interval: SSH keepalive 간격 (초, 기본: 30, 0이면 사용 안 함)
+            health_check_interval: 이 시간 이상 쉰 연결은 재사용 전에 점검 (초, 기본: 60)
+        """
+        if max_connections < 1:
+            raise ValueError(f"max_connections는 1 이상이어야 합니다: {max_connections}")
+
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.health_check_interval = health_check_interval
+
+        self._entries: Dict[SSHPoolKey, _PoolEntry] = {}
+        self._connecting: Dict[SSHPoolKey, "asyncio.Future[asyncssh.SSHClientConnection]"] = {}
+        self._slot_freed = asyncio.Event()
+        self._reaper: Optional["asyncio.Task[None]"] = None
+
+        # 통계
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def connect_options(self) -> Dict[str, float]:
+        """asyncssh.connect()에 추가할 keepalive 옵션"""
+        if self.keepalive_interval <= 0:
+            return {}
+        return {"keepalive_interval": self.keepalive_interval, "keepalive_count_max": 3}
+
+    async def acquire(
+        self,
+        key: SSHPoolKey,
+        connect: Callable[[], Awaitable[asyncssh.SSHClientConnection]],
+    ) -> asyncssh.SSHClientConnection:
+        """연결 빌리기
+
+        같은 키의 정상 연결이 있으면 재사용하고, 없으면 connect()로 새로 엽니다.
+        같은 키의 연결을 동시에 요청하면 연결은 한 번만 생성됩니다.
+
+        Args:
+            key: 풀 키 (make_pool_key)
+            connect: 새 연결 생성 함수
+
+        Returns:
+            asyncssh 연결 (사용 후 release() 필요)
+
+        Raises:
+            Exception: connect()가 발생시킨 예외 (함께 기다리던 요청에도 전달)
+        """
+        self._start_reaper()
+
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # 상태 점검을 기다리는 동안 유휴 연결 정리에서 제외되도록 먼저 빌린 상태로 표시
+                in_use = entry.borrowers > entry.checking
+                entry.borrowers += 1
+                entry.checking += 1
+                try:
+                    healthy = await self._is_healthy(entry, in_use)
+                except BaseException:
+                    entry.borrowers -= 1
+                    raise
+                finally:
+                    entry.checking -= 1
+
+                if healthy and self._entries.get(key) is entry:
+                    entry.last_used = time.monotonic()
+                    self.reused += 1
+                    logger.debug(f"SSH 연결 재사용: {key[2]}@{key[0]}:{key[1]}")
+                    return entry.conn
+                entry.borrowers -= 1
+                self._discard(key, entry)
+                continue
+
+            pending = self._connecting.get(key)
+            if pending is not None:
+                # 다른 요청이 연결 중이면 완료 후 다시 확인
+                await asyncio.wait([pending])
+                if not pending.cancelled() and pending.exception() is not None:
+                    raise pending.exception()
+                continue
+
+            return await self._open(key, connect)
+
+    def release(self, key: SSHPoolKey, conn: asyncssh.SSHClientConnection) -> None:
+        """빌린 연결 반환 (연결은 유휴 상태로 풀에 남음)
+
+        Args:
+            key: acquire()에 사용한 풀 키
+            conn: acquire()가 반환한 연결
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.conn is not conn:
+            # 이미 풀에서 제거된 연결 (상태 점검 실패 등)
+            if not conn.is_closed():
+                conn.close()
+            return
+
+        entry.borrowers = max(0, entry.borrowers - 1)
+        entry.last_used = time.monotonic()
+        self._notify()
+
+    def invalidate(
+        self, key: SSHPoolKey, conn: Optional[asyncssh.SSHClientConnection] = None
+    ) -> None:
+        """연결 폐기 (오류가 발생한 연결 등)
+
+        Args:
+            key: 풀 키
+            conn: 폐기할 연결 (지정하면 풀의 연결이 이 연결일 때만 폐기,
+                다른 작업이 이미 새로 연결한 경우 유지)
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (conn is None or entry.conn is conn):
+            self._discard(key, entry)
+
+    async def close_idle(self, max_idle: Optional[float] = None) -> int:
+        """유휴 연결 종료
+
+        Args:
+            max_idle: 이 시간 이상 쉰 연결만 종료 (초, 기본: idle_timeout)
+
+        Returns:
+            종료한 연결 수
+        """
+        max_idle = self.idle_timeout if max_idle is None else max_idle
+        now = time.monotonic()
+        expired = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.borrowers == 0 and now - entry.last_used >= max_idle
+        ]
+        for key, entry in expired:
+            self._discard(key, entry)
+
+        for _, entry in expired:
+            await entry.conn.wait_closed()
+
+        if expired:
+            logger.info(f"유휴 SSH 연결 {len(expired)}개 종료")
+        return len(expired)
+
+    async def close_all(self) -> None:
+        """모든 연결 종료 (애플리케이션 종료 시)"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        entries = list(self._entries.items())
+        for key, entry in entries:
+            self._discard(key, entry)
+        for _, entry in entries:
+            await entry.conn.wait_closed()
+
+    def get_stats(self) -> Dict[str, int]:
+        """풀 통계
+
+        Returns:
+            {"connections": 연결 수, "in_use": 사용 중인 연결 수,
+             "created": 생성한 연결 수, "reused": 재사용 횟수}
+        """
+        return {
+            "connections": len(self._entries),
+            "in_use": sum(1 for entry in self._entries.values() if entry.borrowers),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+    async def _open(
+        self,
+        key: SSHPoolKey,
+        connect: Callable[[], Awaitable[asyncssh.SSHClientConnection]],
+    ) -> asyncssh.SSHClientConnection:
+        """새 연결 생성 후 풀에 등록 (최대 연결 수 초과 시 대기)"""
+        future: "asyncio.Future[asyncssh.SSHClientConnection]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._connecting[key] = future
+
+        try:
+            await self._reserve_slot()
+            conn = await connect()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.cancel()
+            raise
+        finally:
+            self._connecting.pop(key, None)
+            self._notify()
+
+        self._entries[key] = _PoolEntry(conn=conn, borrowers=1)
+        self.created += 1
+        future.set_result(conn)
+        logger.debug(f"SSH 연결 생성 (풀 {len(self._entries)}/{self.max_connections})")
+        return conn
+
+    async def _reserve_slot(self) -> None:
+        """새 연결을 위한 자리 확보 (유휴 연결 정리 → 반환 대기)"""
+        # 현재 요청도 _connecting에 포함되어 있으므로 1을 뺌
+        while len(self._entries) + len(self._connecting) - 1 >= self.max_connections:
+            idle = [
+                (entry.last_used, key)
+                for key, entry in self._entries.items()
+                if entry.borrowers == 0
+            ]
+            if idle:
+                _, oldest = min(idle)
+                self._discard(oldest, self._entries[oldest])
+                continue
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+
+    async def _is_healthy(self, entry: _PoolEntry, in_use: bool = False) -> bool:
+        """재사용 전 연결 상태 확인
+
+        Args:
+            entry: 점검할 연결
+            in_use: 다른 사용자가 빌려 쓰는 중인지 여부 (점검 중인 요청 제외)
+        """
+        if entry.conn.is_closed():
+            return False
+
+        # 사용 중인 연결은 방금 동작한 것으로 간주
+        if in_use or time.monotonic() - entry.last_checked < self.health_check_interval:
+            return True
+
+        try:
+            await entry.conn.run("true", check=False, timeout=10)
+        except Exception as e:
+            logger.info(f"SSH 연결 상태 점검 실패, 새로 연결합니다: {e}")
+            return False
+
+        entry.last_checked = time.monotonic()
+        return True
+
+    def _discard(self, key: SSHPoolKey, entry: _PoolEntry) -> None:
+        """풀에서 제거하고 연결 종료"""
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+        if not entry.conn.is_closed():
+            entry.conn.close()
+        self._notify()
+
+    def _notify(self) -> None:
+        """자리를 기다리는 요청 깨우기"""
+        self._slot_freed.set()
+
+    def _start_reaper(self) -> None:
+        """유휴 연결 정리 작업 시작 (이벤트 루프당 1개)"""
+        if self._reaper is not None and not self._reaper.done():
+            return
+        if self.idle_timeout <= 0:
+            return
+
+        async def reap() -> None:
+            while self._entries or self._connecting:
+                await asyncio.sleep(max(self.idle_timeout / 2, 1.0))
+                try:
+                    await self.close_idle()
+                except Exception as e:
+                    logger.warning(f"유휴 SSH 연결 정리 실패: {e}")
+
+        self._reaper = asyncio.get_running_loop().create_task(reap())
+
+
+# 이벤트 루프별 기본 풀
+_default_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SSHConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_default_pool() -> SSHConnectionPool:
+    """현재 이벤트 루프의 기본 연결 풀
+
+    Returns:
+        SSHConnectionPool (이벤트 루프마다 1개)
+
+    Raises:
+        RuntimeError: 실행 중인 이벤트 루프가 없는 경우
+    """
+    loop = asyncio.get_running_loop()
+    pool = _default_pools.get(loop)
+    if pool is None:
+        pool = SSHConnectionPool()
+        _default_pools[loop] = pool
+    return pool
+
+
+__all__ = [
+    "SSHPoolKey",
+    "make_pool_key",
+    "SSHConnectionPool",
+    "get_default_pool",
+]
@@ -1,25 +1,213 @@
 """WinRM 클라이언트
 
-pywinrm 기반 비동기 WinRM 클라이언트 구현.
+비동기 WinRM 클라이언트 구현.
 Windows 서버에 연결하여 PowerShell 명령어를 실행합니다.
 
 주요 기능:
 - WinRM 연결 (HTTP/HTTPS)
+- asyncio WS-Man 전송 (NTLM/Basic, 요청마다 스레드를 점유하지 않음)
+- pywinrm 전송 (Kerberos, CredSSP, HTTP 위 NTLM 등, 스레드 풀에서 실행)
 - PowerShell 명령어 실행
-- 레지스트리 조회
+- 지속 셸 재사용 및 셸 풀 (명령어마다 셸을 열고 닫지 않음)
+- 취소/타임아웃 시 원격 명령어 종료 신호 및 셸 삭제 (백그라운드, 호출자는 기다리지 않음)
+- 레지스트리 조회 (키 단위 일괄 조회)
 - 서비스 상태 확인
+- 명령어 실행 기록 (recorder, 캡처 파일 작성용)
 - 에러 처리 및 로깅
 """
 
 import asyncio
+import base64
+import json
 import logging
-from typing import Optional
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from winrm.exceptions import WinRMError, WinRMTransportError
 from winrm.protocol import Protocol
 
+from .wsman import (
+    WSManConnectionError,
+    WSManError,
+    WSManProtocol,
+    WSManTransport,
+    supports_native_transport,
+)
+
 logger = logging.getLogger(__name__)
 
+# 셸 출력 코드 페이지 (UTF-8, 한글 출력 보존)
+SHELL_CODEPAGE = 65001
+
+# HTTP 응답 대기 시간 = 작업 대기 시간 + 여유 (서버가 작업 대기 시간만큼 응답을 보류함)
+READ_TIMEOUT_MARGIN = 10
+
+# 원격 실행 오류 (pywinrm, asyncio WS-Man)
+REMOTE_ERRORS = (WinRMError, WSManError)
+
+# 레지스트리 일괄 조회 결과 시작 표시
+REGISTRY_MARKER = "BLUEPY-REGISTRY"
+
+# 레지스트리 (키 경로, 값 이름)
+RegistryPair = Tuple[str, str]
+
+
+def encode_powershell(script: str) -> str:
+    """PowerShell -EncodedCommand 인자 생성 (UTF-16LE + Base64)
+
+    Args:
+        script: PowerShell 스크립트
+
+    Returns:
+        Base64 문자열
+    """
+    return base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+
+
+def clean_clixml(stderr: str) -> str:
+    """PowerShell CLIXML 형식 stderr를 읽을 수 있는 문자열로 변환
+
+    Args:
+        stderr: PowerShell stderr (#< CLIXML로 시작할 수 있음)
+
+    Returns:
+        오류 메시지
+    """
+    if not stderr.startswith("#< CLIXML"):
+        return stderr
+
+    messages = re.findall(r'<S S="Error">(.*?)</S>', stderr, re.DOTALL)
+    if not messages:
+        return ""
+    return "".join(messages).replace("_x000D__x000A_", "\n").strip()
+
+
+@dataclass(frozen=True)
+class RegistryValue:
+    r"""원격 레지스트리 값
+
+    Attributes:
+        path: 키 경로 (예: HKLM:\System\CurrentControlSet\Control\Lsa)
+        name: 값 이름
+        kind: 값 형식 (DWord, QWord, String, ExpandString, MultiString, Binary)
+        value: 값 (DWord/QWord: int, String: str, MultiString: List[str], Binary: List[int])
+    """
+
+    path: str
+    name: str
+    kind: str
+    value: Any
+
+    def to_output(self) -> str:
+        """`Get-ItemProperty ... | Select-Object -ExpandProperty <name>` 출력 재현"""
+        if isinstance(self.value, list):
+            lines = [str(item) for item in self.value]
+        elif self.value is None:
+            return ""
+        else:
+            lines = [str(self.value)]
+        return "".join(f"{line}\r\n" for line in lines)
+
+
+def normalize_registry_pair(path: str, name: str) -> RegistryPair:
+    """대소문자를 구분하지 않는 레지스트리 조회 키 (소문자, 끝의 역슬래시 제거)"""
+    return (path.rstrip("\\").lower(), name.lower())
+
+
+def build_registry_script(pairs: Iterable[RegistryPair]) -> str:
+    """레지스트리 일괄 조회 PowerShell 스크립트 생성
+
+    (키 경로, 값 이름) 목록을 키 경로별로 묶어 키마다 한 번만 열고
+    요청한 값들을 형식과 함께 JSON 배열로 출력합니다.
+    키 경로와 값 이름은 Base64 JSON으로 전달되어 따옴표 이스케이프 문제가 없습니다.
+
+    Args:
+        pairs: (키 경로, 값 이름) 목록
+
+    Returns:
+        PowerShell 스크립트
+    """
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for path, name in pairs:
+        group = grouped.setdefault(
+            normalize_registry_pair(path, name)[0], {"path": path, "names": []}
+        )
+        if name.lower() not in (existing.lower() for existing in group["names"]):
+            group["names"].append(name)
+
+    request = base64.b64encode(
+        json.dumps(list(grouped.values()), ensure_ascii=False).encode("utf-8")
+    ).decode("ascii")
+
+    return (
+        "\n".join(
+            [
+                "$ProgressPreference = 'SilentlyContinue'",
+                "$requests = [Text.Encoding]::UTF8.GetString("
+                f"[Convert]::FromBase64String('{request}')) | ConvertFrom-Json",
+                "$values = New-Object System.Collections.ArrayList",
+                "foreach ($request in $requests) {",
+                "    $key = Get-Item -LiteralPath $request.path -ErrorAction SilentlyContinue",
+                "    if (-not $key) { continue }",
+                "    foreach ($name in $request.names) {",
+                "        try { $kind = $key.GetValueKind($name) } catch { continue }",
+                "        [void]$values.Add(@{ path = $request.path; name = $name; "
+                "kind = [string]$kind; value = $key.GetValue($name) })",
+                "    }",
+                "}",
+                f"Write-Output '{REGISTRY_MARKER}'",
+                "ConvertTo-Json -InputObject @($values) -Compress -Depth 3",
+            ]
+        )
+        + "\n"
+    )
+
+
+def parse_registry_output(output: str) -> Dict[RegistryPair, RegistryValue]:
+    """레지스트리 일괄 조회 출력 파싱
+
+    Args:
+        output: build_registry_script() 스크립트 출력 (stdout)
+
+    Returns:
+        (소문자 키 경로, 소문자 값 이름) -> RegistryValue (존재하는 값만 포함)
+
+    Raises:
+        ValueError: 결과 표시가 없거나 JSON 파싱에 실패한 경우
+    """
+    pos = output.rfind(REGISTRY_MARKER)
+    if pos < 0:
+        raise ValueError("레지스트리 조회 결과를 찾을 수 없습니다")
+
+    document = json.loads(output[pos + len(REGISTRY_MARKER) :].strip() or "[]")
+    if isinstance(document, dict):
+        # PowerShell 버전에 따라 원소 1개 배열이 객체로 출력됨
+        document = [document]
+
+    values: Dict[RegistryPair, RegistryValue] = {}
+    for item in document:
+        value = RegistryValue(
+            path=item["path"], name=item["name"], kind=item["kind"], value=item.get("value")
+        )
+        values[normalize_registry_pair(value.path, value.name)] = value
+    return values
+
+
+@dataclass
+class _Shell:
+    """원격 WinRS 셸 1개
+
+    pywinrm: 셸마다 별도 Protocol (별도 HTTP/NTLM 세션)
+    asyncio WS-Man: 클라이언트의 WSManProtocol 1개를 공유 (연결 풀에서 HTTP/NTLM 세션 재사용)
+    """
+
+    protocol: Union[Protocol, WSManProtocol]
+    shell_id: str
+    # 실행 중인 명령어 ID (취소 시 종료 신호용)
+    command_id: Optional[str] = None
+
 
 class WinRMConnectionError(Exception):
     """WinRM 연결 예외"""
@@ -40,7 +228,7 @@ class WinRMTimeoutError(Exception):
 
 
 class WinRMClient:
-    """pywinrm 기반 WinRM 클라이언트
+    """WinRM 클라이언트
 
     Windows 서버에 WinRM으로 연결하여 PowerShell 명령어를 실행합니다.
     asyncio를 사용하여 비동기 처리를 지원합니다.
@@ -55,6 +243,18 @@ class WinRMClient:
         >>> result = await client.execute_powershell("Get-Service")
         >>> print(result)
         >>> await client.disconnect()
+
+    지속 셸 모드 (기본):
+        connect() 시 원격 셸을 열고, 각 명령어는 열려 있는 셸 안에서
+        `powershell -EncodedCommand`로 실행합니다 (명령어당 셸 생성/삭제 왕복 없음).
+        최대 max_shells개의 셸을 풀로 유지하여 명령어를 동시에 실행합니다.
+        persistent_shell=False이면 명령어마다 셸을 열고 닫습니다.
+
+    전송 방식:
+        NTLM/Basic over HTTPS, Basic over HTTP는 asyncio WS-Man 전송으로
+        이벤트 루프에서 직접 실행합니다 (keep-alive 연결과 NTLM 세션 재사용).
+        그 외 조합(Kerberos, CredSSP, HTTP 위 NTLM)은 pywinrm을 스레드 풀에서 실행합니다.
+        native_transport=False이면 항상 pywinrm을 사용합니다.
     """
 
     def __init__(
@@ -66,6 +266,9 @@ class WinRMClient:
         transport: str = "ntlm",
         use_ssl: bool = True,
         timeout: int = 30,
+        persistent_shell: bool = True,
+        max_shells: int = 2,
+        native_transport: Optional[bool] = None,
     ):
         """초기화
 
@@ -77,7 +280,20 @@ class WinRMClient:
             transport: 인증 방식 (ntlm, kerberos, basic, credssp)
             use_ssl: SSL/TLS 사용 여부 (기본: True)
             timeout: 연결 타임아웃 (초, 기본: 30)
+            persistent_shell: 지속 셸 재사용 여부 (기본: True)
+            max_shells: 동시에 사용할 최대 셸 수 (기본: 2)
+            native_transport: asyncio WS-Man 전송 사용 여부
+                (None: 지원하는 인증/전송 조합이면 사용, 기본: None)
         """
+        if max_shells < 1:
+            raise ValueError(f"max_shells는 1 이상이어야 합니다: {max_shells}")
+
+        native_supported = supports_native_transport(transport, use_ssl)
+        if native_transport and not native_supported:
+            raise ValueError(
+                f"asyncio WS-Man 전송은 {transport} (SSL: {use_ssl})를 지원하지 않습니다"
+            )
+
         self.host = host
         self.username = username
         self.password = password
@@ -85,10 +301,24 @@ class WinRMClient:
         self.transport = transport
         self.use_ssl = use_ssl
         self.timeout = timeout
+        self.persistent_shell = persistent_shell
+        self.max_shells = max_shells
+        self.native_transport = native_supported if native_transport is None else native_transport
 
-        self._protocol: Optional[Protocol] = None
+        self._protocol: Optional[Union[Protocol, WSManProtocol]] = None
+        self._wsman: Optional[WSManProtocol] = None
         self._connected = False
 
+        # 셸 풀 (유휴 셸 목록 + 동시 사용 셸 수 제한)
+        self._idle_shells: List[_Shell] = []
+        self._shell_slots = asyncio.Semaphore(max_shells)
+
+        # 취소/타임아웃된 셸 정리 작업 (disconnect()에서 완료 대기)
+        self._cleanup_tasks: Set["asyncio.Task[None]"] = set()
+
+        # 명령어 완료 시 호출 (스크립트, stdin, stdout, 종료 코드, 소요 시간 초)
+        self.recorder: Optional[Callable[[str, Optional[str], str, int, float], None]] = None
+
         # WinRM 엔드포인트 URL 생성
         protocol_scheme = "https" if use_ssl else "http"
         self._endpoint = f"{protocol_scheme}://{host}:{port}/wsman"
@@ -109,55 +339,298 @@ class WinRMClient:
         try:
             logger.info(f"WinRM 연결 시도: {self.username}@{self.host}:{self.port}")
 
-            # Protocol 객체 생성 (동기 작업을 비동기로 래핑)
-            await asyncio.get_event_loop().run_in_executor(None, self._create_protocol)
+            # 첫 셸 생성 (인증 및 연결 확인)
+            shell = await self._open_shell_async()
+            self._protocol = shell.protocol
 
-            # 연결 테스트 (간단한 명령어 실행)
-            test_result = await self.execute_powershell("echo 'test'", timeout=10)
-
-            if "test" not in test_result:
-                raise WinRMConnectionError("연결 테스트 실패: 응답 없음")
+            if self.persistent_shell:
+                self._idle_shells.append(shell)
+            else:
+                await self._close_shell_async(shell)
 
             self._connected = True
             logger.info(f"WinRM 연결 성공: {self.username}@{self.host}")
             return True
 
         except WinRMTransportError as e:
+            await self._close_wsman()
             raise WinRMConnectionError(f"WinRM 전송 오류: {self.host}, 오류: {e}")
-        except WinRMError as e:
+        except REMOTE_ERRORS as e:
+            await self._close_wsman()
             raise WinRMConnectionError(f"WinRM 연결 실패: {self.host}, 오류: {e}")
         except Exception as e:
+            await self._close_wsman()
             raise WinRMConnectionError(f"예상치 못한 오류: {e}")
 
-    def _create_protocol(self) -> None:
+    def _create_protocol(self) -> Protocol:
         """Protocol 객체 생성 (동기 메서드)
 
         pywinrm은 동기 라이브러리이므로 별도 메서드로 분리.
         run_in_executor로 비동기 실행.
         """
-        self._protocol = Protocol(
+        return Protocol(
             endpoint=self._endpoint,
             transport=self.transport,
             username=self.username,
             password=self.password,
             server_cert_validation="ignore" if self.use_ssl else "validate",
-            read_timeout_sec=self.timeout,
+            # pywinrm은 read_timeout_sec > operation_timeout_sec를 요구
+            read_timeout_sec=self.timeout + READ_TIMEOUT_MARGIN,
             operation_timeout_sec=self.timeout,
         )
 
+    def _create_wsman(self) -> WSManProtocol:
+        """asyncio WS-Man 프로토콜 생성 (클라이언트당 1개, 셸이 공유)"""
+        transport = WSManTransport(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            auth=self.transport,
+            use_ssl=self.use_ssl,
+            verify_ssl=False,
+            read_timeout=self.timeout + READ_TIMEOUT_MARGIN,
+        )
+        return WSManProtocol(transport, operation_timeout=self.timeout)
+
+    async def _close_wsman(self) -> None:
+        """asyncio WS-Man HTTP 연결 종료"""
+        wsman, self._wsman = self._wsman, None
+        if wsman is not None:
+            await wsman.close()
+
+    def _open_shell(self) -> _Shell:
+        """원격 셸 생성 (동기 메서드)
+
+        Returns:
+            _Shell
+        """
+        protocol = self._create_protocol()
+        shell_id = protocol.open_shell(codepage=SHELL_CODEPAGE, noprofile=True)
+        logger.debug(f"WinRM 셸 생성: {self.host}, {shell_id}")
+        return _Shell(protocol=protocol, shell_id=shell_id)
+
+    def _close_shell(self, shell: _Shell) -> None:
+        """원격 셸 삭제 (동기 메서드, 실패는 무시)"""
+        try:
+            shell.protocol.close_shell(shell.shell_id)
+        except Exception as e:
+            logger.debug(f"WinRM 셸 삭제 실패 (무시): {e}")
+
+    def _run_in_shell(self, shell: _Shell, script: str) -> Tuple[str, str, int]:
+        """셸 안에서 PowerShell 실행 (동기 메서드)
+
+        Args:
+            shell: 원격 셸
+            script: PowerShell 스크립트
+
+        Returns:
+            (stdout, stderr, exit_code)
+        """
+        command_id = shell.protocol.run_command(
+            shell.shell_id,
+            "powershell",
+            ["-NoProfile", "-NonInteractive", "-EncodedCommand", encode_powershell(script)],
+            # cmd.exe를 거치지 않음 (명령줄 제한 8191자 → 32767자)
+            skip_cmd_shell=True,
+        )
+        shell.command_id = command_id
+        try:
+            std_out, std_err, exit_code = shell.protocol.get_command_output(
+                shell.shell_id, command_id
+            )
+        finally:
+            shell.command_id = None
+            shell.protocol.cleanup_command(shell.shell_id, command_id)
+
+        return self._decode_output(std_out, std_err, exit_code)
+
+    @staticmethod
+    def _decode_output(std_out: bytes, std_err: bytes, exit_code: int) -> Tuple[str, str, int]:
+        """셸 출력 디코딩 (코드 페이지 65001 → UTF-8)"""
+        stdout = std_out.decode("utf-8", errors="ignore") if std_out else ""
+        stderr = std_err.decode("utf-8", errors="ignore") if std_err else ""
+        return stdout, clean_clixml(stderr), exit_code
+
+    def _run_once(self, script: str) -> Tuple[str, str, int]:
+        """셸을 열고 실행한 뒤 닫기 (동기 메서드, 지속 셸 미사용 시)"""
+        shell = self._open_shell()
+        try:
+            return self._run_in_shell(shell, script)
+        finally:
+            self._close_shell(shell)
+
+    async def _open_shell_async(self) -> _Shell:
+        """원격 셸 생성 (asyncio WS-Man 또는 스레드 풀의 pywinrm)"""
+        if not self.native_transport:
+            return await asyncio.get_running_loop().run_in_executor(None, self._open_shell)
+
+        if self._wsman is None:
+            self._wsman = self._create_wsman()
+        shell_id = await self._wsman.open_shell(codepage=SHELL_CODEPAGE, noprofile=True)
+        logger.debug(f"WinRM 셸 생성: {self.host}, {shell_id}")
+        return _Shell(protocol=self._wsman, shell_id=shell_id)
+
+    async def _close_shell_async(self, shell: _Shell) -> None:
+        """원격 셸 삭제 (실패는 무시)"""
+        if not isinstance(shell.protocol, WSManProtocol):
+            await asyncio.get_running_loop().run_in_executor(None, self._close_shell, shell)
+            return
+
+        try:
+            await shell.protocol.close_shell(shell.shell_id)
+        except Exception as e:
+            logger.debug(f"WinRM 셸 삭제 실패 (무시): {e}")
+
+    async def _run_in_shell_async(self, shell: _Shell, script: str) -> Tuple[str, str, int]:
+        """셸 안에서 PowerShell 실행 (asyncio WS-Man 또는 스레드 풀의 pywinrm)"""
+        if not isinstance(shell.protocol, WSManProtocol):
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._run_in_shell, shell, script
+            )
+
+        protocol = shell.protocol
+        command_id = await protocol.run_command(
+            shell.shell_id,
+            "powershell",
+            ["-NoProfile", "-NonInteractive", "-EncodedCommand", encode_powershell(script)],
+            skip_cmd_shell=True,
+        )
+        shell.command_id = command_id
+        try:
+            std_out, std_err, exit_code = await protocol.get_command_output(
+                shell.shell_id, command_id
+            )
+        except asyncio.CancelledError:
+            # 취소/타임아웃: 종료 신호는 호출자의 _discard_shell()이 백그라운드에서 보냄
+            raise
+        except BaseException:
+            shell.command_id = None
+            await asyncio.shield(self._cleanup_command(protocol, shell.shell_id, command_id))
+            raise
+
+        shell.command_id = None
+        await self._cleanup_command(protocol, shell.shell_id, command_id)
+        return self._decode_output(std_out, std_err, exit_code)
+
+    @staticmethod
+    async def _cleanup_command(protocol: WSManProtocol, shell_id: str, command_id: str) -> None:
+        """원격 명령어 종료 신호 (실패는 무시)"""
+        try:
+            await protocol.cleanup_command(shell_id, command_id)
+        except Exception as e:
+            logger.debug(f"WinRM 명령어 정리 실패 (무시): {e}")
+
+    def _discard_shell(self, shell: _Shell) -> None:
+        """실행 중인 셸 폐기 (취소/타임아웃 시)
+
+        원격 명령어 종료 신호와 셸 삭제를 백그라운드 작업으로 보내고 바로 반환합니다.
+        셸을 삭제하면 서버는 셸에서 실행 중인 프로세스를 종료합니다.
+        """
+        task = asyncio.get_running_loop().create_task(self._terminate_shell(shell))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+
+    async def _terminate_shell(self, shell: _Shell) -> None:
+        """원격 명령어 종료 신호 후 셸 삭제 (실패는 무시)"""
+        command_id, shell.command_id = shell.command_id, None
+        if command_id is not None:
+            if isinstance(shell.protocol, WSManProtocol):
+                await self._cleanup_command(shell.protocol, shell.shell_id, command_id)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._cleanup_command_sync, shell, command_id
+                )
+        await self._close_shell_async(shell)
+        logger.debug(f"WinRM 셸 폐기: {shell.shell_id}")
+
+    @staticmethod
+    def _cleanup_command_sync(shell: _Shell, command_id: str) -> None:
+        """원격 명령어 종료 신호 (pywinrm, 동기 메서드, 실패는 무시)
+
+        get_command_output()을 기다리는 스레드는 종료된 명령어의 응답을 받고 끝납니다.
+        """
+        try:
+            shell.protocol.cleanup_command(shell.shell_id, command_id)
+        except Exception as e:
+            logger.debug(f"WinRM 명령어 정리 실패 (무시): {e}")
+
+    async def _run_once_async(self, script: str) -> Tuple[str, str, int]:
+        """셸을 열고 실행한 뒤 닫기 (지속 셸 미사용 시)"""
+        shell = await self._open_shell_async()
+        try:
+            result = await self._run_in_shell_async(shell, script)
+        except asyncio.CancelledError:
+            self._discard_shell(shell)
+            raise
+        except BaseException:
+            await self._close_shell_async(shell)
+            raise
+
+        await self._close_shell_async(shell)
+        return result
+
+    async def _run_pooled(self, script: str, timeout: int) -> Tuple[str, str, int]:
+        """셸 풀에서 셸을 빌려 PowerShell 실행
+
+        재사용한 셸이 서버에서 만료된 경우 새 셸로 한 번 재시도합니다.
+        타임아웃된 셸은 명령어가 아직 실행 중일 수 있으므로 풀에 반환하지 않습니다.
+        """
+        async with self._shell_slots:
+            for attempt in range(2):
+                reused = bool(self._idle_shells)
+                shell = self._idle_shells.pop() if reused else await self._open_shell_async()
+
+                try:
+                    result = await asyncio.wait_for(
+                        self._run_in_shell_async(shell, script), timeout=timeout
+                    )
+                except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                    # 명령어가 아직 실행 중일 수 있으므로 종료 신호 후 셸 삭제
+                    reason = "타임아웃" if isinstance(e, asyncio.TimeoutError) else "취소"
+                    logger.warning(f"WinRM 셸 폐기 ({reason}): {shell.shell_id}")
+                    self._discard_shell(shell)
+                    raise
+                except (*REMOTE_ERRORS, OSError) as e:
+                    # 만료된 셸(서버 유휴 타임아웃) 또는 끊긴 HTTP 연결
+                    await self._close_shell_async(shell)
+                    if reused and attempt == 0:
+                        logger.info(f"WinRM 셸 재생성 후 재시도: {e}")
+                        continue
+                    raise
+
+                if self._connected:
+                    self._idle_shells.append(shell)
+                else:
+                    await self._close_shell_async(shell)
+                return result
+
+        raise WinRMCommandError("WinRM 셸을 사용할 수 없습니다")
+
     async def disconnect(self) -> None:
         """WinRM 연결 해제
 
-        pywinrm은 명시적인 disconnect가 없으므로
-        객체 참조만 해제합니다.
+        유휴 셸을 삭제하고 asyncio WS-Man HTTP 연결을 닫습니다.
+        pywinrm은 명시적인 disconnect가 없으므로 객체 참조만 해제합니다.
         """
         if not self._connected:
             logger.debug(f"연결되어 있지 않습니다: {self.host}")
             return
 
         try:
-            self._protocol = None
             self._connected = False
+
+            # 유휴 셸 삭제 (사용 중인 셸은 명령어 완료 후 삭제)
+            shells, self._idle_shells = self._idle_shells, []
+            for shell in shells:
+                await self._close_shell_async(shell)
+
+            # 취소/타임아웃된 셸의 종료 신호가 전송될 때까지 대기
+            if self._cleanup_tasks:
+                await asyncio.gather(*self._cleanup_tasks, return_exceptions=True)
+
+            await self._close_wsman()
+            self._protocol = None
             logger.info(f"WinRM 연결 해제: {self.username}@{self.host}")
         except Exception as e:
             logger.error(f"연결 해제 중 오류: {e}")
@@ -173,7 +646,7 @@ class WinRMClient:
             명령어 출력 (stdout)
 
         Raises:
-            WinRMConnectionError: 연결되지 않은 경우
+            WinRMConnectionError: 연결되지 않았거나 실행 중 연결이 끊어진 경우
             WinRMCommandError: 명령어 실행 실패
             WinRMTimeoutError: 타임아웃 발생
         """
@@ -182,20 +655,15 @@ class WinRMClient:
 
         try:
             logger.debug(f"PowerShell 실행: {script[:100]}...")
-
-            # PowerShell 명령어 실행 (동기 -> 비동기 래핑)
-            result = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._protocol.run_ps(script),
-                ),
-                timeout=timeout,
-            )
-
-            # 결과 파싱
-            stdout = result.std_out.decode("utf-8", errors="ignore") if result.std_out else ""
-            stderr = result.std_err.decode("utf-8", errors="ignore") if result.std_err else ""
-            exit_code = result.status_code
+            started = time.monotonic()
+
+            # PowerShell 명령어 실행
+            if self.persistent_shell:
+                stdout, stderr, exit_code = await self._run_pooled(script, timeout)
+            else:
+                stdout, stderr, exit_code = await asyncio.wait_for(
+                    self._run_once_async(script), timeout=timeout
+                )
 
             if exit_code != 0:
                 logger.warning(
@@ -207,11 +675,18 @@ class WinRMClient:
                 # (validator가 결과를 판단)
 
             logger.debug(f"PowerShell 실행 완료 (exit: {exit_code}): {len(stdout)} 바이트 출력")
+            if self.recorder is not None:
+                self.recorder(script, None, stdout, exit_code, time.monotonic() - started)
             return stdout
 
         except asyncio.TimeoutError:
             raise WinRMTimeoutError(f"PowerShell 실행 타임아웃: {script[:100]}...")
-        except WinRMError as e:
+        except WinRMCommandError:
+            raise
+        except (WSManConnectionError, OSError) as e:
+            # 연결 끊김 (pywinrm의 requests 연결 오류도 OSError)
+            raise WinRMConnectionError(f"WinRM 연결이 끊어졌습니다: {self.host}, 오류: {e}")
+        except REMOTE_ERRORS as e:
             raise WinRMCommandError(f"PowerShell 실행 실패: {script[:100]}..., 오류: {e}")
         except Exception as e:
             raise WinRMCommandError(f"예상치 못한 오류: {e}")
@@ -224,7 +699,27 @@ class WinRMClient:
             name: 레지스트리 값 이름
 
         Returns:
-            레지스트리 값 (문자열)
+            레지스트리 값 (문자열, 없으면 빈 문자열)
+
+        Raises:
+            WinRMCommandError: 레지스트리 조회 실패
+        """
+        values = await self.get_registry_values([(path, name)])
+        value = values[(path, name)]
+        return value.to_output().strip() if value else ""
+
+    async def get_registry_values(
+        self, pairs: Iterable[RegistryPair]
+    ) -> Dict[RegistryPair, Optional[RegistryValue]]:
+        r"""레지스트리 값 일괄 조회
+
+        키 경로별로 묶어 키마다 한 번만 조회하며, 전체 조회는 PowerShell 실행 1회입니다.
+
+        Args:
+            pairs: (키 경로, 값 이름) 목록 (예: [("HKLM:\...\Lsa", "NoLMHash")])
+
+        Returns:
+            (키 경로, 값 이름) -> RegistryValue (키나 값이 없으면 None)
 
         Raises:
             WinRMCommandError: 레지스트리 조회 실패
@@ -232,22 +727,17 @@ class WinRMClient:
         if not self._connected:
             raise WinRMConnectionError("WinRM에 연결되지 않았습니다.")
 
-        try:
-            # PowerShell Get-ItemProperty 사용
-            script = f"""
-                $value = Get-ItemProperty -Path '{path}' -Name '{name}' -ErrorAction SilentlyContinue
-                if ($value) {{
-                    $value.{name}
-                }} else {{
-                    Write-Output ""
-                }}
-            """
-
-            result = await self.execute_powershell(script)
-            return result.strip()
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
 
+        try:
+            output = await self.execute_powershell(build_registry_script(pairs))
+            values = parse_registry_output(output)
         except Exception as e:
-            raise WinRMCommandError(f"레지스트리 조회 실패: {path}\\{name}, 오류: {e}")
+            raise WinRMCommandError(f"레지스트리 일괄 조회 실패: {len(pairs)}개 값, 오류: {e}")
+
+        return {pair: values.get(normalize_registry_pair(*pair)) for pair in pairs}
 
     async def check_service(self, name: str) -> bool:
         """서비스 상태 확인
@@ -303,6 +793,13 @@ class WinRMClient:
 
 
 __all__ = [
+    "encode_powershell",
+    "clean_clixml",
+    "RegistryPair",
+    "RegistryValue",
+    "normalize_registry_pair",
+    "build_registry_script",
+    "parse_registry_output",
     "WinRMConnectionError",
     "WinRMCommandError",
     "WinRMTimeoutError",
@@ -0,0 +1,689 @@
+"""asyncio 기반 WS-Man 전송
+
+pywinrm Protocol을 스레드 풀에서 실행하지 않고, 이벤트 루프 위에서 직접
+WS-Management(WinRS) SOAP 메시지를 주고받는 비동기 구현입니다.
+명령어 1개가 스레드 1개를 점유하지 않으므로 수백 대의 Windows 서버를
+이벤트 루프 하나로 처리할 수 있습니다.
+
+주요 기능:
+- HTTP/1.1 keep-alive 연결 재사용 (Content-Length, chunked 응답 지원)
+- NTLM 연결 단위 인증 (TCP 연결마다 핸드셰이크 1회, 이후 요청은 인증 헤더 없음)
+- HTTPS 채널 바인딩 (tls-server-end-point, EPA 활성화 서버 지원)
+- Basic 인증
+- WinRS 셸 작업: Create, Command, Receive, Signal(terminate), Delete
+
+지원 범위:
+    NTLM/Basic over HTTPS, Basic over HTTP만 지원합니다.
+    HTTP 위 NTLM(메시지 암호화 필요), Kerberos, CredSSP는
+    WinRMClient가 pywinrm 경로로 처리합니다 (supports_native_transport 참고).
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import ssl
+import uuid
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+logger = logging.getLogger(__name__)
+
+# XML 네임스페이스
+NS_SOAP = "http://www.w3.org/2003/05/soap-envelope"
+NS_ADDRESSING = "http://schemas.xmlsoap.org/ws/2004/08/addressing"
+NS_WSMAN = "http://schemas.dmtf.org/wbem/wsman/1/wsman.xsd"
+NS_SHELL = "http://schemas.microsoft.com/wbem/wsman/1/windows/shell"
+NS_WSMAN_FAULT = "http://schemas.microsoft.com/wbem/wsman/1/wsmanfault"
+
+# WinRS 리소스 및 액션
+RESOURCE_CMD = f"{NS_SHELL}/cmd"
+ACTION_CREATE = "http://schemas.xmlsoap.org/ws/2004/09/transfer/Create"
+ACTION_DELETE = "http://schemas.xmlsoap.org/ws/2004/09/transfer/Delete"
+ACTION_COMMAND = f"{NS_SHELL}/Command"
+ACTION_RECEIVE = f"{NS_SHELL}/Receive"
+ACTION_SIGNAL = f"{NS_SHELL}/Signal"
+SIGNAL_TERMINATE = f"{NS_SHELL}/signal/terminate"
+
+# Receive 대기 시간 초과 (출력이 아직 없음, 다시 Receive)
+OPERATION_TIMEOUT_FAULT = 2150858793
+
+# 최대 SOAP 메시지 크기 (pywinrm 기본값과 동일)
+MAX_ENVELOPE_SIZE = 153600
+
+# 지원하는 인증 방식
+NATIVE_AUTH_METHODS = ("ntlm", "basic")
+
+
+def supports_native_transport(auth: str, use_ssl: bool) -> bool:
+    """asyncio WS-Man 전송으로 처리할 수 있는 인증/전송 조합인지 확인
+
+    Args:
+        auth: 인증 방식 (ntlm, basic, kerberos, credssp)
+        use_ssl: HTTPS 사용 여부
+
+    Returns:
+        지원 여부 (HTTP 위 NTLM은 메시지 암호화가 필요하므로 미지원)
+    """
+    auth = auth.lower()
+    if auth not in NATIVE_AUTH_METHODS:
+        return False
+    return use_ssl or auth == "basic"
+
+
+class WSManError(Exception):
+    """WS-Man 전송 예외"""
+
+    pass
+
+
+class WSManConnectionError(WSManError):
+    """WS-Man 연결 끊김 예외 (서버가 연결을 닫았거나 재설정함)"""
+
+    pass
+
+
+class WSManAuthError(WSManError):
+    """WS-Man 인증 실패 예외"""
+
+    pass
+
+
+class WSManFaultError(WSManError):
+    """WS-Man SOAP Fault 예외
+
+    Attributes:
+        code: WSManFault 코드 (없으면 None)
+        reason: 오류 메시지
+    """
+
+    def __init__(self, reason: str, code: Optional[int] = None):
+        super().__init__(f"{reason} (code: {code})" if code is not None else reason)
+        self.reason = reason
+        self.code = code
+
+
+def _tls_server_end_point(certificate: bytes) -> bytes:
+    """TLS 채널 바인딩 데이터 생성 (RFC 5929 tls-server-end-point)
+
+    인증서 서명 해시 알고리즘을 사용하며, MD5/SHA-1이거나 알 수 없으면 SHA-256을 사용합니다.
+
+    Args:
+        certificate: 서버 인증서 (DER)
+
+    Returns:
+        b"tls-server-end-point:" + 인증서 해시
+    """
+    algorithm = "sha256"
+    try:
+        from cryptography import x509
+
+        hash_algorithm = x509.load_der_x509_certificate(certificate).signature_hash_algorithm
+        if hash_algorithm is not None and hash_algorithm.name not in ("md5", "sha1"):
+            algorithm = hash_algorithm.name
+    except Exception as e:
+        logger.debug(f"인증서 해시 알고리즘 확인 실패, SHA-256 사용: {e}")
+
+    return b"tls-server-end-point:" + hashlib.new(algorithm, certificate).digest()
+
+
+class _HTTPConnection:
+    """keep-alive HTTP/1.1 연결 1개 (NTLM 인증 상태 포함)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        # NTLM 인증 완료 여부 (연결 단위 인증)
+        self.authenticated = False
+        self.requests = 0
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def peer_certificate(self) -> Optional[bytes]:
+        """HTTPS 서버 인증서 (DER, HTTP면 None)"""
+        ssl_object = self.writer.get_extra_info("ssl_object")
+        return ssl_object.getpeercert(binary_form=True) if ssl_object else None
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def request(
+        self, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """POST 요청 1회
+
+        Returns:
+            (상태 코드, 응답 헤더(소문자 키), 응답 본문)
+        """
+        lines = [f"POST {target} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("서버가 연결을 닫았습니다")
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise WSManError(f"잘못된 HTTP 응답: {status_line[:100]!r}")
+        status = int(parts[1])
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            value = value.strip()
+            # 같은 헤더가 여러 번 오면 쉼표로 연결 (WWW-Authenticate 등)
+            response_headers[name] = (
+                f"{response_headers[name]}, {value}" if name in response_headers else value
+            )
+
+        if "chunked" in response_headers.get("transfer-encoding", "").lower():
+            response_body = await self._read_chunked()
+        else:
+            response_body = await self.reader.readexactly(
+                int(response_headers.get("content-length", "0"))
+            )
+
+        self.requests += 1
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+
+        return status, response_headers, response_body
+
+    async def _read_chunked(self) -> bytes:
+        """chunked 전송 인코딩 본문 읽기"""
+        chunks: List[bytes] = []
+        while True:
+            size_line = await self.reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # trailer 헤더 무시
+                while (await self.reader.readline()).strip():
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class WSManTransport:
+    """asyncio HTTP 전송 (keep-alive 연결 풀 + NTLM/Basic 인증)
+
+    요청마다 유휴 연결을 빌려 사용하고, 응답을 받으면 풀에 반환합니다.
+    요청 도중 취소·타임아웃·오류가 발생한 연결은 응답 상태를 알 수 없으므로 닫습니다.
+
+    사용 예시:
+        >>> transport = WSManTransport("192.168.1.100", 5986, "Administrator", "pw")
+        >>> response = await transport.send(envelope)
+        >>> await transport.close()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        auth: str = "ntlm",
+        use_ssl: bool = True,
+        verify_ssl: bool = False,
+        read_timeout: float = 40,
+        path: str = "/wsman",
+    ):
+        """초기화
+
+        Args:
+            host: 서버 호스트명 또는 IP
+            port: WinRM 포트
+            username: Windows 사용자명
+            password: Windows 패스워드
+            auth: 인증 방식 (ntlm, basic)
+            use_ssl: HTTPS 사용 여부
+            verify_ssl: 서버 인증서 검증 여부
+            read_timeout: 요청 1회 응답 대기 시간 (초)
+            path: WS-Man 엔드포인트 경로
+        """
+        auth = auth.lower()
+        if not supports_native_transport(auth, use_ssl):
+            raise ValueError(f"지원하지 않는 WS-Man 전송: {auth} (SSL: {use_ssl})")
+
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.auth = auth
+        self.use_ssl = use_ssl
+        self.read_timeout = read_timeout
+        self.path = path
+
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        if use_ssl:
+            self._ssl_context = ssl.create_default_context()
+            if not verify_ssl:
+                self._ssl_context.check_hostname = False
+                self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        self._idle: List[_HTTPConnection] = []
+        self._active: List[_HTTPConnection] = []
+        self.connections_opened = 0
+
+    def _base_headers(self) -> Dict[str, str]:
+        return {
+            "Host": f"{self.host}:{self.port}",
+            "Content-Type": "application/soap+xml;charset=UTF-8",
+            "User-Agent": "Python WinRM client",
+            "Connection": "Keep-Alive",
+        }
+
+    async def _open_connection(self) -> _HTTPConnection:
+        """새 TCP(TLS) 연결"""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self._ssl_context),
+            timeout=self.read_timeout,
+        )
+        self.connections_opened += 1
+        logger.debug(f"WS-Man 연결 생성: {self.host}:{self.port}")
+        return _HTTPConnection(reader, writer)
+
+    async def send(self, message: str) -> bytes:
+        """SOAP 메시지 전송
+
+        재사용한 연결이 서버에서 이미 닫혀 있으면 새 연결로 한 번 재시도합니다.
+
+        Args:
+            message: SOAP envelope
+
+        Returns:
+            응답 본문
+
+        Raises:
+            WSManAuthError: 인증 실패
+            WSManFaultError: SOAP Fault 응답
+            WSManConnectionError: 연결이 끊어진 경우
+            WSManError: 기타 HTTP 오류
+        """
+        body = message.encode("utf-8")
+
+        for attempt in range(2):
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await self._open_connection()
+            self._active.append(connection)
+
+            try:
+                status, body_out = await asyncio.wait_for(
+                    self._send_on(connection, body), timeout=self.read_timeout
+                )
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                connection.close()
+                if reused and attempt == 0:
+                    logger.debug(f"WS-Man 연결 재생성 후 재시도: {e}")
+                    continue
+                raise WSManConnectionError(f"WS-Man 연결 오류: {self.host}, {e}")
+            except BaseException:
+                # 타임아웃/취소: 응답이 남아 있을 수 있으므로 재사용하지 않음
+                connection.close()
+                raise
+            finally:
+                self._active.remove(connection)
+
+            if connection.closed:
+                connection.close()
+            else:
+                self._idle.append(connection)
+
+            return self._check_response(status, body_out)
+
+        raise WSManConnectionError(f"WS-Man 연결 오류: {self.host}")
+
+    async def _send_on(self, connection: _HTTPConnection, body: bytes) -> Tuple[int, bytes]:
+        """연결 1개에서 요청 전송 (필요하면 인증 핸드셰이크 수행)"""
+        headers = self._base_headers()
+
+        if self.auth == "basic":
+            credentials = f"{self.username}:{self.password}".encode("utf-8")
+            headers["Authorization"] = "Basic " + base64.b64encode(credentials).decode("ascii")
+        elif not connection.authenticated:
+            return await self._ntlm_handshake(connection, body)
+
+        status, _, response = await connection.request(self.path, headers, body)
+        if status == 401:
+            raise WSManAuthError(f"WS-Man 인증 실패: {self.username}@{self.host}")
+        return status, response
+
+    async def _ntlm_handshake(self, connection: _HTTPConnection, body: bytes) -> Tuple[int, bytes]:
+        """NTLM 핸드셰이크 + 본문 전송 (연결당 1회)
+
+        1) Negotiate 토큰을 빈 본문으로 전송 → 401 + 챌린지
+        2) Authenticate 토큰과 실제 본문을 전송 → 응답
+        """
+        import spnego
+        from spnego.channel_bindings import GssChannelBindings
+
+        certificate = connection.peer_certificate()
+        bindings = (
+            GssChannelBindings(application_data=_tls_server_end_point(certificate))
+            if certificate
+            else None
+        )
+        context = spnego.client(
+            self.username,
+            self.password,
+            hostname=self.host,
+            service="HTTP",
+            channel_bindings=bindings,
+            protocol="ntlm",
+        )
+
+        headers = self._base_headers()
+        headers["Authorization"] = "Negotiate " + base64.b64encode(context.step()).decode("ascii")
+        status, response_headers, _ = await connection.request(self.path, headers, b"")
+
+        challenge = self._auth_token(response_headers.get("www-authenticate", ""))
+        if status != 401 or challenge is None:
+            raise WSManAuthError(f"WS-Man NTLM 챌린지 없음 (HTTP {status}): {self.host}")
+
+        headers = self._base_headers()
+        headers["Authorization"] = "Negotiate " + base64.b64encode(context.step(challenge)).decode(
+            "ascii"
+        )
+        status, _, response = await connection.request(self.path, headers, body)
+        if status == 401:
+            raise WSManAuthError(f"WS-Man 인증 실패: {self.username}@{self.host}")
+
+        connection.authenticated = True
+        return status, response
+
+    @staticmethod
+    def _auth_token(header: str) -> Optional[bytes]:
+        """WWW-Authenticate 헤더에서 Negotiate/NTLM 토큰 추출"""
+        for challenge in header.split(","):
+            scheme, _, token = challenge.strip().partition(" ")
+            if scheme.lower() in ("negotiate", "ntlm") and token.strip():
+                return base64.b64decode(token.strip())
+        return None
+
+    def _check_response(self, status: int, body: bytes) -> bytes:
+        """HTTP 상태 코드 확인 (SOAP Fault는 WSManFaultError로 변환)"""
+        if status == 200:
+            return body
+        if body:
+            fault = parse_fault(body)
+            if fault is not None:
+                raise fault
+        raise WSManError(f"WS-Man HTTP 오류: {status}, {body[:200]!r}")
+
+    async def close(self) -> None:
+        """모든 연결 종료"""
+        connections = self._idle + self._active
+        self._idle, self._active = [], []
+        for connection in connections:
+            connection.close()
+
+
+def parse_fault(body: bytes) -> Optional[WSManFaultError]:
+    """SOAP Fault 응답 파싱
+
+    Args:
+        body: 응답 본문
+
+    Returns:
+        WSManFaultError (Fault가 아니면 None)
+    """
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError:
+        return None
+
+    fault = root.find(f"{{{NS_SOAP}}}Body/{{{NS_SOAP}}}Fault")
+    if fault is None:
+        return None
+
+    code = None
+    wsman_fault = fault.find(f"{{{NS_SOAP}}}Detail/{{{NS_WSMAN_FAULT}}}WSManFault")
+    if wsman_fault is not None and wsman_fault.get("Code"):
+        code = int(wsman_fault.get("Code"))
+
+    reason = fault.findtext(f"{{{NS_SOAP}}}Reason/{{{NS_SOAP}}}Text")
+    return WSManFaultError((reason or "(no error message in fault)").strip(), code)
+
+
+def build_envelope(
+    action: str,
+    body: str = "",
+    shell_id: Optional[str] = None,
+    options: Optional[Dict[str, str]] = None,
+    operation_timeout: int = 20,
+    message_id: Optional[str] = None,
+) -> str:
+    """WS-Man SOAP envelope 생성
+
+    Args:
+        action: WS-Addressing Action URI
+        body: SOAP Body 안의 XML
+        shell_id: 대상 셸 ID (SelectorSet)
+        options: WinRS 옵션 (OptionSet)
+        operation_timeout: 작업 대기 시간 (초)
+        message_id: 메시지 ID (없으면 새 UUID)
+
+    Returns:
+        SOAP envelope 문자열
+    """
+    header = [
+        "<a:To>http://windows-host:5985/wsman</a:To>",
+        '<a:ReplyTo><a:Address s:mustUnderstand="true">'
+        "http://schemas.xmlsoap.org/ws/2004/08/addressing/role/anonymous"
+        "</a:Address></a:ReplyTo>",
+        f'<w:MaxEnvelopeSize s:mustUnderstand="true">{MAX_ENVELOPE_SIZE}</w:MaxEnvelopeSize>',
+        f"<a:MessageID>uuid:{message_id or uuid.uuid4()}</a:MessageID>",
+        '<w:Locale s:mustUnderstand="false" xml:lang="en-US"/>',
+        f"<w:OperationTimeout>PT{int(operation_timeout)}S</w:OperationTimeout>",
+        f'<w:ResourceURI s:mustUnderstand="true">{RESOURCE_CMD}</w:ResourceURI>',
+        f'<a:Action s:mustUnderstand="true">{escape(action)}</a:Action>',
+    ]
+    if shell_id:
+        header.append(
+            f'<w:SelectorSet><w:Selector Name="ShellId">{escape(shell_id)}</w:Selector>'
+            "</w:SelectorSet>"
+        )
+    if options:
+        header.append(
+            "<w:OptionSet>"
+            + "".join(
+                f"<w:Option Name={quoteattr(name)}>{escape(value)}</w:Option>"
+                for name, value in options.items()
+            )
+            + "</w:OptionSet>"
+        )
+
+    return (
+        f'<s:Envelope xmlns:s="{NS_SOAP}" xmlns:a="{NS_ADDRESSING}" '
+        f'xmlns:w="{NS_WSMAN}" xmlns:rsp="{NS_SHELL}">'
+        f"<s:Header>{''.join(header)}</s:Header>"
+        f"<s:Body>{body}</s:Body>"
+        "</s:Envelope>"
+    )
+
+
+def _find_text(root: ET.Element, local_name: str) -> Optional[str]:
+    """네임스페이스와 무관하게 첫 번째 요소의 텍스트 조회"""
+    for node in root.iter():
+        if node.tag.endswith(f"}}{local_name}") or node.tag == local_name:
+            return node.text
+    return None
+
+
+class WSManProtocol:
+    """asyncio WinRS 셸 프로토콜
+
+    pywinrm Protocol의 셸 작업(open_shell, run_command, get_command_output,
+    cleanup_command, close_shell)과 같은 흐름을 코루틴으로 제공합니다.
+
+    사용 예시:
+        >>> protocol = WSManProtocol(WSManTransport("host", 5986, "user", "pw"))
+        >>> shell_id = await protocol.open_shell(codepage=65001, noprofile=True)
+        >>> command_id = await protocol.run_command(shell_id, "ipconfig")
+        >>> stdout, stderr, exit_code = await protocol.get_command_output(shell_id, command_id)
+        >>> await protocol.cleanup_command(shell_id, command_id)
+        >>> await protocol.close_shell(shell_id)
+    """
+
+    def __init__(self, transport: WSManTransport, operation_timeout: int = 20):
+        """초기화
+
+        Args:
+            transport: WSManTransport
+            operation_timeout: WS-Man 작업 대기 시간 (초, transport.read_timeout보다 짧아야 함)
+        """
+        self.transport = transport
+        self.operation_timeout = operation_timeout
+
+    async def _send(self, action: str, body: str = "", **kwargs) -> ET.Element:
+        envelope = build_envelope(action, body, operation_timeout=self.operation_timeout, **kwargs)
+        response = await self.transport.send(envelope)
+        try:
+            return ET.fromstring(response)
+        except ET.ParseError as e:
+            raise WSManError(f"WS-Man 응답 파싱 실패: {e}")
+
+    async def open_shell(self, codepage: int = 437, noprofile: bool = False) -> str:
+        """원격 셸 생성
+
+        Returns:
+            ShellId
+        """
+        root = await self._send(
+            ACTION_CREATE,
+            "<rsp:Shell><rsp:InputStreams>stdin</rsp:InputStreams>"
+            "<rsp:OutputStreams>stdout stderr</rsp:OutputStreams></rsp:Shell>",
+            options={
+                "WINRS_NOPROFILE": str(noprofile).upper(),
+                "WINRS_CODEPAGE": str(codepage),
+            },
+        )
+        for node in root.iter():
+            if node.get("Name") == "ShellId" and node.text:
+                return node.text
+        raise WSManError("WS-Man 셸 생성 응답에 ShellId가 없습니다")
+
+    async def run_command(
+        self,
+        shell_id: str,
+        command: str,
+        arguments: Iterable[str] = (),
+        skip_cmd_shell: bool = False,
+    ) -> str:
+        """셸에서 명령어 시작
+
+        Returns:
+            CommandId
+        """
+        arguments = list(arguments)
+        body = f"<rsp:CommandLine><rsp:Command>{escape(command)}</rsp:Command>"
+        if arguments:
+            body += f"<rsp:Arguments>{escape(' '.join(arguments))}</rsp:Arguments>"
+        body += "</rsp:CommandLine>"
+
+        root = await self._send(
+            ACTION_COMMAND,
+            body,
+            shell_id=shell_id,
+            options={
+                "WINRS_CONSOLEMODE_STDIN": "TRUE",
+                "WINRS_SKIP_CMD_SHELL": str(skip_cmd_shell).upper(),
+            },
+        )
+        command_id = _find_text(root, "CommandId")
+        if not command_id:
+            raise WSManError("WS-Man 명령어 응답에 CommandId가 없습니다")
+        return command_id
+
+    async def receive(self, shell_id: str, command_id: str) -> Tuple[bytes, bytes, int, bool]:
+        """출력 1회 수신
+
+        Returns:
+            (stdout, stderr, exit_code, 완료 여부) (완료 전 exit_code는 -1)
+
+        Raises:
+            WSManFaultError: OPERATION_TIMEOUT_FAULT (아직 출력 없음) 포함
+        """
+        root = await self._send(
+            ACTION_RECEIVE,
+            f"<rsp:Receive><rsp:DesiredStream CommandId={quoteattr(command_id)}>"
+            "stdout stderr</rsp:DesiredStream></rsp:Receive>",
+            shell_id=shell_id,
+        )
+
+        stdout: List[bytes] = []
+        stderr: List[bytes] = []
+        done = False
+        exit_code = -1
+        for node in root.iter():
+            if node.tag == f"{{{NS_SHELL}}}Stream" and node.text:
+                data = base64.b64decode(node.text)
+                (stdout if node.get("Name") == "stdout" else stderr).append(data)
+            elif node.tag == f"{{{NS_SHELL}}}CommandState":
+                done = node.get("State", "").endswith("CommandState/Done")
+                if done:
+                    code = node.findtext(f"{{{NS_SHELL}}}ExitCode")
+                    exit_code = int(code) if code not in (None, "") else -1
+
+        return b"".join(stdout), b"".join(stderr), exit_code, done
+
+    async def get_command_output(self, shell_id: str, command_id: str) -> Tuple[bytes, bytes, int]:
+        """명령어가 끝날 때까지 출력 수신
+
+        Returns:
+            (stdout, stderr, exit_code)
+        """
+        stdout: List[bytes] = []
+        stderr: List[bytes] = []
+        while True:
+            try:
+                out, err, exit_code, done = await self.receive(shell_id, command_id)
+            except WSManFaultError as e:
+                # 장시간 실행 명령어: 출력이 없으면 서버가 대기 시간 초과를 반환
+                if e.code == OPERATION_TIMEOUT_FAULT:
+                    continue
+                raise
+            stdout.append(out)
+            stderr.append(err)
+            if done:
+                return b"".join(stdout), b"".join(stderr), exit_code
+
+    async def cleanup_command(self, shell_id: str, command_id: str) -> None:
+        """명령어 종료 신호 (terminate)"""
+        await self._send(
+            ACTION_SIGNAL,
+            f"<rsp:Signal CommandId={quoteattr(command_id)}>"
+            f"<rsp:Code>{SIGNAL_TERMINATE}</rsp:Code></rsp:Signal>",
+            shell_id=shell_id,
+        )
+
+    async def close_shell(self, shell_id: str) -> None:
+        """원격 셸 삭제"""
+        await self._send(ACTION_DELETE, shell_id=shell_id)
+
+    async def close(self) -> None:
+        """HTTP 연결 종료"""
+        await self.transport.close()
+
+
+__all__ = [
+    "OPERATION_TIMEOUT_FAULT",
+    "supports_native_transport",
+    "WSManError",
+    "WSManConnectionError",
+    "WSManAuthError",
+    "WSManFaultError",
+    "WSManTransport",
+    "WSManProtocol",
+    "build_envelope",
+    "parse_fault",
+]
@@ -38,6 +38,15 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: 느린 테스트 (skip with -m 'not slow')")
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory):
+    """규칙 캐시 등 사용자 캐시를 테스트 전용 임시 디렉토리에 저장"""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("BLUEPY_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
 # ==================== Domain Model Fixtures ====================
 
 
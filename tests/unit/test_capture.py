@@ -0,0 +1,156 @@
+"""명령어 기록 및 재생 단위 테스트
+
+src/infrastructure/network/capture.py 와 스캐너 기록/재생 연동을 테스트합니다.
+
+테스트 범위:
+1. ScanCapture 기록 및 파일 왕복
+2. ReplayExecutor 순서 재생, 기록되지 않은 명령어
+3. 로컬 스캔 기록 후 재생 시 같은 결과 (네트워크 없음)
+4. Windows 레지스트리 일괄 조회 재생
+"""
+
+import gzip
+import sys
+
+import pytest
+
+from src.core.domain.models import RuleMetadata, Severity
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.replay import create_replay_scanner
+from src.infrastructure.network.capture import (
+    CaptureError,
+    ReplayExecutor,
+    ReplayMissError,
+    ScanCapture,
+)
+from src.infrastructure.network.winrm_client import REGISTRY_MARKER, build_registry_script
+
+
+def make_rule(rule_id: str, commands, validator: str) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="파일 및 디렉토리 관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=commands,
+        validator=validator,
+    )
+
+
+@pytest.mark.unit
+class TestScanCapture:
+    """ScanCapture 테스트"""
+
+    def test_file_round_trip(self, tmp_path):
+        """save() 후 load()로 기록, 옵션, 종료 코드 복원 (gzip 파일)"""
+        path = str(tmp_path / "captures" / "s1.bpcap")
+        capture = ScanCapture(server_id="s1", platform="linux")
+        capture.options = {"batch_mode": True}
+        capture.record("cat /etc/passwd", None, "root:x:0:0\n", 0, 0.25)
+        capture.record("sh -s", "echo hi\n", "hi\n", 3, 0.5)
+        capture.save(path)
+
+        restored = ScanCapture.load(path)
+
+        assert restored.server_id == "s1"
+        assert restored.options == {"batch_mode": True}
+        assert [entry.exit_code for entry in restored.entries] == [0, 3]
+        assert restored.total_latency() == 0.75
+        assert restored.created_at == capture.created_at
+
+    def test_load_invalid_file(self, tmp_path):
+        """손상되었거나 버전이 다른 파일은 CaptureError"""
+        path = tmp_path / "broken.bpcap"
+        path.write_bytes(b"not gzip")
+        with pytest.raises(CaptureError):
+            ScanCapture.load(str(path))
+
+        path.write_bytes(gzip.compress(b'{"version": 0}'))
+        with pytest.raises(CaptureError, match="버전"):
+            ScanCapture.load(str(path))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplayExecutor:
+    """ReplayExecutor 테스트"""
+
+    async def test_replays_in_recorded_order(self):
+        """같은 명령어는 기록 순서대로, 이후에는 마지막 기록 반환, stdin이 다르면 다른 명령어"""
+        capture = ScanCapture(server_id="s1", platform="linux")
+        capture.record("run", "request", "first\n", 0, 0.1)
+        capture.record("run", "request", "second\n", 0, 0.1)
+        capture.record("run", None, "no input\n", 0, 0.1)
+        executor = ReplayExecutor(capture)
+        await executor.connect()
+
+        assert await executor.execute("run", input="request") == "first\n"
+        assert await executor.execute("run", input="request") == "second\n"
+        assert await executor.execute("run", input="request") == "second\n"
+        assert await executor.execute("run") == "no input\n"
+
+    async def test_missing_command(self):
+        """기록되지 않은 명령어는 ReplayMissError"""
+        executor = ReplayExecutor(ScanCapture(server_id="s1", platform="linux"))
+
+        with pytest.raises(ReplayMissError):
+            await executor.execute("uname -a")
+
+    async def test_windows_registry_replay(self):
+        """레지스트리 일괄 조회도 같은 스크립트로 재생"""
+        pair = ("HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Lsa", "NoLMHash")
+        capture = ScanCapture(server_id="w1", platform="windows")
+        capture.record(
+            build_registry_script([pair]),
+            None,
+            f'{REGISTRY_MARKER}\r\n[{{"path":"{pair[0]}","name":"NoLMHash",'
+            '"kind":"DWord","value":1}]\r\n'.replace("\\", "\\\\"),
+            0,
+            0.3,
+        )
+        scanner = create_replay_scanner(capture)
+        await scanner.connect()
+
+        values = await scanner.get_registry_values([pair])
+
+        assert values[pair].value == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRecordAndReplayScan:
+    """스캔 기록 후 재생 테스트"""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX 셸 필요")
+    async def test_replay_reproduces_local_scan(self, tmp_path):
+        """로컬 스캔을 기록한 캡처로 재생하면 실행 없이 같은 결과"""
+        rules = [
+            make_rule("U-18", ["ls -l /etc/passwd"], "validators.linux.check_u18"),
+            make_rule("U-20", ["ls -l /etc/hosts"], "validators.linux.check_u20"),
+        ]
+        scanner = LinuxScanner(
+            server_id="localhost", host="localhost", username="", batch_mode=True, local=True
+        )
+        capture = ScanCapture(server_id="localhost", platform="linux")
+        scanner.set_capture(capture)
+        await scanner.connect()
+        scanner.set_rules(rules)
+        recorded = await scanner.scan_all()
+        await scanner.disconnect()
+
+        path = str(tmp_path / "localhost.bpcap")
+        capture.save(path)
+
+        replay = create_replay_scanner(ScanCapture.load(path))
+        await replay.connect()
+        replay.set_rules(rules)
+        replayed = await replay.scan_all()
+
+        assert capture.options["batch_mode"] is True
+        assert len(capture) > 0
+        assert {rule_id: (r.status, r.message) for rule_id, r in replayed.results.items()} == {
+            rule_id: (r.status, r.message) for rule_id, r in recorded.results.items()
+        }
@@ -0,0 +1,191 @@
+"""스캔 체크포인트 단위 테스트
+
+src/core/scanner/checkpoint.py 와 BaseScanner 재연결 후 이어서 실행을 테스트합니다.
+
+테스트 범위:
+1. ScanCheckpoint 파일 기록 및 복원, 규칙 정의 변경, 다른 서버/오래된 체크포인트
+2. 기록 도중 중단된 줄 무시, 서버 체크포인트 삭제 (discard_checkpoints)
+3. 연결이 끊어지면 재연결 후 남은 규칙만 실행 (결과는 한 번씩)
+4. 재연결 실패 시 ConnectionError, 체크포인트로 다음 스캔에서 이어서 실행
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.core.domain.models import CheckResult, RuleMetadata, Severity, Status
+from src.core.scanner.checkpoint import ScanCheckpoint, discard_checkpoints
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.infrastructure.network.ssh_client import SSHClientError, SSHConnectionLostError
+
+
+def make_rule(rule_id: str, commands: List[str]) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="계정관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=commands,
+        validator=f"validators.linux.check_{rule_id.lower().replace('-', '')}",
+    )
+
+
+RULES = [make_rule(f"U-0{index}", [f"echo {index}"]) for index in range(1, 6)]
+
+
+@pytest.mark.unit
+class TestScanCheckpoint:
+    """ScanCheckpoint 테스트"""
+
+    def test_file_round_trip(self, tmp_path):
+        """기록한 결과를 새 체크포인트에서 복원, 규칙 정의가 바뀐 규칙은 제외"""
+        checkpoint = ScanCheckpoint("linux-s1", str(tmp_path))
+        assert checkpoint.load("s1", "linux", RULES) == {}
+        checkpoint.record(RULES[0], CheckResult(status=Status.PASS, message="ok"))
+        checkpoint.record(RULES[1], CheckResult(status=Status.FAIL, message="bad"))
+
+        changed = [RULES[0], make_rule("U-02", ["echo changed"])]
+        restored = ScanCheckpoint("linux-s1", str(tmp_path)).load("s1", "linux", changed)
+
+        assert list(restored) == ["U-01"]
+        assert restored["U-01"].status == Status.PASS
+        assert restored["U-01"].message == "ok"
+
+    def test_other_server_or_expired_discarded(self, tmp_path):
+        """다른 서버의 체크포인트나 max_age보다 오래된 체크포인트는 삭제 후 새로 시작"""
+        checkpoint = ScanCheckpoint("scan", str(tmp_path))
+        checkpoint.load("s1", "linux", RULES)
+        checkpoint.record(RULES[0], CheckResult(status=Status.PASS, message="ok"))
+
+        assert ScanCheckpoint("scan", str(tmp_path)).load("s2", "linux", RULES) == {}
+        assert not checkpoint.path.exists()
+
+        checkpoint = ScanCheckpoint("scan", str(tmp_path))
+        checkpoint.load("s1", "linux", RULES)
+        checkpoint._header["created_at"] = (datetime.now() - timedelta(hours=2)).isoformat()
+        checkpoint.record(RULES[0], CheckResult(status=Status.PASS, message="ok"))
+
+        expired = ScanCheckpoint("scan", str(tmp_path), max_age=3600)
+        assert expired.load("s1", "linux", RULES) == {}
+        assert ScanCheckpoint("scan", str(tmp_path)).load("s1", "linux", RULES) == {}
+
+    def test_partial_line_ignored(self, tmp_path):
+        """기록 도중 중단된 마지막 줄은 무시하고, 다음 기록은 새 줄에서 시작"""
+        checkpoint = ScanCheckpoint("scan", str(tmp_path))
+        checkpoint.load("s1", "linux", RULES)
+        checkpoint.record(RULES[0], CheckResult(status=Status.PASS, message="ok"))
+        with open(checkpoint.path, "a", encoding="utf-8") as f:
+            f.write('{"rule_id": "U-02", "dig')
+
+        resumed = ScanCheckpoint("scan", str(tmp_path))
+        assert list(resumed.load("s1", "linux", RULES)) == ["U-01"]
+        resumed.record(RULES[2], CheckResult(status=Status.PASS, message="ok"))
+
+        lines = checkpoint.path.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[-1])["rule_id"] == "U-03"
+        assert list(ScanCheckpoint("scan", str(tmp_path)).load("s1", "linux", RULES)) == [
+            "U-01",
+            "U-03",
+        ]
+
+    def test_discard_checkpoints_by_server(self, tmp_path):
+        """지정한 서버의 체크포인트 파일만 삭제"""
+        for scan_id, server_id in [("linux-s1-a", "s1"), ("linux-s1-b", "s1"), ("linux-s2", "s2")]:
+            checkpoint = ScanCheckpoint(scan_id, str(tmp_path))
+            checkpoint.load(server_id, "linux", RULES)
+            checkpoint.record(RULES[0], CheckResult(status=Status.FAIL, message="bad"))
+
+        assert discard_checkpoints(str(tmp_path), "s1") == 2
+        assert [path.name for path in tmp_path.iterdir()] == ["linux-s2.jsonl"]
+        assert discard_checkpoints(str(tmp_path / "missing"), "s1") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResumableScan:
+    """BaseScanner 재연결 후 이어서 실행 테스트"""
+
+    @staticmethod
+    def _make_scanner(
+        executed: List[str], drops: List[str], connects: List[str], reconnects: int = 10
+    ) -> LinuxScanner:
+        """drops에 있는 명령어를 처음 실행할 때 연결이 끊어지는 스캐너 (재연결 reconnects번 성공)"""
+        scanner = LinuxScanner(
+            server_id="s1", host="h", username="u", password="p", snapshot_collectors=False
+        )
+        scanner._connected = True
+        scanner.set_rules(RULES)
+
+        async def execute(command, timeout=60, input=None):
+            if command in drops:
+                drops.remove(command)
+                raise SSHConnectionLostError("SSH 연결이 끊어졌습니다: h")
+            executed.append(command)
+            return command
+
+        async def connect():
+            connects.append("connect")
+            if len(connects) > reconnects:
+                raise SSHClientError("SSH 연결 실패: h")
+
+        async def disconnect():
+            pass
+
+        scanner._ssh_client.execute = execute
+        scanner._ssh_client.connect = connect
+        scanner._ssh_client.disconnect = disconnect
+        scanner._call_validator = lambda rule, outputs: CheckResult(
+            status=Status.PASS, message="|".join(outputs)
+        )
+        return scanner
+
+    async def test_resume_runs_missing_rules(self):
+        """연결이 끊어지면 재연결 후 남은 규칙만 실행, 규칙마다 결과 한 번"""
+        executed: List[str] = []
+        connects: List[str] = []
+        scanner = self._make_scanner(executed, ["echo 3", "echo 5"], connects)
+
+        yielded = [rule.id async for rule, _ in scanner.scan_iter_resumable(backoff=0)]
+
+        assert yielded == ["U-01", "U-02", "U-03", "U-04", "U-05"]
+        assert executed == ["echo 1", "echo 2", "echo 3", "echo 4", "echo 5"]
+        assert connects == ["connect", "connect"]
+        assert scanner._checkpoint is None
+
+    async def test_concurrent_scan_resume(self):
+        """동시 실행에서도 연결이 끊어지기 전에 완료된 규칙은 다시 실행하지 않음"""
+        executed: List[str] = []
+        scanner = self._make_scanner(executed, ["echo 4"], [])
+        scanner.max_concurrency = 3
+
+        result = await scanner.scan_all_resumable(backoff=0)
+
+        assert list(result.results) == [rule.id for rule in RULES]
+        assert result.results["U-04"].message == "echo 4"
+        assert [executed.count(f"echo {index}") for index in range(1, 4)] == [1, 1, 1]
+
+    async def test_gives_up_and_resumes_from_file(self, tmp_path):
+        """재연결에 실패하면 ConnectionError, 같은 체크포인트로 다음 스캔이 남은 규칙만 실행"""
+        executed: List[str] = []
+        connects: List[str] = []
+        scanner = self._make_scanner(executed, ["echo 2"], connects, reconnects=0)
+        scanner.set_checkpoint(ScanCheckpoint("linux-s1", str(tmp_path)))
+
+        with pytest.raises(ConnectionError):
+            await scanner.scan_all_resumable(max_retries=2, backoff=0)
+        assert executed == ["echo 1"]
+        assert len(connects) == 2
+
+        executed.clear()
+        scanner = self._make_scanner(executed, [], [])
+        scanner.set_checkpoint(ScanCheckpoint("linux-s1", str(tmp_path)))
+        result = await scanner.scan_all()
+
+        assert executed == ["echo 2", "echo 3", "echo 4", "echo 5"]
+        assert result.total == len(RULES)
+        assert scanner.get_incremental_stats() == {"reused": 1, "executed": 4}
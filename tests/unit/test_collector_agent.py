@@ -0,0 +1,222 @@
+"""수집 에이전트 단위 테스트
+
+src/core/scanner/collector_agent.py 와 UnixScanner 에이전트 모드를 테스트합니다.
+LocalExecutor로 로컬 sh/python3에서 실제 에이전트를 실행합니다.
+
+테스트 범위:
+1. 에이전트 스크립트 해시, 요청 생성, 번들 파싱
+2. 에이전트 업로드(최초 1회) 및 병렬 실행 결과, 타임아웃된 파이프라인 종료
+3. 규칙 세트 변경 시 재업로드, 실패 시 배치 수집 대체
+"""
+
+import base64
+import json
+import shutil
+import subprocess
+import sys
+import time
+import zlib
+from typing import List
+
+import pytest
+
+from src.core.domain.models import CheckResult, RuleMetadata, Severity, Status
+from src.core.scanner.collector_agent import (
+    AGENT_MARKER,
+    AgentNotInstalledError,
+    CollectorAgent,
+    CollectorAgentError,
+)
+from src.core.scanner.command_batch import BATCH_SHELL, CommandBatch
+from src.core.scanner.linux_scanner import LinuxScanner
+
+requires_posix = pytest.mark.skipif(
+    sys.platform == "win32" or shutil.which("python3") is None, reason="sh, python3 필요"
+)
+
+
+def make_rule(rule_id: str, commands: List[str]) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="계정관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=commands,
+        validator=f"validators.linux.check_{rule_id.lower().replace('-', '')}",
+    )
+
+
+def bundle(results) -> str:
+    """에이전트 출력 형식 생성"""
+    data = zlib.compress(json.dumps({"results": results}).encode("utf-8"))
+    return f"{AGENT_MARKER} {base64.b64encode(data).decode('ascii')}\n"
+
+
+@pytest.mark.unit
+class TestCollectorAgent:
+    """CollectorAgent 테스트"""
+
+    def test_digest_follows_rule_set(self):
+        """같은 명령어 집합이면 같은 해시, 바뀌면 다른 해시"""
+        first = CollectorAgent(["id", "uname -a"])
+        same = CollectorAgent(["id", "uname -a", "id"])
+        changed = CollectorAgent(["id", "uname -r"])
+
+        assert first.digest == same.digest
+        assert first.digest != changed.digest
+        assert first.filename == f"agent-{first.digest}.py"
+
+    def test_request_uses_indexes(self):
+        """내장 명령어는 인덱스, 나머지는 명령어 문자열"""
+        agent = CollectorAgent(["id", "uname -a"])
+        request = json.loads(agent.build_request(["uname -a", "ps -ef", "uname -a"], workers=4))
+
+        assert request == {"workers": 4, "commands": [1, "ps -ef"]}
+
+    def test_parse_output(self):
+        """번들을 요청 순서대로 명령어에 매핑"""
+        agent = CollectorAgent(["id"])
+        outputs = agent.parse_output("motd\n" + bundle([[0, "uid=0\n"], [1, ""]]), ["id", "false"])
+
+        assert outputs["id"].stdout == "uid=0\n"
+        assert outputs["false"].exit_code == 1
+
+    def test_parse_output_errors(self):
+        """에이전트 없음, python3 없음, 결과 수 불일치, 번들 없음"""
+        agent = CollectorAgent(["id"])
+
+        with pytest.raises(AgentNotInstalledError):
+            agent.parse_output("BLUEPY-AGENT-MISSING\n", ["id"])
+        with pytest.raises(CollectorAgentError, match="python3"):
+            agent.parse_output("BLUEPY-AGENT-NOPYTHON\n", ["id"])
+        with pytest.raises(CollectorAgentError, match="불일치"):
+            agent.parse_output(bundle([]), ["id"])
+        with pytest.raises(CollectorAgentError):
+            agent.parse_output("Traceback (most recent call last):\n", ["id"])
+
+    @requires_posix
+    def test_timeout_kills_whole_pipeline(self, tmp_path):
+        """타임아웃된 파이프라인은 자식 프로세스까지 종료, 다른 명령어 결과는 유지"""
+        commands = ["sleep 6 | cat", "echo ok"]
+        agent = CollectorAgent(commands, command_timeout=1)
+        script = tmp_path / agent.filename
+        script.write_text(agent.script, encoding="utf-8")
+
+        started = time.monotonic()
+        output = subprocess.run(
+            ["python3", str(script)],
+            input=agent.build_request(commands),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        ).stdout
+        elapsed = time.monotonic() - started
+
+        outputs = agent.parse_output(output, commands)
+        assert elapsed < 5
+        assert outputs["sleep 6 | cat"].exit_code != 0
+        assert outputs["echo ok"].stdout == "ok\n"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAgentScan:
+    """UnixScanner 에이전트 모드 테스트"""
+
+    @staticmethod
+    async def _make_scanner(rules: List[RuleMetadata], executed: List[str]) -> LinuxScanner:
+        scanner = LinuxScanner(
+            server_id="localhost",
+            host="localhost",
+            username="",
+            local=True,
+            agent_mode=True,
+            snapshot_collectors=False,
+        )
+        await scanner.connect()
+        scanner._rules = rules
+
+        execute = scanner._ssh_client.execute
+
+        async def recording_execute(command, timeout=60, input=None):
+            executed.append(command)
+            return await execute(command, timeout=timeout, input=input)
+
+        scanner._ssh_client.execute = recording_execute
+        scanner._call_validator = lambda rule, outputs: CheckResult(
+            status=Status.PASS, message="|".join(outputs)
+        )
+        return scanner
+
+    @requires_posix
+    async def test_upload_once_and_collect(self, tmp_path, monkeypatch):
+        """최초 스캔만 업로드, 이후 스캔은 에이전트 실행 1회로 전체 수집"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        rules = [
+            make_rule("U-01", ["echo one", "printf 'a\\tb'"]),
+            make_rule("U-02", ["echo two; exit 3"]),
+            make_rule("U-03", ["[[ -n $HOME ]] && echo bash"]),
+        ]
+
+        executed: List[str] = []
+        scanner = await self._make_scanner(rules, executed)
+        result = await scanner.scan_all()
+
+        agent_files = list((tmp_path / ".cache" / "bluepy").glob("agent-*.py"))
+        assert [path.name for path in agent_files] == [scanner._agent.filename]
+        assert len(executed) == 3  # 실행(없음) → 업로드 → 실행
+        assert result.results["U-01"].message == "one\n|a\tb"
+        assert result.results["U-02"].message == "two\n"
+        if shutil.which("bash"):
+            assert result.results["U-03"].message == "bash\n"
+
+        executed.clear()
+        await scanner.scan_all()
+        assert len(executed) == 1
+
+    @requires_posix
+    async def test_rule_set_change_reuploads(self, tmp_path, monkeypatch):
+        """규칙 명령어가 바뀌면 새 에이전트 업로드, 이전 에이전트 삭제"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        executed: List[str] = []
+        scanner = await self._make_scanner([make_rule("U-01", ["echo one"])], executed)
+        await scanner.scan_all()
+        old_filename = scanner._agent.filename
+
+        scanner._rules = [make_rule("U-01", ["echo changed"])]
+        result = await scanner.scan_all()
+
+        agent_dir = tmp_path / ".cache" / "bluepy"
+        assert scanner._agent.filename != old_filename
+        assert [path.name for path in agent_dir.glob("agent-*.py")] == [scanner._agent.filename]
+        assert result.results["U-01"].message == "changed\n"
+
+    async def test_failure_falls_back_to_batch(self):
+        """에이전트 실행에 실패하면 배치 수집으로 대체"""
+        scanner = LinuxScanner(
+            server_id="s1", host="h", username="u", agent_mode=True, snapshot_collectors=False
+        )
+        scanner._connected = True
+        scanner._rules = [make_rule("U-01", ["echo one"])]
+        scanner._call_validator = lambda rule, outputs: CheckResult(
+            status=Status.PASS, message="|".join(outputs)
+        )
+
+        executed: List[str] = []
+
+        async def fake_execute(command, timeout=60, input=None):
+            executed.append(command)
+            if command == BATCH_SHELL:
+                batch = CommandBatch(["echo one"])
+                return f"{batch.marker} 0 0 4\none\n"
+            return "BLUEPY-AGENT-NOPYTHON\n"
+
+        scanner._ssh_client.execute = fake_execute
+        result = await scanner.scan_all()
+
+        assert executed[-1] == BATCH_SHELL
+        assert len(executed) == 2
+        assert result.results["U-01"].message == "one\n"
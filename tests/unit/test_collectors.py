@@ -0,0 +1,602 @@
+"""Snapshot collector 단위 테스트
+
+src/core/scanner/collectors/ 와 UnixScanner 스냅샷 연동을 테스트합니다.
+
+테스트 범위:
+1. ps | grep 파이프라인 파싱 (지원/미지원 형태)
+2. 프로세스 테이블 파싱 및 grep 로컬 평가
+3. UnixScanner._prepare_scan() 스냅샷 수집 (일반/배치 모드, 실패 대체)
+4. Get-ItemProperty 명령어 파싱, 레지스트리 일괄 조회 및 WindowsScanner 연동
+5. net accounts | findstr 명령어 파싱, 계정 정책 스냅샷
+"""
+
+import base64
+import json
+import re
+import shlex
+import shutil
+import subprocess
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.domain.models import RuleMetadata, Severity, Status
+from src.core.scanner.collectors.process import (
+    PS_SNAPSHOT_COMMAND,
+    ProcessSnapshotCollector,
+    bre_to_python,
+    parse_ps_output,
+    parse_ps_pipeline,
+)
+from src.core.scanner.collectors.account_policy import (
+    NET_ACCOUNTS_COMMAND,
+    AccountPolicyCollector,
+    parse_findstr_command,
+)
+from src.core.scanner.collectors.registry import RegistryCollector, parse_registry_command
+from src.core.scanner.command_batch import BATCH_SHELL, CommandBatch
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.windows_scanner import WindowsScanner
+from src.infrastructure.network.winrm_client import REGISTRY_MARKER, RegistryValue
+
+PS_OUTPUT = """\
+UID          PID    PPID  C STIME TTY          TIME CMD
+root           1       0  0 Oct16 ?        00:00:02 /sbin/init splash
+root         812       1  0 Oct16 ?        00:00:00 sendmail: accepting connections
+smmsp        820       1  0 Oct16 ?        00:00:00 sendmail: Queue runner@01:00:00 for /var/spool/clientmqueue
+root         901       1  0 Oct16 ?        00:00:01 /usr/sbin/named -u bind
+root         950       1  0 Oct16 ?        00:00:00 rpc.statd --no-notify
+admin       1200    1100  0 10:02 pts/0    00:00:00 vim /etc/mail/sendmail.cf
+root        1300    1299  0 10:05 ?        00:00:00 ps -ef
+"""
+
+
+def make_rule(rule_id: str, commands, validator: str) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="서비스 관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=commands,
+        validator=validator,
+    )
+
+
+@pytest.mark.unit
+class TestPsPipelineParsing:
+    """ps | grep 파이프라인 파싱 테스트"""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            'ps -ef | grep sendmail | grep -v "grep"',
+            "ps -ef | grep named | grep -v grep",
+            'ps -ef | grep -E "tftp|talk" | grep -v grep',
+        ],
+    )
+    def test_supported_pipelines(self, command):
+        """grep 자신을 제외하는 ps -ef 파이프라인은 처리 가능"""
+        assert ProcessSnapshotCollector().claims(command)
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "ps -ef",
+            "ps -ef | grep automount",
+            'ps -ef | egrep "ypserv|ypbind|ypxfrd"',
+            "ps -ax | grep sshd | grep -v grep",
+            "cat /etc/passwd | grep root | grep -v grep",
+            "ps -ef | grep sendmail | grep -v grep | wc -l",
+            "ps -ef | grep -c sendmail | grep -v grep",
+            "ps -o comm | grep sshd | grep -v grep",
+            "ps -ef | grep 'unterminated",
+        ],
+    )
+    def test_unsupported_pipelines(self, command):
+        """원격 출력과 달라질 수 있는 형태(grep 자신의 줄, 다른 ps 옵션)는 원격 실행 대상으로 남김"""
+        assert parse_ps_pipeline(command) is None
+
+    def test_bre_translation(self):
+        """BRE의 |, ()는 리터럴, \\|는 대안"""
+        assert bre_to_python("a|b") == r"a\|b"
+        assert bre_to_python(r"a\|b") == "a|b"
+        assert bre_to_python("rpc.*") == "rpc.*"
+
+
+@pytest.mark.unit
+class TestProcessSnapshotCollector:
+    """ProcessSnapshotCollector 테스트"""
+
+    @staticmethod
+    def _loaded() -> ProcessSnapshotCollector:
+        collector = ProcessSnapshotCollector()
+        collector.load(PS_OUTPUT)
+        return collector
+
+    def test_parse_ps_ef(self):
+        """ps -ef 출력을 ProcessEntry 레코드로 파싱 (헤더 제외)"""
+        collector = self._loaded()
+
+        assert len(collector.processes) == 7
+        assert collector.processes[1].pid == 812
+        assert collector.processes[1].ppid == 1
+        assert collector.processes[1].user == "root"
+        assert collector.processes[3].argv == ["/usr/sbin/named", "-u", "bind"]
+        assert collector.processes[3].command == "named"
+
+    def test_parse_skips_malformed_lines(self):
+        """pid가 숫자가 아니거나 열이 부족한 줄은 무시"""
+        entries = parse_ps_output(
+            "UID PID PPID C STIME TTY TIME CMD\nroot 1 0 0 Oct16 ? 00:00:02 init\nroot 2\n\n"
+        )
+        assert [entry.pid for entry in entries] == [1]
+
+    def test_render_matches_remote_output(self):
+        """ps -ef 원본 줄을 grep 단계로 거른 출력 (원격 실행 결과와 같은 형식)"""
+        output = self._loaded().render('ps -ef | grep sendmail | grep -v "grep"')
+
+        assert output.splitlines() == [
+            line for line in PS_OUTPUT.splitlines() if "sendmail" in line
+        ]
+
+    def test_render_grep_chain_with_invert(self):
+        """grep -v 단계 적용"""
+        output = self._loaded().render('ps -ef | grep sendmail | grep -v "vim" | grep -v grep')
+        assert len(output.splitlines()) == 2
+
+    def test_render_egrep_alternation(self):
+        """egrep 패턴은 ERE로 평가"""
+        output = self._loaded().render('ps -ef | egrep "named|rpc.*" | grep -v grep')
+        assert [line.split()[1] for line in output.splitlines()] == ["901", "950"]
+
+    def test_render_bre_pipe_is_literal(self):
+        """grep(BRE)의 |는 리터럴이므로 일치하지 않음"""
+        assert self._loaded().render('ps -ef | grep "named|rpc" | grep -v grep') == ""
+
+    def test_render_before_load_returns_none(self):
+        """스냅샷 로드 전에는 재현하지 않음"""
+        collector = ProcessSnapshotCollector()
+        assert collector.render("ps -ef | grep sendmail | grep -v grep") is None
+
+    def test_find(self):
+        """명령줄 정규식으로 프로세스 조회"""
+        assert [entry.pid for entry in self._loaded().find("^sendmail")] == [812, 820]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUnixScannerSnapshot:
+    """UnixScanner 스냅샷 수집 연동 테스트"""
+
+    @staticmethod
+    def _make_scanner(**kwargs) -> LinuxScanner:
+        scanner = LinuxScanner(server_id="s", host="h", username="u", **kwargs)
+        scanner._connected = True
+        scanner._rules = [
+            make_rule(
+                "U-13", ['ps -ef | grep sendmail | grep -v "grep"'], "validators.linux.check_u13"
+            ),
+            make_rule("U-26", ["ps -ef | grep automount"], "validators.linux.check_u26"),
+            make_rule("U-01", ["cat /etc/securetty"], "validators.linux.check_u01"),
+        ]
+        return scanner
+
+    async def test_process_rules_share_one_snapshot(self):
+        """grep 자신을 제외하는 ps | grep 규칙은 원격 ps 1회로 평가, 나머지는 원격 실행"""
+        scanner = self._make_scanner(snapshot_collectors=True)
+
+        async def fake_execute(command, timeout=60, input=None):
+            return PS_OUTPUT if command == PS_SNAPSHOT_COMMAND else ""
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        executed = [call.args[0] for call in mock_execute.call_args_list]
+        assert executed == [PS_SNAPSHOT_COMMAND, "ps -ef | grep automount", "cat /etc/securetty"]
+        assert result.total == 3
+        assert (
+            scanner._command_cache.get('ps -ef | grep sendmail | grep -v "grep"').count("\n") == 3
+        )
+        assert scanner.get_snapshot("process") is not None
+
+    async def test_snapshot_failure_falls_back(self):
+        """스냅샷 수집 실패 시 명령어별 원격 실행"""
+        scanner = self._make_scanner(snapshot_collectors=True)
+
+        async def fake_execute(command, timeout=60, input=None):
+            if command == PS_SNAPSHOT_COMMAND:
+                raise RuntimeError("channel open failed")
+            return ""
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            await scanner.scan_all()
+
+        executed = [call.args[0] for call in mock_execute.call_args_list]
+        assert 'ps -ef | grep sendmail | grep -v "grep"' in executed
+        assert scanner.get_snapshot("process") is None
+
+    async def test_disabled_by_default(self):
+        """snapshot_collectors 기본값(False)이면 기존처럼 명령어별 실행"""
+        scanner = self._make_scanner()
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, return_value=""
+        ) as mock_execute:
+            await scanner.scan_all()
+
+        assert mock_execute.call_count == 3
+        assert PS_SNAPSHOT_COMMAND not in [call.args[0] for call in mock_execute.call_args_list]
+
+    async def test_batch_mode_includes_snapshot_command(self):
+        """배치 모드에서는 스냅샷 명령어가 배치에 포함되고 ps | grep 명령어는 제외"""
+        scanner = self._make_scanner(batch_mode=True, snapshot_collectors=True)
+        expected = CommandBatch(
+            ["ps -ef | grep automount", "cat /etc/securetty", PS_SNAPSHOT_COMMAND]
+        )
+
+        async def fake_execute(command, timeout=60, input=None):
+            assert command == BATCH_SHELL
+            assert input == expected.build_script()
+            return "".join(
+                f"{expected.marker} {index} 0 {len(out.encode())}\n{out}"
+                for index, out in enumerate(["", "pts/0\n", PS_OUTPUT])
+            )
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        mock_execute.assert_called_once()
+        assert result.total == 3
+        assert scanner._command_cache.get("cat /etc/securetty") == "pts/0\n"
+        assert "sendmail" in scanner._command_cache.get('ps -ef | grep sendmail | grep -v "grep"')
+
+    @pytest.mark.skipif(shutil.which("grep") is None, reason="grep이 필요합니다")
+    async def test_same_verdicts_with_and_without_snapshot(self):
+        """스냅샷 사용 여부와 관계없이 같은 판정 (원격 파이프라인은 로컬 sh로 재현)"""
+
+        def run_remote(command: str) -> str:
+            # 원격 ps -ef 출력에는 파이프라인의 grep 프로세스 자신도 나타남
+            stages = [" ".join(shlex.split(stage)) for stage in command.split(" | ")[1:]]
+            own = "".join(
+                f"root {1301 + i:>10}    1299  0 10:05 ?        00:00:00 {stage}\n"
+                for i, stage in enumerate(stages)
+            )
+            completed = subprocess.run(
+                ["sh", "-c", command.replace("ps -ef", "cat", 1)],
+                input=PS_OUTPUT + own,
+                capture_output=True,
+                timeout=30,
+                text=True,
+            )
+            return completed.stdout
+
+        async def fake_execute(command, timeout=60, input=None):
+            if command == PS_SNAPSHOT_COMMAND:
+                return PS_OUTPUT
+            return run_remote(command)
+
+        rules = [
+            make_rule(
+                "U-13", ['ps -ef | grep sendmail | grep -v "grep"'], "validators.linux.check_u43"
+            ),
+            make_rule("U-16", ["ps -ef | grep named | grep -v grep"], "validators.linux.check_u16"),
+            make_rule("U-45", ['ps -ef | egrep "ypserv|ypbind"'], "validators.linux.check_u45"),
+            make_rule("U-65", ["ps -ef | grep snmp"], "validators.linux.check_u65"),
+        ]
+
+        verdicts = []
+        for snapshot_collectors in (False, True):
+            scanner = self._make_scanner(snapshot_collectors=snapshot_collectors)
+            scanner.set_rules(rules)
+            with patch.object(scanner._ssh_client, "execute", side_effect=fake_execute):
+                result = await scanner.scan_all()
+            verdicts.append(
+                {
+                    rule_id: (check.status, check.message)
+                    for rule_id, check in result.results.items()
+                }
+            )
+
+        assert verdicts[0] == verdicts[1]
+        assert verdicts[0]["U-13"][0] == Status.FAIL
+        assert verdicts[0]["U-45"][0] == Status.PASS
+        assert verdicts[0]["U-65"][0] == Status.PASS
+
+
+LSA = r"HKLM:\System\CurrentControlSet\Control\Lsa"
+WINLOGON = r"HKLM:\Software\Microsoft\Windows NT\CurrentVersion\Winlogon"
+
+# 원격 레지스트리 대역 (소문자 키 경로 -> {값 이름: (형식, 값)})
+REGISTRY = {
+    LSA.lower(): {"NoLMHash": ("DWord", 1), "RestrictAnonymousSAM": ("DWord", 0)},
+    WINLOGON.lower(): {"LegalNoticeText": ("MultiString", ["경고", "무단 접근 금지"])},
+}
+
+
+def registry_command(path: str, name: str, silent: bool = True) -> str:
+    """규칙 YAML과 같은 형태의 Get-ItemProperty 명령어"""
+    option = " -ErrorAction SilentlyContinue" if silent else ""
+    return (
+        f'Get-ItemProperty -Path "{path}" -Name "{name}"{option} | '
+        f"Select-Object -ExpandProperty {name}"
+    )
+
+
+def run_registry_script(script: str) -> str:
+    """레지스트리 일괄 조회 스크립트 실행 대역"""
+    encoded = re.search(r"FromBase64String\('([^']+)'\)", script).group(1)
+    requests = json.loads(base64.b64decode(encoded).decode("utf-8"))
+    values = []
+    for request in requests:
+        key = REGISTRY.get(request["path"].lower())
+        if key is None:
+            continue
+        for name in request["names"]:
+            for actual, (kind, value) in key.items():
+                if actual.lower() == name.lower():
+                    values.append(
+                        {"path": request["path"], "name": name, "kind": kind, "value": value}
+                    )
+    return f"{REGISTRY_MARKER}\r\n{json.dumps(values)}\r\n"
+
+
+@pytest.mark.unit
+class TestRegistryCollector:
+    """RegistryCollector 테스트"""
+
+    def test_parse_registry_command(self):
+        """Get-ItemProperty 단일 값 조회 명령어만 처리"""
+        assert parse_registry_command(registry_command(LSA, "NoLMHash")) == (LSA, "NoLMHash")
+        assert parse_registry_command(registry_command(LSA, "NoLMHash", silent=False)) == (
+            LSA,
+            "NoLMHash",
+        )
+        # 다른 속성을 출력하거나 와일드카드 경로는 원격 실행
+        assert (
+            parse_registry_command(
+                f'Get-ItemProperty -Path "{LSA}" -Name "NoLMHash" | Select-Object -ExpandProperty X'
+            )
+            is None
+        )
+        assert parse_registry_command(registry_command(r"HKLM:\System\*", "Start")) is None
+        assert parse_registry_command("net accounts | findstr Lockout") is None
+
+    def test_keys_are_read_once(self):
+        """같은 키의 값은 키 단위로 묶어 한 번만 조회"""
+        collector = RegistryCollector()
+        script = collector.build_command(
+            [
+                registry_command(LSA, "NoLMHash"),
+                registry_command(LSA.upper(), "RestrictAnonymousSAM"),
+                registry_command(WINLOGON, "LegalNoticeText"),
+            ]
+        )
+
+        encoded = re.search(r"FromBase64String\('([^']+)'\)", script).group(1)
+        requests = json.loads(base64.b64decode(encoded).decode("utf-8"))
+        assert [request["names"] for request in requests] == [
+            ["NoLMHash", "RestrictAnonymousSAM"],
+            ["LegalNoticeText"],
+        ]
+
+    def test_render_typed_values(self):
+        """DWord, MultiString, 없는 값을 Get-ItemProperty 출력 형식으로 재현"""
+        collector = RegistryCollector()
+        commands = [
+            registry_command(LSA, "NoLMHash"),
+            registry_command(WINLOGON, "LegalNoticeText"),
+            registry_command(LSA, "RunAsPPL"),
+        ]
+        collector.load(run_registry_script(collector.build_command(commands)))
+
+        assert collector.get(LSA.lower(), "nolmhash") == RegistryValue(LSA, "NoLMHash", "DWord", 1)
+        assert collector.render(commands[0]) == "1\r\n"
+        assert collector.render(commands[1]) == "경고\r\n무단 접근 금지\r\n"
+        assert collector.render(commands[2]) == ""
+        # 조회하지 않은 값은 원격 실행
+        assert collector.render(registry_command(LSA, "LmCompatibilityLevel")) is None
+
+    def test_load_without_marker_raises(self):
+        """결과 표시가 없으면 ValueError (명령어별 실행으로 대체)"""
+        collector = RegistryCollector()
+        collector.build_command([registry_command(LSA, "NoLMHash")])
+        with pytest.raises(ValueError):
+            collector.load("Get-Item : Access denied")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWindowsScannerRegistry:
+    """WindowsScanner 레지스트리 수집 테스트"""
+
+    @staticmethod
+    def _make_scanner(**kwargs) -> WindowsScanner:
+        scanner = WindowsScanner(
+            server_id="server-001",
+            host="192.168.1.100",
+            username="Administrator",
+            password="pw",
+            **kwargs,
+        )
+        scanner._connected = True
+        scanner._client._connected = True
+        scanner._rules = [
+            RuleMetadata(
+                id=rule_id,
+                name=rule_id,
+                category="레지스트리",
+                severity=Severity.HIGH,
+                kisa_standard=rule_id,
+                description="Test",
+                commands=[command],
+                validator=f"validators.windows.check_{rule_id.lower().replace('-', '')}",
+            )
+            for rule_id, command in [
+                ("W-12", registry_command(LSA, "NoLMHash")),
+                ("W-13", registry_command(LSA, "RestrictAnonymousSAM", silent=False)),
+                ("W-14", registry_command(WINLOGON, "AutoAdminLogon")),
+            ]
+        ]
+        return scanner
+
+    async def test_scan_reads_registry_once(self):
+        """레지스트리 규칙은 일괄 조회 1회로 평가"""
+        scanner = self._make_scanner()
+
+        async def fake_execute(script, timeout=60):
+            return run_registry_script(script)
+
+        with patch.object(
+            scanner._client, "execute_powershell", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        mock_execute.assert_called_once()
+        assert result.results["W-12"].status == Status.PASS
+        assert result.results["W-13"].status == Status.FAIL
+        assert result.results["W-14"].status == Status.PASS
+
+    async def test_get_registry_values_uses_scan_cache(self):
+        """이번 스캔에서 조회한 값은 원격 실행 없이 반환"""
+        scanner = self._make_scanner()
+
+        async def fake_execute(script, timeout=60):
+            return run_registry_script(script)
+
+        with patch.object(
+            scanner._client, "execute_powershell", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            await scanner.scan_all()
+            cached = await scanner.get_registry_values(
+                [(LSA, "NoLMHash"), (WINLOGON, "AutoAdminLogon")]
+            )
+            fetched = await scanner.get_registry_values([(WINLOGON, "LegalNoticeText")])
+            again = await scanner.get_registry_values([(WINLOGON, "LegalNoticeText")])
+
+        assert mock_execute.call_count == 2
+        assert cached[(LSA, "NoLMHash")].value == 1
+        assert cached[(WINLOGON, "AutoAdminLogon")] is None
+        assert fetched == again
+        assert fetched[(WINLOGON, "LegalNoticeText")].kind == "MultiString"
+
+    async def test_registry_failure_falls_back_to_per_command(self):
+        """일괄 조회 실패 시 명령어별 실행으로 대체"""
+        scanner = self._make_scanner()
+        executed = []
+
+        async def fake_execute(script, timeout=60):
+            executed.append(script)
+            if REGISTRY_MARKER in script:
+                raise RuntimeError("WinRM 오류")
+            return "1\r\n"
+
+        with patch.object(
+            scanner._client, "execute_powershell", new_callable=AsyncMock, side_effect=fake_execute
+        ):
+            result = await scanner.scan_all()
+
+        assert len(executed) == 4
+        assert result.results["W-12"].status == Status.PASS
+
+
+NET_ACCOUNTS_OUTPUT = (
+    "Force user logoff how long after time expires?:       Never\r\n"
+    "Minimum password age (days):                          0\r\n"
+    "Maximum password age (days):                          90\r\n"
+    "Minimum password length:                              8\r\n"
+    "Length of password history maintained:                None\r\n"
+    "Lockout threshold:                                    5\r\n"
+    "Lockout duration (minutes):                           30\r\n"
+    "Lockout observation window (minutes):                 30\r\n"
+    "Computer role:                                        SERVER\r\n"
+    "The command completed successfully.\r\n"
+)
+
+
+@pytest.mark.unit
+class TestAccountPolicyCollector:
+    """AccountPolicyCollector 테스트"""
+
+    def test_parse_findstr_command(self):
+        """옵션 없는 findstr만 처리 (공백으로 구분된 단어)"""
+        assert parse_findstr_command('net accounts | findstr "Lockout threshold"') == [
+            "Lockout",
+            "threshold",
+        ]
+        assert parse_findstr_command("net accounts | findstr Lockout") == ["Lockout"]
+        assert parse_findstr_command('net accounts | findstr /i "lockout"') is None
+        assert parse_findstr_command('net accounts | findstr "Lockout.*"') is None
+        assert parse_findstr_command('net user | findstr "Guest"') is None
+
+    def test_policies_and_findstr_render(self):
+        """정책 딕셔너리와 findstr 출력 재현 (단어 중 하나라도 포함된 줄)"""
+        collector = AccountPolicyCollector()
+        assert collector.build_command([]) == NET_ACCOUNTS_COMMAND
+        collector.load(NET_ACCOUNTS_OUTPUT)
+
+        assert collector.get_int("lockout threshold") == 5
+        assert collector.get_int("Maximum password age (days)") == 90
+        assert collector.get_int("Force user logoff how long after time expires?") is None
+        assert collector.render('net accounts | findstr "length"') == (
+            "Minimum password length:                              8\r\n"
+        )
+        # findstr "Lockout threshold": Lockout 또는 threshold가 포함된 3줄 모두 출력
+        rendered = collector.render('net accounts | findstr "Lockout threshold"')
+        assert rendered.startswith("Lockout threshold:")
+        assert rendered.count("\r\n") == 3
+
+    def test_load_invalid_output_raises(self):
+        """정책 항목이 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            AccountPolicyCollector().load("System error 5 has occurred.")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWindowsScannerAccountPolicy:
+    """WindowsScanner 계정 정책 스냅샷 테스트"""
+
+    async def test_windows_scan_runs_net_accounts_once(self):
+        """W-04..W-07 형태의 규칙은 net accounts 1회로 평가"""
+        scanner = WindowsScanner(
+            server_id="server-001", host="192.168.1.100", username="Administrator", password="pw"
+        )
+        scanner._connected = True
+        scanner._rules = [
+            RuleMetadata(
+                id=rule_id,
+                name=rule_id,
+                category="계정관리",
+                severity=Severity.HIGH,
+                kisa_standard=rule_id,
+                description="Test",
+                commands=[f'net accounts | findstr "{text}"'],
+                validator=f"validators.windows.check_{rule_id.lower().replace('-', '')}",
+            )
+            for rule_id, text in [
+                ("W-04", "Minimum password length"),
+                ("W-06", "Lockout threshold"),
+            ]
+        ]
+
+        with patch.object(
+            scanner._client,
+            "execute_powershell",
+            new_callable=AsyncMock,
+            return_value=NET_ACCOUNTS_OUTPUT,
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        mock_execute.assert_called_once()
+        assert mock_execute.call_args.args[0] == NET_ACCOUNTS_COMMAND
+        assert scanner.get_snapshot("account_policy").get_int("Lockout threshold") == 5
+        assert result.results["W-06"].status == Status.PASS
@@ -0,0 +1,236 @@
+"""CommandBatch 단위 테스트
+
+src/core/scanner/command_batch.py와 UnixScanner 배치 모드를 테스트합니다.
+
+테스트 범위:
+1. 스크립트 생성 및 실제 sh 실행 결과 파싱
+2. 프레임 파싱 (종료 코드, 멀티바이트 출력, 잘린 출력)
+3. UnixScanner.collect_batch() / scan_one() 연동
+"""
+
+import os
+import shlex
+import shutil
+import subprocess
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.domain.models import RuleMetadata, Severity, Status
+from src.core.scanner.command_batch import (
+    BATCH_SHELL,
+    CommandBatch,
+    CommandBatchError,
+)
+from src.core.scanner.linux_scanner import LinuxScanner
+
+
+def run_batch_locally(batch: CommandBatch) -> str:
+    """배치 스크립트를 로컬 sh로 실행 (원격 실행 대체)"""
+    completed = subprocess.run(
+        shlex.split(BATCH_SHELL),
+        input=batch.build_script().encode("utf-8"),
+        capture_output=True,
+        timeout=30,
+    )
+    return completed.stdout.decode("utf-8")
+
+
+requires_sh = pytest.mark.skipif(shutil.which("sh") is None, reason="sh가 필요합니다")
+requires_bash = pytest.mark.skipif(shutil.which("bash") is None, reason="bash가 필요합니다")
+
+
+@pytest.mark.unit
+class TestCommandBatch:
+    """CommandBatch 테스트"""
+
+    def test_duplicate_commands_run_once(self):
+        """중복 명령어는 한 번만 포함 (순서 유지)"""
+        batch = CommandBatch(["cat /etc/passwd", "ls -l /etc/shadow", "cat /etc/passwd"])
+        assert batch.commands == ["cat /etc/passwd", "ls -l /etc/shadow"]
+        assert len(batch) == 2
+
+    def test_marker_is_deterministic(self):
+        """같은 명령어 집합이면 같은 스크립트"""
+        assert CommandBatch(["a", "b"]).build_script() == CommandBatch(["a", "b"]).build_script()
+        assert CommandBatch(["a"]).marker != CommandBatch(["b"]).marker
+
+    @requires_sh
+    def test_run_and_parse(self):
+        """실제 sh 실행 결과를 명령어별로 분리"""
+        commands = [
+            "echo hello",
+            "printf 'no newline'",
+            "echo '한글 출력'; echo second",
+            "exit 3",
+            "echo 'quoted \"value\"' && false",
+            "true",
+        ]
+        batch = CommandBatch(commands)
+        outputs = batch.parse_output(run_batch_locally(batch))
+
+        assert outputs["echo hello"].stdout == "hello\n"
+        assert outputs["echo hello"].exit_code == 0
+        assert outputs["printf 'no newline'"].stdout == "no newline"
+        assert outputs["echo '한글 출력'; echo second"].stdout == "한글 출력\nsecond\n"
+        assert outputs["exit 3"].exit_code == 3
+        assert outputs["exit 3"].stdout == ""
+        assert outputs["echo 'quoted \"value\"' && false"].stdout == 'quoted "value"\n'
+        assert outputs["echo 'quoted \"value\"' && false"].exit_code == 1
+        assert outputs["true"].stdout == ""
+
+    @requires_sh
+    def test_output_resembling_header_is_not_split(self):
+        """출력에 개행이 많아도 길이 기반으로 정확히 분리"""
+        batch = CommandBatch(["printf 'a\\n\\n\\nb\\n'", "echo next"])
+        outputs = batch.parse_output(run_batch_locally(batch))
+
+        assert outputs["printf 'a\\n\\n\\nb\\n'"].stdout == "a\n\n\nb\n"
+        assert outputs["echo next"].stdout == "next\n"
+
+    @requires_bash
+    def test_bash_syntax_matches_per_command(self):
+        """bash가 있으면 bash로 실행 (bash 문법 명령어가 명령어별 실행과 같은 출력)"""
+        commands = [
+            '[[ -n "$HOME" ]] && echo yes',
+            "echo $'a\\tb'",
+            "cat <(echo substituted)",
+            'echo "${BASH_VERSION:+bash}"',
+        ]
+        batch = CommandBatch(commands)
+        outputs = batch.parse_output(run_batch_locally(batch))
+
+        for command in commands:
+            expected = subprocess.run(
+                ["bash", "-c", command], capture_output=True, timeout=30, text=True
+            )
+            assert outputs[command].stdout == expected.stdout
+        assert outputs['echo "${BASH_VERSION:+bash}"'].stdout == "bash\n"
+
+    @requires_sh
+    def test_falls_back_to_sh_without_bash(self, tmp_path):
+        """bash가 없는 서버에서는 sh로 실행"""
+        if os.path.realpath(shutil.which("sh")).endswith("bash"):
+            pytest.skip("sh가 bash인 환경에서는 확인할 수 없습니다")
+        for tool in ("sh", "cat", "wc", "tr", "mktemp", "rm"):
+            path = shutil.which(tool)
+            if path is None:
+                pytest.skip(f"{tool}이 필요합니다")
+            (tmp_path / tool).symlink_to(path)
+
+        batch = CommandBatch(['echo "shell=${BASH_VERSION:-sh}"'])
+        completed = subprocess.run(
+            [str(tmp_path / "sh")] + shlex.split(BATCH_SHELL)[1:],
+            input=batch.build_script(),
+            capture_output=True,
+            timeout=30,
+            text=True,
+            env={"PATH": str(tmp_path)},
+        )
+
+        assert batch.parse_output(completed.stdout)[batch.commands[0]].stdout == "shell=sh\n"
+
+    def test_parse_skips_leading_noise(self):
+        """marker 이전의 출력(로그인 배너 등)은 무시"""
+        batch = CommandBatch(["echo hi"])
+        output = f"welcome banner\n{batch.marker} 0 0 3\nhi\n"
+        assert batch.parse_output(output)["echo hi"].stdout == "hi\n"
+
+    def test_parse_truncated_output(self):
+        """잘린 섹션은 결과에서 제외"""
+        batch = CommandBatch(["echo a", "echo b"])
+        output = f"{batch.marker} 0 0 2\na\n{batch.marker} 1 0 100\nb\n"
+        outputs = batch.parse_output(output)
+
+        assert outputs["echo a"].stdout == "a\n"
+        assert "echo b" not in outputs
+
+    def test_parse_without_marker_raises(self):
+        """marker가 없으면 CommandBatchError"""
+        batch = CommandBatch(["echo a"])
+        with pytest.raises(CommandBatchError):
+            batch.parse_output("sh: not found\n")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUnixScannerBatchMode:
+    """UnixScanner 배치 모드 테스트"""
+
+    @staticmethod
+    def _make_scanner() -> LinuxScanner:
+        scanner = LinuxScanner(
+            server_id="server-001", host="192.168.1.100", username="admin", batch_mode=True
+        )
+        scanner._connected = True
+        scanner._rules = [
+            RuleMetadata(
+                id="U-18",
+                name="/etc/passwd 파일 권한",
+                category="파일 및 디렉터리 관리",
+                severity=Severity.HIGH,
+                kisa_standard="U-18",
+                description="Test",
+                commands=["echo '-rw------- 1 root root 1234 Jan 1 12:00 /etc/passwd'"],
+                validator="validators.linux.check_u18",
+            ),
+            RuleMetadata(
+                id="U-41",
+                name="수동 점검",
+                category="서비스 관리",
+                severity=Severity.LOW,
+                kisa_standard="U-41",
+                description="Test",
+                commands=["echo 'No commands (manual check)'"],
+                validator="validators.linux.check_u41",
+            ),
+        ]
+        return scanner
+
+    @requires_sh
+    async def test_scan_all_uses_single_session(self):
+        """배치 모드 scan_all은 SSH 세션 1회로 모든 명령어 실행"""
+        scanner = self._make_scanner()
+
+        async def fake_execute(command, timeout=60, input=None):
+            assert command == BATCH_SHELL
+            completed = subprocess.run(
+                shlex.split(BATCH_SHELL), input=input.encode(), capture_output=True, timeout=30
+            )
+            return completed.stdout.decode()
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        mock_execute.assert_called_once()
+        assert result.results["U-18"].status == Status.PASS
+
+    async def test_batch_failure_falls_back_to_per_command(self):
+        """배치 실패 시 명령어별 실행으로 대체"""
+        scanner = self._make_scanner()
+
+        async def fake_execute(command, timeout=60, input=None):
+            if command == BATCH_SHELL:
+                return "sh: not found\n"
+            return "-rw------- 1 root root 1234 Jan 1 12:00 /etc/passwd\n"
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        # 배치 1회 + 개별 명령어 1회
+        assert mock_execute.call_count == 2
+        assert result.results["U-18"].status == Status.PASS
+
+    async def test_manual_commands_are_not_batched(self):
+        """수동 점검 자리표시자 명령어는 배치에 포함되지 않음"""
+        scanner = self._make_scanner()
+        scanner._rules = scanner._rules[1:]
+
+        with patch.object(scanner._ssh_client, "execute", new_callable=AsyncMock) as mock_execute:
+            assert await scanner.collect_batch() == 0
+
+        mock_execute.assert_not_called()
@@ -0,0 +1,146 @@
+"""CommandCache 단위 테스트
+
+src/core/scanner/command_cache.py와 스캐너 연동을 테스트합니다.
+
+테스트 범위:
+1. normalize_command: 명령어 정규화
+2. CommandCache: 캐싱, 동시 요청 병합, 실패 처리, 통계
+3. 스캐너 연동: 중복 명령어 1회 실행
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.domain.models import RuleMetadata, Severity
+from src.core.scanner.command_cache import CommandCache, normalize_command
+from src.core.scanner.linux_scanner import LinuxScanner
+
+
+@pytest.mark.unit
+class TestNormalizeCommand:
+    """normalize_command 테스트"""
+
+    def test_collapse_whitespace(self):
+        assert normalize_command("  cat   /etc/inetd.conf  ") == "cat /etc/inetd.conf"
+
+    def test_tabs_and_newlines(self):
+        assert normalize_command("ps -ef |\tgrep\nsendmail") == "ps -ef | grep sendmail"
+
+    def test_quoted_whitespace_preserved(self):
+        assert normalize_command('grep  "a   b"  file') == 'grep "a   b" file'
+        assert normalize_command("echo 'x  y'") == "echo 'x  y'"
+
+    def test_identical_rule_commands(self):
+        """YAML에서 반복되는 명령어는 같은 키"""
+        cmd = 'ps -ef | grep sendmail | grep -v "grep"'
+        assert normalize_command(cmd) == normalize_command(cmd + " ")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCommandCache:
+    """CommandCache 테스트"""
+
+    async def test_cache_hit(self):
+        """같은 명령어는 한 번만 실행"""
+        cache = CommandCache()
+        execute = AsyncMock(return_value="output")
+
+        assert await cache.get_or_execute("cat /etc/inetd.conf", execute) == "output"
+        assert await cache.get_or_execute("cat  /etc/inetd.conf", execute) == "output"
+
+        execute.assert_called_once_with("cat /etc/inetd.conf")
+        assert cache.get_stats() == {"entries": 1, "executions": 1, "saved": 1}
+
+    async def test_concurrent_requests_coalesced(self):
+        """동시에 들어온 같은 명령어 요청은 실행 1회로 병합"""
+        cache = CommandCache()
+        calls = 0
+
+        async def execute(command):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return f"out:{command}"
+
+        results = await asyncio.gather(
+            *(cache.get_or_execute("ls -al /var/spool/cron/crontabs/*", execute) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert set(results) == {"out:ls -al /var/spool/cron/crontabs/*"}
+        assert cache.saved_executions == 4
+
+    async def test_failure_propagates_and_is_not_cached(self):
+        """실패는 대기 중인 요청에도 전달되고 캐시되지 않음"""
+        cache = CommandCache()
+
+        async def failing(command):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_execute("cat /etc/motd", failing),
+            cache.get_or_execute("cat /etc/motd", failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "cat /etc/motd" not in cache
+
+        execute = AsyncMock(return_value="ok")
+        assert await cache.get_or_execute("cat /etc/motd", execute) == "ok"
+        execute.assert_called_once()
+
+    async def test_prime(self):
+        """prime()으로 등록한 결과는 실행 없이 반환"""
+        cache = CommandCache()
+        cache.prime("cat /etc/passwd", "root:x:0:0")
+        execute = AsyncMock()
+
+        assert await cache.get_or_execute("cat /etc/passwd", execute) == "root:x:0:0"
+        execute.assert_not_called()
+        assert cache.get("cat /etc/passwd") == "root:x:0:0"
+
+    async def test_clear(self):
+        """clear()는 결과와 통계 초기화"""
+        cache = CommandCache()
+        await cache.get_or_execute("a", AsyncMock(return_value="x"))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_stats() == {"entries": 0, "executions": 0, "saved": 0}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScannerCommandDedup:
+    """스캐너 명령어 중복 제거 테스트"""
+
+    async def test_duplicate_commands_across_rules(self):
+        """여러 규칙의 같은 명령어는 스캔당 1회만 원격 실행"""
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=4)
+        scanner._connected = True
+        scanner._rules = [
+            RuleMetadata(
+                id=rule_id,
+                name="sendmail",
+                category="서비스 관리",
+                severity=Severity.HIGH,
+                kisa_standard=rule_id,
+                description="Test",
+                commands=["cat /etc/mail/sendmail.cf"],
+                validator=f"validators.linux.check_u{rule_id[2:]}",
+            )
+            for rule_id in ("U-13", "U-14")
+        ]
+
+        with patch.object(
+            scanner._ssh_client, "execute", new_callable=AsyncMock, return_value=""
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        assert result.total == 2
+        mock_execute.assert_called_once()
+        assert scanner.get_cache_stats()["saved"] == 1
@@ -0,0 +1,230 @@
+"""증분 스캔 지문 단위 테스트
+
+src/core/scanner/fingerprint.py 와 BaseScanner 증분 스캔 연동을 테스트합니다.
+
+테스트 범위:
+1. 지문 수집 스크립트 생성 및 출력 파싱 (로컬 sh 실행 포함)
+2. FingerprintStore 조회/저장/파일 왕복
+3. 입력이 바뀌지 않은 규칙의 결과 재사용, 바뀐 규칙만 재실행
+"""
+
+import json
+import shlex
+import shutil
+import subprocess
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from src.core.domain.models import CheckResult, RuleDependencies, RuleMetadata, Severity, Status
+from src.core.scanner.fingerprint import (
+    FINGERPRINT_MARKER,
+    FingerprintStore,
+    build_unix_fingerprint_script,
+    build_windows_fingerprint_script,
+    parse_fingerprint_output,
+)
+from src.core.scanner.linux_scanner import LinuxScanner
+
+
+def make_rule(rule_id: str, commands: List[str], depends_on=None) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="파일 및 디렉토리 관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=commands,
+        validator=f"validators.linux.check_{rule_id.lower().replace('-', '')}",
+        depends_on=depends_on,
+    )
+
+
+def fingerprint_output(fingerprints: Dict[str, str]) -> str:
+    """지문 수집 스크립트 출력 형식 생성"""
+    lines = [FINGERPRINT_MARKER] + [f"{key}\t{value}" for key, value in fingerprints.items()]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.unit
+class TestFingerprintScript:
+    """지문 수집 스크립트 및 파싱 테스트"""
+
+    def test_parse_output(self):
+        """marker 이전 출력은 무시, 탭 이후가 지문"""
+        output = "motd banner\n" + fingerprint_output(
+            {"file:/etc/passwd": "81a4|0|0|1146|1700000000|1700000000|42", "package:bind": "9.16"}
+        )
+
+        assert parse_fingerprint_output(output) == {
+            "file:/etc/passwd": "81a4|0|0|1146|1700000000|1700000000|42",
+            "package:bind": "9.16",
+        }
+
+    def test_parse_output_without_marker(self):
+        """marker가 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            parse_fingerprint_output("sh: syntax error\n")
+
+    def test_invalid_key(self):
+        """알 수 없는 종류의 키는 ValueError"""
+        with pytest.raises(ValueError):
+            build_unix_fingerprint_script(["registry:HKLM"])
+
+    def test_windows_script_quotes_names(self):
+        """PowerShell 인자는 작은따옴표로 감싸고 '는 ''로 이스케이프"""
+        script = build_windows_fingerprint_script(["file:C:\\it's.ini", "service:Spooler"])
+
+        assert "fp_file 'C:\\it''s.ini'" in script
+        assert "fp_service 'Spooler'" in script
+
+    @pytest.mark.skipif(shutil.which("stat") is None, reason="stat 명령어 필요")
+    def test_unix_script_runs(self, tmp_path):
+        """로컬 sh로 실행: 파일 변경 시 지문이 바뀌고 없는 입력은 missing"""
+        target = tmp_path / "it's a file"
+        target.write_text("a")
+        keys = [f"file:{target}", f"file:{tmp_path / 'missing'}", "package:bluepy-no-such-pkg"]
+        command = f"sh -c {shlex.quote(build_unix_fingerprint_script(keys))}"
+
+        def run() -> Dict[str, str]:
+            output = subprocess.run(command, shell=True, capture_output=True, text=True).stdout
+            return parse_fingerprint_output(output)
+
+        before = run()
+        target.chmod(0o600)
+        after = run()
+
+        assert before[f"file:{tmp_path / 'missing'}"] == "missing"
+        assert before["package:bluepy-no-such-pkg"] == "missing"
+        assert before[f"file:{target}"] != after[f"file:{target}"]
+
+
+@pytest.mark.unit
+class TestFingerprintStore:
+    """FingerprintStore 테스트"""
+
+    RULE = make_rule("U-18", ["ls -l /etc/passwd"], RuleDependencies(files=["/etc/passwd"]))
+
+    def test_reuse_requires_same_fingerprints(self):
+        """지문이 같으면 이전 결과, 다르거나 없으면 None"""
+        store = FingerprintStore()
+        store.put(
+            "s1",
+            self.RULE,
+            {"file:/etc/passwd": "v1"},
+            CheckResult(status=Status.PASS, message="ok"),
+        )
+
+        assert store.get("s1", self.RULE, {"file:/etc/passwd": "v1"}).status == Status.PASS
+        assert store.get("s1", self.RULE, {"file:/etc/passwd": "v2"}) is None
+        assert store.get("s1", self.RULE, {}) is None
+        assert store.get("s2", self.RULE, {"file:/etc/passwd": "v1"}) is None
+
+    def test_rule_change_invalidates(self):
+        """규칙 명령어가 바뀌면 재사용하지 않음"""
+        store = FingerprintStore()
+        store.put(
+            "s1",
+            self.RULE,
+            {"file:/etc/passwd": "v1"},
+            CheckResult(status=Status.PASS, message="ok"),
+        )
+        changed = self.RULE.model_copy(update={"commands": ["stat /etc/passwd"]})
+
+        assert store.get("s1", changed, {"file:/etc/passwd": "v1"}) is None
+
+    def test_file_round_trip(self, tmp_path):
+        """save() 후 새 저장소에서 결과와 details 복원"""
+        path = tmp_path / "state" / "fingerprints.json"
+        store = FingerprintStore(str(path))
+        result = CheckResult(status=Status.FAIL, message="취약", details={"mode": "0666"})
+        store.put("s1", self.RULE, {"file:/etc/passwd": "v1"}, result)
+        store.save()
+
+        restored = FingerprintStore(str(path)).get("s1", self.RULE, {"file:/etc/passwd": "v1"})
+
+        assert restored.status == Status.FAIL
+        assert restored.details == {"mode": "0666"}
+        assert restored.timestamp == result.timestamp
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """손상되었거나 버전이 다른 파일은 빈 저장소로 시작"""
+        path = tmp_path / "fingerprints.json"
+        path.write_text("{not json")
+        assert FingerprintStore(str(path)).get("s1", self.RULE, {"file:/etc/passwd": "v1"}) is None
+
+        path.write_text(json.dumps({"version": 0, "servers": {"s1": {}}}))
+        assert FingerprintStore(str(path)).get("s1", self.RULE, {"file:/etc/passwd": "v1"}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIncrementalScan:
+    """BaseScanner 증분 스캔 연동 테스트"""
+
+    @staticmethod
+    def _make_scanner(store: FingerprintStore, fingerprints: Dict[str, str], executed: List[str]):
+        scanner = LinuxScanner(server_id="s1", host="h", username="u", snapshot_collectors=False)
+        scanner._connected = True
+        scanner._rules = [
+            make_rule("U-18", ["ls -l /etc/passwd"], RuleDependencies(files=["/etc/passwd"])),
+            make_rule("U-19", ["ls -l /etc/shadow"], RuleDependencies(files=["/etc/shadow"])),
+            make_rule("U-08", ["ps -ef | grep automount"]),
+        ]
+        scanner.set_fingerprint_store(store)
+
+        async def execute(command: str) -> str:
+            if command.startswith("sh -c"):
+                return fingerprint_output(fingerprints)
+            executed.append(command)
+            return command
+
+        def validate(rule, outputs):
+            return CheckResult(status=Status.PASS, message=f"{rule.id} 실행")
+
+        scanner.execute_command = execute
+        scanner._call_validator = validate
+        return scanner
+
+    async def test_unchanged_rules_reused(self, tmp_path):
+        """두 번째 스캔은 지문이 바뀐 규칙과 depends_on이 없는 규칙만 실행"""
+        path = str(tmp_path / "fingerprints.json")
+        fingerprints = {"file:/etc/passwd": "p1", "file:/etc/shadow": "s1"}
+
+        executed: List[str] = []
+        first = await self._make_scanner(FingerprintStore(path), fingerprints, executed).scan_all()
+        assert len(executed) == 3
+        assert first.total == 3
+
+        fingerprints["file:/etc/shadow"] = "s2"
+        executed = []
+        scanner = self._make_scanner(FingerprintStore(path), fingerprints, executed)
+        second = await scanner.scan_all()
+
+        assert executed == ["ls -l /etc/shadow", "ps -ef | grep automount"]
+        assert scanner.get_incremental_stats() == {"reused": 1, "executed": 2}
+        assert list(second.results) == ["U-18", "U-19", "U-08"]
+        assert second.results["U-18"].timestamp == first.results["U-18"].timestamp
+
+    async def test_fingerprint_failure_runs_all(self):
+        """지문 수집에 실패하면 모든 규칙 실행"""
+        store = FingerprintStore()
+        executed: List[str] = []
+        scanner = self._make_scanner(store, {}, executed)
+        await scanner.scan_all()
+        executed.clear()
+
+        async def broken(command: str) -> str:
+            if command.startswith("sh -c"):
+                raise RuntimeError("channel closed")
+            executed.append(command)
+            return command
+
+        with patch.object(scanner, "execute_command", broken):
+            await scanner.scan_all()
+
+        assert len(executed) == 3
+        assert scanner.get_incremental_stats() == {"reused": 0, "executed": 3}
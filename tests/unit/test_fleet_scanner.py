@@ -0,0 +1,243 @@
+"""FleetScanner 단위 테스트
+
+src/core/scanner/fleet_scanner.py를 테스트합니다.
+
+테스트 범위:
+1. create_scanner: Server 행 → 플랫폼별 스캐너
+2. FleetScanner: 전체 연결 수 제한, 호스트 타임아웃, 실패 격리, 결과 스트림
+3. 공유 RuleCatalog 규칙 사용 (macOS 서버는 Linux 공유 규칙)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from src.core.domain.models import CheckResult, RuleMetadata, Severity, Status
+from src.core.scanner.base_scanner import BaseScanner
+from src.core.scanner.fleet_scanner import FleetScanner, create_scanner
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.rule_catalog import get_rule_catalog
+from src.core.scanner.windows_scanner import WindowsScanner
+
+RULE_YAML = {
+    "id": "U-01",
+    "name": "root 원격 접속 제한",
+    "category": "계정관리",
+    "severity": "high",
+    "kisa_standard": "U-01",
+    "description": "Test",
+    "platforms": ["linux", "macos"],
+    "check": {"commands": ["cat /etc/securetty"]},
+    "validator": "validators.linux.check_u01",
+}
+
+
+def make_server(server_id: int, platform: str = "linux", **kwargs) -> SimpleNamespace:
+    """Server 모델과 같은 속성을 가진 테스트용 객체"""
+    values = dict(
+        id=server_id,
+        name=f"server-{server_id}",
+        host=f"10.0.0.{server_id}",
+        port=22,
+        username="root",
+        auth_method="password",
+        key_path=None,
+        platform=platform,
+    )
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+class FakeScanner(BaseScanner):
+    """연결 수와 스캔 지연을 기록하는 테스트용 스캐너"""
+
+    open_connections = 0
+    peak_connections = 0
+
+    def __init__(self, server, delay: float = 0.01, fail_connect: bool = False):
+        super().__init__(server_id=str(server.id), platform=server.platform)
+        self.delay = delay
+        self.fail_connect = fail_connect
+        self.disconnected = False
+
+    async def connect(self) -> None:
+        if self.fail_connect:
+            raise ConnectionError("서버 연결 실패: auth failed")
+        FakeScanner.open_connections += 1
+        FakeScanner.peak_connections = max(
+            FakeScanner.peak_connections, FakeScanner.open_connections
+        )
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        if self._connected:
+            FakeScanner.open_connections -= 1
+        self._connected = False
+        self.disconnected = True
+
+    async def execute_command(self, command: str) -> str:
+        return ""
+
+    async def load_rules(self, rules_dir: str) -> None:
+        pass
+
+    async def scan_one(self, rule: RuleMetadata) -> CheckResult:
+        await asyncio.sleep(self.delay)
+        return CheckResult(status=Status.PASS, message="양호")
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_scanner():
+    FakeScanner.open_connections = 0
+    FakeScanner.peak_connections = 0
+
+
+@pytest.fixture
+def rules_dir(tmp_path) -> str:
+    """Linux 규칙 1개 (macOS와 공유) + validator가 없는 macOS 규칙 파일 (config/rules/macos와 같음)"""
+    root = tmp_path / "rules"
+    (root / "linux").mkdir(parents=True)
+    (root / "macos").mkdir()
+    with open(root / "linux" / "U-01.yaml", "w", encoding="utf-8") as f:
+        yaml.dump(RULE_YAML, f, allow_unicode=True)
+    with open(root / "macos" / "M-01.yaml", "w", encoding="utf-8") as f:
+        yaml.dump({"id": "M-01", "name": "SIP", "check": {"validator": "x"}}, f)
+    return str(root)
+
+
+@pytest.mark.unit
+class TestCreateScanner:
+    """create_scanner 테스트"""
+
+    def test_linux_key_auth(self):
+        """키 인증 서버는 key_path를 사용"""
+        server = make_server(1, auth_method="key", key_path="/keys/id_rsa")
+        scanner = create_scanner(server, None, 4)
+
+        assert isinstance(scanner, LinuxScanner)
+        assert scanner.server_id == "1"
+        assert scanner.max_concurrency == 4
+        assert scanner._ssh_client.key_filename == "/keys/id_rsa"
+
+    def test_windows_default_port(self):
+        """SSH 기본 포트로 저장된 Windows 서버는 WinRM 포트 사용"""
+        scanner = create_scanner(make_server(2, platform="windows"), "pw", 1)
+
+        assert isinstance(scanner, WindowsScanner)
+        assert scanner._client.port == 5986
+
+    def test_unknown_platform(self):
+        """지원하지 않는 플랫폼은 ValueError"""
+        with pytest.raises(ValueError):
+            create_scanner(make_server(3, platform="aix"), None, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFleetScanner:
+    """FleetScanner 테스트"""
+
+    async def test_global_connection_cap(self, rules_dir):
+        """동시에 열린 연결 수는 max_connections를 넘지 않음"""
+        servers = [make_server(i) for i in range(1, 11)]
+        fleet = FleetScanner(
+            servers,
+            max_connections=3,
+            rules_dir=rules_dir,
+            scanner_factory=lambda server, password, channels: FakeScanner(server),
+        )
+
+        outcomes = await fleet.scan_all()
+
+        assert [outcome.server_id for outcome in outcomes] == [str(i) for i in range(1, 11)]
+        assert all(outcome.succeeded for outcome in outcomes)
+        assert FakeScanner.peak_connections == 3
+        assert FakeScanner.open_connections == 0
+
+    async def test_rules_shared_from_catalog(self, rules_dir):
+        """모든 서버가 공유 카탈로그의 같은 규칙 객체 사용, macOS 서버는 Linux 공유 규칙"""
+        scanners = []
+
+        def factory(server, password, channels):
+            scanners.append(FakeScanner(server))
+            return scanners[-1]
+
+        servers = [make_server(1), make_server(2), make_server(3, platform="macos")]
+        fleet = FleetScanner(servers, rules_dir=rules_dir, scanner_factory=factory)
+
+        outcomes = await fleet.scan_all()
+
+        assert all(outcome.succeeded for outcome in outcomes)
+        assert outcomes[2].result.total == 1
+        shared = get_rule_catalog(rules_dir).get("U-01")
+        assert [scanner._rules for scanner in scanners] == [[shared]] * 3
+        assert all(scanner._rules[0] is shared for scanner in scanners)
+
+    async def test_host_timeout_and_failure_are_isolated(self, rules_dir):
+        """느린 서버와 연결 실패 서버는 다른 서버에 영향을 주지 않음"""
+        scanners = {}
+
+        def factory(server, password, channels):
+            scanners[server.id] = FakeScanner(
+                server, delay=5 if server.id == 2 else 0.01, fail_connect=server.id == 3
+            )
+            return scanners[server.id]
+
+        fleet = FleetScanner(
+            [make_server(1), make_server(2), make_server(3)],
+            host_timeout=0.2,
+            rules_dir=rules_dir,
+            scanner_factory=factory,
+        )
+
+        outcomes = await fleet.scan_all()
+
+        assert outcomes[0].succeeded
+        assert outcomes[0].result.score == 100.0
+        assert "타임아웃" in outcomes[1].error
+        assert scanners[2].disconnected
+        assert "auth failed" in outcomes[2].error
+
+    async def test_scan_iter_yields_in_completion_order(self, rules_dir):
+        """scan_iter는 완료된 서버부터 반환"""
+        delays = {1: 0.2, 2: 0.01}
+        fleet = FleetScanner(
+            [make_server(1), make_server(2)],
+            rules_dir=rules_dir,
+            scanner_factory=lambda server, password, channels: FakeScanner(
+                server, delay=delays[server.id]
+            ),
+        )
+
+        order = [outcome.server_id async for outcome in fleet.scan_iter()]
+
+        assert order == ["2", "1"]
+
+    async def test_password_provider_and_channels(self, rules_dir):
+        """패스워드 조회 함수와 호스트당 채널 수를 스캐너 생성에 전달"""
+        received = []
+
+        def factory(server, password, channels):
+            received.append((password, channels))
+            return FakeScanner(server)
+
+        fleet = FleetScanner(
+            [make_server(1)],
+            max_channels_per_host=6,
+            password_provider=lambda server: f"pw-{server.name}",
+            rules_dir=rules_dir,
+            scanner_factory=factory,
+        )
+
+        await fleet.scan_all()
+
+        assert received == [("pw-server-1", 6)]
+
+    async def test_invalid_limits(self):
+        """동시성 설정이 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            FleetScanner([], max_connections=0)
+        with pytest.raises(ValueError):
+            FleetScanner([], max_channels_per_host=0)
@@ -220,3 +220,151 @@ class TestGUISmokeTests:
 
         # MainWindow 클래스에 __init__ 메서드가 있는지 확인
         assert hasattr(MainWindow, "__init__")
+
+
+# ==================== RuleWatcher Tests ====================
+
+
+@pytest.mark.unit
+class TestRuleWatcher:
+    """RuleWatcher 테스트"""
+
+    def test_rule_file_change_emits_changed_ids(self, qtbot, tmp_path):
+        """생성 시 규칙 미로드, 로드 후 규칙 파일을 수정하면 바뀐 규칙 id를 rules_changed로 전달"""
+        import yaml
+
+        from src.core.scanner.rule_catalog import RuleCatalog
+        from src.gui.workers.rule_watcher import RuleWatcher
+
+        rules_dir = tmp_path / "rules" / "linux"
+        rules_dir.mkdir(parents=True)
+        data = {
+            "id": "U-01",
+            "name": "root 계정 원격 접속 제한",
+            "category": "계정관리",
+            "severity": "high",
+            "kisa_standard": "U-01",
+            "description": "Test",
+            "check": {"commands": ["cat /etc/securetty"]},
+            "validator": "validators.linux.check_u01",
+        }
+        (rules_dir / "U-01.yaml").write_text(yaml.dump(data), encoding="utf-8")
+
+        catalog = RuleCatalog(str(tmp_path / "rules"))
+        watcher = RuleWatcher(catalog)
+        assert not catalog.is_loaded
+        assert watcher._watcher.directories() == [str(rules_dir)]
+        assert watcher._watcher.files() == []
+
+        # 카탈로그 로드 후 refresh()부터 규칙 파일 감시
+        catalog.rules("linux")
+        assert watcher.refresh() == []
+        assert str(rules_dir / "U-01.yaml") in watcher._watcher.files()
+
+        data["severity"] = "low"
+        with qtbot.waitSignal(watcher.rules_changed, timeout=5000) as blocker:
+            (rules_dir / "U-01.yaml").write_text(yaml.dump(data), encoding="utf-8")
+
+        assert blocker.args == [["U-01"]]
+        assert catalog.get("U-01").severity.value == "low"
+
+
+# ==================== ScanWorker Tests ====================
+
+
+@pytest.mark.unit
+class TestScanWorker:
+    """ScanWorker 테스트"""
+
+    def test_max_concurrency_passed_to_scanner(self):
+        """max_concurrency를 스캐너에 전달 (하나의 연결 위에서 규칙 동시 실행)"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from src.gui.workers.scan_worker import ScanWorker
+
+        assert ScanWorker(server_id="s1", host="h", username="u").max_concurrency == 4
+
+        worker = ScanWorker(server_id="s1", host="h", username="u", max_concurrency=6)
+        with patch("src.gui.workers.scan_worker.LinuxScanner") as scanner_class:
+            scanner_class.return_value.platform = "linux"
+            scanner_class.return_value.connect = AsyncMock(side_effect=ConnectionError("offline"))
+            with pytest.raises(ConnectionError):
+                asyncio.run(worker._run_scan())
+
+        assert scanner_class.call_args.kwargs["max_concurrency"] == 6
+
+    def test_interrupted_scan_not_resumed_by_next_scan(self, tmp_path):
+        """실패한 스캔의 체크포인트는 삭제, 다음 스캔은 모든 규칙을 다시 실행"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from src.core.domain.models import CheckResult, RuleMetadata, Severity, Status
+        from src.core.scanner.checkpoint import ScanCheckpoint
+        from src.core.scanner.linux_scanner import LinuxScanner
+        from src.gui.workers.scan_worker import ScanWorker
+        from src.infrastructure.network.ssh_client import SSHConnectionLostError
+
+        rules = [
+            RuleMetadata(
+                id=f"U-0{index}",
+                name=f"U-0{index} 테스트",
+                category="계정관리",
+                severity=Severity.HIGH,
+                kisa_standard=f"U-0{index}",
+                description="Test",
+                commands=[f"echo {index}"],
+                validator=f"validators.linux.check_u0{index}",
+            )
+            for index in range(1, 4)
+        ]
+        executed = []
+        drops = ["echo 2"]
+
+        def make_scanner(**kwargs):
+            scanner = LinuxScanner(
+                server_id=kwargs["server_id"], host="h", username="u", snapshot_collectors=False
+            )
+
+            async def execute(command, timeout=60, input=None):
+                if command in drops:
+                    drops.remove(command)
+                    raise SSHConnectionLostError("SSH 연결이 끊어졌습니다: h")
+                executed.append(command)
+                return command
+
+            async def connect():
+                scanner._connected = True
+
+            scanner.connect = connect
+            scanner.disconnect = AsyncMock()
+            scanner.load_rules = AsyncMock(side_effect=lambda rules_dir: scanner.set_rules(rules))
+            scanner._ssh_client.execute = execute
+            scanner._call_validator = lambda rule, outputs: CheckResult(
+                status=Status.FAIL, message="|".join(outputs)
+            )
+            return scanner
+
+        # 비정상 종료된 이전 스캔의 체크포인트 (다음 스캔에서 정리)
+        stale = ScanCheckpoint("linux-s1-old", str(tmp_path))
+        stale.load("s1", "linux", rules)
+        stale.record(rules[2], CheckResult(status=Status.FAIL, message="stale"))
+
+        checkpoint_dir = str(tmp_path)
+        worker = ScanWorker(server_id="s1", host="h", username="u", checkpoint_dir=checkpoint_dir)
+        worker.MAX_RECONNECTS = 0
+        with patch("src.gui.workers.scan_worker.LinuxScanner", side_effect=make_scanner):
+            with pytest.raises(ConnectionError):
+                asyncio.run(worker._run_scan())
+            assert executed == ["echo 1"]
+            assert list(tmp_path.iterdir()) == []
+
+            executed.clear()
+            worker = ScanWorker(
+                server_id="s1", host="h", username="u", checkpoint_dir=checkpoint_dir
+            )
+            result = asyncio.run(worker._run_scan())
+
+        assert sorted(executed) == ["echo 1", "echo 2", "echo 3"]
+        assert result.results["U-03"].message == "echo 3"
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,125 @@
+"""LocalExecutor 단위 테스트
+
+src/infrastructure/network/local_executor.py와 UnixScanner(local=True) 연동을 테스트합니다.
+로컬 셸(bash가 있으면 bash)로 실제 명령어를 실행합니다.
+
+테스트 범위:
+1. 명령어 출력, stdin 전달, 0이 아닌 종료 코드, bash 문법
+2. 동시 실행 프로세스 수 제한
+3. 취소/타임아웃 시 프로세스 그룹 종료
+4. LinuxScanner(local=True)로 로컬 머신 점검
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+from src.core.domain.models import Status
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.infrastructure.network.local_executor import LocalExecutor, LocalExecutorError
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX 셸 필요")
+
+
+def process_alive(pid: int) -> bool:
+    """프로세스 생존 여부 (좀비는 종료로 간주)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLocalExecutor:
+    """LocalExecutor.execute 테스트"""
+
+    async def test_execute_returns_stdout(self):
+        """stdout 반환, 0이 아닌 종료 코드도 예외 없이 반환"""
+        async with LocalExecutor() as executor:
+            assert await executor.execute("echo hello") == "hello\n"
+            assert await executor.execute("echo partial; exit 3") == "partial\n"
+
+    async def test_execute_with_input(self):
+        """input은 stdin으로 전달"""
+        async with LocalExecutor() as executor:
+            assert await executor.execute("sh -s", input="echo from-stdin\n") == "from-stdin\n"
+
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash가 필요합니다")
+    async def test_bash_syntax(self):
+        """bash가 있으면 bash로 실행 (배치 수집, 수집 에이전트와 같은 문법)"""
+        async with LocalExecutor() as executor:
+            assert await executor.execute("[[ -n $HOME ]] && echo bash") == "bash\n"
+
+    async def test_not_connected(self):
+        """connect() 전에는 LocalExecutorError"""
+        with pytest.raises(LocalExecutorError):
+            await LocalExecutor().execute("echo hello")
+
+    async def test_concurrency_limit(self):
+        """max_processes개까지만 동시에 실행"""
+        executor = LocalExecutor(max_processes=2)
+        await executor.connect()
+
+        started = time.monotonic()
+        await asyncio.gather(*(executor.execute("sleep 0.2") for _ in range(4)))
+
+        assert time.monotonic() - started >= 0.4
+
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="/proc 필요")
+    async def test_cancel_kills_process_group(self, tmp_path):
+        """취소하면 즉시 반환하고 파이프라인의 자식 프로세스까지 종료"""
+        pid_file = tmp_path / "pid"
+        executor = LocalExecutor()
+        await executor.connect()
+
+        task = asyncio.ensure_future(executor.execute(f"sleep 60 & echo $! > {pid_file}; wait"))
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+        child_pid = int(pid_file.read_text())
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - started < 0.1
+
+        for _ in range(100):
+            if not process_alive(child_pid):
+                break
+            await asyncio.sleep(0.01)
+        assert not process_alive(child_pid)
+
+    async def test_timeout(self):
+        """타임아웃되면 LocalExecutorError"""
+        async with LocalExecutor() as executor:
+            with pytest.raises(LocalExecutorError, match="타임아웃"):
+                await executor.execute("sleep 60", timeout=0.2)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLocalScan:
+    """LinuxScanner(local=True) 테스트"""
+
+    async def test_scan_local_machine(self, tmp_path):
+        """SSH 없이 로컬 명령어 출력으로 validator 실행"""
+        scanner = LinuxScanner(
+            server_id="localhost", host="localhost", username="", max_concurrency=4, local=True
+        )
+        await scanner.connect()
+        await scanner.load_rules("config/rules")
+        scanner._rules = [rule for rule in scanner._rules if rule.id in ("U-04", "U-18")]
+
+        result = await scanner.scan_all()
+        await scanner.disconnect()
+
+        assert set(result.results) == {"U-04", "U-18"}
+        for check in result.results.values():
+            assert not check.message.startswith("점검 중 오류 발생")
+        assert result.results["U-18"].status in (Status.PASS, Status.FAIL)
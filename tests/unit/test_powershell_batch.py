@@ -0,0 +1,167 @@
+"""PowerShellBatch 단위 테스트
+
+src/core/scanner/powershell_batch.py와 WindowsScanner 배치 모드를 테스트합니다.
+
+테스트 범위:
+1. 스크립트 생성 (try/catch, Base64 명령어, 중복 제거, 분할)
+2. JSON 결과 파싱
+3. WindowsScanner.collect_batch() / scan_all() 연동
+"""
+
+import base64
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.domain.models import RuleMetadata, Severity
+from src.core.scanner.command_batch import CommandBatchError
+from src.core.scanner.powershell_batch import PowerShellBatch
+from src.core.scanner.windows_scanner import WindowsScanner
+
+GUEST_COMMAND = 'Get-LocalUser -Name "Guest" | Select-Object -ExpandProperty Enabled'
+ADMIN_COMMAND = (
+    "Get-LocalUser | Where-Object {$_.SID -like '*-500'} | Select-Object -ExpandProperty Name"
+)
+
+
+def fake_run(script: str, outputs: dict) -> str:
+    """배치 스크립트 실행 대역 (명령어 -> stdout 딕셔너리로 JSON 결과 생성)"""
+    document = {}
+    for key, encoded in re.findall(r"Invoke-BluepyCommand '([^']+)' '([^']+)'", script):
+        command = base64.b64decode(encoded).decode("utf-8")
+        if command in outputs:
+            document[key] = {"stdout": outputs[command], "exit_code": 0}
+        else:
+            document[key] = {"stdout": "", "exit_code": 1, "error": "not recognized"}
+    marker = re.search(r"Write-Output '([^']+)'", script).group(1)
+    return f"{marker}\r\n{json.dumps(document)}\r\n"
+
+
+@pytest.mark.unit
+class TestPowerShellBatch:
+    """PowerShellBatch 테스트"""
+
+    def test_duplicate_commands_use_first_key(self):
+        """중복 명령어는 처음 등장한 규칙/인덱스 키로 한 번만 실행"""
+        batch = PowerShellBatch([("W-01:0", "a"), ("W-02:0", "b"), ("W-03:1", "a")])
+        assert batch.entries == {"W-01:0": "a", "W-02:0": "b"}
+        assert len(batch) == 2
+
+    def test_script_embeds_commands_in_try_catch(self):
+        """명령어는 Base64로 포함되고 try/catch 함수로 실행"""
+        script = PowerShellBatch([("W-02:0", GUEST_COMMAND)]).build_script()
+
+        assert "try {" in script and "} catch {" in script
+        assert GUEST_COMMAND not in script
+        assert fake_run(script, {GUEST_COMMAND: "False\r\n"}).count("W-02:0") == 1
+        assert script == PowerShellBatch([("W-02:0", GUEST_COMMAND)]).build_script()
+
+    def test_parse_output(self):
+        """JSON 결과를 명령어별로 분리 (실패한 명령어는 빈 출력)"""
+        batch = PowerShellBatch([("W-01:0", ADMIN_COMMAND), ("W-02:0", "Registry:HKLM\\X")])
+        output = "WARNING: noise\r\n" + fake_run(
+            batch.build_script(), {ADMIN_COMMAND: "관리자\r\n"}
+        )
+
+        outputs = batch.parse_output(output)
+
+        assert outputs[ADMIN_COMMAND].stdout == "관리자\r\n"
+        assert outputs[ADMIN_COMMAND].exit_code == 0
+        assert outputs["Registry:HKLM\\X"].stdout == ""
+        assert outputs["Registry:HKLM\\X"].exit_code == 1
+
+    def test_parse_without_marker_raises(self):
+        """marker가 없으면 CommandBatchError"""
+        batch = PowerShellBatch([("W-01:0", "a")])
+        with pytest.raises(CommandBatchError):
+            batch.parse_output("The term 'ConvertTo-Json' is not recognized")
+        with pytest.raises(CommandBatchError):
+            batch.parse_output(f"{batch.marker}\r\n{{broken")
+
+    def test_split_respects_max_chars(self):
+        """스크립트 길이 제한에 맞게 분할 (순서 유지)"""
+        entries = [(f"W-{i:02d}:0", f"Get-Item C:\\path\\{i} | Out-Null") for i in range(30)]
+        batch = PowerShellBatch(entries)
+        limit = len(PowerShellBatch(entries[:10]).build_script())
+
+        chunks = batch.split(max_chars=limit)
+
+        assert len(chunks) == 3
+        assert all(len(chunk.build_script()) <= limit for chunk in chunks)
+        assert [command for chunk in chunks for command in chunk.commands] == batch.commands
+        assert PowerShellBatch([]).split() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWindowsScannerBatchMode:
+    """WindowsScanner 배치 모드 테스트"""
+
+    @staticmethod
+    def _make_scanner() -> WindowsScanner:
+        scanner = WindowsScanner(
+            server_id="server-001",
+            host="192.168.1.100",
+            username="Administrator",
+            password="pw",
+            batch_mode=True,
+        )
+        scanner._connected = True
+        scanner._rules = [
+            RuleMetadata(
+                id=rule_id,
+                name=rule_id,
+                category="계정관리",
+                severity=Severity.HIGH,
+                kisa_standard=rule_id,
+                description="Test",
+                commands=commands,
+                validator=f"validators.windows.check_{rule_id.lower().replace('-', '')}",
+            )
+            for rule_id, commands in [
+                ("W-01", [ADMIN_COMMAND]),
+                ("W-02", [GUEST_COMMAND]),
+                ("W-03", [GUEST_COMMAND, "echo 'No commands (manual check)'"]),
+            ]
+        ]
+        return scanner
+
+    async def test_scan_all_uses_single_round_trip(self):
+        """배치 모드 scan_all은 PowerShell 실행 1회로 모든 명령어 수집"""
+        scanner = self._make_scanner()
+        outputs = {ADMIN_COMMAND: "Admin_Renamed\r\n", GUEST_COMMAND: "False\r\n"}
+
+        async def fake_execute(script, timeout=60):
+            return fake_run(script, outputs)
+
+        with patch.object(
+            scanner._client, "execute_powershell", new_callable=AsyncMock, side_effect=fake_execute
+        ) as mock_execute:
+            result = await scanner.scan_all()
+
+        mock_execute.assert_called_once()
+        assert len(result.results) == 3
+        assert scanner._command_cache.get(GUEST_COMMAND) == "False\r\n"
+        assert scanner.get_cache_stats()["executions"] == 0
+
+    async def test_batch_failure_falls_back_to_per_command(self):
+        """배치 실패 시 명령어별 실행으로 대체"""
+        scanner = self._make_scanner()
+        executed = []
+
+        async def fake_execute(script, timeout=60):
+            executed.append(script)
+            if "Invoke-BluepyCommand" in script:
+                raise RuntimeError("WinRM 오류")
+            return "False\r\n"
+
+        with patch.object(
+            scanner._client, "execute_powershell", new_callable=AsyncMock, side_effect=fake_execute
+        ):
+            await scanner.scan_all()
+
+        # 배치 1회 + 개별 명령어 2회 (중복 명령어는 캐시)
+        assert len(executed) == 3
+        assert executed[1:] == [ADMIN_COMMAND, GUEST_COMMAND]
@@ -0,0 +1,222 @@
+"""RuleCatalog 단위 테스트
+
+src/core/scanner/rule_catalog.py 를 테스트합니다.
+
+테스트 범위:
+1. 플랫폼별 규칙 목록, platforms 필드로 공유하는 규칙은 객체 1개
+2. id 조회, 카테고리/심각도/자동 수정 인덱스
+3. 규칙이 없는 플랫폼, reload()
+4. get_rule_catalog() 디렉토리별 공유 인스턴스
+5. refresh() 증분 갱신 (바뀐 파일만 파싱, 파싱 실패 시 이전 규칙 유지, 스냅샷 유지)
+6. 사용하는 플랫폼의 validator 모듈만 import
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.core.domain.models import Severity
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.macos_scanner import MacOSScanner
+from src.core.scanner import rule_catalog
+from src.core.scanner.rule_catalog import RuleCatalog, get_rule_catalog
+from src.core.scanner.rule_loader import RuleLoaderError
+
+
+def write_rule(
+    directory: Path,
+    rule_id: str,
+    category: str = "계정관리",
+    severity: str = "high",
+    platforms: Optional[List[str]] = None,
+    auto: bool = False,
+) -> None:
+    """테스트용 규칙 파일 생성"""
+    directory.mkdir(parents=True, exist_ok=True)
+    data = {
+        "id": rule_id,
+        "name": f"{rule_id} 테스트",
+        "category": category,
+        "severity": severity,
+        "kisa_standard": rule_id,
+        "description": "Test",
+        "check": {"commands": ["echo test"]},
+        "validator": f"validators.linux.check_{rule_id.lower().replace('-', '')}",
+        "remediation": {"auto": auto, "commands": ["echo fix"] if auto else []},
+    }
+    if platforms is not None:
+        data["platforms"] = platforms
+    with open(directory / f"{rule_id}.yaml", "w", encoding="utf-8") as f:
+        yaml.dump(data, f, allow_unicode=True)
+
+
+@pytest.fixture
+def rules_dir(tmp_path) -> Path:
+    """Linux 규칙 3개 (U-01은 macOS와 공유) + macOS 규칙 1개"""
+    root = tmp_path / "rules"
+    write_rule(root / "linux", "U-01", platforms=["linux", "macos"], auto=True)
+    write_rule(root / "linux", "U-02", category="서비스 관리", severity="mid")
+    write_rule(root / "linux", "U-03", severity="low", auto=True)
+    write_rule(root / "macos", "M-01", category="서비스 관리", platforms=["macos"])
+    return root
+
+
+@pytest.mark.unit
+class TestRuleCatalog:
+    """RuleCatalog 테스트"""
+
+    def test_platform_rules_share_objects(self, rules_dir):
+        """macOS 목록에 공유 Linux 규칙 포함, 두 플랫폼이 같은 객체 사용"""
+        catalog = RuleCatalog(str(rules_dir))
+
+        linux = catalog.rules("linux")
+        macos = catalog.rules("macos")
+
+        assert [rule.id for rule in linux] == ["U-01", "U-02", "U-03"]
+        assert [rule.id for rule in macos] == ["M-01", "U-01"]
+        assert macos[1] is linux[0] is catalog.get("U-01")
+        assert len(catalog) == 4
+
+    def test_lookup_and_indexes(self, rules_dir):
+        """id 조회 (플랫폼 지정), 카테고리/심각도/자동 수정 인덱스"""
+        catalog = RuleCatalog(str(rules_dir))
+
+        assert catalog.get("U-02").category == "서비스 관리"
+        assert catalog.get("U-02", platform="macos") is None
+        assert catalog.get("U-99") is None
+        assert "M-01" in catalog
+
+        assert [rule.id for rule in catalog.by_category("서비스 관리")] == ["M-01", "U-02"]
+        assert [rule.id for rule in catalog.by_category("서비스 관리", "linux")] == ["U-02"]
+        assert [rule.id for rule in catalog.by_severity(Severity.HIGH, "macos")] == [
+            "M-01",
+            "U-01",
+        ]
+        assert [rule.id for rule in catalog.auto_remediable()] == ["U-01", "U-03"]
+        assert [rule.id for rule in catalog.auto_remediable("macos")] == ["U-01"]
+        assert catalog.is_auto_remediable("U-03")
+        assert not catalog.is_auto_remediable("U-02")
+        assert not catalog.is_auto_remediable("U-99")
+        assert catalog.categories() == ["계정관리", "서비스 관리"]
+
+    def test_missing_platform_and_reload(self, rules_dir):
+        """규칙이 없는 플랫폼은 RuleLoaderError, reload() 후 추가된 규칙 반영"""
+        catalog = RuleCatalog(str(rules_dir / "linux"))
+
+        with pytest.raises(RuleLoaderError):
+            catalog.rules("windows")
+
+        write_rule(rules_dir / "linux", "U-04")
+        assert "U-04" not in catalog
+
+        catalog.reload()
+        assert [rule.id for rule in catalog.rules("linux")][-1] == "U-04"
+
+    def test_windows_rules_load_only_windows_validators(self, tmp_path):
+        """Windows 규칙 조회, 스캐너 등록 시 Linux/macOS validator 모듈 미로드"""
+        code = (
+            "import sys\n"
+            "from src.core.scanner.rule_catalog import get_rule_catalog\n"
+            "from src.core.scanner.windows_scanner import WindowsScanner\n"
+            "scanner = WindowsScanner(server_id='s1', host='h', username='u', password='p')\n"
+            "scanner.set_rules(get_rule_catalog('config/rules').rules('windows'))\n"
+            "print(' '.join(sorted(m for m in sys.modules if 'analyzer.validators.' in m)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            env={**os.environ, "BLUEPY_CACHE_DIR": str(tmp_path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        modules = output.split()
+        assert "src.core.analyzer.validators.windows" in modules
+        assert not [m for m in modules if ".validators.linux" in m or ".validators.macos" in m]
+
+    def test_shared_catalog(self, rules_dir):
+        """같은 규칙 디렉토리는 같은 카탈로그, 플랫폼 디렉토리를 지정해도 동일"""
+        catalog = get_rule_catalog(str(rules_dir))
+
+        assert get_rule_catalog(str(rules_dir / "macos")) is catalog
+        assert get_rule_catalog(str(rules_dir.parent / "other")) is not catalog
+
+
+@pytest.mark.unit
+class TestRuleCatalogRefresh:
+    """RuleCatalog.refresh() 증분 갱신 테스트"""
+
+    def test_refresh_parses_changed_files_only(self, rules_dir):
+        """수정, 추가, 삭제된 파일만 반영하고 바뀐 규칙 id 보고"""
+        catalog = RuleCatalog(str(rules_dir))
+        before = catalog.rules("macos")
+        assert not catalog.refresh()
+
+        write_rule(rules_dir / "linux", "U-01", platforms=["linux"], auto=True)
+        write_rule(rules_dir / "linux", "U-04")
+        (rules_dir / "linux" / "U-03.yaml").unlink()
+
+        parsed = []
+        load_yaml_file = rule_catalog.load_yaml_file
+
+        def tracking_load(path):
+            parsed.append(path.name)
+            return load_yaml_file(path)
+
+        with patch.object(rule_catalog, "load_yaml_file", side_effect=tracking_load):
+            changes = catalog.refresh()
+
+        assert sorted(parsed) == ["U-01.yaml", "U-04.yaml"]
+        assert (changes.added, changes.modified, changes.removed) == (["U-04"], ["U-01"], ["U-03"])
+        assert changes.changed_ids == ["U-01", "U-03", "U-04"]
+        assert [rule.id for rule in catalog.rules("linux")] == ["U-01", "U-02", "U-04"]
+        assert [rule.id for rule in catalog.rules("macos")] == ["M-01"]
+        assert [rule.id for rule in catalog.auto_remediable()] == ["U-01"]
+
+        # 갱신 전에 받은 목록은 그대로 (실행 중인 스캔의 스냅샷)
+        assert [rule.id for rule in before] == ["M-01", "U-01"]
+        assert before[1].platforms == ["linux", "macos"]
+
+    def test_invalid_file_keeps_previous_rule(self, rules_dir):
+        """파싱에 실패한 파일은 오류 보고 후 이전 규칙 유지, 고치면 반영"""
+        catalog = RuleCatalog(str(rules_dir))
+        previous = catalog.get("U-02")
+
+        rule_file = rules_dir / "linux" / "U-02.yaml"
+        rule_file.write_text("id: U-02\nname: [broken", encoding="utf-8")
+        changes = catalog.refresh()
+
+        assert not changes
+        assert list(changes.errors) == ["U-02.yaml"]
+        assert catalog.get("U-02") is previous
+
+        write_rule(rules_dir / "linux", "U-02", severity="low")
+        changes = catalog.refresh()
+
+        assert changes.modified == ["U-02"]
+        assert catalog.get("U-02").severity == Severity.LOW
+        assert [rule.id for rule in catalog.by_severity(Severity.MID)] == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScannerRuleCatalog:
+    """스캐너 규칙 로드 카탈로그 연동 테스트"""
+
+    async def test_scanners_share_rules(self, rules_dir):
+        """스캐너는 카탈로그의 규칙 객체 사용, macOS 스캐너는 공유 규칙 포함"""
+        linux = LinuxScanner(server_id="s1", host="h1", username="u")
+        macos = MacOSScanner(server_id="s2", host="h2", username="u")
+
+        await linux.load_rules(str(rules_dir))
+        await macos.load_rules(str(rules_dir))
+
+        assert [rule.id for rule in macos._rules] == ["M-01", "U-01"]
+        assert macos._rules[1] is linux._rules[0]
@@ -3,13 +3,20 @@
 rule_loader 모듈의 함수들을 테스트합니다.
 """
 
+import json
+import os
+import shutil
+from unittest.mock import patch
+
 import pytest
 from pathlib import Path
 
+from src.core.scanner import rule_loader
 from src.core.scanner.rule_loader import (
     load_yaml_file,
     convert_yaml_to_metadata,
     load_rules,
+    rule_cache_path,
     RuleLoaderError,
 )
 from src.core.domain.models import Severity
@@ -61,6 +68,16 @@ class TestConvertYamlToMetadata:
         assert rule.severity == Severity.HIGH
         assert rule.validator.startswith("validators.linux.check_u")
 
+    def test_convert_depends_on(self):
+        """depends_on은 RuleDependencies로 변환, 없으면 None"""
+        yaml_path = Path("config/rules/linux/U-60.yaml")
+        rule = convert_yaml_to_metadata(load_yaml_file(yaml_path), yaml_path)
+
+        assert rule.depends_on.keys() == ["file:/etc/vsftpd/vsftpd.conf", "service:vsftpd"]
+
+        yaml_path = Path("config/rules/linux/U-08.yaml")
+        assert convert_yaml_to_metadata(load_yaml_file(yaml_path), yaml_path).depends_on is None
+
     def test_convert_multiple_rules(self):
         """여러 YAML 파일 변환"""
         rules_dir = Path("config/rules/linux")
@@ -148,3 +165,88 @@ class TestConvertYamlErrors:
 
         with pytest.raises(RuleLoaderError, match="필수 필드 누락"):
             convert_yaml_to_metadata(yaml_data, yaml_path)
+
+
+@pytest.mark.unit
+class TestRuleCache:
+    """컴파일된 규칙 캐시 테스트"""
+
+    @staticmethod
+    def _copy_rules(tmp_path, count: int = 5) -> Path:
+        rules_dir = tmp_path / "linux"
+        rules_dir.mkdir()
+        for yaml_file in sorted(Path("config/rules/linux").glob("*.yaml"))[:count]:
+            shutil.copy(yaml_file, rules_dir / yaml_file.name)
+        return rules_dir
+
+    def test_cache_hit_skips_yaml(self, tmp_path):
+        """두 번째 로드는 YAML 파싱 없이 캐시에서 같은 규칙 반환"""
+        rules_dir = self._copy_rules(tmp_path)
+        first = load_rules(str(rules_dir))
+        assert rule_cache_path(rules_dir).exists()
+
+        with patch.object(rule_loader, "load_yaml_file", side_effect=AssertionError):
+            cached = load_rules(str(rules_dir))
+
+        assert cached == first
+        assert cached[0].severity is first[0].severity
+        assert cached == load_rules(str(rules_dir), use_cache=False)
+
+    def test_cache_is_json_outside_rules_dir(self, tmp_path, isolated_cache_dir):
+        """캐시는 사용자 캐시 디렉토리의 JSON 파일 (규칙 디렉토리에는 쓰지 않음)"""
+        rules_dir = self._copy_rules(tmp_path)
+        load_rules(str(rules_dir))
+
+        cache_path = rule_cache_path(rules_dir)
+        assert cache_path.parent == isolated_cache_dir / "rules"
+        assert sorted(path.name for path in rules_dir.iterdir()) == [
+            "U-01.yaml",
+            "U-02.yaml",
+            "U-03.yaml",
+            "U-04.yaml",
+            "U-05.yaml",
+        ]
+
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+        assert cache["rules"][0]["id"] == "U-01"
+        assert cache["rules"][0]["severity"] == "high"
+
+        other_dir = tmp_path / "other"
+        load_rules(str(rules_dir), cache_dir=str(other_dir))
+        assert rule_cache_path(rules_dir, other_dir).exists()
+
+    def test_modified_file_rebuilds(self, tmp_path):
+        """규칙 파일이 바뀌거나 추가되면 YAML에서 다시 로드"""
+        rules_dir = self._copy_rules(tmp_path)
+        load_rules(str(rules_dir))
+
+        rule_file = rules_dir / "U-01.yaml"
+        rule_file.write_text(
+            rule_file.read_text(encoding="utf-8").replace("name:", "name: 변경", 1),
+            encoding="utf-8",
+        )
+        stat = rule_file.stat()
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_rules(str(rules_dir))[0].name.startswith("변경")
+
+        shutil.copy("config/rules/linux/U-10.yaml", rules_dir / "U-10.yaml")
+        assert len(load_rules(str(rules_dir))) == 6
+
+    def test_errors_not_cached(self, tmp_path):
+        """로드 오류가 있으면 캐시를 만들지 않음 (매번 오류 보고)"""
+        rules_dir = self._copy_rules(tmp_path)
+        (rules_dir / "U-99.yaml").write_text("id: U-99\n", encoding="utf-8")
+
+        assert len(load_rules(str(rules_dir))) == 5
+        assert not rule_cache_path(rules_dir).exists()
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """손상된 캐시는 무시하고 다시 생성"""
+        rules_dir = self._copy_rules(tmp_path)
+        cache_path = rule_cache_path(rules_dir)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text("not json", encoding="utf-8")
+
+        assert len(load_rules(str(rules_dir))) == 5
+        assert load_rules(str(rules_dir)) == load_rules(str(rules_dir), use_cache=False)
@@ -0,0 +1,174 @@
+"""규칙 실행 시간 스케줄링 단위 테스트
+
+src/core/scanner/rule_timing.py 와 BaseScanner 연동을 테스트합니다.
+
+테스트 범위:
+1. LPT 정렬 및 소요 시간 예측
+2. RuleTimingStore 기록/추정/파일 왕복
+3. 동시 실행 시 느린 규칙부터 시작, 남은 시간 예측
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from src.core.domain.models import CheckResult, RuleMetadata, Severity, Status
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.rule_timing import (
+    DEFAULT_RULE_SECONDS,
+    RuleTimingStore,
+    order_longest_first,
+    predict_makespan,
+)
+
+
+def make_rule(rule_id: str) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="계정관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=[f"echo {rule_id}"],
+        validator=f"validators.linux.check_{rule_id.lower().replace('-', '')}",
+    )
+
+
+@pytest.mark.unit
+class TestScheduling:
+    """LPT 정렬 및 소요 시간 예측 테스트"""
+
+    def test_order_longest_first(self):
+        """추정 시간 내림차순, 같으면 기존 순서 유지"""
+        rules = [make_rule(rule_id) for rule_id in ["U-01", "U-02", "U-03", "U-04"]]
+        durations = {"U-01": 1.0, "U-02": 9.0, "U-03": 1.0, "U-04": 5.0}
+
+        ordered = order_longest_first(rules, durations)
+
+        assert [rule.id for rule in ordered] == ["U-02", "U-04", "U-01", "U-03"]
+
+    def test_predict_makespan(self):
+        """슬롯이 빈 순서대로 다음 작업 배정"""
+        assert predict_makespan([9, 5, 1, 1], workers=1) == 16
+        assert predict_makespan([9, 5, 1, 1], workers=2) == 9
+        # 긴 작업이 마지막이면 꼬리가 길어짐
+        assert predict_makespan([1, 1, 5, 9], workers=2) == 10
+        assert predict_makespan([], workers=4) == 0
+
+
+@pytest.mark.unit
+class TestRuleTimingStore:
+    """RuleTimingStore 테스트"""
+
+    def test_record_moving_average(self):
+        """두 번째 기록부터 지수 이동 평균"""
+        store = RuleTimingStore(smoothing=0.5)
+        store.record("s1", "linux", "U-01", 10.0)
+        store.record("s1", "linux", "U-01", 20.0)
+
+        assert store.estimate("s1", "linux", "U-01") == 15.0
+
+    def test_estimate_fallbacks(self):
+        """같은 플랫폼 다른 호스트 평균, 그 다음 이번 규칙들의 평균"""
+        store = RuleTimingStore()
+        store.record("s1", "linux", "U-01", 4.0)
+        store.record("s2", "linux", "U-01", 8.0)
+        store.record("w1", "windows", "U-02", 100.0)
+
+        assert store.estimate("s3", "linux", "U-01") == 6.0
+        assert store.estimate("s3", "linux", "U-02") is None
+        assert store.estimates("s3", "linux", [make_rule("U-01"), make_rule("U-02")]) == {
+            "U-01": 6.0,
+            "U-02": 6.0,
+        }
+        assert store.estimates("s3", "macos", [make_rule("U-01")]) == {"U-01": DEFAULT_RULE_SECONDS}
+
+    def test_file_round_trip(self, tmp_path):
+        """save() 후 새 저장소에서 기록 복원"""
+        path = str(tmp_path / "state" / "rule_timings.json")
+        store = RuleTimingStore(path)
+        store.record("s1", "linux", "U-01", 3.5)
+        store.save()
+
+        assert RuleTimingStore(path).estimate("s1", "linux", "U-01") == 3.5
+
+    def test_invalid_smoothing(self):
+        """smoothing 범위 검증"""
+        with pytest.raises(ValueError):
+            RuleTimingStore(smoothing=0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTimedScan:
+    """BaseScanner 실행 시간 기반 스케줄링 테스트"""
+
+    @staticmethod
+    def _make_scanner(store: RuleTimingStore, started: List[str], max_concurrency: int):
+        scanner = LinuxScanner(
+            server_id="s1",
+            host="h",
+            username="u",
+            max_concurrency=max_concurrency,
+            snapshot_collectors=False,
+        )
+        scanner._connected = True
+        scanner._rules = [make_rule(f"U-{i:02d}") for i in range(1, 6)]
+        scanner.set_timing_store(store)
+
+        async def scan_one(rule):
+            started.append(rule.id)
+            await asyncio.sleep(0)
+            return CheckResult(status=Status.PASS, message="ok")
+
+        scanner.scan_one = scan_one
+        return scanner
+
+    async def test_longest_rules_start_first(self):
+        """동시 실행이면 기록된 시간이 긴 규칙부터 시작, 결과는 규칙 순서로 저장"""
+        store = RuleTimingStore()
+        for rule_id, seconds in [("U-01", 1), ("U-02", 2), ("U-03", 30), ("U-04", 3), ("U-05", 20)]:
+            store.record("s1", "linux", rule_id, seconds)
+
+        started: List[str] = []
+        scanner = self._make_scanner(store, started, max_concurrency=2)
+        result = await scanner.scan_all()
+
+        assert started == ["U-03", "U-05", "U-04", "U-02", "U-01"]
+        assert list(result.results) == ["U-01", "U-02", "U-03", "U-04", "U-05"]
+
+    async def test_sequential_keeps_rule_order(self):
+        """순차 실행은 규칙 순서 유지, 예측 시간은 합계"""
+        store = RuleTimingStore()
+        store.record("s1", "linux", "U-05", 20)
+
+        started: List[str] = []
+        scanner = self._make_scanner(store, started, max_concurrency=1)
+        await scanner.scan_all()
+
+        assert started == ["U-01", "U-02", "U-03", "U-04", "U-05"]
+        assert scanner.get_predicted_duration() == 100
+
+    async def test_estimate_remaining_decreases(self):
+        """규칙이 끝날 때마다 남은 시간 감소, 끝나면 0"""
+        store = RuleTimingStore()
+        for i in range(1, 6):
+            store.record("s1", "linux", f"U-{i:02d}", 10)
+
+        scanner = self._make_scanner(store, [], max_concurrency=1)
+        remaining = [scanner.estimate_remaining() async for _ in scanner.scan_iter()]
+
+        assert remaining == [40, 30, 20, 10, 0]
+        # 실행 시간이 기록되어 추정값이 갱신됨
+        assert store.estimate("s1", "linux", "U-01") < 10
+
+    async def test_without_store(self):
+        """저장소가 없으면 예측하지 않음"""
+        scanner = self._make_scanner(None, [], max_concurrency=2)
+        await scanner.scan_all()
+
+        assert scanner.get_predicted_duration() is None
+        assert scanner.estimate_remaining() is None
@@ -466,3 +466,143 @@ class TestBaseScannerAdditional:
 
         assert hasattr(scanner, "is_connected")
         # 초기에는 연결되지 않음
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConcurrentScan:
+    """동시 스캔 테스트 (max_concurrency)"""
+
+    @staticmethod
+    def _make_rules(count: int) -> list:
+        return [
+            RuleMetadata(
+                id=f"U-{i:02d}",
+                name=f"테스트 규칙 {i}",
+                category="account_management",
+                description="Test rule",
+                severity=Severity.HIGH,
+                kisa_standard=f"U-{i:02d}",
+                commands=["echo test"],
+                validator=f"validators.linux.check_u{i:02d}",
+            )
+            for i in range(1, count + 1)
+        ]
+
+    async def test_invalid_max_concurrency(self):
+        """max_concurrency가 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            LinuxScanner(server_id="s", host="h", username="u", max_concurrency=0)
+
+    async def test_ssh_channel_limit_follows_concurrency(self):
+        """SSH 채널 제한이 max_concurrency와 같은지 확인"""
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=6)
+        assert scanner.max_concurrency == 6
+        assert scanner._ssh_client.max_channels == 6
+
+    async def test_concurrent_scan_preserves_rule_order(self):
+        """늦게 끝난 규칙이 있어도 결과는 규칙 id 순서"""
+        import asyncio
+
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=4)
+        scanner._connected = True
+        scanner._rules = self._make_rules(8)
+
+        async def mock_scan_one(rule):
+            # 앞쪽 규칙일수록 늦게 완료
+            await asyncio.sleep(0.001 * (10 - int(rule.id[2:])))
+            return CheckResult(status=Status.PASS, message=rule.id)
+
+        scanner.scan_one = mock_scan_one
+
+        result = await scanner.scan_all()
+
+        assert list(result.results.keys()) == [f"U-{i:02d}" for i in range(1, 9)]
+        assert all(result.results[k].message == k for k in result.results)
+
+    async def test_concurrent_scan_respects_limit(self):
+        """동시에 실행되는 규칙 수가 max_concurrency를 넘지 않음"""
+        import asyncio
+
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=3)
+        scanner._connected = True
+        scanner._rules = self._make_rules(10)
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_scan_one(rule):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return CheckResult(status=Status.PASS, message=rule.id)
+
+        scanner.scan_one = mock_scan_one
+
+        result = await scanner.scan_all()
+
+        assert result.total == 10
+        assert peak == 3
+
+    async def test_scan_iter_yields_in_completion_order(self):
+        """동시 실행 시 scan_iter는 완료된 순서대로 결과 반환"""
+        import asyncio
+
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=4)
+        scanner._connected = True
+        scanner._rules = self._make_rules(4)
+
+        async def mock_scan_one(rule):
+            # 앞쪽 규칙일수록 늦게 완료
+            await asyncio.sleep(0.01 * (5 - int(rule.id[2:])))
+            return CheckResult(status=Status.PASS, message=rule.id)
+
+        scanner.scan_one = mock_scan_one
+
+        order = [rule.id async for rule, result in scanner.scan_iter()]
+
+        assert order == ["U-04", "U-03", "U-02", "U-01"]
+
+    async def test_scan_iter_sequential_keeps_rule_order(self):
+        """순차 실행 시 scan_iter는 규칙 순서대로 결과 반환"""
+        scanner = LinuxScanner(server_id="s", host="h", username="u")
+        scanner._connected = True
+        scanner._rules = self._make_rules(3)
+        scanner.scan_one = AsyncMock(
+            side_effect=lambda rule: CheckResult(status=Status.PASS, message=rule.id)
+        )
+
+        results = [(rule.id, result.message) async for rule, result in scanner.scan_iter()]
+
+        assert results == [("U-01", "U-01"), ("U-02", "U-02"), ("U-03", "U-03")]
+
+    async def test_scan_iter_break_cancels_running_rules(self):
+        """반복을 중단하면 실행 중인 규칙은 취소"""
+        import asyncio
+
+        scanner = LinuxScanner(server_id="s", host="h", username="u", max_concurrency=3)
+        scanner._connected = True
+        scanner._rules = self._make_rules(3)
+        cancelled = []
+
+        async def mock_scan_one(rule):
+            if rule.id != "U-01":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(rule.id)
+                    raise
+            await asyncio.sleep(0.01)
+            return CheckResult(status=Status.PASS, message=rule.id)
+
+        scanner.scan_one = mock_scan_one
+
+        results = scanner.scan_iter()
+        async for rule, result in results:
+            assert rule.id == "U-01"
+            break
+        await results.aclose()
+
+        assert sorted(cancelled) == ["U-02", "U-03"]
@@ -45,6 +45,11 @@ class TestGetDefaultSettings:
         assert "level" in settings["logging"]
         assert settings["logging"]["level"] in ["DEBUG", "INFO", "WARNING", "ERROR"]
 
+    def test_scan_has_max_concurrency(self):
+        """scan.max_concurrency 키가 있는지 확인"""
+        settings = get_default_settings()
+        assert settings["scan"]["max_concurrency"] >= 1
+
     def test_returns_copy(self):
         """복사본을 반환하는지 확인 (원본 보호)"""
         settings1 = get_default_settings()
@@ -0,0 +1,141 @@
+"""SSHClient 단위 테스트
+
+src/infrastructure/network/ssh_client.py의 명령어 실행을 테스트합니다.
+테스트용 asyncssh 서버를 띄워 실제 SSH 세션 채널을 사용합니다.
+
+테스트 범위:
+1. 명령어 실행 결과
+2. 취소 시 원격 프로세스 종료 신호 및 채널 닫기
+3. 타임아웃 시 원격 프로세스 종료 신호
+4. 실행 중 연결 끊김 감지
+"""
+
+import asyncio
+import time
+from typing import List
+
+import asyncssh
+import pytest
+
+from src.infrastructure.network.ssh_client import (
+    SSHClient,
+    SSHClientError,
+    SSHConnectionLostError,
+)
+
+
+class NoAuthServer(asyncssh.SSHServer):
+    """인증 없는 테스트용 SSH 서버"""
+
+    def begin_auth(self, username: str) -> bool:
+        return False
+
+
+class FakeSSHServer:
+    """테스트용 SSH 서버
+
+    - "echo <문자열>": 문자열 출력 후 종료
+    - "drop": 응답 없이 SSH 연결을 끊음 (네트워크 단절)
+    - 그 외 명령어: stdin이 닫히거나 신호를 받을 때까지 실행
+    """
+
+    def __init__(self):
+        self.events: List[str] = []
+        self.started = asyncio.Event()
+        self.finished = asyncio.Event()
+        self._server = None
+
+    async def handle(self, process: asyncssh.SSHServerProcess) -> None:
+        if process.command.startswith("echo "):
+            process.stdout.write(process.command[5:] + "\n")
+            process.exit(0)
+            return
+        if process.command == "drop":
+            process.channel.get_connection().abort()
+            return
+
+        self.started.set()
+        try:
+            await process.stdin.read()
+            self.events.append("eof")
+        except asyncssh.SignalReceived as e:
+            self.events.append(f"signal:{e.signal}")
+        except (asyncssh.Error, ConnectionError, asyncio.CancelledError):
+            self.events.append("closed")
+        finally:
+            self.finished.set()
+            process.exit(0)
+
+    async def start(self) -> SSHClient:
+        key = asyncssh.generate_private_key("ssh-ed25519")
+        self._server = await asyncssh.create_server(
+            NoAuthServer, "127.0.0.1", 0, server_host_keys=[key], process_factory=self.handle
+        )
+        port = self._server.sockets[0].getsockname()[1]
+
+        client = SSHClient(host="127.0.0.1", username="u", port=port)
+        client._conn = await asyncssh.connect("127.0.0.1", port, username="u", known_hosts=None)
+        client._connected = True
+        return client
+
+    async def stop(self, client: SSHClient) -> None:
+        client._conn.close()
+        await client._conn.wait_closed()
+        self._server.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSSHClientExecute:
+    """SSHClient.execute 테스트"""
+
+    async def test_execute_returns_stdout(self):
+        """명령어 출력 반환"""
+        server = FakeSSHServer()
+        client = await server.start()
+
+        assert await client.execute("echo hello") == "hello\n"
+        await server.stop(client)
+
+    async def test_cancel_terminates_remote_process(self):
+        """취소하면 즉시 반환하고 원격 프로세스는 TERM 신호를 받음, 연결은 계속 사용 가능"""
+        server = FakeSSHServer()
+        client = await server.start()
+
+        task = asyncio.ensure_future(client.execute("find / -perm -4000"))
+        await server.started.wait()
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - started < 0.1
+
+        await asyncio.wait_for(server.finished.wait(), timeout=2)
+        assert server.events == ["signal:TERM"]
+        assert await client.execute("echo still-open") == "still-open\n"
+        await server.stop(client)
+
+    async def test_timeout_terminates_remote_process(self):
+        """타임아웃되면 SSHClientError, 원격 프로세스는 종료 신호를 받음"""
+        server = FakeSSHServer()
+        client = await server.start()
+
+        with pytest.raises(SSHClientError, match="타임아웃"):
+            await client.execute("sleep 60", timeout=0.2)
+
+        await asyncio.wait_for(server.finished.wait(), timeout=2)
+        assert server.events == ["signal:TERM"]
+        await server.stop(client)
+
+    async def test_connection_drop_raises_connection_lost(self):
+        """실행 중 연결이 끊어지면 빈 출력 대신 SSHConnectionLostError, 이후 명령어도 같은 예외"""
+        server = FakeSSHServer()
+        client = await server.start()
+
+        with pytest.raises(SSHConnectionLostError):
+            await client.execute("drop", timeout=5)
+        with pytest.raises(SSHConnectionLostError):
+            await client.execute("echo after-drop")
+        await server.stop(client)
@@ -0,0 +1,318 @@
+"""SSH 연결 풀 단위 테스트
+
+src/infrastructure/network/ssh_pool.py와 SSHClient 연동을 테스트합니다.
+
+테스트 범위:
+1. 풀 키 생성 (인증 정보 지문)
+2. 연결 재사용, 동시 요청 병합, 상태 점검 (점검 중 유휴 정리 제외), 최대 연결 수, 유휴 연결 종료
+3. SSHClient(pool=...) 연결/반환
+4. Worker 공용 이벤트 루프 (다른 스레드에서 취소)
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.network.ssh_client import SSHClient
+from src.infrastructure.network.ssh_pool import SSHConnectionPool, make_pool_key
+
+
+def make_conn() -> MagicMock:
+    """asyncssh 연결 대역 (close() 호출 시 닫힌 상태)"""
+    conn = MagicMock()
+    conn.closed = False
+    conn.is_closed.side_effect = lambda: conn.closed
+    conn.close.side_effect = lambda: setattr(conn, "closed", True)
+    conn.wait_closed = AsyncMock()
+    conn.run = AsyncMock()
+    return conn
+
+
+KEY_A = make_pool_key("10.0.0.1", 22, "root", password="pw")
+KEY_B = make_pool_key("10.0.0.2", 22, "root", password="pw")
+
+
+@pytest.mark.unit
+class TestMakePoolKey:
+    """make_pool_key 테스트"""
+
+    def test_password_not_stored_in_key(self):
+        """키에는 패스워드 평문 대신 지문 저장"""
+        key = make_pool_key("h", 22, "u", password="secret")
+        assert "secret" not in "".join(str(part) for part in key)
+
+    def test_different_credentials_are_different_keys(self):
+        """인증 정보가 다르면 다른 키"""
+        assert make_pool_key("h", 22, "u", password="a") != make_pool_key(
+            "h", 22, "u", password="b"
+        )
+        assert make_pool_key("h", 22, "u", key_filename="/k") != make_pool_key("h", 22, "u")
+        assert make_pool_key("h", 22, "u", password="a") == make_pool_key(
+            "h", 22, "u", password="a"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSSHConnectionPool:
+    """SSHConnectionPool 테스트"""
+
+    @pytest.fixture
+    def pool(self):
+        # idle_timeout=0: 유휴 연결 정리 작업 비활성화
+        return SSHConnectionPool(max_connections=2, idle_timeout=0)
+
+    async def test_reuse_after_release(self, pool):
+        """반환한 연결은 재사용 (새 연결 없음)"""
+        connect = AsyncMock(side_effect=lambda: make_conn())
+
+        conn1 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn1)
+        conn2 = await pool.acquire(KEY_A, connect)
+
+        assert conn1 is conn2
+        connect.assert_awaited_once()
+        assert not conn1.closed
+        assert pool.get_stats() == {"connections": 1, "in_use": 1, "created": 1, "reused": 1}
+
+    async def test_concurrent_acquire_connects_once(self, pool):
+        """같은 키 동시 요청은 연결 1개를 공유"""
+        gate = asyncio.Event()
+
+        async def slow_connect():
+            await gate.wait()
+            return make_conn()
+
+        connect = AsyncMock(side_effect=slow_connect)
+        tasks = [asyncio.create_task(pool.acquire(KEY_A, connect)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        conns = await asyncio.gather(*tasks)
+
+        assert conns[0] is conns[1] is conns[2]
+        connect.assert_awaited_once()
+
+    async def test_closed_connection_is_replaced(self, pool):
+        """닫힌 연결은 버리고 새로 연결"""
+        connect = AsyncMock(side_effect=lambda: make_conn())
+
+        conn1 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn1)
+        conn1.closed = True
+        conn2 = await pool.acquire(KEY_A, connect)
+
+        assert conn2 is not conn1
+        assert connect.await_count == 2
+
+    async def test_health_check_after_idle(self):
+        """오래 쉰 연결은 재사용 전에 점검, 실패하면 새로 연결"""
+        pool = SSHConnectionPool(health_check_interval=0)
+        connect = AsyncMock(side_effect=lambda: make_conn())
+
+        conn1 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn1)
+        conn1.run.side_effect = OSError("broken pipe")
+        conn2 = await pool.acquire(KEY_A, connect)
+
+        conn1.run.assert_awaited_once()
+        assert conn1.closed
+        assert conn2 is not conn1
+        await pool.close_all()
+
+    async def test_idle_reaper_skips_connection_under_health_check(self):
+        """상태 점검 중인 연결은 유휴 연결 정리에서 제외, 점검 후 그대로 재사용"""
+        pool = SSHConnectionPool(idle_timeout=0, health_check_interval=0)
+        connect = AsyncMock(side_effect=lambda: make_conn())
+        conn1 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn1)
+
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def slow_check(*args, **kwargs):
+            started.set()
+            await finish.wait()
+
+        conn1.run.side_effect = slow_check
+        task = asyncio.ensure_future(pool.acquire(KEY_A, connect))
+        await started.wait()
+
+        assert await pool.close_idle(max_idle=0) == 0
+        finish.set()
+        conn2 = await task
+
+        assert conn2 is conn1
+        assert not conn1.closed
+        connect.assert_awaited_once()
+        assert pool.get_stats()["in_use"] == 1
+        await pool.close_all()
+
+    async def test_failed_health_check_releases_mark(self):
+        """상태 점검이 실패하면 빌린 표시를 되돌리고 새로 연결"""
+        pool = SSHConnectionPool(idle_timeout=0, health_check_interval=0)
+        connect = AsyncMock(side_effect=lambda: make_conn())
+        conn1 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn1)
+        conn1.run.side_effect = OSError("broken pipe")
+
+        conn2 = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn2)
+
+        assert conn1.closed
+        assert pool.get_stats()["in_use"] == 0
+        await pool.close_all()
+
+    async def test_max_connections_evicts_idle(self, pool):
+        """최대 연결 수에 도달하면 가장 오래된 유휴 연결을 닫음"""
+        connect = AsyncMock(side_effect=lambda: make_conn())
+        key_c = make_pool_key("10.0.0.3", 22, "root", password="pw")
+
+        conn_a = await pool.acquire(KEY_A, connect)
+        pool.release(KEY_A, conn_a)
+        await pool.acquire(KEY_B, connect)
+        await pool.acquire(key_c, connect)
+
+        assert conn_a.closed
+        assert len(pool) == 2
+
+    async def test_max_connections_waits_for_release(self, pool):
+        """모든 연결이 사용 중이면 반환될 때까지 대기"""
+        connect = AsyncMock(side_effect=lambda: make_conn())
+        key_c = make_pool_key("10.0.0.3", 22, "root", password="pw")
+
+        conn_a = await pool.acquire(KEY_A, connect)
+        await pool.acquire(KEY_B, connect)
+        waiter = asyncio.create_task(pool.acquire(key_c, connect))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        pool.release(KEY_A, conn_a)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert conn_a.closed
+        assert connect.await_count == 3
+
+    async def test_close_idle(self, pool):
+        """유휴 연결만 종료"""
+        connect = AsyncMock(side_effect=lambda: make_conn())
+
+        conn_a = await pool.acquire(KEY_A, connect)
+        conn_b = await pool.acquire(KEY_B, connect)
+        pool.release(KEY_A, conn_a)
+
+        assert await pool.close_idle(max_idle=0) == 1
+        assert conn_a.closed
+        assert not conn_b.closed
+
+    async def test_connect_failure_is_not_pooled(self, pool):
+        """연결 실패는 대기 중인 요청에 전달되고 풀에 남지 않음"""
+        connect = AsyncMock(side_effect=OSError("refused"))
+
+        with pytest.raises(OSError):
+            await pool.acquire(KEY_A, connect)
+
+        assert len(pool) == 0
+        connect.side_effect = lambda: make_conn()
+        assert await pool.acquire(KEY_A, connect) is not None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSSHClientWithPool:
+    """SSHClient 연결 풀 연동 테스트"""
+
+    async def test_disconnect_returns_connection_to_pool(self):
+        """disconnect()는 연결을 닫지 않고, 다음 클라이언트가 재사용"""
+        pool = SSHConnectionPool()
+        conn = make_conn()
+
+        with patch(
+            "src.infrastructure.network.ssh_client.asyncssh.connect",
+            new_callable=AsyncMock,
+            return_value=conn,
+        ) as mock_connect:
+            first = SSHClient(host="h", username="u", password="pw", pool=pool)
+            await first.connect()
+            await first.disconnect()
+
+            second = SSHClient(host="h", username="u", password="pw", pool=pool)
+            await second.connect()
+
+        mock_connect.assert_awaited_once()
+        assert mock_connect.await_args.kwargs["keepalive_interval"] == pool.keepalive_interval
+        assert second.is_connected()
+        assert not conn.closed
+        await second.disconnect()
+        await pool.close_all()
+
+    async def test_without_pool_closes_connection(self):
+        """풀이 없으면 기존처럼 연결 종료"""
+        conn = make_conn()
+
+        with patch(
+            "src.infrastructure.network.ssh_client.asyncssh.connect",
+            new_callable=AsyncMock,
+            return_value=conn,
+        ) as mock_connect:
+            client = SSHClient(host="h", username="u", password="pw")
+            await client.connect()
+            await client.disconnect()
+
+        assert "keepalive_interval" not in mock_connect.await_args.kwargs
+        assert conn.closed
+
+
+@pytest.mark.unit
+class TestWorkerEventLoop:
+    """Worker 공용 이벤트 루프 테스트"""
+
+    def test_workers_share_one_loop(self):
+        """다른 스레드에서 실행한 코루틴도 같은 이벤트 루프에서 실행"""
+        from src.gui.workers.event_loop import run_coroutine, shutdown_event_loop
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loops = []
+        threads = [
+            threading.Thread(target=lambda: loops.append(run_coroutine(current_loop())))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        try:
+            assert len(loops) == 2
+            assert loops[0] is loops[1]
+        finally:
+            shutdown_event_loop()
+
+        assert loops[0].is_closed()
+
+    def test_submitted_coroutine_cancelled_from_other_thread(self):
+        """submit_coroutine()의 Future를 취소하면 이벤트 루프의 작업도 취소되어 finally 실행"""
+        from src.gui.workers.event_loop import shutdown_event_loop, submit_coroutine
+
+        started = threading.Event()
+        cleaned_up = threading.Event()
+
+        async def long_running():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                cleaned_up.set()
+
+        future = submit_coroutine(long_running())
+        try:
+            assert started.wait(5)
+            future.cancel()
+
+            assert cleaned_up.wait(5)
+            assert future.cancelled()
+        finally:
+            shutdown_event_loop()
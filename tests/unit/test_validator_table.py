@@ -0,0 +1,106 @@
+"""Validator 디스패치 테이블 단위 테스트
+
+src/core/scanner/validator_table.py 와 스캐너 연동을 테스트합니다.
+
+테스트 범위:
+1. validator 경로 변환, 찾을 수 없는 validator (형식 오류, 모듈/함수 없음)
+2. 규칙 로드 시 미리 등록, 실패도 기억하여 다시 import하지 않음
+3. 스캔 중 validator 호출에 import 없음, 찾을 수 없는 validator 규칙은 MANUAL
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.analyzer.validators.linux import check_u01
+from src.core.domain.models import RuleMetadata, Severity, Status
+from src.core.scanner import validator_table
+from src.core.scanner.linux_scanner import LinuxScanner
+from src.core.scanner.validator_table import (
+    ValidatorNotFoundError,
+    ValidatorTable,
+    resolve_validator,
+)
+
+
+def make_rule(rule_id: str, validator: str) -> RuleMetadata:
+    """테스트용 규칙 생성"""
+    return RuleMetadata(
+        id=rule_id,
+        name=f"{rule_id} 테스트",
+        category="계정관리",
+        severity=Severity.HIGH,
+        kisa_standard=rule_id,
+        description="Test",
+        commands=["cat /etc/pam.d/login", "cat /etc/securetty"],
+        validator=validator,
+    )
+
+
+@pytest.mark.unit
+class TestValidatorTable:
+    """ValidatorTable 테스트"""
+
+    def test_resolve_validator(self):
+        """validator 경로를 함수로 변환, 찾을 수 없으면 ValidatorNotFoundError"""
+        assert resolve_validator("validators.linux.check_u01") is check_u01
+
+        with pytest.raises(ValidatorNotFoundError, match="경로"):
+            resolve_validator("check_u01")
+        with pytest.raises(ValidatorNotFoundError, match="모듈"):
+            resolve_validator("validators.solaris.check_s01")
+        with pytest.raises(ValidatorNotFoundError, match="함수"):
+            resolve_validator("validators.linux.check_u99")
+
+    def test_compile_reports_missing_once(self):
+        """compile()은 찾을 수 없는 규칙 반환, 같은 경로는 다시 import하지 않음"""
+        table = ValidatorTable()
+        rules = [
+            make_rule("U-01", "validators.linux.check_u01"),
+            make_rule("U-99", "validators.linux.check_u99"),
+        ]
+
+        missing = table.compile(rules)
+
+        assert list(missing) == ["U-99"]
+        assert "validators.linux.check_u01" in table
+        with patch.object(validator_table.importlib, "import_module", side_effect=AssertionError):
+            assert table.compile(rules) == missing
+            assert table.get("validators.linux.check_u01") is check_u01
+            with pytest.raises(ValidatorNotFoundError):
+                table.get("validators.linux.check_u99")
+
+
+@pytest.mark.unit
+class TestScannerValidatorDispatch:
+    """스캐너 validator 호출 테스트"""
+
+    def test_scan_uses_compiled_validators(self):
+        """set_rules() 후 validator 호출에 import 없음, 찾을 수 없는 validator는 RuntimeError"""
+        scanner = LinuxScanner(server_id="s1", host="h", username="u")
+        rule = make_rule("U-01", "validators.linux.check_u01")
+        missing = make_rule("U-99", "validators.linux.check_u99")
+        scanner.set_rules([rule, missing])
+
+        with patch.object(validator_table.importlib, "import_module", side_effect=AssertionError):
+            result = scanner._call_validator(rule, ["auth required pam_securetty.so", ""])
+            with pytest.raises(RuntimeError, match="check_u99"):
+                scanner._call_validator(missing, ["", ""])
+
+        expected = check_u01(["auth required pam_securetty.so", ""])
+        assert (result.status, result.message) == (expected.status, expected.message)
+
+    @pytest.mark.asyncio
+    async def test_missing_validator_rule_manual(self):
+        """찾을 수 없는 validator 규칙은 스캔 결과 MANUAL"""
+        scanner = LinuxScanner(server_id="s1", host="h", username="u", snapshot_collectors=False)
+        scanner._connected = True
+        scanner.set_rules([make_rule("U-99", "validators.linux.check_u99")])
+
+        async def execute(command, timeout=60, input=None):
+            return ""
+
+        scanner._ssh_client.execute = execute
+        result = await scanner.scan_all()
+
+        assert result.results["U-99"].status == Status.MANUAL
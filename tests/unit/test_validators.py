@@ -6,6 +6,7 @@ src/core/analyzer/validators/linux/ 모듈의 73개 validator 함수를 테스
 1. 73개 함수 존재 확인
 2. 함수 시그니처 검증 (List[str] -> CheckResult)
 3. 카테고리별 대표 함수 상세 테스트 (5개 카테고리)
+4. 플랫폼 패키지 지연 import (필요한 모듈만 로드)
 
 카테고리:
 - account_management (15개): U-01 ~ U-15
@@ -15,7 +16,11 @@ src/core/analyzer/validators/linux/ 모듈의 73개 validator 함수를 테스
 - patch_management (1개): U-71
 """
 
+import importlib
 import inspect
+import subprocess
+import sys
+from pathlib import Path
 from typing import List, get_args, get_origin
 
 import pytest
@@ -249,6 +254,18 @@ class TestServiceManagementValidators:
         # RPC 서비스가 없으면 PASS
         assert result.status == Status.PASS
 
+    def test_check_u44_ignores_pipeline_shell(self):
+        """check_u44: 점검 파이프라인을 실행한 셸과 grep 자신의 줄은 제외"""
+        output = (
+            'root 1299 1298  0 10:05 ?        00:00:00 bash -c ps -ef | egrep "rpc.*|sadmind"\n'
+            "root 1301 1299  0 10:05 ?        00:00:00 egrep rpc.*|sadmind"
+        )
+
+        rpcbind = "rpc   612    1  0 Oct16 ?        00:00:01 rpcbind -w"
+
+        assert linux.check_u44([output]).status == Status.PASS
+        assert linux.check_u44([f"{output}\n{rpcbind}"]).status == Status.FAIL
+
 
 @pytest.mark.unit
 class TestLogManagementValidators:
@@ -724,6 +741,15 @@ class TestServiceManagementDetailed:
         result = linux.check_u65(outputs)
         assert result.status == Status.PASS
 
+    def test_check_u65_pass_pipeline_shell(self):
+        """check_u65 PASS: 점검 파이프라인을 실행한 셸의 줄 (실제 snmpd 없음)"""
+        outputs = [
+            "root 1299 1298 0 12:00 ? 00:00:00 bash -c ps -ef | grep snmp\n"
+            "root 1301 1299 0 12:00 ? 00:00:00 grep snmp"
+        ]
+        result = linux.check_u65(outputs)
+        assert result.status == Status.PASS
+
     def test_check_u65_fail_snmpd_running(self):
         """check_u65 FAIL: snmpd 프로세스 실행 중"""
         outputs = ["root 1234 1 0 12:00 ? /usr/sbin/snmpd"]
@@ -997,3 +1023,47 @@ class TestValidatorsEdgeCases:
                 validator = getattr(linux, func_name)
                 result = validator([long_string])
                 assert isinstance(result, CheckResult)
+
+
+# ==================== 지연 import ====================
+
+
+@pytest.mark.unit
+class TestLazyValidatorImport:
+    """플랫폼 validator 패키지 지연 import 테스트"""
+
+    @pytest.mark.parametrize("platform", ["linux", "macos", "windows"])
+    def test_manifest_matches_modules(self, platform):
+        """_VALIDATOR_MODULES가 __all__ 및 각 모듈에 정의된 check_* 함수와 일치"""
+        package = importlib.import_module(f"src.core.analyzer.validators.{platform}")
+        manifest = package._VALIDATOR_MODULES
+
+        assert set(manifest) == set(package.__all__)
+        for module_name in set(manifest.values()):
+            module = importlib.import_module(f"{package.__name__}.{module_name}")
+            defined = {
+                name
+                for name, func in inspect.getmembers(module, inspect.isfunction)
+                if name.startswith("check_") and func.__module__ == module.__name__
+            }
+            assert defined == {name for name, owner in manifest.items() if owner == module_name}
+
+    def test_import_loads_only_needed_modules(self):
+        """Windows validator 1개 사용 시 정의 모듈만 import (Linux, macOS validator 미로드)"""
+        code = (
+            "import sys\n"
+            "from src.core.analyzer.validators.windows import check_w01\n"
+            "print(' '.join(sorted(m for m in sys.modules if 'analyzer.validators.' in m)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.split() == [
+            "src.core.analyzer.validators.windows",
+            "src.core.analyzer.validators.windows.account_management",
+        ]
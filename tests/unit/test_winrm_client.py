@@ -3,7 +3,20 @@
 WinRM 클라이언트의 연결, 명령어 실행, 에러 처리 등을 테스트합니다.
 """
 
+import asyncio
+import base64
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
+from winrm.exceptions import WinRMError
+
+from src.infrastructure.network.winrm_client import (
+    WinRMClient,
+    WinRMTimeoutError,
+    clean_clixml,
+    encode_powershell,
+)
 
 
 class TestWinRMClientInit:
@@ -192,3 +205,134 @@ class TestWinRMClientContextManager:
         """비동기 context manager 예외 처리"""
         # TODO: 구현 필요
         pass
+
+
+def make_protocol(shell_id: str = "shell-1") -> MagicMock:
+    """pywinrm Protocol 대역"""
+    protocol = MagicMock()
+    protocol.open_shell.return_value = shell_id
+    protocol.run_command.return_value = "command-1"
+    protocol.get_command_output.return_value = (b"ok\r\n", b"", 0)
+    return protocol
+
+
+@pytest.mark.unit
+class TestPowerShellEncoding:
+    """encode_powershell / clean_clixml 테스트"""
+
+    def test_encode_powershell_utf16le(self):
+        """UTF-16LE + Base64 인코딩 (한글 포함)"""
+        encoded = encode_powershell("Write-Output '점검'")
+        assert base64.b64decode(encoded).decode("utf-16-le") == "Write-Output '점검'"
+
+    def test_clean_clixml(self):
+        """CLIXML stderr에서 오류 메시지만 추출"""
+        stderr = (
+            '#< CLIXML\r\n<Objs Version="1.1.0.1" '
+            'xmlns="http://schemas.microsoft.com/powershell/2004/04">'
+            '<S S="Error">Access denied_x000D__x000A_</S></Objs>'
+        )
+        assert clean_clixml(stderr) == "Access denied"
+        assert clean_clixml("plain error") == "plain error"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWinRMClientPersistentShell:
+    """지속 셸 재사용 및 셸 풀 테스트"""
+
+    async def test_commands_reuse_one_shell(self):
+        """connect()에서 연 셸 하나로 여러 명령어 실행"""
+        protocol = make_protocol()
+        client = WinRMClient(host="h", username="u", password="pw", native_transport=False)
+
+        with patch.object(client, "_create_protocol", return_value=protocol):
+            await client.connect()
+            assert await client.execute_powershell("Get-Service") == "ok\r\n"
+            await client.execute_powershell("Get-Process")
+            await client.disconnect()
+
+        protocol.open_shell.assert_called_once()
+        assert protocol.open_shell.call_args.kwargs["codepage"] == 65001
+        assert protocol.run_command.call_count == 2
+        assert protocol.cleanup_command.call_count == 2
+        protocol.close_shell.assert_called_once_with("shell-1")
+
+        command, args = protocol.run_command.call_args.args[1:]
+        assert command == "powershell"
+        assert base64.b64decode(args[-1]).decode("utf-16-le") == "Get-Process"
+
+    async def test_shell_pool_runs_commands_concurrently(self):
+        """max_shells개의 셸에서 명령어를 동시에 실행"""
+        protocols = [make_protocol(f"shell-{i}") for i in range(3)]
+        running = 0
+        peak = 0
+
+        def slow_output(shell_id, command_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            time.sleep(0.05)
+            running -= 1
+            return (b"ok", b"", 0)
+
+        for protocol in protocols:
+            protocol.get_command_output.side_effect = slow_output
+
+        client = WinRMClient(
+            host="h", username="u", password="pw", native_transport=False, max_shells=2
+        )
+        with patch.object(client, "_create_protocol", side_effect=protocols):
+            await client.connect()
+            await asyncio.gather(*(client.execute_powershell(f"cmd {i}") for i in range(4)))
+
+        assert peak == 2
+        assert protocols[2].open_shell.call_count == 0
+        assert len(client._idle_shells) == 2
+
+    async def test_expired_shell_is_recreated(self):
+        """서버에서 만료된 셸은 새 셸로 한 번 재시도"""
+        expired = make_protocol("shell-old")
+        expired.run_command.side_effect = WinRMError("shell not found")
+        fresh = make_protocol("shell-new")
+
+        client = WinRMClient(host="h", username="u", password="pw", native_transport=False)
+        with patch.object(client, "_create_protocol", side_effect=[expired, fresh]):
+            await client.connect()
+            assert await client.execute_powershell("hostname") == "ok\r\n"
+
+        expired.close_shell.assert_called_once_with("shell-old")
+        assert [shell.shell_id for shell in client._idle_shells] == ["shell-new"]
+
+    async def test_timed_out_shell_is_not_reused(self):
+        """타임아웃된 셸은 풀에 반환하지 않음"""
+        protocol = make_protocol()
+        protocol.get_command_output.side_effect = lambda *args: time.sleep(0.3) or (b"", b"", 0)
+
+        client = WinRMClient(host="h", username="u", password="pw", native_transport=False)
+        with patch.object(client, "_create_protocol", return_value=protocol):
+            await client.connect()
+            with pytest.raises(WinRMTimeoutError):
+                await client.execute_powershell("Start-Sleep 10", timeout=0.05)
+
+        assert client._idle_shells == []
+
+    async def test_non_persistent_mode_opens_shell_per_command(self):
+        """persistent_shell=False이면 명령어마다 셸 생성/삭제"""
+        protocol = make_protocol()
+        client = WinRMClient(
+            host="h", username="u", password="pw", native_transport=False, persistent_shell=False
+        )
+
+        with patch.object(client, "_create_protocol", return_value=protocol):
+            await client.connect()
+            await client.execute_powershell("hostname")
+            await client.execute_powershell("hostname")
+
+        assert protocol.open_shell.call_count == 3
+        assert protocol.close_shell.call_count == 3
+
+    async def test_invalid_max_shells(self):
+        """max_shells가 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            WinRMClient(host="h", username="u", password="pw", max_shells=0)
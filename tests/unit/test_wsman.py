@@ -0,0 +1,440 @@
+"""asyncio WS-Man 전송 단위 테스트
+
+src/infrastructure/network/wsman.py와 WinRMClient 연동을 테스트합니다.
+테스트용 WinRM 서버(asyncio.start_server)를 띄워 실제 HTTP/SOAP 메시지를 주고받습니다.
+
+테스트 범위:
+1. 지원하는 인증/전송 조합 판별
+2. keep-alive 연결 재사용, 끊긴 연결 재생성, chunked 응답, Receive 대기 시간 초과 재시도
+3. NTLM 연결 단위 인증 (HTTPS + 채널 바인딩)
+4. SOAP Fault → WinRMCommandError, 타임아웃/취소 시 terminate 신호
+"""
+
+import asyncio
+import base64
+import datetime
+import re
+import ssl
+import time
+import uuid
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.network.winrm_client import (
+    WinRMClient,
+    WinRMCommandError,
+    WinRMTimeoutError,
+)
+from src.infrastructure.network.wsman import (
+    OPERATION_TIMEOUT_FAULT,
+    WSManProtocol,
+    WSManTransport,
+    _tls_server_end_point,
+    build_envelope,
+    parse_fault,
+    supports_native_transport,
+)
+
+NS_SHELL = "http://schemas.microsoft.com/wbem/wsman/1/windows/shell"
+
+
+def soap(body: str) -> bytes:
+    return (
+        '<s:Envelope xmlns:s="http://www.w3.org/2003/05/soap-envelope" '
+        f'xmlns:rsp="{NS_SHELL}" '
+        'xmlns:x="http://schemas.xmlsoap.org/ws/2004/09/transfer" '
+        'xmlns:w="http://schemas.dmtf.org/wbem/wsman/1/wsman.xsd">'
+        f"<s:Body>{body}</s:Body></s:Envelope>"
+    ).encode("utf-8")
+
+
+def fault(code: int, reason: str) -> bytes:
+    return soap(
+        "<s:Fault><s:Reason><s:Text>"
+        f"{reason}</s:Text></s:Reason><s:Detail>"
+        '<f:WSManFault xmlns:f="http://schemas.microsoft.com/wbem/wsman/1/wsmanfault" '
+        f'Code="{code}"/></s:Detail></s:Fault>'
+    )
+
+
+class FakeWinRMServer:
+    """테스트용 WinRM 서버 (WinRS 셸 작업만 구현)
+
+    - Receive 첫 요청은 작업 대기 시간 초과 Fault, 이후 출력/완료 (chunked 응답)
+    - 명령어 출력: "ok:<디코딩한 스크립트>"
+    - 스크립트가 "hang"이면 Receive에 응답하지 않음
+    """
+
+    def __init__(self, auth: str = "basic", ntlm_server=None, close_after: int = 0):
+        self.auth = auth
+        self.ntlm_server = ntlm_server
+        # 응답 N개 후 연결 종료 (서버 유휴 연결 정리 흉내, 0이면 유지)
+        self.close_after = close_after
+        self.connections = 0
+        self.actions: List[str] = []
+        self.auth_headers: List[Optional[str]] = []
+        self.scripts: Dict[str, str] = {}
+        self.receives: Dict[str, int] = {}
+        self.fail_command = False
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        authenticated = False
+        ntlm = self.ntlm_server() if self.ntlm_server else None
+        served = 0
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().rstrip("\r\n")
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                self.auth_headers.append(headers.get("authorization"))
+
+                if self.auth == "basic":
+                    expected = "Basic " + base64.b64encode(b"u:pw").decode()
+                    if headers.get("authorization") != expected:
+                        await self._write(writer, 401, b"")
+                        continue
+                elif not authenticated:
+                    scheme, _, token = headers.get("authorization", "").partition(" ")
+                    out = ntlm.step(base64.b64decode(token)) if token else None
+                    if not ntlm.complete:
+                        challenge = {
+                            "WWW-Authenticate": f"Negotiate {base64.b64encode(out).decode()}"
+                        }
+                        await self._write(writer, 401, b"", challenge)
+                        continue
+                    authenticated = True
+
+                status, response, chunked = await self.dispatch(body.decode("utf-8"))
+                await self._write(writer, status, response, chunked=chunked)
+                served += 1
+                if self.close_after and served >= self.close_after:
+                    writer.close()
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # 테스트 종료 시 응답 대기 중인 핸들러 취소 포함
+            return
+        finally:
+            writer.close()
+
+    async def dispatch(self, body: str):
+        action = re.search(r"<a:Action[^>]*>([^<]+)</a:Action>", body).group(1).rsplit("/", 1)[1]
+        self.actions.append(action)
+
+        if action == "Create":
+            selector = '<w:Selector Name="ShellId">shell-1</w:Selector>'
+            return (
+                200,
+                soap(
+                    f"<x:ResourceCreated><w:SelectorSet>{selector}</w:SelectorSet>"
+                    "</x:ResourceCreated>"
+                ),
+                False,
+            )
+        if action == "Command":
+            if self.fail_command:
+                return 500, fault(2150858843, "The request is not valid."), False
+            arguments = re.search(r"<rsp:Arguments>([^<]*)</rsp:Arguments>", body).group(1)
+            command_id = str(uuid.uuid4())
+            encoded = arguments.split()[-1]
+            self.scripts[command_id] = base64.b64decode(encoded).decode("utf-16-le")
+            return (
+                200,
+                soap(
+                    f"<rsp:CommandResponse><rsp:CommandId>{command_id}"
+                    "</rsp:CommandId></rsp:CommandResponse>"
+                ),
+                False,
+            )
+        if action == "Receive":
+            command_id = re.search(r'CommandId="([^"]+)"', body).group(1)
+            count = self.receives.get(command_id, 0)
+            self.receives[command_id] = count + 1
+            if self.scripts[command_id] == "hang":
+                await asyncio.sleep(3600)
+            if count == 0:
+                return (
+                    500,
+                    fault(
+                        OPERATION_TIMEOUT_FAULT,
+                        "The WS-Management service cannot "
+                        "complete the operation within the time specified.",
+                    ),
+                    False,
+                )
+            output = f"ok:{self.scripts[command_id]}".encode("utf-8")
+            if count == 1:
+                stream = base64.b64encode(output[:3]).decode()
+                state = "Running"
+                exit_code = ""
+            else:
+                stream = base64.b64encode(output[3:]).decode()
+                state = "Done"
+                exit_code = "<rsp:ExitCode>0</rsp:ExitCode>"
+            return (
+                200,
+                soap(
+                    f'<rsp:ReceiveResponse><rsp:Stream Name="stdout" CommandId="{command_id}">'
+                    f"{stream}</rsp:Stream>"
+                    f'<rsp:CommandState CommandId="{command_id}" '
+                    f'State="{NS_SHELL}/CommandState/{state}">{exit_code}</rsp:CommandState>'
+                    "</rsp:ReceiveResponse>"
+                ),
+                True,
+            )
+        return 200, soap(""), False
+
+    @staticmethod
+    async def _write(writer, status, body, headers=None, chunked=False):
+        lines = [f"HTTP/1.1 {status} X", "Content-Type: application/soap+xml;charset=UTF-8"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        if chunked:
+            lines.append("Transfer-Encoding: chunked")
+            half = len(body) // 2
+            payload = (
+                b"".join(
+                    f"{len(part):x}\r\n".encode() + part + b"\r\n"
+                    for part in (body[:half], body[half:])
+                )
+                + b"0\r\n\r\n"
+            )
+        else:
+            lines.append(f"Content-Length: {len(body)}")
+            payload = body
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+        await writer.drain()
+
+
+async def start(server: FakeWinRMServer, ssl_context=None):
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0, ssl=ssl_context)
+    return listener, listener.sockets[0].getsockname()[1]
+
+
+def make_certificate(tmp_path):
+    """자체 서명 인증서 생성 (cert.pem, key.pem 경로, DER 인증서)"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA384())
+    )
+    cert_path, key_path = tmp_path / "cert.pem", tmp_path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path, cert.public_bytes(serialization.Encoding.DER)
+
+
+@pytest.mark.unit
+class TestWSManHelpers:
+    """지원 조합 판별, envelope 생성, Fault 파싱 테스트"""
+
+    def test_supports_native_transport(self):
+        """NTLM/Basic over HTTPS, Basic over HTTP만 지원"""
+        assert supports_native_transport("ntlm", True)
+        assert supports_native_transport("basic", False)
+        assert not supports_native_transport("ntlm", False)
+        assert not supports_native_transport("kerberos", True)
+
+    def test_client_selects_transport(self):
+        """WinRMClient는 지원하는 조합이면 asyncio WS-Man 전송 사용"""
+        assert WinRMClient(host="h", username="u", password="pw").native_transport
+        assert not WinRMClient(
+            host="h", username="u", password="pw", transport="kerberos"
+        ).native_transport
+        with pytest.raises(ValueError):
+            WinRMClient(host="h", username="u", password="pw", use_ssl=False, native_transport=True)
+
+    def test_build_envelope_escapes_values(self):
+        """셸 ID와 옵션 값은 XML 이스케이프"""
+        envelope = build_envelope(
+            "http://x/Command", shell_id="a&b", options={"WINRS_CODEPAGE": "65001"}
+        )
+        assert '<w:Selector Name="ShellId">a&amp;b</w:Selector>' in envelope
+        assert '<w:Option Name="WINRS_CODEPAGE">65001</w:Option>' in envelope
+
+    def test_parse_fault(self):
+        """SOAP Fault에서 WSManFault 코드와 메시지 추출"""
+        error = parse_fault(fault(OPERATION_TIMEOUT_FAULT, "timed out"))
+        assert error.code == OPERATION_TIMEOUT_FAULT
+        assert error.reason == "timed out"
+        assert parse_fault(soap("")) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWSManTransport:
+    """asyncio WS-Man 전송 + WinRMClient 연동 테스트"""
+
+    async def test_commands_share_one_keepalive_connection(self):
+        """셸 생성, 명령어 2개, 셸 삭제가 TCP 연결 1개에서 실행 (스레드 풀 미사용)"""
+        server = FakeWinRMServer()
+        listener, port = await start(server)
+        client = WinRMClient(
+            host="127.0.0.1",
+            username="u",
+            password="pw",
+            port=port,
+            transport="basic",
+            use_ssl=False,
+        )
+
+        with patch.object(client, "_create_protocol", side_effect=AssertionError("pywinrm")):
+            await client.connect()
+            assert await client.execute_powershell("Get-Service") == "ok:Get-Service"
+            assert await client.execute_powershell("점검") == "ok:점검"
+            await client.disconnect()
+        listener.close()
+
+        assert server.connections == 1
+        assert server.actions.count("Create") == 1
+        assert server.actions.count("Signal") == 2
+        assert server.actions[-1] == "Delete"
+
+    async def test_stale_connection_is_replaced(self):
+        """서버가 닫은 유휴 연결은 새 연결로 재시도"""
+        server = FakeWinRMServer(close_after=1)
+        listener, port = await start(server)
+        transport = WSManTransport("127.0.0.1", port, "u", "pw", auth="basic", use_ssl=False)
+        protocol = WSManProtocol(transport)
+
+        shell_id = await protocol.open_shell()
+        await asyncio.sleep(0.01)
+        await protocol.close_shell(shell_id)
+        await protocol.close()
+        listener.close()
+
+        assert shell_id == "shell-1"
+        assert server.connections == 2
+        assert server.actions == ["Create", "Delete"]
+
+    async def test_ntlm_authenticates_once_per_connection(self, tmp_path, monkeypatch):
+        """HTTPS NTLM: 연결당 핸드셰이크 1회, 이후 요청은 인증 헤더 없음"""
+        import spnego
+        from spnego.channel_bindings import GssChannelBindings
+
+        users = tmp_path / "ntlm_users"
+        users.write_text("DOMAIN:u:pw\n")
+        monkeypatch.setenv("NTLM_USER_FILE", str(users))
+
+        cert_path, key_path, der = make_certificate(tmp_path)
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(cert_path, key_path)
+        bindings = GssChannelBindings(application_data=_tls_server_end_point(der))
+
+        server = FakeWinRMServer(
+            auth="ntlm",
+            ntlm_server=lambda: spnego.server(protocol="ntlm", channel_bindings=bindings),
+        )
+        listener, port = await start(server, ssl_context)
+        client = WinRMClient(host="127.0.0.1", username="DOMAIN\\u", password="pw", port=port)
+
+        await client.connect()
+        assert await client.execute_powershell("hostname") == "ok:hostname"
+        await client.disconnect()
+        listener.close()
+
+        assert server.connections == 1
+        negotiate = [header for header in server.auth_headers if header]
+        assert len(negotiate) == 2
+        assert all(header.startswith("Negotiate ") for header in negotiate)
+        assert server.auth_headers[2:] == [None] * (len(server.auth_headers) - 2)
+
+    async def test_fault_raises_command_error(self):
+        """SOAP Fault 응답은 WinRMCommandError"""
+        server = FakeWinRMServer()
+        listener, port = await start(server)
+        client = WinRMClient(
+            host="127.0.0.1",
+            username="u",
+            password="pw",
+            port=port,
+            transport="basic",
+            use_ssl=False,
+        )
+
+        await client.connect()
+        server.fail_command = True
+        with pytest.raises(WinRMCommandError, match="not valid"):
+            await client.execute_powershell("hostname")
+        await client.disconnect()
+        listener.close()
+
+    async def test_timeout_terminates_remote_command(self):
+        """타임아웃되면 응답 대기 중인 연결을 닫고 terminate 신호를 보냄"""
+        server = FakeWinRMServer()
+        listener, port = await start(server)
+        client = WinRMClient(
+            host="127.0.0.1",
+            username="u",
+            password="pw",
+            port=port,
+            transport="basic",
+            use_ssl=False,
+        )
+
+        await client.connect()
+        with pytest.raises(WinRMTimeoutError):
+            await client.execute_powershell("hang", timeout=0.2)
+        await client.disconnect()
+        listener.close()
+
+        assert "Signal" in server.actions
+        assert client._idle_shells == []
+
+    async def test_cancel_terminates_remote_command(self):
+        """취소하면 즉시 반환하고 terminate 신호와 셸 삭제는 백그라운드에서 전송"""
+        server = FakeWinRMServer()
+        listener, port = await start(server)
+        client = WinRMClient(
+            host="127.0.0.1",
+            username="u",
+            password="pw",
+            port=port,
+            transport="basic",
+            use_ssl=False,
+        )
+
+        await client.connect()
+        task = asyncio.ensure_future(client.execute_powershell("hang"))
+        while "Receive" not in server.actions:
+            await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - started < 0.1
+
+        await client.disconnect()
+        listener.close()
+
+        assert server.actions[-2:] == ["Signal", "Delete"]
+        assert client._idle_shells == []